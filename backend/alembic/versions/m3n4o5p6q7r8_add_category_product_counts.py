@@ -0,0 +1,81 @@
+"""Add materialized category product counts for shop navigation
+
+Revision ID: m3n4o5p6q7r8
+Revises: data_filament_type_migration
+Create Date: 2026-10-16
+
+category_product_counts holds the number of active, shop-visible products per
+category so the shop navigation can be rendered from one indexed read. It is
+only read when SHOP_CATEGORY_COUNTS_MATERIALIZED is enabled; rows are rebuilt
+per tenant whenever product visibility or category membership changes.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "m3n4o5p6q7r8"
+down_revision: Union[str, None] = "data_filament_type_migration"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "category_product_counts",
+        sa.Column("category_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "tenant_id", sa.UUID(), nullable=False, comment="Tenant ID for multi-tenant isolation"
+        ),
+        sa.Column(
+            "product_count",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Active, shop-visible products in this category",
+        ),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("category_id"),
+    )
+    op.create_index(
+        "ix_category_product_counts_tenant_id", "category_product_counts", ["tenant_id"]
+    )
+
+    # Backfill counts for every existing category
+    op.execute("""
+        INSERT INTO category_product_counts (category_id, tenant_id, product_count)
+        SELECT c.id, c.tenant_id, COALESCE(v.product_count, 0)
+        FROM categories c
+        LEFT JOIN (
+            SELECT pc.category_id, COUNT(*) AS product_count
+            FROM product_categories pc
+            JOIN products p ON p.id = pc.product_id
+            WHERE p.is_active AND p.shop_visible
+            GROUP BY pc.category_id
+        ) v ON v.category_id = c.id
+    """)
+
+    # Enable RLS for category_product_counts (PostgreSQL only)
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pgcrypto') THEN
+                ALTER TABLE category_product_counts ENABLE ROW LEVEL SECURITY;
+
+                -- Policy for tenant isolation
+                DROP POLICY IF EXISTS category_product_counts_tenant_isolation
+                    ON category_product_counts;
+                CREATE POLICY category_product_counts_tenant_isolation ON category_product_counts
+                    USING (tenant_id = current_setting('app.current_tenant_id', true)::uuid);
+            END IF;
+        END $$;
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_category_product_counts_tenant_id", table_name="category_product_counts")
+    op.drop_table("category_product_counts")
@@ -0,0 +1,132 @@
+"""Add denormalized shop product projections
+
+Revision ID: n4o5p6q7r8s9
+Revises: m3n4o5p6q7r8
+Create Date: 2026-10-16
+
+shop_product_projections holds one row per shop-visible product and sales
+channel (plus a channel-less default row) with the resolved price, image
+URLs, categories, designer and variants already shaped as the shop API
+returns them. Rows are rebuilt by app.services.shop_projection on write.
+
+Existing catalogues are backfilled with scripts/backfill_shop_projections.py
+after upgrading.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "n4o5p6q7r8s9"
+down_revision: Union[str, None] = "m3n4o5p6q7r8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "shop_product_projections",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "tenant_id", sa.UUID(), nullable=False, comment="Tenant ID for multi-tenant isolation"
+        ),
+        sa.Column("product_id", sa.UUID(), nullable=False, comment="Projected product"),
+        sa.Column(
+            "sales_channel_id",
+            sa.UUID(),
+            nullable=True,
+            comment="Channel the price was resolved for (NULL = default pricing)",
+        ),
+        sa.Column(
+            "is_active",
+            sa.Boolean(),
+            nullable=False,
+            comment="Product is active (inactive products are only reachable by direct link)",
+        ),
+        sa.Column(
+            "is_dragon",
+            sa.Boolean(),
+            nullable=False,
+            comment="Product appears in the Dragons collection",
+        ),
+        sa.Column(
+            "designer_slug",
+            sa.String(length=100),
+            nullable=True,
+            comment="Slug of the product's designer (NULL if none or inactive)",
+        ),
+        sa.Column(
+            "seo_slug",
+            sa.String(length=200),
+            nullable=True,
+            comment="Product seo_slug for slug lookups",
+        ),
+        sa.Column(
+            "price_pence",
+            sa.Integer(),
+            nullable=False,
+            comment="Resolved price for this channel in pence",
+        ),
+        sa.Column(
+            "product_created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Product creation time (listing sort key)",
+        ),
+        sa.Column(
+            "payload",
+            sa.JSON(),
+            nullable=False,
+            comment="Listing card as returned by GET /shop/products",
+        ),
+        sa.Column(
+            "detail",
+            sa.JSON(),
+            nullable=False,
+            comment="Product page as returned by GET /shop/products/{id}",
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["sales_channel_id"], ["sales_channels.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        comment="Denormalized shop product read model, one row per product and channel",
+    )
+    op.create_index(
+        "ix_shop_product_projections_product_id", "shop_product_projections", ["product_id"]
+    )
+    op.create_index(
+        "ix_shop_product_projections_seo_slug", "shop_product_projections", ["seo_slug"]
+    )
+    op.create_index(
+        "ix_shop_product_projections_listing",
+        "shop_product_projections",
+        ["tenant_id", "sales_channel_id", "is_active", "product_created_at"],
+    )
+
+    # Enable RLS for shop_product_projections (PostgreSQL only)
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pgcrypto') THEN
+                ALTER TABLE shop_product_projections ENABLE ROW LEVEL SECURITY;
+
+                -- Policy for tenant isolation
+                DROP POLICY IF EXISTS shop_product_projections_tenant_isolation
+                    ON shop_product_projections;
+                CREATE POLICY shop_product_projections_tenant_isolation ON shop_product_projections
+                    USING (tenant_id = current_setting('app.current_tenant_id', true)::uuid);
+            END IF;
+        END $$;
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_shop_product_projections_listing", table_name="shop_product_projections")
+    op.drop_index("ix_shop_product_projections_seo_slug", table_name="shop_product_projections")
+    op.drop_index("ix_shop_product_projections_product_id", table_name="shop_product_projections")
+    op.drop_table("shop_product_projections")
@@ -0,0 +1,71 @@
+"""Add composite indexes for keyset (cursor) pagination
+
+Revision ID: o5p6q7r8s9t0
+Revises: n4o5p6q7r8s9
+Create Date: 2026-10-16
+
+Cursor pagination filters on ``(sort_column, id) < (:value, :id)`` and orders
+by the same pair, so each listing needs an index ending in its sort column
+and primary key to seek straight to the page boundary:
+
+  - products / orders: (tenant_id, created_at, id)
+  - production_runs: (tenant_id, started_at, id)
+  - webhook_deliveries: (subscription_id, created_at, id), replacing the
+    (subscription_id, created_at) index it extends
+  - shop_product_projections: listing index gains product_id as tie-breaker
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "o5p6q7r8s9t0"
+down_revision: Union[str, None] = "n4o5p6q7r8s9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_products_tenant_created_id", "products", ["tenant_id", "created_at", "id"])
+    op.create_index("ix_orders_tenant_created_id", "orders", ["tenant_id", "created_at", "id"])
+    op.create_index(
+        "idx_production_runs_tenant_started_id",
+        "production_runs",
+        ["tenant_id", "started_at", "id"],
+    )
+
+    op.drop_index("ix_webhook_deliveries_subscription_created", table_name="webhook_deliveries")
+    op.create_index(
+        "ix_webhook_deliveries_subscription_created",
+        "webhook_deliveries",
+        ["subscription_id", "created_at", "id"],
+    )
+
+    op.drop_index("ix_shop_product_projections_listing", table_name="shop_product_projections")
+    op.create_index(
+        "ix_shop_product_projections_listing",
+        "shop_product_projections",
+        ["tenant_id", "sales_channel_id", "is_active", "product_created_at", "product_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_shop_product_projections_listing", table_name="shop_product_projections")
+    op.create_index(
+        "ix_shop_product_projections_listing",
+        "shop_product_projections",
+        ["tenant_id", "sales_channel_id", "is_active", "product_created_at"],
+    )
+
+    op.drop_index("ix_webhook_deliveries_subscription_created", table_name="webhook_deliveries")
+    op.create_index(
+        "ix_webhook_deliveries_subscription_created",
+        "webhook_deliveries",
+        ["subscription_id", "created_at"],
+    )
+
+    op.drop_index("idx_production_runs_tenant_started_id", table_name="production_runs")
+    op.drop_index("ix_orders_tenant_created_id", table_name="orders")
+    op.drop_index("ix_products_tenant_created_id", table_name="products")
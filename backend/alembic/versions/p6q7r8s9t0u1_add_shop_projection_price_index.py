@@ -0,0 +1,33 @@
+"""Index shop product projections by resolved price
+
+Revision ID: p6q7r8s9t0u1
+Revises: o5p6q7r8s9t0
+Create Date: 2026-10-16
+
+The shop listing sorts and filters on the channel-resolved price_pence kept
+on each projection row. This index lets price-ordered pages and price-range
+filters seek within a tenant/channel instead of scanning the catalogue.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "p6q7r8s9t0u1"
+down_revision: Union[str, None] = "o5p6q7r8s9t0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_shop_product_projections_price",
+        "shop_product_projections",
+        ["tenant_id", "sales_channel_id", "is_active", "price_pence", "product_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_shop_product_projections_price", table_name="shop_product_projections")
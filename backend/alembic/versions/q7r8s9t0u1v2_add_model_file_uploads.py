@@ -0,0 +1,112 @@
+"""Add resumable model file uploads and content hashes
+
+Revision ID: q7r8s9t0u1v2
+Revises: p6q7r8s9t0u1
+Create Date: 2026-10-16
+
+model_files.content_sha256 records the SHA-256 computed while an upload is
+streamed to storage. model_file_uploads tracks resumable chunked uploads in
+progress: the declared size, the bytes received so far and the metadata
+for the ModelFile created when the upload completes.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "q7r8s9t0u1v2"
+down_revision: Union[str, None] = "p6q7r8s9t0u1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "model_files",
+        sa.Column(
+            "content_sha256",
+            sa.String(length=64),
+            nullable=True,
+            comment="Hex SHA-256 of the stored content (null for local references)",
+        ),
+    )
+
+    op.create_table(
+        "model_file_uploads",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("tenant_id", sa.UUID(), nullable=False, comment="Tenant this upload belongs to"),
+        sa.Column(
+            "model_id", sa.UUID(), nullable=False, comment="3D model the file will be attached to"
+        ),
+        sa.Column(
+            "file_type",
+            sa.String(length=30),
+            nullable=False,
+            comment="File type of the resulting ModelFile",
+        ),
+        sa.Column(
+            "original_filename",
+            sa.String(length=255),
+            nullable=False,
+            comment="Original filename as uploaded",
+        ),
+        sa.Column(
+            "content_type",
+            sa.String(length=100),
+            nullable=False,
+            comment="MIME content type declared by the client",
+        ),
+        sa.Column(
+            "total_size",
+            sa.BigInteger(),
+            nullable=False,
+            comment="Declared size of the complete file in bytes",
+        ),
+        sa.Column(
+            "received_size",
+            sa.BigInteger(),
+            server_default="0",
+            nullable=False,
+            comment="Bytes received so far (the offset the next chunk must start at)",
+        ),
+        sa.Column("part_name", sa.String(length=100), nullable=True),
+        sa.Column("version", sa.String(length=50), nullable=True),
+        sa.Column("is_primary", sa.Boolean(), server_default="false", nullable=False),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column(
+            "uploaded_by_user_id", sa.UUID(), nullable=True, comment="User who started the upload"
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["model_id"], ["models.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["uploaded_by_user_id"], ["users.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_model_file_uploads_tenant_id", "model_file_uploads", ["tenant_id"])
+    op.create_index("ix_model_file_uploads_model_id", "model_file_uploads", ["model_id"])
+
+    # Enable RLS for model_file_uploads (PostgreSQL only)
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pgcrypto') THEN
+                ALTER TABLE model_file_uploads ENABLE ROW LEVEL SECURITY;
+
+                -- Policy for tenant isolation
+                DROP POLICY IF EXISTS model_file_uploads_tenant_isolation ON model_file_uploads;
+                CREATE POLICY model_file_uploads_tenant_isolation ON model_file_uploads
+                    USING (tenant_id = current_setting('app.current_tenant_id', true)::uuid);
+            END IF;
+        END $$;
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_model_file_uploads_model_id", table_name="model_file_uploads")
+    op.drop_index("ix_model_file_uploads_tenant_id", table_name="model_file_uploads")
+    op.drop_table("model_file_uploads")
+    op.drop_column("model_files", "content_sha256")
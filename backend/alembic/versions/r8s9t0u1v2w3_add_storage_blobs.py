@@ -0,0 +1,102 @@
+"""Add refcounted, content-addressed storage blobs
+
+Revision ID: r8s9t0u1v2w3
+Revises: q7r8s9t0u1v2
+Create Date: 2026-10-16
+
+storage_blobs maps the SHA-256 of an uploaded model file or image to the one
+stored copy shared by every record with that content, with a reference
+count so the content is only deleted when its last record goes. Files
+stored before this migration have no blob and keep being deleted with
+their record.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "r8s9t0u1v2w3"
+down_revision: Union[str, None] = "q7r8s9t0u1v2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "storage_blobs",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "tenant_id", sa.UUID(), nullable=False, comment="Tenant ID for multi-tenant isolation"
+        ),
+        sa.Column(
+            "kind",
+            sa.String(length=20),
+            nullable=False,
+            comment="What the blob stores: 'model_file' or 'image'",
+        ),
+        sa.Column(
+            "sha256",
+            sa.String(length=64),
+            nullable=False,
+            comment="Hex SHA-256 of the uploaded content",
+        ),
+        sa.Column(
+            "url",
+            sa.String(length=500),
+            nullable=False,
+            comment="/uploads/ URL of the stored content",
+        ),
+        sa.Column(
+            "thumbnail_url",
+            sa.String(length=500),
+            nullable=True,
+            comment="/uploads/ URL of the derived thumbnail (images only)",
+        ),
+        sa.Column(
+            "size", sa.BigInteger(), nullable=False, comment="Size of the uploaded content in bytes"
+        ),
+        sa.Column(
+            "content_type",
+            sa.String(length=100),
+            nullable=False,
+            comment="MIME content type of the stored content",
+        ),
+        sa.Column(
+            "ref_count",
+            sa.Integer(),
+            server_default="1",
+            nullable=False,
+            comment="Records referencing this blob",
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "tenant_id", "kind", "sha256", name="uq_storage_blob_tenant_kind_sha256"
+        ),
+    )
+    op.create_index("ix_storage_blobs_tenant_url", "storage_blobs", ["tenant_id", "url"])
+
+    # Enable RLS for storage_blobs (PostgreSQL only)
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pgcrypto') THEN
+                ALTER TABLE storage_blobs ENABLE ROW LEVEL SECURITY;
+
+                -- Policy for tenant isolation
+                DROP POLICY IF EXISTS storage_blobs_tenant_isolation ON storage_blobs;
+                CREATE POLICY storage_blobs_tenant_isolation ON storage_blobs
+                    USING (tenant_id = current_setting('app.current_tenant_id', true)::uuid);
+            END IF;
+        END $$;
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_storage_blobs_tenant_url", table_name="storage_blobs")
+    op.drop_table("storage_blobs")
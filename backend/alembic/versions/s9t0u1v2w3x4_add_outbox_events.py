@@ -0,0 +1,94 @@
+"""Add transactional outbox for post-commit side effects
+
+Revision ID: s9t0u1v2w3x4
+Revises: r8s9t0u1v2w3
+Create Date: 2026-10-16
+
+outbox_events records side effects (confirmation emails, outbound webhooks,
+Shopify fulfilment sync, cache invalidation) in the same transaction as the
+change that causes them; a dispatcher runs them after commit with retries.
+The table is deliberately not RLS-scoped: the dispatcher claims events
+across all tenants and rows are never exposed through tenant APIs.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "s9t0u1v2w3x4"
+down_revision: Union[str, None] = "r8s9t0u1v2w3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox_events",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "tenant_id", sa.UUID(), nullable=False, comment="Tenant the side effect belongs to"
+        ),
+        sa.Column(
+            "event_type",
+            sa.String(length=100),
+            nullable=False,
+            comment="Handler key (e.g. email.order_confirmation, webhook)",
+        ),
+        sa.Column(
+            "payload",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="Handler arguments",
+        ),
+        sa.Column(
+            "status",
+            sa.String(length=20),
+            server_default="pending",
+            nullable=False,
+            comment="Dispatch status (pending, completed, failed)",
+        ),
+        sa.Column(
+            "attempts",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Number of dispatch attempts so far",
+        ),
+        sa.Column(
+            "next_attempt_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Earliest time to (re)try; also the lease while being dispatched",
+        ),
+        sa.Column(
+            "last_error",
+            sa.Text(),
+            nullable=True,
+            comment="Error from the most recent failed attempt",
+        ),
+        sa.Column(
+            "completed_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When the handler succeeded or retries ran out",
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        comment="Post-commit side effects awaiting dispatch",
+    )
+    op.create_index("ix_outbox_events_tenant_id", "outbox_events", ["tenant_id"])
+    op.create_index(
+        "ix_outbox_events_status_next_attempt", "outbox_events", ["status", "next_attempt_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbox_events_status_next_attempt", table_name="outbox_events")
+    op.drop_index("ix_outbox_events_tenant_id", table_name="outbox_events")
+    op.drop_table("outbox_events")
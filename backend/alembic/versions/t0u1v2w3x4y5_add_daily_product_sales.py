@@ -0,0 +1,91 @@
+"""Add daily product sales rollup
+
+Revision ID: t0u1v2w3x4y5
+Revises: s9t0u1v2w3x4
+Create Date: 2026-10-16
+
+daily_product_sales holds units, revenue and order count per tenant,
+product, sales channel and UTC day, so forecasting reads a few hundred
+pre-summed rows instead of aggregating order history. Rows are rebuilt by
+app.services.sales_rollup whenever an order on that day changes.
+
+Existing order history is backfilled with scripts/backfill_sales_rollup.py
+after upgrading.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "t0u1v2w3x4y5"
+down_revision: Union[str, None] = "s9t0u1v2w3x4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_product_sales",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "tenant_id", sa.UUID(), nullable=False, comment="Tenant ID for multi-tenant isolation"
+        ),
+        sa.Column("product_id", sa.UUID(), nullable=False, comment="Product sold"),
+        sa.Column(
+            "sales_channel_id",
+            sa.UUID(),
+            nullable=True,
+            comment="Channel the orders came from (NULL = no channel)",
+        ),
+        sa.Column("day", sa.Date(), nullable=False, comment="UTC day the orders were placed"),
+        sa.Column(
+            "units_sold", sa.Integer(), nullable=False, comment="Sum of order item quantities"
+        ),
+        sa.Column(
+            "revenue",
+            sa.Numeric(precision=12, scale=2),
+            nullable=False,
+            comment="Sum of order item totals",
+        ),
+        sa.Column("order_count", sa.Integer(), nullable=False, comment="Number of distinct orders"),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["sales_channel_id"], ["sales_channels.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+        comment="Daily sales rollup per product and sales channel",
+    )
+    op.create_index(
+        "ix_daily_product_sales_tenant_day", "daily_product_sales", ["tenant_id", "day"]
+    )
+    op.create_index(
+        "ix_daily_product_sales_tenant_product_day",
+        "daily_product_sales",
+        ["tenant_id", "product_id", "day"],
+    )
+
+    # Enable RLS for daily_product_sales (PostgreSQL only)
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pgcrypto') THEN
+                ALTER TABLE daily_product_sales ENABLE ROW LEVEL SECURITY;
+
+                -- Policy for tenant isolation
+                DROP POLICY IF EXISTS daily_product_sales_tenant_isolation
+                    ON daily_product_sales;
+                CREATE POLICY daily_product_sales_tenant_isolation ON daily_product_sales
+                    USING (tenant_id = current_setting('app.current_tenant_id', true)::uuid);
+            END IF;
+        END $$;
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_daily_product_sales_tenant_product_day", table_name="daily_product_sales")
+    op.drop_index("ix_daily_product_sales_tenant_day", table_name="daily_product_sales")
+    op.drop_table("daily_product_sales")
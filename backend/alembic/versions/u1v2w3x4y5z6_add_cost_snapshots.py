@@ -0,0 +1,128 @@
+"""Add product and model cost snapshots
+
+Revision ID: u1v2w3x4y5z6
+Revises: t0u1v2w3x4y5
+Create Date: 2026-10-16
+
+product_cost_snapshots and model_cost_snapshots hold the computed cost
+breakdown of every product and model, so the product list and profit
+calculations read stored numbers instead of walking the bill of materials
+on every request, and make costs can be filtered and sorted in SQL. Rows
+are rebuilt by app.services.cost_snapshots whenever a cost input changes.
+
+Existing products and models are backfilled with
+scripts/backfill_cost_snapshots.py after upgrading.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "u1v2w3x4y5z6"
+down_revision: Union[str, None] = "t0u1v2w3x4y5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _cost(name: str, comment: str, scale: int, nullable: bool = False) -> sa.Column:
+    return sa.Column(
+        name, sa.Numeric(precision=10, scale=scale), nullable=nullable, comment=comment
+    )
+
+
+def _enable_rls(table: str) -> None:
+    op.execute(f"""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pgcrypto') THEN
+                ALTER TABLE {table} ENABLE ROW LEVEL SECURITY;
+
+                -- Policy for tenant isolation
+                DROP POLICY IF EXISTS {table}_tenant_isolation ON {table};
+                CREATE POLICY {table}_tenant_isolation ON {table}
+                    USING (tenant_id = current_setting('app.current_tenant_id', true)::uuid);
+            END IF;
+        END $$;
+    """)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "model_cost_snapshots",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "tenant_id", sa.UUID(), nullable=False, comment="Tenant ID for multi-tenant isolation"
+        ),
+        sa.Column("model_id", sa.UUID(), nullable=False, comment="Model costed"),
+        _cost("material_cost", "Material cost per unit", 3),
+        _cost("component_cost", "Component cost per unit", 3),
+        _cost("labor_cost", "Labor cost per unit", 3),
+        _cost("overhead_cost", "Overhead cost per unit", 3),
+        _cost("total_cost", "Total cost per unit", 3),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["model_id"], ["models.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("model_id"),
+        comment="Computed model cost breakdowns",
+    )
+    op.create_index(
+        "ix_model_cost_snapshots_tenant_total",
+        "model_cost_snapshots",
+        ["tenant_id", "total_cost"],
+    )
+
+    op.create_table(
+        "product_cost_snapshots",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "tenant_id", sa.UUID(), nullable=False, comment="Tenant ID for multi-tenant isolation"
+        ),
+        sa.Column("product_id", sa.UUID(), nullable=False, comment="Product costed"),
+        _cost("models_cost", "Total cost of all models", 2),
+        _cost("child_products_cost", "Total cost of child products", 2),
+        _cost("packaging_cost", "Packaging cost", 2),
+        _cost("assembly_cost", "Assembly labor cost", 2),
+        _cost("total_make_cost", "Total make cost", 2),
+        _cost("models_actual_cost", "Actual production cost of models", 2, nullable=True),
+        _cost("total_actual_cost", "Actual make cost (all models have data)", 2, nullable=True),
+        _cost(
+            "cost_variance_percentage", "Actual vs theoretical cost variance (%)", 2, nullable=True
+        ),
+        sa.Column(
+            "models_with_actual_cost",
+            sa.Integer(),
+            nullable=False,
+            comment="Models with actual cost data",
+        ),
+        sa.Column(
+            "models_total", sa.Integer(), nullable=False, comment="Distinct models in product"
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("product_id"),
+        comment="Computed product make cost breakdowns",
+    )
+    op.create_index(
+        "ix_product_cost_snapshots_tenant_make_cost",
+        "product_cost_snapshots",
+        ["tenant_id", "total_make_cost"],
+    )
+
+    # Enable RLS (PostgreSQL only)
+    _enable_rls("model_cost_snapshots")
+    _enable_rls("product_cost_snapshots")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_product_cost_snapshots_tenant_make_cost", table_name="product_cost_snapshots")
+    op.drop_table("product_cost_snapshots")
+    op.drop_index("ix_model_cost_snapshots_tenant_total", table_name="model_cost_snapshots")
+    op.drop_table("model_cost_snapshots")
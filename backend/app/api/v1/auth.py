@@ -63,7 +63,7 @@ async def register(
 
     # Create new user
     new_user = User(email=user_data.email, full_name=user_data.full_name, is_active=True)
-    new_user.set_password(user_data.password)
+    await new_user.set_password_async(user_data.password)
 
     db.add(new_user)
     await db.flush()  # Get user ID
@@ -109,7 +109,7 @@ async def login(
     result = await db.execute(select(User).where(User.email == credentials.email))
     user = result.scalar_one_or_none()
 
-    if not user or not user.verify_password(credentials.password):
+    if not user or not await user.verify_password_async(credentials.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -131,6 +131,10 @@ async def login(
             detail="User has no associated workspace",
         )
 
+    # Persist a hash upgraded to the current bcrypt cost during verification
+    if db.is_modified(user):
+        await db.commit()
+
     # Create tokens
     token_data = {
         "user_id": str(user.id),
@@ -281,7 +285,7 @@ async def reset_password(
         )
 
     # Update password
-    user.set_password(reset_data.new_password)
+    await user.set_password_async(reset_data.new_password)
 
     # Clear reset token
     user.reset_token = None
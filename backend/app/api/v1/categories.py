@@ -18,6 +18,9 @@ from app.schemas.category import (
     CategoryUpdate,
     slugify,
 )
+from app.services.cache_service import invalidate_category_change, invalidate_on_product_change
+from app.services.category_counts import refresh_category_counts
+from app.services.shop_projection import mark_products_changed
 
 router = APIRouter()
 
@@ -153,6 +156,7 @@ async def create_category(
 
     db.add(category)
     await db.commit()
+    await invalidate_category_change(str(tenant.id))
     await db.refresh(category)
 
     return CategoryResponse(
@@ -208,6 +212,7 @@ async def update_category(
         setattr(category, field, value)
 
     await db.commit()
+    await invalidate_category_change(str(tenant.id))
     await db.refresh(category)
 
     # Get product count
@@ -257,6 +262,7 @@ async def delete_category(
         category.is_active = False
 
     await db.commit()
+    await invalidate_category_change(str(tenant.id))
     return None
 
 
@@ -347,7 +353,10 @@ async def add_product_to_category(
             category_id=category_id,
         )
     )
+    mark_products_changed(db, product_id)
+    await refresh_category_counts(db, tenant.id)
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
     return None
 
 
@@ -384,6 +393,9 @@ async def remove_product_from_category(
             product_categories.c.category_id == category_id,
         )
     )
+    mark_products_changed(db, product_id)
+    await refresh_category_counts(db, tenant.id)
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
 
     return None
@@ -26,6 +26,7 @@ from app.schemas.consumable import (
     LowStockAlert,
     StockAdjustment,
 )
+from app.services.cache_service import invalidate_on_inventory_change
 
 router = APIRouter()
 
@@ -224,6 +225,7 @@ async def update_consumable_type(
         setattr(consumable, field, value)
 
     await db.commit()
+    await invalidate_on_inventory_change(str(tenant.id))
     await db.refresh(consumable)
 
     return ConsumableTypeResponse(**consumable_type_to_response(consumable))
@@ -403,6 +405,7 @@ async def create_purchase(
     consumable.current_cost_per_unit = cost_per_unit
 
     await db.commit()
+    await invalidate_on_inventory_change(str(tenant.id))
     await db.refresh(purchase)
 
     return ConsumablePurchaseResponse(**purchase_to_response(purchase))
@@ -525,6 +528,7 @@ async def delete_purchase(
 
     await db.delete(purchase)
     await db.commit()
+    await invalidate_on_inventory_change(str(tenant.id))
 
 
 # =============================================================================
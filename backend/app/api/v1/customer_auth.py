@@ -74,7 +74,7 @@ async def register_customer(
         marketing_consent=data.marketing_consent,
         marketing_consent_at=datetime.now(timezone.utc) if data.marketing_consent else None,
     )
-    customer.set_password(data.password)
+    await customer.set_password_async(data.password)
 
     # Generate email verification token
     verification_token = customer.generate_verification_token()
@@ -136,7 +136,7 @@ async def login_customer(
     )
     customer = result.scalar_one_or_none()
 
-    if not customer or not customer.verify_password(data.password):
+    if not customer or not await customer.verify_password_async(data.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -314,7 +314,7 @@ async def reset_password(
         )
 
     # Update password
-    customer.set_password(data.password)
+    await customer.set_password_async(data.password)
     customer.reset_token = None
     customer.reset_token_expires = None
     await db.commit()
@@ -418,14 +418,14 @@ async def change_password(
     Change password (requires authentication).
     """
     # Verify current password
-    if not customer.verify_password(data.current_password):
+    if not await customer.verify_password_async(data.current_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
         )
 
     # Update password
-    customer.set_password(data.new_password)
+    await customer.set_password_async(data.new_password)
     await db.commit()
 
     return {"message": "Password changed successfully"}
@@ -10,13 +10,14 @@ Provides dashboard data for the authenticated home page including:
 - Failure analytics
 """
 
-from datetime import datetime, timedelta
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import select, func, and_, case
+from sqlalchemy import Date, select, func, and_, case, cast, literal_column
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -26,6 +27,7 @@ from app.models.spool import Spool
 from app.models.filament_type import FilamentType
 from app.models.inventory_transaction import InventoryTransaction, TransactionType
 from app.auth.dependencies import CurrentTenant
+from app.services.cache_service import get_cache_service
 
 
 router = APIRouter(tags=["dashboard"])
@@ -154,30 +156,134 @@ class FailureAnalytics(BaseModel):
     failure_rate: float = Field(description="Percentage of runs that failed")
 
 
-# Endpoints
+# Aggregation helpers
 
 
-@router.get("/summary", response_model=DashboardSummary)
-async def get_dashboard_summary(
-    low_stock_threshold: int = Query(
-        10, ge=1, le=100, description="Low stock threshold percentage"
-    ),
-    db: AsyncSession = Depends(get_db),
-    tenant: CurrentTenant = None,
-):
+@dataclass(frozen=True)
+class _DailyRunStats:
+    """Production totals for a single day (keyed by completed_at date)."""
+
+    runs_completed: int = 0
+    runs_failed: int = 0
+    items_completed: int = 0
+    items_failed: int = 0
+
+
+_EMPTY_DAY = _DailyRunStats()
+
+
+def _day_bucket(dialect: str, column):
     """
-    Get dashboard summary statistics.
+    Truncate a timestamp column to its calendar day.
 
-    Returns counts for active prints, completions/failures today,
-    low stock alerts, and 7-day success rate.
+    PostgreSQL uses date_trunc (cast back to DATE); SQLite uses date(),
+    which returns an ISO 'YYYY-MM-DD' string.
     """
+    if dialect == "postgresql":
+        return cast(func.date_trunc(literal_column("'day'"), column), Date)
+    return func.date(column)
+
+
+def _count_if(dialect: str, column, condition):
+    """COUNT(column) restricted to rows matching condition."""
+    if dialect == "postgresql":
+        return func.count(column).filter(condition)
+    return func.sum(case((condition, 1), else_=0))
+
+
+def _sum_if(dialect: str, column, condition):
+    """SUM(column) restricted to rows matching condition."""
+    if dialect == "postgresql":
+        return func.sum(column).filter(condition)
+    return func.sum(case((condition, column), else_=0))
+
+
+def _bucket_key(value) -> str:
+    """Normalize a day bucket (date on PostgreSQL, str on SQLite) to an ISO string."""
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+async def _aggregate_daily_run_stats(
+    db: AsyncSession, tenant_id: UUID, start_date: date
+) -> dict[str, _DailyRunStats]:
+    """
+    Aggregate run and item counts per day since start_date.
+
+    Issues exactly two grouped queries regardless of the length of the
+    period, instead of one query per metric per day.
+
+    Returns:
+        Mapping of ISO date string to that day's totals (days without
+        activity are omitted)
+    """
+    dialect = db.bind.dialect.name if db.bind else "postgresql"
+    day = _day_bucket(dialect, ProductionRun.completed_at).label("day")
+    is_completed = ProductionRun.status == "completed"
+    is_failed = ProductionRun.status == "failed"
+
+    runs_result = await db.execute(
+        select(
+            day,
+            _count_if(dialect, ProductionRun.id, is_completed),
+            _count_if(dialect, ProductionRun.id, is_failed),
+        )
+        .where(
+            and_(
+                ProductionRun.tenant_id == tenant_id,
+                ProductionRun.status.in_(("completed", "failed")),
+                day >= start_date,
+            )
+        )
+        .group_by(day)
+    )
+
+    items_result = await db.execute(
+        select(
+            day,
+            _sum_if(dialect, ProductionRunItem.successful_quantity, is_completed),
+            func.sum(ProductionRunItem.failed_quantity),
+        )
+        .select_from(ProductionRunItem)
+        .join(ProductionRun, ProductionRunItem.production_run_id == ProductionRun.id)
+        .where(
+            and_(
+                ProductionRun.tenant_id == tenant_id,
+                day >= start_date,
+            )
+        )
+        .group_by(day)
+    )
+
+    stats: dict[str, _DailyRunStats] = {}
+    for bucket, completed, failed in runs_result.all():
+        stats[_bucket_key(bucket)] = _DailyRunStats(
+            runs_completed=int(completed or 0),
+            runs_failed=int(failed or 0),
+        )
+    for bucket, items_completed, items_failed in items_result.all():
+        key = _bucket_key(bucket)
+        stats[key] = replace(
+            stats.get(key, _EMPTY_DAY),
+            items_completed=int(items_completed or 0),
+            items_failed=int(items_failed or 0),
+        )
+    return stats
+
+
+# Endpoints
+
+
+async def _compute_dashboard_summary(
+    db: AsyncSession, tenant_id: UUID, low_stock_threshold: int
+) -> DashboardSummary:
+    """Compute dashboard summary statistics from the database."""
     today = datetime.now().date()
     seven_days_ago = today - timedelta(days=7)
 
     # Active prints count
     active_result = await db.execute(
         select(func.count(ProductionRun.id)).where(
-            and_(ProductionRun.tenant_id == tenant.id, ProductionRun.status == "in_progress")
+            and_(ProductionRun.tenant_id == tenant_id, ProductionRun.status == "in_progress")
         )
     )
     active_prints = active_result.scalar() or 0
@@ -186,7 +292,7 @@ async def get_dashboard_summary(
     completed_result = await db.execute(
         select(func.count(ProductionRun.id)).where(
             and_(
-                ProductionRun.tenant_id == tenant.id,
+                ProductionRun.tenant_id == tenant_id,
                 ProductionRun.status == "completed",
                 func.date(ProductionRun.completed_at) == today,
             )
@@ -198,7 +304,7 @@ async def get_dashboard_summary(
     failed_result = await db.execute(
         select(func.count(ProductionRun.id)).where(
             and_(
-                ProductionRun.tenant_id == tenant.id,
+                ProductionRun.tenant_id == tenant_id,
                 ProductionRun.status == "failed",
                 func.date(ProductionRun.completed_at) == today,
             )
@@ -210,7 +316,7 @@ async def get_dashboard_summary(
     cancelled_result = await db.execute(
         select(func.count(ProductionRun.id)).where(
             and_(
-                ProductionRun.tenant_id == tenant.id,
+                ProductionRun.tenant_id == tenant_id,
                 ProductionRun.status == "cancelled",
                 func.date(ProductionRun.completed_at) == today,
             )
@@ -222,7 +328,7 @@ async def get_dashboard_summary(
     low_stock_result = await db.execute(
         select(func.count(Spool.id)).where(
             and_(
-                Spool.tenant_id == tenant.id,
+                Spool.tenant_id == tenant_id,
                 Spool.is_active.is_(True),
                 Spool.initial_weight > 0,
                 (Spool.current_weight / Spool.initial_weight * 100) < low_stock_threshold,
@@ -235,7 +341,7 @@ async def get_dashboard_summary(
     seven_day_completed = await db.execute(
         select(func.count(ProductionRun.id)).where(
             and_(
-                ProductionRun.tenant_id == tenant.id,
+                ProductionRun.tenant_id == tenant_id,
                 ProductionRun.status == "completed",
                 func.date(ProductionRun.completed_at) >= seven_days_ago,
             )
@@ -246,7 +352,7 @@ async def get_dashboard_summary(
     seven_day_failed = await db.execute(
         select(func.count(ProductionRun.id)).where(
             and_(
-                ProductionRun.tenant_id == tenant.id,
+                ProductionRun.tenant_id == tenant_id,
                 ProductionRun.status == "failed",
                 func.date(ProductionRun.completed_at) >= seven_days_ago,
             )
@@ -261,7 +367,7 @@ async def get_dashboard_summary(
     waste_result = await db.execute(
         select(func.coalesce(func.sum(func.abs(InventoryTransaction.weight_change)), 0)).where(
             and_(
-                InventoryTransaction.tenant_id == tenant.id,
+                InventoryTransaction.tenant_id == tenant_id,
                 InventoryTransaction.transaction_type == TransactionType.WASTE,
                 func.date(InventoryTransaction.created_at) >= seven_days_ago,
             )
@@ -280,6 +386,31 @@ async def get_dashboard_summary(
     )
 
 
+@router.get("/summary", response_model=DashboardSummary)
+async def get_dashboard_summary(
+    low_stock_threshold: int = Query(
+        10, ge=1, le=100, description="Low stock threshold percentage"
+    ),
+    db: AsyncSession = Depends(get_db),
+    tenant: CurrentTenant = None,
+):
+    """
+    Get dashboard summary statistics.
+
+    Returns counts for active prints, completions/failures today,
+    low stock alerts, and 7-day success rate. Cached per tenant for
+    DASHBOARD_TTL; concurrent requests share a single recomputation.
+    """
+
+    async def load() -> dict:
+        summary = await _compute_dashboard_summary(db, tenant.id, low_stock_threshold)
+        return summary.model_dump(mode="json")
+
+    cache = await get_cache_service()
+    data = await cache.get_or_set_dashboard(str(tenant.id), f"summary:{low_stock_threshold}", load)
+    return DashboardSummary.model_validate(data)
+
+
 @router.get("/active-production", response_model=list[ActiveProductionRun])
 async def get_active_production(
     db: AsyncSession = Depends(get_db),
@@ -429,46 +560,23 @@ async def get_recent_activity(
     return activity
 
 
-@router.get("/performance-charts", response_model=PerformanceChartData)
-async def get_performance_data(
-    days: int = Query(7, ge=1, le=90, description="Number of days to include"),
-    db: AsyncSession = Depends(get_db),
-    tenant: CurrentTenant = None,
-):
-    """
-    Get performance chart data for dashboard visualization.
-
-    Returns success rate trends, material usage, and daily production data.
-    """
+async def _compute_performance_data(
+    db: AsyncSession, tenant_id: UUID, days: int
+) -> PerformanceChartData:
+    """Compute performance chart data from the database."""
     today = datetime.now().date()
     start_date = today - timedelta(days=days - 1)
 
+    # Per-day run and item totals for the whole period (two grouped queries)
+    daily_stats = await _aggregate_daily_run_stats(db, tenant_id, start_date)
+
     # Success rate trend by day
     success_trend = []
     for i in range(days):
         date = start_date + timedelta(days=i)
-
-        completed_result = await db.execute(
-            select(func.count(ProductionRun.id)).where(
-                and_(
-                    ProductionRun.tenant_id == tenant.id,
-                    ProductionRun.status == "completed",
-                    func.date(ProductionRun.completed_at) == date,
-                )
-            )
-        )
-        completed = completed_result.scalar() or 0
-
-        failed_result = await db.execute(
-            select(func.count(ProductionRun.id)).where(
-                and_(
-                    ProductionRun.tenant_id == tenant.id,
-                    ProductionRun.status == "failed",
-                    func.date(ProductionRun.completed_at) == date,
-                )
-            )
-        )
-        failed = failed_result.scalar() or 0
+        stats = daily_stats.get(date.isoformat(), _EMPTY_DAY)
+        completed = stats.runs_completed
+        failed = stats.runs_failed
 
         total = completed + failed
         rate = (completed / total * 100) if total > 0 else 100.0
@@ -513,7 +621,7 @@ async def get_performance_data(
         .join(FilamentType, Spool.filament_type_id == FilamentType.id)
         .where(
             and_(
-                ProductionRun.tenant_id == tenant.id,
+                ProductionRun.tenant_id == tenant_id,
                 ProductionRun.status == "completed",
                 func.date(ProductionRun.completed_at) >= start_date,
             )
@@ -536,54 +644,14 @@ async def get_performance_data(
     daily_production = []
     for i in range(days):
         date = start_date + timedelta(days=i)
-
-        # Count items from completed runs
-        completed_items_result = await db.execute(
-            select(func.sum(ProductionRunItem.successful_quantity))
-            .select_from(ProductionRunItem)
-            .join(ProductionRun, ProductionRunItem.production_run_id == ProductionRun.id)
-            .where(
-                and_(
-                    ProductionRun.tenant_id == tenant.id,
-                    ProductionRun.status == "completed",
-                    func.date(ProductionRun.completed_at) == date,
-                )
-            )
-        )
-        items_completed = completed_items_result.scalar() or 0
-
-        # Count failed items
-        failed_items_result = await db.execute(
-            select(func.sum(ProductionRunItem.failed_quantity))
-            .select_from(ProductionRunItem)
-            .join(ProductionRun, ProductionRunItem.production_run_id == ProductionRun.id)
-            .where(
-                and_(
-                    ProductionRun.tenant_id == tenant.id,
-                    func.date(ProductionRun.completed_at) == date,
-                )
-            )
-        )
-        items_failed = failed_items_result.scalar() or 0
-
-        # Count completed runs
-        runs_result = await db.execute(
-            select(func.count(ProductionRun.id)).where(
-                and_(
-                    ProductionRun.tenant_id == tenant.id,
-                    ProductionRun.status == "completed",
-                    func.date(ProductionRun.completed_at) == date,
-                )
-            )
-        )
-        runs_completed = runs_result.scalar() or 0
+        stats = daily_stats.get(date.isoformat(), _EMPTY_DAY)
 
         daily_production.append(
             DailyProduction(
                 date=date.isoformat(),
-                items_completed=items_completed,
-                items_failed=items_failed,
-                runs_completed=runs_completed,
+                items_completed=stats.items_completed,
+                items_failed=stats.items_failed,
+                runs_completed=stats.runs_completed,
             )
         )
 
@@ -594,6 +662,28 @@ async def get_performance_data(
     )
 
 
+@router.get("/performance-charts", response_model=PerformanceChartData)
+async def get_performance_data(
+    days: int = Query(7, ge=1, le=90, description="Number of days to include"),
+    db: AsyncSession = Depends(get_db),
+    tenant: CurrentTenant = None,
+):
+    """
+    Get performance chart data for dashboard visualization.
+
+    Returns success rate trends, material usage, and daily production data.
+    Cached per tenant and period for DASHBOARD_TTL.
+    """
+
+    async def load() -> dict:
+        data = await _compute_performance_data(db, tenant.id, days)
+        return data.model_dump(mode="json")
+
+    cache = await get_cache_service()
+    data = await cache.get_or_set_dashboard(str(tenant.id), f"performance:{days}", load)
+    return PerformanceChartData.model_validate(data)
+
+
 @router.get("/failure-analytics", response_model=FailureAnalytics)
 async def get_failure_analytics(
     days: int = Query(30, ge=1, le=90, description="Number of days to analyze"),
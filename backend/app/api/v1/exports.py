@@ -3,10 +3,14 @@ CSV Export API endpoints.
 
 Provides endpoints to download products, orders, and inventory
 in Shopify-compatible CSV format.
+
+Exports are streamed as they are generated, so the first bytes arrive
+immediately and memory use does not depend on the export size. Pass
+``gzip=true`` to download a gzip-compressed ``.csv.gz`` instead.
 """
 
 from datetime import date
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import StreamingResponse
@@ -14,13 +18,33 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import CurrentTenant
 from app.database import get_db
-from app.services.export_service import get_export_service
+from app.services.export_service import get_export_service, gzip_chunks
 
 router = APIRouter()
 
 
+def csv_download(chunks: AsyncIterator[str], filename: str, gzip: bool) -> StreamingResponse:
+    """Stream CSV chunks as a file download, optionally gzip-compressed."""
+    if gzip:
+        return StreamingResponse(
+            gzip_chunks(chunks),
+            media_type="application/gzip",
+            headers={"Content-Disposition": f'attachment; filename="{filename}.gz"'},
+        )
+
+    return StreamingResponse(
+        (chunk.encode("utf-8") async for chunk in chunks),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Type": "text/csv; charset=utf-8",
+        },
+    )
+
+
 @router.get("/products")
 async def export_products_csv(
+    gzip: bool = Query(False, description="Download as a gzip-compressed .csv.gz"),
     db: AsyncSession = Depends(get_db),
     tenant: CurrentTenant = None,
 ):
@@ -31,23 +55,15 @@ async def export_products_csv(
     using their product import feature.
     """
     service = get_export_service(db, tenant)
-    csv_content = await service.export_products_csv()
-
     filename = f"products_{date.today().isoformat()}.csv"
 
-    return StreamingResponse(
-        iter([csv_content]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-            "Content-Type": "text/csv; charset=utf-8",
-        },
-    )
+    return csv_download(service.stream_products_csv(), filename, gzip)
 
 
 @router.get("/inventory")
 async def export_inventory_csv(
     location: str = Query("Default", description="Inventory location name"),
+    gzip: bool = Query(False, description="Download as a gzip-compressed .csv.gz"),
     db: AsyncSession = Depends(get_db),
     tenant: CurrentTenant = None,
 ):
@@ -57,18 +73,9 @@ async def export_inventory_csv(
     Returns a CSV file for updating stock levels in Shopify.
     """
     service = get_export_service(db, tenant)
-    csv_content = await service.export_inventory_csv(location=location)
-
     filename = f"inventory_{date.today().isoformat()}.csv"
 
-    return StreamingResponse(
-        iter([csv_content]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-            "Content-Type": "text/csv; charset=utf-8",
-        },
-    )
+    return csv_download(service.stream_inventory_csv(location=location), filename, gzip)
 
 
 @router.get("/orders")
@@ -77,6 +84,7 @@ async def export_orders_csv(
     end_date: Optional[date] = Query(None, description="Filter orders to this date"),
     status: Optional[str] = Query(None, description="Filter by order status"),
     format: str = Query("shopify", description="Export format: 'shopify' or 'accounting'"),
+    gzip: bool = Query(False, description="Download as a gzip-compressed .csv.gz"),
     db: AsyncSession = Depends(get_db),
     tenant: CurrentTenant = None,
 ):
@@ -92,24 +100,17 @@ async def export_orders_csv(
     service = get_export_service(db, tenant)
 
     if format == "accounting":
-        csv_content = await service.export_orders_accounting_csv(
+        chunks = service.stream_orders_accounting_csv(
             start_date=start_date,
             end_date=end_date,
         )
         filename = f"orders_accounting_{date.today().isoformat()}.csv"
     else:
-        csv_content = await service.export_orders_csv(
+        chunks = service.stream_orders_csv(
             start_date=start_date,
             end_date=end_date,
             status=status,
         )
         filename = f"orders_{date.today().isoformat()}.csv"
 
-    return StreamingResponse(
-        iter([csv_content]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-            "Content-Type": "text/csv; charset=utf-8",
-        },
-    )
+    return csv_download(chunks, filename, gzip)
@@ -3,8 +3,18 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, status
-from fastapi.responses import Response
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import RedirectResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import CurrentTenant, CurrentUser
@@ -18,9 +28,16 @@ from app.schemas.model_file import (
     ModelFileResponse,
     ModelFileUpdate,
     ModelFileUploadResponse,
+    ModelFileUploadSessionCreate,
+    ModelFileUploadSessionResponse,
     ModelFileType as SchemaFileType,
 )
-from app.services.model_file_service import ModelFileService, ModelFileStorageError
+from app.services.model_file_service import (
+    ModelFileService,
+    ModelFileStorageError,
+    UploadOffsetError,
+)
+from app.utils.file_streaming import stream_file_response
 
 router = APIRouter()
 
@@ -71,17 +88,15 @@ async def upload_file(
 
     Supports STL, 3MF, and gcode files up to 500MB.
     File type must be specified (source_stl, source_3mf, slicer_project, gcode, plate_layout).
+    The spooled upload is streamed to storage in chunks rather than read into memory;
+    use the resumable upload endpoints for unreliable connections.
     """
     service = get_file_service(db, tenant, user)
 
     try:
-        # Read file content
-        content = await file.read()
-
-        # Upload file
-        model_file = await service.upload_file(
+        model_file = await service.upload_file_stream(
             model_id=model_id,
-            file_content=content,
+            source=file.file,
             content_type=file.content_type or "application/octet-stream",
             original_filename=file.filename or "unnamed",
             file_type=ModelFileType(file_type.value),
@@ -170,6 +185,175 @@ async def validate_local_path(
     return LocalPathValidationResponse(**result)
 
 
+async def get_upload_or_404(
+    service: ModelFileService, model_id: UUID, upload_id: UUID, for_update: bool = False
+):
+    """Fetch an in-progress upload for a model, or raise 404."""
+    upload = await service.get_upload(upload_id, for_update=for_update)
+    if not upload or upload.model_id != model_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload not found",
+        )
+    return upload
+
+
+@router.post(
+    "/{model_id}/files/uploads",
+    response_model=ModelFileUploadSessionResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Start a resumable upload",
+    description="Start a chunked upload that can be resumed after a dropped connection.",
+)
+async def start_upload(
+    model_id: UUID,
+    data: ModelFileUploadSessionCreate,
+    user: CurrentUser = None,
+    tenant: CurrentTenant = None,
+    db: AsyncSession = Depends(get_db),
+) -> ModelFileUploadSessionResponse:
+    """
+    Start a resumable upload.
+
+    Send the file with PUT requests to the returned upload, each carrying the
+    next chunk as the raw request body and its starting byte offset. After a
+    dropped connection, GET the upload and continue from received_size. When
+    all bytes are received, POST to /complete to create the file.
+    """
+    service = get_file_service(db, tenant, user)
+
+    try:
+        upload = await service.start_upload(
+            model_id=model_id,
+            original_filename=data.filename,
+            content_type=data.content_type,
+            total_size=data.total_size,
+            file_type=ModelFileType(data.file_type.value),
+            part_name=data.part_name,
+            version=data.version,
+            is_primary=data.is_primary,
+            notes=data.notes,
+        )
+    except ModelFileStorageError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    return ModelFileUploadSessionResponse.model_validate(upload)
+
+
+@router.get(
+    "/{model_id}/files/uploads/{upload_id}",
+    response_model=ModelFileUploadSessionResponse,
+    summary="Get upload progress",
+    description="Get a resumable upload's progress to find the offset to resume from.",
+)
+async def get_upload(
+    model_id: UUID,
+    upload_id: UUID,
+    user: CurrentUser = None,
+    tenant: CurrentTenant = None,
+    db: AsyncSession = Depends(get_db),
+) -> ModelFileUploadSessionResponse:
+    """Get a resumable upload's progress."""
+    service = get_file_service(db, tenant, user)
+    upload = await get_upload_or_404(service, model_id, upload_id)
+    return ModelFileUploadSessionResponse.model_validate(upload)
+
+
+@router.put(
+    "/{model_id}/files/uploads/{upload_id}",
+    response_model=ModelFileUploadSessionResponse,
+    summary="Upload a chunk",
+    description="Append the raw request body to a resumable upload at the given offset.",
+)
+async def upload_chunk(
+    request: Request,
+    model_id: UUID,
+    upload_id: UUID,
+    offset: int = Query(..., ge=0, description="Byte offset of this chunk in the file"),
+    user: CurrentUser = None,
+    tenant: CurrentTenant = None,
+    db: AsyncSession = Depends(get_db),
+) -> ModelFileUploadSessionResponse:
+    """
+    Upload a chunk.
+
+    The body is streamed to the staging file as it arrives. Returns 409 if
+    the offset does not match the bytes already received.
+    """
+    service = get_file_service(db, tenant, user)
+    upload = await get_upload_or_404(service, model_id, upload_id)
+
+    try:
+        upload = await service.append_upload_chunk(upload, offset, request.stream())
+    except UploadOffsetError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        )
+    except ModelFileStorageError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    return ModelFileUploadSessionResponse.model_validate(upload)
+
+
+@router.post(
+    "/{model_id}/files/uploads/{upload_id}/complete",
+    response_model=ModelFileUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Complete a resumable upload",
+    description="Create the model file once every byte of a resumable upload is received.",
+)
+async def complete_upload(
+    model_id: UUID,
+    upload_id: UUID,
+    user: CurrentUser = None,
+    tenant: CurrentTenant = None,
+    db: AsyncSession = Depends(get_db),
+) -> ModelFileUploadResponse:
+    """Complete a resumable upload."""
+    service = get_file_service(db, tenant, user)
+    upload = await get_upload_or_404(service, model_id, upload_id, for_update=True)
+    filename = upload.original_filename
+
+    try:
+        model_file = await service.complete_upload(upload)
+    except ModelFileStorageError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    return ModelFileUploadResponse(
+        file=ModelFileResponse.model_validate(model_file),
+        message=f"File '{filename}' uploaded successfully",
+    )
+
+
+@router.delete(
+    "/{model_id}/files/uploads/{upload_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Abort a resumable upload",
+    description="Discard a resumable upload and the chunks received so far.",
+)
+async def abort_upload(
+    model_id: UUID,
+    upload_id: UUID,
+    user: CurrentUser = None,
+    tenant: CurrentTenant = None,
+    db: AsyncSession = Depends(get_db),
+) -> None:
+    """Abort a resumable upload."""
+    service = get_file_service(db, tenant, user)
+    upload = await get_upload_or_404(service, model_id, upload_id, for_update=True)
+    await service.abort_upload(upload)
+
+
 @router.get(
     "/{model_id}/files",
     response_model=ModelFileListResponse,
@@ -279,6 +463,7 @@ async def get_file(
     },
 )
 async def download_file(
+    request: Request,
     model_id: UUID,
     file_id: UUID,
     user: CurrentUser = None,
@@ -288,7 +473,9 @@ async def download_file(
     """
     Download a model file.
 
-    Returns the file content with appropriate headers for download.
+    Streams the file in chunks and honours Range requests, so large gcode
+    and 3MF files never sit in memory. With presigned downloads enabled on
+    S3 storage, redirects to a short-lived presigned URL instead.
     """
     service = get_file_service(db, tenant, user)
 
@@ -300,24 +487,25 @@ async def download_file(
             detail="File not found",
         )
 
-    try:
-        content, content_type, filename = await service.get_file_content(file_id)
-
-        return Response(
-            content=content,
-            media_type=content_type,
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"',
-                "Content-Length": str(len(content)),
-            },
-        )
+    presigned_url = service.presigned_download_url(model_file)
+    if presigned_url:
+        return RedirectResponse(presigned_url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
 
+    try:
+        stored = await service.open_file(model_file)
     except ModelFileStorageError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         )
 
+    filename = model_file.original_filename.replace('"', "")
+    return stream_file_response(
+        request,
+        stored,
+        {"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
 
 @router.patch(
     "/{model_id}/files/{file_id}",
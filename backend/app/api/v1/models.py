@@ -29,6 +29,7 @@ from app.schemas.model import (
     ModelResponse,
     ModelUpdate,
 )
+from app.services.cache_service import invalidate_on_inventory_change
 from app.services.costing import CostingService
 from app.utils.csv_handler import (
     CSVImportError,
@@ -350,6 +351,7 @@ async def update_model(
         setattr(model, field, value)
 
     await db.commit()
+    await invalidate_on_inventory_change(str(tenant.id))
     await db.refresh(model)
 
     return ModelDetailResponse(**await model_with_cost(model))
@@ -386,6 +388,7 @@ async def delete_model(
     # Soft delete
     model.is_active = False
     await db.commit()
+    await invalidate_on_inventory_change(str(tenant.id))
 
 
 # ==================== BOM (Model Materials) Management ====================
@@ -433,6 +436,7 @@ async def add_model_material(
 
     db.add(material)
     await db.commit()
+    await invalidate_on_inventory_change(str(tenant.id))
     await db.refresh(material)
 
     return ModelMaterialResponse.model_validate(material)
@@ -474,6 +478,7 @@ async def remove_model_material(
 
     await db.delete(material)
     await db.commit()
+    await invalidate_on_inventory_change(str(tenant.id))
 
 
 # ==================== Component Management ====================
@@ -513,6 +518,7 @@ async def add_model_component(
 
     db.add(component)
     await db.commit()
+    await invalidate_on_inventory_change(str(tenant.id))
     await db.refresh(component)
 
     return ModelComponentResponse.model_validate(component)
@@ -554,6 +560,7 @@ async def remove_model_component(
 
     await db.delete(component)
     await db.commit()
+    await invalidate_on_inventory_change(str(tenant.id))
 
 
 # ==================== CSV Import/Export ====================
@@ -676,6 +683,7 @@ async def import_models_csv(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to save models: {str(e)}",
         )
+    await invalidate_on_inventory_change(str(tenant.id))
 
     return {
         "success": True,
@@ -15,7 +15,11 @@ from app.database import get_db
 from app.models.order import Order, OrderItem, OrderStatus
 from app.models.product import Product
 from app.models.sales_channel import SalesChannel
+from app.models.webhook import WebhookEventType
 from app.auth.dependencies import CurrentTenant, RequireAdmin
+from app.services import outbox
+from app.services.cache_service import invalidate_on_inventory_change, invalidate_on_order_complete
+from app.utils.pagination import InvalidCursorError, encode_cursor, paginate_keyset
 
 router = APIRouter()
 
@@ -80,10 +84,12 @@ class OrderListResponse(BaseModel):
     """Paginated order list response."""
 
     data: list[OrderResponse]
-    total: int
+    total: Optional[int] = None  # Omitted in cursor mode unless include_total is set
     page: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = None  # Pass as 'after' for the next page
+    prev_cursor: Optional[str] = None  # Pass as 'before' for the previous page
 
 
 class UpdateOrderRequest(BaseModel):
@@ -295,6 +301,7 @@ async def create_order(
         )
 
     await db.commit()
+    await invalidate_on_order_complete(str(tenant.id))
 
     result = await db.execute(
         select(Order)
@@ -315,17 +322,23 @@ async def list_orders(
     date_to: Optional[date] = Query(None, description="Filter orders to this date (inclusive)"),
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    after: Optional[str] = Query(None, description="Cursor: return the page after this one"),
+    before: Optional[str] = Query(None, description="Cursor: return the page before this one"),
+    include_total: bool = Query(False, description="Count total matches in cursor mode"),
     db: AsyncSession = Depends(get_db),
     tenant: CurrentTenant = None,
 ):
-    """List all orders for the current tenant with filtering options."""
+    """
+    List all orders for the current tenant with filtering options.
+
+    Passing an ``after``/``before`` cursor switches to keyset pagination over
+    (created_at, id); ``page`` is then ignored and the total is only counted
+    when ``include_total`` is set.
+    """
+    use_cursor = bool(after or before)
+
     # Build base query
-    query = (
-        select(Order)
-        .where(Order.tenant_id == tenant.id)
-        .options(selectinload(Order.items))
-        .order_by(desc(Order.created_at))
-    )
+    query = select(Order).where(Order.tenant_id == tenant.id).options(selectinload(Order.items))
 
     # Build count query with same filters
     count_query = select(func.count(Order.id)).where(Order.tenant_id == tenant.id)
@@ -359,16 +372,37 @@ async def list_orders(
         query = query.where(Order.created_at <= to_datetime)
         count_query = count_query.where(Order.created_at <= to_datetime)
 
-    # Get total count with filters applied
-    count_result = await db.execute(count_query)
-    total = count_result.scalar() or 0
+    # Get total count with filters applied (optional in cursor mode)
+    total = None
+    if not use_cursor or include_total:
+        count_result = await db.execute(count_query)
+        total = count_result.scalar() or 0
 
-    # Apply pagination
-    query = query.offset((page - 1) * limit).limit(limit)
+    next_cursor = prev_cursor = None
+    if use_cursor:
+        try:
+            keyset_page = await paginate_keyset(
+                db, query, Order.created_at, Order.id, limit, after=after, before=before
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        orders = keyset_page.items
+        next_cursor, prev_cursor = keyset_page.next_cursor, keyset_page.prev_cursor
+        has_more = next_cursor is not None
+    else:
+        # Apply pagination
+        query = (
+            query.order_by(desc(Order.created_at), desc(Order.id))
+            .offset((page - 1) * limit)
+            .limit(limit)
+        )
 
-    # Execute query
-    result = await db.execute(query)
-    orders = result.scalars().all()
+        # Execute query
+        result = await db.execute(query)
+        orders = result.scalars().all()
+        has_more = page * limit < total
+        if orders and has_more:
+            next_cursor = encode_cursor(orders[-1].created_at, orders[-1].id)
 
     return OrderListResponse(
         data=[
@@ -420,7 +454,9 @@ async def list_orders(
         total=total,
         page=page,
         limit=limit,
-        has_more=page * limit < total,
+        has_more=has_more,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
     )
 
 
@@ -679,7 +715,38 @@ async def ship_order(
         order.tracking_url = request.tracking_url
     order.updated_at = datetime.now(timezone.utc)
 
+    # Third-party side effects run from the outbox once the shipment commits
+    outbox.enqueue(
+        db,
+        tenant.id,
+        outbox.EVENT_WEBHOOK,
+        {
+            "event_type": WebhookEventType.ORDER_SHIPPED.value,
+            "data": {
+                "order_id": str(order.id),
+                "order_number": order.order_number,
+                "tracking_number": order.tracking_number,
+                "tracking_url": order.tracking_url,
+            },
+        },
+    )
+    if order.payment_provider and "shopify" in order.payment_provider.lower() and order.payment_id:
+        # Sync fulfilment back to Shopify for orders that originated there
+        outbox.enqueue(
+            db,
+            tenant.id,
+            outbox.EVENT_SHOPIFY_FULFILLMENT,
+            {
+                "shopify_order_id": order.payment_id,
+                "tracking_number": order.tracking_number,
+                "tracking_url": order.tracking_url,
+                "shipping_method": order.shipping_method,
+            },
+        )
+
     await db.commit()
+    outbox.wake_outbox_dispatcher()
+    await invalidate_on_inventory_change(str(tenant.id))
 
     # Send shipped notification email
     try:
@@ -702,89 +769,9 @@ async def ship_order(
     except Exception as e:
         logger.error(f"Error sending shipped email for order {order.order_number}: {e}")
 
-    # Sync fulfilment back to Shopify if this order originated from Shopify
-    if order.payment_provider and "shopify" in order.payment_provider.lower() and order.payment_id:
-        try:
-            await _sync_shopify_fulfillment(
-                shopify_order_id=order.payment_id,
-                tracking_number=order.tracking_number,
-                tracking_url=order.tracking_url,
-                shipping_method=order.shipping_method,
-            )
-            logger.info(f"Synced fulfilment to Shopify for order {order.order_number}")
-        except Exception as e:
-            logger.error(
-                f"Failed to sync fulfilment to Shopify for order {order.order_number}: {e}"
-            )
-
     return {"message": f"Order {order.order_number} marked as shipped"}
 
 
-async def _sync_shopify_fulfillment(
-    shopify_order_id: str,
-    tracking_number: Optional[str],
-    tracking_url: Optional[str],
-    shipping_method: Optional[str],
-) -> None:
-    """Call Shopify Admin API to create a fulfilment for a Shopify order.
-
-    Only runs when SHOPIFY_STORE_DOMAIN and SHOPIFY_ACCESS_TOKEN are configured.
-    Failures are logged but do not fail the ship request.
-    """
-    import httpx
-
-    from app.config import get_settings
-
-    cfg = get_settings()
-    if not cfg.shopify_store_domain or not cfg.shopify_access_token:
-        return
-
-    base = f"https://{cfg.shopify_store_domain}/admin/api/2024-01"
-    headers = {
-        "X-Shopify-Access-Token": cfg.shopify_access_token,
-        "Content-Type": "application/json",
-    }
-
-    fulfillment_payload: dict = {
-        "fulfillment": {
-            "notify_customer": True,
-            "line_items_by_fulfillment_order": [],
-        }
-    }
-
-    if tracking_number:
-        fulfillment_payload["fulfillment"]["tracking_info"] = {
-            "number": tracking_number,
-            "url": tracking_url or "",
-            "company": shipping_method or "Carrier",
-        }
-
-    async with httpx.AsyncClient(timeout=10) as client:
-        # Fetch open fulfillment orders from Shopify
-        fo_resp = await client.get(
-            f"{base}/orders/{shopify_order_id}/fulfillment_orders.json",
-            headers=headers,
-        )
-        fo_resp.raise_for_status()
-        fulfillment_orders = fo_resp.json().get("fulfillment_orders", [])
-
-        for fo in fulfillment_orders:
-            if fo.get("status") in ("open", "in_progress"):
-                fulfillment_payload["fulfillment"]["line_items_by_fulfillment_order"].append(
-                    {"fulfillment_order_id": fo["id"]}
-                )
-
-        if not fulfillment_payload["fulfillment"]["line_items_by_fulfillment_order"]:
-            return
-
-        resp = await client.post(
-            f"{base}/fulfillments.json",
-            headers=headers,
-            json=fulfillment_payload,
-        )
-        resp.raise_for_status()
-
-
 @router.post("/{order_id}/deliver")
 async def deliver_order(
     order_id: UUID,
@@ -820,6 +807,7 @@ async def deliver_order(
     order.updated_at = datetime.now(timezone.utc)
 
     await db.commit()
+    await invalidate_on_order_complete(str(tenant.id))
 
     # Send delivered notification email
     try:
@@ -918,6 +906,7 @@ async def fulfill_order(
     low_stock_alerts = await service.check_low_stock_alerts(order)
 
     await db.commit()
+    await invalidate_on_inventory_change(str(tenant.id))
 
     return FulfillOrderResponse(
         message=f"Order {order.order_number} has been fulfilled",
@@ -1072,6 +1061,7 @@ async def refund_order(
     order.updated_at = datetime.now(timezone.utc)
 
     await db.commit()
+    await invalidate_on_inventory_change(str(tenant.id))
 
     # Send refund confirmation email
     try:
@@ -1149,6 +1139,7 @@ async def cancel_order(
     order.updated_at = datetime.now(timezone.utc)
 
     await db.commit()
+    await invalidate_on_inventory_change(str(tenant.id))
 
     # Send cancellation notification email
     try:
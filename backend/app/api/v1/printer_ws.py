@@ -1,11 +1,16 @@
 """WebSocket endpoint for live printer state broadcasting.
 
 Clients connect to /ws/printers?token=<JWT> and immediately receive the
-current state of all printers for their tenant.  State is polled every
-15 seconds for non-Bambu printers; on change the new state is broadcast.
+current state of all printers for their tenant.  One poller task per tenant
+polls non-Bambu printers every 15 seconds, however many dashboards are open,
+and fans changes out to every connection for that tenant.  The poller starts
+with the first connection and stops when the last one leaves.
 
-Message format:
+Message formats:
   { "type": "printer_state", "data": [ PrinterLiveState, ... ] }
+      Full snapshot: sent on connect and when printers are added or removed.
+  { "type": "printer_state_delta", "data": [ PrinterLiveState, ... ] }
+      Only the printers whose state changed since the previous message.
 """
 
 import asyncio
@@ -26,6 +31,10 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 POLL_INTERVAL = 15  # seconds between polls for non-Bambu printers
+POLL_CONCURRENCY = 10  # printers polled at once per tenant
+
+# Fields whose change triggers a broadcast (last_seen_at changes every poll)
+_TRACKED_FIELDS = ("status", "progress_percent", "job_name")
 
 
 # ---------------------------------------------------------------------------
@@ -33,16 +42,70 @@ POLL_INTERVAL = 15  # seconds between polls for non-Bambu printers
 # ---------------------------------------------------------------------------
 
 
+class TenantPrinterPoller:
+    """Polls one tenant's printers and broadcasts changes to its subscribers."""
+
+    def __init__(self, tenant_id: UUID, ws_manager: "PrinterWSManager") -> None:
+        self.tenant_id = tenant_id
+        self._manager = ws_manager
+        self._states: Optional[list[dict]] = None
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def snapshot(self) -> list[dict]:
+        """Latest states, waiting for the first poll if it has not finished."""
+        await self._ready.wait()
+        return self._states or []
+
+    async def poll_once(self) -> None:
+        """Poll all printers and broadcast what changed since the last poll."""
+        new_states = await _build_printer_live_states(self.tenant_id)
+        old_states, self._states = self._states, new_states
+
+        if not self._ready.is_set():
+            self._ready.set()
+            return
+
+        message = _state_message(old_states or [], new_states)
+        if message is not None:
+            await self._manager.broadcast_to_tenant(self.tenant_id, message)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.poll_once()
+            except Exception:
+                logger.exception("Printer poll failed for tenant %s", self.tenant_id)
+                # Let waiting connections proceed with whatever we have
+                self._ready.set()
+            await asyncio.sleep(POLL_INTERVAL)
+
+
 class PrinterWSManager:
-    """Tracks active WebSocket connections per tenant."""
+    """Tracks active WebSocket connections and the shared poller per tenant."""
 
     def __init__(self) -> None:
         # tenant_id → list of websocket connections
         self._connections: dict[UUID, list[WebSocket]] = {}
+        # tenant_id → poller shared by that tenant's connections
+        self._pollers: dict[UUID, TenantPrinterPoller] = {}
 
     async def connect(self, ws: WebSocket, tenant_id: UUID) -> None:
         await ws.accept()
         self._connections.setdefault(tenant_id, []).append(ws)
+        poller = self._pollers.get(tenant_id)
+        if poller is None:
+            poller = self._pollers[tenant_id] = TenantPrinterPoller(tenant_id, self)
+        poller.start()
         logger.debug(
             "WS connected: tenant=%s total=%d", tenant_id, len(self._connections[tenant_id])
         )
@@ -51,8 +114,18 @@ class PrinterWSManager:
         conns = self._connections.get(tenant_id, [])
         if ws in conns:
             conns.remove(ws)
+        if not conns:
+            self._connections.pop(tenant_id, None)
+            poller = self._pollers.pop(tenant_id, None)
+            if poller is not None:
+                poller.stop()
         logger.debug("WS disconnected: tenant=%s", tenant_id)
 
+    async def snapshot(self, tenant_id: UUID) -> list[dict]:
+        """Current printer states for a tenant with at least one connection."""
+        poller = self._pollers.get(tenant_id)
+        return await poller.snapshot() if poller is not None else []
+
     async def send(self, ws: WebSocket, data: dict) -> bool:
         """Send data to a single websocket.  Returns False on failure."""
         try:
@@ -62,12 +135,12 @@ class PrinterWSManager:
             return False
 
     async def broadcast_to_tenant(self, tenant_id: UUID, data: dict) -> None:
-        dead: list[WebSocket] = []
-        for ws in list(self._connections.get(tenant_id, [])):
-            if not await self.send(ws, data):
-                dead.append(ws)
-        for ws in dead:
-            self.disconnect(ws, tenant_id)
+        conns = list(self._connections.get(tenant_id, []))
+        # Send concurrently so one slow client does not delay the others
+        results = await asyncio.gather(*(self.send(ws, data) for ws in conns))
+        for ws, ok in zip(conns, results):
+            if not ok:
+                self.disconnect(ws, tenant_id)
 
 
 manager = PrinterWSManager()
@@ -94,8 +167,6 @@ async def _build_printer_live_states(tenant_id: UUID) -> list[dict]:
     """
     from app.services.printer_registry import get_printer_model
 
-    states: list[dict] = []
-
     async with async_session_maker() as db:
         # Fetch all active printers + their connections for this tenant
         result = await db.execute(
@@ -113,14 +184,16 @@ async def _build_printer_live_states(tenant_id: UUID) -> list[dict]:
             c.printer_id: c for c in conn_result.scalars().all()
         }
 
-    for printer in printers:
+    semaphore = asyncio.Semaphore(POLL_CONCURRENCY)
+
+    async def poll(printer: Printer) -> dict:
         conn = connections_by_printer.get(printer.id)
         model_info = get_printer_model(printer.model or "") if printer.model else None
+        async with semaphore:
+            return await _get_printer_state(printer, conn, model_info)
 
-        state = await _get_printer_state(printer, conn, model_info)
-        states.append(state)
-
-    return states
+    # gather preserves printer order
+    return list(await asyncio.gather(*(poll(printer) for printer in printers)))
 
 
 async def _get_printer_state(
@@ -204,18 +277,24 @@ def _get_bambu_state(conn: PrinterConnection) -> Optional[dict]:
         return None
 
 
-def _states_changed(old: list[dict], new: list[dict]) -> bool:
-    """Quick equality check to avoid redundant broadcasts."""
-    if len(old) != len(new):
-        return True
-    for o, n in zip(old, new):
-        if (
-            o.get("status") != n.get("status")
-            or o.get("progress_percent") != n.get("progress_percent")
-            or o.get("job_name") != n.get("job_name")
-        ):
-            return True
-    return False
+def _state_changed(old: dict, new: dict) -> bool:
+    return any(old.get(field) != new.get(field) for field in _TRACKED_FIELDS)
+
+
+def _state_message(old: list[dict], new: list[dict]) -> Optional[dict]:
+    """
+    Build the message that brings a client from *old* to *new*.
+
+    Returns a delta with only the changed printers when the printer list is
+    the same, a full snapshot when printers were added, removed or renamed
+    (order changed), and None when nothing changed.
+    """
+    if [s["id"] for s in old] != [s["id"] for s in new]:
+        return {"type": "printer_state", "data": new}
+    changed = [n for o, n in zip(old, new) if _state_changed(o, n)]
+    if not changed:
+        return None
+    return {"type": "printer_state_delta", "data": changed}
 
 
 # ---------------------------------------------------------------------------
@@ -252,10 +331,10 @@ async def ws_printers(
     Query params:
       token: JWT access token (required)
 
-    On connect, immediately broadcasts:
+    On connect, immediately sends:
       { "type": "printer_state", "data": [ <PrinterLiveState>, ... ] }
 
-    Then re-polls every 15 s and broadcasts again if state changed.
+    Afterwards the tenant's shared poller sends changes every 15 s.
     """
     tenant_id = _verify_ws_token(token)
     if tenant_id is None:
@@ -265,25 +344,13 @@ async def ws_printers(
     await manager.connect(websocket, tenant_id)
 
     try:
-        # Send initial state immediately
-        states = await _build_printer_live_states(tenant_id)
+        # Send the latest snapshot (waits for the first poll on a cold tenant)
+        states = await manager.snapshot(tenant_id)
         await manager.send(websocket, {"type": "printer_state", "data": states})
 
-        # Polling loop
+        # Updates come from the poller; just wait for the client to leave
         while True:
-            try:
-                # Wait POLL_INTERVAL seconds, but also listen for incoming
-                # messages (e.g., ping) so we detect disconnects promptly.
-                await asyncio.wait_for(websocket.receive_text(), timeout=POLL_INTERVAL)
-            except asyncio.TimeoutError:
-                pass
-            except WebSocketDisconnect:
-                break
-
-            new_states = await _build_printer_live_states(tenant_id)
-            if _states_changed(states, new_states):
-                await manager.send(websocket, {"type": "printer_state", "data": new_states})
-                states = new_states
+            await websocket.receive_text()
 
     except WebSocketDisconnect:
         pass
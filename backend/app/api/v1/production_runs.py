@@ -48,8 +48,13 @@ from app.schemas.production_run_plate import (
     ProductionRunPlateListResponse,
     MarkPlateCompleteRequest,
 )
+from app.services.cache_service import (
+    invalidate_on_inventory_change,
+    invalidate_on_production_change,
+)
 from app.services.production_run import ProductionRunService
 from app.services.production_run_plate_service import ProductionRunPlateService
+from app.utils.pagination import InvalidCursorError, encode_cursor, paginate_keyset
 
 router = APIRouter(tags=["production-runs"])
 
@@ -154,6 +159,7 @@ async def create_production_run(
         db.add(db_material)
 
     await db.commit()
+    await invalidate_on_production_change(str(tenant.id))
 
     # Reload with relationships (including nested model and spool details)
     result = await db.execute(
@@ -179,24 +185,36 @@ async def list_production_runs(
     end_date: Optional[datetime] = Query(None, description="Filter by end date (inclusive)"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    after: Optional[str] = Query(None, description="Cursor: return the page after this one"),
+    before: Optional[str] = Query(None, description="Cursor: return the page before this one"),
+    include_total: bool = Query(False, description="Count total matches in cursor mode"),
     db: AsyncSession = Depends(get_db),
     tenant: CurrentTenant = None,
 ):
     """
     List production runs with optional filtering and pagination.
 
+    Passing an ``after``/``before`` cursor switches to keyset pagination over
+    (started_at, id); ``skip`` is then ignored and the total is only counted
+    when ``include_total`` is set.
+
     Args:
         status_filter: Filter by status (in_progress, completed, failed, cancelled)
         start_date: Filter runs started on or after this date
         end_date: Filter runs started on or before this date
         skip: Pagination offset
         limit: Maximum results per page
+        after: Cursor from a previous page's next_cursor
+        before: Cursor from a previous page's prev_cursor
+        include_total: Count total matches when paginating by cursor
         db: Database session
         tenant: Current authenticated tenant
 
     Returns:
         Paginated list of production runs
     """
+    use_cursor = bool(after or before)
+
     # Build base query with filters
     base_query = select(ProductionRun).where(ProductionRun.tenant_id == tenant.id)
 
@@ -209,25 +227,57 @@ async def list_production_runs(
     if end_date:
         base_query = base_query.where(ProductionRun.started_at <= end_date)
 
-    # Get total count
-    count_query = select(func.count()).select_from(base_query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    # Get total count (optional in cursor mode)
+    total = None
+    if not use_cursor or include_total:
+        count_query = select(func.count()).select_from(base_query.subquery())
+        total_result = await db.execute(count_query)
+        total = total_result.scalar() or 0
+
+    # Eager loading for items_summary
+    base_query = base_query.options(
+        selectinload(ProductionRun.items).selectinload(ProductionRunItem.model),
+        selectinload(ProductionRun.product),
+    )
 
-    # Get paginated results with eager loading for items_summary
-    query = (
-        base_query.options(
-            selectinload(ProductionRun.items).selectinload(ProductionRunItem.model),
-            selectinload(ProductionRun.product),
+    if use_cursor:
+        try:
+            page = await paginate_keyset(
+                db,
+                base_query,
+                ProductionRun.started_at,
+                ProductionRun.id,
+                limit,
+                after=after,
+                before=before,
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        return ProductionRunListResponse(
+            runs=page.items,
+            total=total,
+            skip=0,
+            limit=limit,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
         )
-        .order_by(ProductionRun.started_at.desc())
+
+    # Get paginated results
+    query = (
+        base_query.order_by(ProductionRun.started_at.desc(), ProductionRun.id.desc())
         .offset(skip)
         .limit(limit)
     )
     result = await db.execute(query)
     runs = result.scalars().all()
 
-    return ProductionRunListResponse(runs=runs, total=total, skip=skip, limit=limit)
+    next_cursor = None
+    if runs and skip + len(runs) < total:
+        next_cursor = encode_cursor(runs[-1].started_at, runs[-1].id)
+
+    return ProductionRunListResponse(
+        runs=runs, total=total, skip=skip, limit=limit, next_cursor=next_cursor
+    )
 
 
 @router.get("/failure-reasons", response_model=list)
@@ -351,6 +401,7 @@ async def update_production_run(
         production_run.duration_hours = Decimal(str(duration.total_seconds() / 3600))
 
     await db.commit()
+    await invalidate_on_production_change(str(tenant.id))
 
     # Reload with relationships for response
     result = await db.execute(
@@ -408,6 +459,7 @@ async def delete_production_run(
 
     await db.delete(production_run)
     await db.commit()
+    await invalidate_on_production_change(str(tenant.id))
 
 
 # Production Run Items Endpoints
@@ -463,6 +515,7 @@ async def add_production_run_item(
     db_item = ProductionRunItem(production_run_id=run_id, **item.model_dump())
     db.add(db_item)
     await db.commit()
+    await invalidate_on_production_change(str(tenant.id))
 
     # Reload with model relationship
     result = await db.execute(
@@ -535,6 +588,7 @@ async def update_production_run_item(
         setattr(item, field, value)
 
     await db.commit()
+    await invalidate_on_production_change(str(tenant.id))
 
     # Reload with model relationship
     result = await db.execute(
@@ -587,6 +641,7 @@ async def delete_production_run_item(
 
     await db.delete(item)
     await db.commit()
+    await invalidate_on_production_change(str(tenant.id))
 
 
 # Production Run Materials Endpoints
@@ -655,6 +710,7 @@ async def add_production_run_material(
     db_material = ProductionRunMaterial(production_run_id=run_id, **material.model_dump())
     db.add(db_material)
     await db.commit()
+    await invalidate_on_production_change(str(tenant.id))
 
     # Reload with spool relationship
     result = await db.execute(
@@ -736,6 +792,7 @@ async def update_production_run_material(
         setattr(material, field, value)
 
     await db.commit()
+    await invalidate_on_production_change(str(tenant.id))
 
     # Reload with spool relationship
     result = await db.execute(
@@ -793,6 +850,7 @@ async def delete_production_run_material(
 
     await db.delete(material)
     await db.commit()
+    await invalidate_on_production_change(str(tenant.id))
 
 
 # Special Endpoint: Complete Production Run with Inventory Deduction
@@ -950,6 +1008,7 @@ async def complete_production_run(
                     item.actual_cost_per_unit = item.model_weight_grams * cost_per_gram
 
     await db.commit()
+    await invalidate_on_inventory_change(str(tenant.id))
 
     # Reload with all relationships for response
     result = await db.execute(
@@ -1034,6 +1093,7 @@ async def cancel_production_run_endpoint(
                 status_code=status.HTTP_404_NOT_FOUND, detail=f"Production run {run_id} not found"
             )
 
+        await invalidate_on_inventory_change(str(tenant.id))
         return result
 
     except ValueError as e:
@@ -1087,6 +1147,7 @@ async def fail_production_run_endpoint(
                 status_code=status.HTTP_404_NOT_FOUND, detail=f"Production run {run_id} not found"
             )
 
+        await invalidate_on_inventory_change(str(tenant.id))
         return result
 
     except ValueError as e:
@@ -1128,6 +1189,7 @@ async def create_production_run_plate(
 
     try:
         plate = await service.create_plate(run_id, plate_data)
+        await invalidate_on_production_change(str(tenant.id))
         return ProductionRunPlateResponse.model_validate(plate)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -1237,6 +1299,7 @@ async def update_production_run_plate(
         )
 
     plate = await service.update_plate(plate_id, updates)
+    await invalidate_on_production_change(str(tenant.id))
     return ProductionRunPlateResponse.model_validate(plate)
 
 
@@ -1276,6 +1339,7 @@ async def start_production_run_plate(
 
     try:
         plate = await service.start_plate(plate_id)
+        await invalidate_on_production_change(str(tenant.id))
         return ProductionRunPlateResponse.model_validate(plate)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -1319,6 +1383,7 @@ async def complete_production_run_plate(
 
     try:
         plate = await service.complete_plate(plate_id, request)
+        await invalidate_on_production_change(str(tenant.id))
         return ProductionRunPlateResponse.model_validate(plate)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -1362,6 +1427,7 @@ async def fail_production_run_plate(
 
     try:
         plate = await service.fail_plate(plate_id, notes)
+        await invalidate_on_production_change(str(tenant.id))
         return ProductionRunPlateResponse.model_validate(plate)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -1405,6 +1471,7 @@ async def cancel_production_run_plate(
 
     try:
         plate = await service.cancel_plate(plate_id, notes)
+        await invalidate_on_production_change(str(tenant.id))
         return ProductionRunPlateResponse.model_validate(plate)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -1447,3 +1514,4 @@ async def delete_production_run_plate(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"Plate {plate_id} not found"
         )
+    await invalidate_on_production_change(str(tenant.id))
@@ -25,6 +25,7 @@ from sqlalchemy.orm import selectinload
 
 from app.auth.dependencies import CurrentTenant, CurrentUser, RequireAdmin
 from app.database import get_db
+from app.models.cost_snapshot import ProductCostSnapshot
 from app.models.designer import Designer
 from app.models.model import Model
 from app.models.product import Product
@@ -38,6 +39,7 @@ from app.schemas.product import (
     ProductComponentCreate,
     ProductComponentResponse,
     ProductComponentUpdate,
+    ProductCostBreakdown,
     ProductCreate,
     ProductDetailResponse,
     ProductListResponse,
@@ -58,7 +60,16 @@ from app.schemas.product_image import (
     ProductImageUpdate,
     ProductImageListResponse,
 )
-from app.services.costing import CostingService
+from app.services.cache_service import (
+    build_cache_key,
+    get_cache_service,
+    invalidate_on_product_change,
+)
+from app.services.blob_store import detach_image, release_image, store_image
+from app.services.category_counts import refresh_category_counts
+from app.services.cost_snapshots import get_product_costs
+from app.services.costing import CostingService, ProductCostCalculator
+from app.services.product_graph import load_product_graph
 from app.services.etsy_sync import EtsySyncService, EtsySyncError
 from app.services.shopify_sync import (
     ShopifySyncService,
@@ -76,57 +87,23 @@ from app.schemas.external_listing import (
     ProductSyncStatusResponse,
     SyncStatusChannel,
 )
+from app.utils.http_client import get_http_client
+from app.utils.pagination import InvalidCursorError, encode_cursor, paginate_keyset
 
 router = APIRouter()
 
 
 def _get_product_load_options():
     """
-    Get SQLAlchemy selectinload options for loading a Product with all
-    relationships needed for cost calculation.
+    Get SQLAlchemy loader options for the parts of a product detail response
+    that costing does not need.
 
-    This includes nested loading for child products to support recursive
-    cost calculation without lazy loading (which fails in async context).
+    The bill of materials (models, packaging and nested child products at any
+    depth) is loaded by ``load_product_graph``.
     """
     return [
-        # Load product models with their model details
-        selectinload(Product.product_models)
-        .selectinload(ProductModel.model)
-        .selectinload(Model.materials),
-        selectinload(Product.product_models)
-        .selectinload(ProductModel.model)
-        .selectinload(Model.components),
-        # Load child products with THEIR relationships (for recursive cost calc)
-        # Level 1: child products
-        selectinload(Product.child_products)
-        .selectinload(ProductComponent.child_product)
-        .selectinload(Product.product_models)
-        .selectinload(ProductModel.model)
-        .selectinload(Model.materials),
-        selectinload(Product.child_products)
-        .selectinload(ProductComponent.child_product)
-        .selectinload(Product.product_models)
-        .selectinload(ProductModel.model)
-        .selectinload(Model.components),
-        selectinload(Product.child_products)
-        .selectinload(ProductComponent.child_product)
-        .selectinload(Product.packaging_consumable),
-        # Level 2: grandchild products (child's child products)
-        selectinload(Product.child_products)
-        .selectinload(ProductComponent.child_product)
-        .selectinload(Product.child_products)
-        .selectinload(ProductComponent.child_product)
-        .selectinload(Product.product_models)
-        .selectinload(ProductModel.model),
-        selectinload(Product.child_products)
-        .selectinload(ProductComponent.child_product)
-        .selectinload(Product.child_products)
-        .selectinload(ProductComponent.child_product)
-        .selectinload(Product.packaging_consumable),
         # Load pricing with sales channels
         selectinload(Product.pricing).selectinload(ProductPricing.sales_channel),
-        # Load packaging consumable
-        selectinload(Product.packaging_consumable),
         # Load designer for attribution
         selectinload(Product.designer),
         # Load categories
@@ -134,15 +111,39 @@ def _get_product_load_options():
     ]
 
 
+async def _load_product_detail(db: AsyncSession, product_id: UUID, *criteria) -> Optional[Product]:
+    """Load a product with everything its detail response and cost breakdown need."""
+    graph = await load_product_graph(
+        db, [product_id], *criteria, root_options=_get_product_load_options()
+    )
+    return graph.get(product_id)
+
+
+async def _get_product_costs(
+    db: AsyncSession, product_ids: list[UUID]
+) -> dict[UUID, ProductCostBreakdown]:
+    """Stored cost breakdowns for products, costing any without a snapshot on demand."""
+    costs = await get_product_costs(db, product_ids)
+    missing = [product_id for product_id in product_ids if product_id not in costs]
+    if missing:
+        graph = await load_product_graph(db, missing)
+        costs.update(
+            CostingService.calculate_product_costs(graph[pid] for pid in missing if pid in graph)
+        )
+    return costs
+
+
 # Helper function to calculate and attach cost breakdown
 async def product_with_cost(product: Product, db: AsyncSession) -> dict:
     """Convert Product model to response dict with cost breakdown."""
-    cost_breakdown = CostingService.calculate_product_cost(product)
+    # Child and model costs below reuse the breakdowns computed for the total
+    costs = ProductCostCalculator()
+    cost_breakdown = costs.product_cost(product)
 
     # Build model responses with details
     model_responses = []
     for pm in product.product_models:
-        model_cost = CostingService.calculate_model_cost(pm.model) if pm.model else None
+        model_cost = costs.model_cost(pm.model) if pm.model else None
         model_responses.append(
             {
                 "id": pm.id,
@@ -161,7 +162,7 @@ async def product_with_cost(product: Product, db: AsyncSession) -> dict:
     for pc in getattr(product, "child_products", []):
         child = pc.child_product
         if child:
-            child_cost = CostingService.calculate_product_cost(child)
+            child_cost = costs.product_cost(child)
             child_product_responses.append(
                 {
                     "id": pc.id,
@@ -331,11 +332,10 @@ async def create_product(
         db.add(product_component)
 
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product.id))
 
     # Reload with relationships
-    query = select(Product).where(Product.id == product.id).options(*_get_product_load_options())
-    result = await db.execute(query)
-    product = result.scalar_one()
+    product = await _load_product_detail(db, product.id)
 
     return ProductDetailResponse(**await product_with_cost(product, db))
 
@@ -352,14 +352,49 @@ async def list_products(
     ),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     designer_id: Optional[UUID] = Query(None, description="Filter by designer"),
+    min_make_cost: Optional[Decimal] = Query(None, ge=0, description="Minimum make cost"),
+    max_make_cost: Optional[Decimal] = Query(None, ge=0, description="Maximum make cost"),
+    after: Optional[str] = Query(None, description="Cursor: return the page after this one"),
+    before: Optional[str] = Query(None, description="Cursor: return the page before this one"),
+    include_total: bool = Query(False, description="Count total matches in cursor mode"),
     search_service: SearchService = Depends(get_search_service),
 ) -> ProductListResponse:
     """
     List all products for current tenant with pagination and filtering.
 
-    Includes calculated make cost and suggested price for each product.
-    Uses PostgreSQL full-text search when search parameter is provided.
+    Includes make cost (read from the stored cost snapshots, which can also be
+    filtered on) and suggested price for each product. Uses PostgreSQL
+    full-text search when search parameter is provided.
+    Responses are cached per parameter set until the tenant's products change.
+
+    Passing an ``after``/``before`` cursor switches to keyset pagination over
+    (created_at, id), which costs the same for every page; ``skip`` is then
+    ignored and the total is only counted when ``include_total`` is set.
     """
+    use_cursor = bool(after or before)
+    if use_cursor and search:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor pagination is not supported with search",
+        )
+
+    cache = await get_cache_service()
+    cache_key = build_cache_key(
+        skip=skip,
+        limit=limit,
+        search=search,
+        is_active=is_active,
+        designer_id=designer_id,
+        min_make_cost=min_make_cost,
+        max_make_cost=max_make_cost,
+        after=after,
+        before=before,
+        include_total=include_total,
+    )
+    cached = await cache.get_product_list(str(tenant.id), cache_key)
+    if cached is not None:
+        return ProductListResponse.model_validate(cached)
+
     # If search is provided, use the search service for FTS
     if search:
         # Use full-text search service
@@ -376,24 +411,16 @@ async def list_products(
             products = [p for p in products if p.designer_id == designer_id]
             # Note: total might be inaccurate with post-filtering, but acceptable for search
 
-        # Load relationships for cost calculation
-        product_ids = [p.id for p in products]
-        if product_ids:
-            query = (
-                select(Product)
-                .where(Product.id.in_(product_ids))
-                .options(*_get_product_load_options())
-            )
-            result = await db.execute(query)
-            products_with_rels = {p.id: p for p in result.scalars().all()}
-            products = [
-                products_with_rels.get(p.id, p) for p in products if p.id in products_with_rels
-            ]
-
-        # Build response with calculated costs
+        # Build response with stored make costs
+        costs = await _get_product_costs(db, [p.id for p in products])
+        # Make cost filters are post-filters here too (total may be inaccurate)
+        if min_make_cost is not None:
+            products = [p for p in products if costs[p.id].total_make_cost >= min_make_cost]
+        if max_make_cost is not None:
+            products = [p for p in products if costs[p.id].total_make_cost <= max_make_cost]
         product_responses = []
         for product in products:
-            cost_breakdown = CostingService.calculate_product_cost(product)
+            cost_breakdown = costs[product.id]
             total_make_cost = cost_breakdown.total_make_cost
             suggested_price = total_make_cost * Decimal("2.5")
 
@@ -441,12 +468,14 @@ async def list_products(
             }
             product_responses.append(ProductResponse(**product_dict))
 
-        return ProductListResponse(
+        response = ProductListResponse(
             products=product_responses,
             total=total,
             skip=skip,
             limit=limit,
         )
+        await cache.set_product_list(str(tenant.id), cache_key, response.model_dump(mode="json"))
+        return response
 
     # Standard query without FTS
     # Build base query
@@ -458,25 +487,56 @@ async def list_products(
     if designer_id is not None:
         base_query = base_query.where(Product.designer_id == designer_id)
 
-    # Get total count
-    count_query = select(func.count()).select_from(base_query.subquery())
-    total = await db.scalar(count_query)
-
-    # Apply pagination and fetch with relationships for cost calculation
-    query = (
-        base_query.options(*_get_product_load_options())
-        .order_by(Product.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-    )
-    result = await db.execute(query)
-    products = result.scalars().all()
-
-    # Build response with calculated costs
+    # Make cost filters run against the stored snapshots
+    if min_make_cost is not None or max_make_cost is not None:
+        base_query = base_query.join(
+            ProductCostSnapshot, ProductCostSnapshot.product_id == Product.id
+        )
+        if min_make_cost is not None:
+            base_query = base_query.where(ProductCostSnapshot.total_make_cost >= min_make_cost)
+        if max_make_cost is not None:
+            base_query = base_query.where(ProductCostSnapshot.total_make_cost <= max_make_cost)
+
+    # Get total count (optional in cursor mode)
+    total = None
+    if not use_cursor or include_total:
+        count_query = select(func.count()).select_from(base_query.subquery())
+        total = await db.scalar(count_query) or 0
+
+    # Apply pagination (costs come from snapshots, so no BOM loading is needed)
+    next_cursor = prev_cursor = None
+    if use_cursor:
+        try:
+            page = await paginate_keyset(
+                db,
+                base_query,
+                Product.created_at,
+                Product.id,
+                limit,
+                after=after,
+                before=before,
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        products = page.items
+        next_cursor, prev_cursor = page.next_cursor, page.prev_cursor
+    else:
+        query = (
+            base_query.order_by(Product.created_at.desc(), Product.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await db.execute(query)
+        products = result.scalars().all()
+        # Let offset clients switch to cursors from any page
+        if products and skip + len(products) < total:
+            next_cursor = encode_cursor(products[-1].created_at, products[-1].id)
+
+    # Build response with stored make costs
+    costs = await _get_product_costs(db, [p.id for p in products])
     product_responses = []
     for product in products:
-        # Calculate cost breakdown
-        cost_breakdown = CostingService.calculate_product_cost(product)
+        cost_breakdown = costs[product.id]
         total_make_cost = cost_breakdown.total_make_cost
         suggested_price = total_make_cost * Decimal("2.5")  # 2.5x markup
 
@@ -527,12 +587,16 @@ async def list_products(
         }
         product_responses.append(ProductResponse(**product_dict))
 
-    return ProductListResponse(
+    response = ProductListResponse(
         products=product_responses,
-        total=total or 0,
+        total=total,
         skip=skip,
         limit=limit,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
     )
+    await cache.set_product_list(str(tenant.id), cache_key, response.model_dump(mode="json"))
+    return response
 
 
 @router.get("/{product_id}", response_model=ProductDetailResponse)
@@ -545,26 +609,27 @@ async def get_product(
     """
     Get product detail with models, child products (bundles), pricing, and cost breakdown.
     """
-    query = (
-        select(Product)
-        .where(
-            Product.id == product_id,
-            Product.tenant_id == tenant.id,
-            Product.is_active.is_(True),
-        )
-        .options(*_get_product_load_options())
+    cache = await get_cache_service()
+    cached = await cache.get_product(str(product_id), str(tenant.id))
+    if cached is not None:
+        return ProductDetailResponse.model_validate(cached)
+
+    product = await _load_product_detail(
+        db,
+        product_id,
+        Product.tenant_id == tenant.id,
+        Product.is_active.is_(True),
     )
 
-    result = await db.execute(query)
-    product = result.scalar_one_or_none()
-
     if not product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found",
         )
 
-    return ProductDetailResponse(**await product_with_cost(product, db))
+    response = ProductDetailResponse(**await product_with_cost(product, db))
+    await cache.set_product(str(product_id), str(tenant.id), response.model_dump(mode="json"))
+    return response
 
 
 @router.put("/{product_id}", response_model=ProductDetailResponse)
@@ -579,13 +644,9 @@ async def update_product(
     Update an existing product.
     """
     # Fetch product
-    query = (
-        select(Product)
-        .where(
-            Product.id == product_id,
-            Product.tenant_id == tenant.id,
-        )
-        .options(*_get_product_load_options())
+    query = select(Product).where(
+        Product.id == product_id,
+        Product.tenant_id == tenant.id,
     )
 
     result = await db.execute(query)
@@ -630,8 +691,14 @@ async def update_product(
     if "name" in update_data and "seo_slug" not in update_data and not product.seo_slug:
         product.seo_slug = _slugify(product.name)
 
+    if update_data.keys() & {"is_active", "shop_visible"}:
+        await refresh_category_counts(db, tenant.id)
+
     await db.commit()
-    await db.refresh(product)
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
+
+    # Reload with relationships
+    product = await _load_product_detail(db, product_id)
 
     return ProductDetailResponse(**await product_with_cost(product, db))
 
@@ -643,6 +710,7 @@ async def delete_product(
     tenant: CurrentTenant,
     _: RequireAdmin,
     db: AsyncSession = Depends(get_db),
+    image_storage: ImageStorage = Depends(get_image_storage),
     purge: bool = Query(
         False,
         description="Hard-delete the product from the database. Only allowed on inactive products.",
@@ -670,18 +738,32 @@ async def delete_product(
             detail="Product not found",
         )
 
+    unreferenced_images = []
     if purge:
         if product.is_active:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Cannot purge an active product. Deactivate it first.",
             )
+        # Images cascade with the product, so release their stored copies first
+        for image in product.images:
+            if await release_image(db, tenant.id, image.image_url):
+                unreferenced_images.append((image.image_url, image.thumbnail_url))
         await db.delete(product)
     else:
         product.is_active = False
 
+    await refresh_category_counts(db, tenant.id)
     await db.commit()
 
+    for image_url, thumbnail_url in unreferenced_images:
+        try:
+            await image_storage.delete_image(image_url, thumbnail_url)
+        except ImageStorageError:
+            pass  # Log but don't fail if file deletion fails
+
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
+
 
 # ==================== Product Models (Composition) Management ====================
 
@@ -737,6 +819,7 @@ async def add_product_model(
 
     db.add(product_model)
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
     await db.refresh(product_model)
 
     # Calculate model cost
@@ -789,6 +872,7 @@ async def update_product_model(
 
     product_model.quantity = model_data.quantity
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
     await db.refresh(product_model)
 
     model_cost = CostingService.calculate_model_cost(product_model.model)
@@ -837,6 +921,7 @@ async def remove_product_model(
 
     await db.delete(product_model)
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
 
 
 # ==================== Product Pricing Management ====================
@@ -857,21 +942,10 @@ async def add_product_pricing(
     """
     Add pricing for a product on a sales channel.
     """
-    # Fetch product with models for cost calculation
-    query = (
-        select(Product)
-        .where(
-            Product.id == product_id,
-            Product.tenant_id == tenant.id,
-        )
-        .options(
-            selectinload(Product.product_models)
-            .selectinload(ProductModel.model)
-            .selectinload(Model.materials),
-            selectinload(Product.product_models)
-            .selectinload(ProductModel.model)
-            .selectinload(Model.components),
-        )
+    # Fetch product (its make cost is read from the cost snapshot below)
+    query = select(Product).where(
+        Product.id == product_id,
+        Product.tenant_id == tenant.id,
     )
 
     result = await db.execute(query)
@@ -914,10 +988,11 @@ async def add_product_pricing(
 
     db.add(pricing)
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
     await db.refresh(pricing)
 
-    # Calculate profit
-    cost_breakdown = CostingService.calculate_product_cost(product)
+    # Calculate profit from the stored make cost
+    cost_breakdown = (await _get_product_costs(db, [product_id]))[product_id]
     profit_data = CostingService.calculate_profit(
         list_price=Decimal(str(pricing.list_price)),
         make_cost=cost_breakdown.total_make_cost,
@@ -963,12 +1038,7 @@ async def update_product_pricing(
             ProductPricing.product_id == product_id,
             Product.tenant_id == tenant.id,
         )
-        .options(
-            selectinload(ProductPricing.sales_channel),
-            selectinload(ProductPricing.product)
-            .selectinload(Product.product_models)
-            .selectinload(ProductModel.model),
-        )
+        .options(selectinload(ProductPricing.sales_channel))
     )
 
     result = await db.execute(query)
@@ -986,10 +1056,11 @@ async def update_product_pricing(
         setattr(pricing, field, value)
 
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
     await db.refresh(pricing)
 
-    # Calculate profit
-    cost_breakdown = CostingService.calculate_product_cost(pricing.product)
+    # Calculate profit from the stored make cost
+    cost_breakdown = (await _get_product_costs(db, [product_id]))[product_id]
     channel = pricing.sales_channel
     profit_data = CostingService.calculate_profit(
         list_price=Decimal(str(pricing.list_price)),
@@ -1047,6 +1118,7 @@ async def remove_product_pricing(
 
     await db.delete(pricing)
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
 
 
 # ==================== Product Components (Bundle Composition) Management ====================
@@ -1158,19 +1230,12 @@ async def add_product_component(
 
     db.add(product_component)
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
     await db.refresh(product_component)
 
-    # Calculate child product cost
-    # Need to load child product with its relationships for cost calculation
-    query = (
-        select(Product)
-        .where(Product.id == component_data.child_product_id)
-        .options(*_get_product_load_options())
-    )
-    result = await db.execute(query)
-    child_product_loaded = result.scalar_one()
-
-    child_cost = CostingService.calculate_product_cost(child_product_loaded)
+    # Child product cost (stored, or costed from its bill of materials)
+    child_id = component_data.child_product_id
+    child_cost = (await _get_product_costs(db, [child_id]))[child_id]
 
     return ProductComponentResponse(
         id=product_component.id,
@@ -1222,18 +1287,12 @@ async def update_product_component(
 
     product_component.quantity = component_data.quantity
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
     await db.refresh(product_component)
 
-    # Calculate child product cost
-    query = (
-        select(Product)
-        .where(Product.id == product_component.child_product_id)
-        .options(*_get_product_load_options())
-    )
-    result = await db.execute(query)
-    child_product_loaded = result.scalar_one()
-
-    child_cost = CostingService.calculate_product_cost(child_product_loaded)
+    # Child product cost (stored, or costed from its bill of materials)
+    child_id = product_component.child_product_id
+    child_cost = (await _get_product_costs(db, [child_id]))[child_id]
 
     return ProductComponentResponse(
         id=product_component.id,
@@ -1282,6 +1341,7 @@ async def remove_product_component(
 
     await db.delete(product_component)
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
 
 
 # ==================== Product Images Management ====================
@@ -1352,9 +1412,12 @@ async def upload_product_image(
     # Read file content
     content = await file.read()
 
-    # Validate and save image
+    # Validate and save image (identical uploads share one stored copy)
     try:
-        storage_result = await image_storage.save_image(
+        storage_result = await store_image(
+            db,
+            tenant.id,
+            image_storage,
             file_content=content,
             content_type=file.content_type or "application/octet-stream",
             product_id=str(product_id),
@@ -1371,7 +1434,7 @@ async def upload_product_image(
         ProductImage.product_id == product_id
     )
     max_order = await db.scalar(max_order_query)
-    next_order = (max_order or -1) + 1
+    next_order = max_order + 1
 
     # Check if this is the first image (make it primary)
     count_query = select(func.count()).where(ProductImage.product_id == product_id)
@@ -1394,6 +1457,7 @@ async def upload_product_image(
 
     db.add(image)
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
     await db.refresh(image)
 
     return ProductImageResponse.model_validate(image)
@@ -1440,9 +1504,8 @@ async def import_product_image_from_url(
         raise HTTPException(status_code=404, detail="Product not found")
 
     try:
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            resp = await client.get(body.url)
-            resp.raise_for_status()
+        resp = await get_http_client("imports").get(body.url, timeout=30.0, follow_redirects=True)
+        resp.raise_for_status()
     except httpx.HTTPError as exc:
         raise HTTPException(status_code=400, detail=f"Failed to fetch image: {exc}") from exc
 
@@ -1456,7 +1519,10 @@ async def import_product_image_from_url(
     filename = parsed.path.rstrip("/").split("/")[-1] or "import.jpg"
 
     try:
-        storage_result = await image_storage.save_image(
+        storage_result = await store_image(
+            db,
+            tenant.id,
+            image_storage,
             file_content=content,
             content_type=content_type,
             product_id=str(product_id),
@@ -1489,7 +1555,7 @@ async def import_product_image_from_url(
         image_url=storage_result["image_url"],
         thumbnail_url=storage_result["thumbnail_url"],
         alt_text=body.alt_text,
-        display_order=(max_order or -1) + 1,
+        display_order=max_order + 1,
         is_primary=is_primary,
         original_filename=filename,
         file_size=storage_result["file_size"],
@@ -1497,6 +1563,7 @@ async def import_product_image_from_url(
     )
     db.add(image)
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
     await db.refresh(image)
 
     return ProductImageResponse.model_validate(image)
@@ -1535,6 +1602,7 @@ async def update_product_image(
         setattr(image, field, value)
 
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
     await db.refresh(image)
 
     return ProductImageResponse.model_validate(image)
@@ -1579,6 +1647,7 @@ async def set_primary_image(
     await db.refresh(image)
     image.is_primary = True
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
     await db.refresh(image)
 
     return ProductImageResponse.model_validate(image)
@@ -1616,15 +1685,17 @@ async def delete_product_image(
     image_url = image.image_url
     thumbnail_url = image.thumbnail_url
 
-    # Delete from database
+    # Delete from database, releasing this image's share of the stored copy
+    delete_stored = await release_image(db, tenant.id, image_url)
     await db.delete(image)
     await db.commit()
 
-    # Delete from storage
-    try:
-        await image_storage.delete_image(image_url, thumbnail_url)
-    except ImageStorageError:
-        pass  # Log but don't fail if file deletion fails
+    # Delete from storage once no other image uses it
+    if delete_stored:
+        try:
+            await image_storage.delete_image(image_url, thumbnail_url)
+        except ImageStorageError:
+            pass  # Log but don't fail if file deletion fails
 
     # If was primary, set next image as primary
     if was_primary:
@@ -1640,6 +1711,8 @@ async def delete_product_image(
             next_image.is_primary = True
             await db.commit()
 
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
+
 
 @router.post("/{product_id}/images/{image_id}/rotate", response_model=ProductImageResponse)
 async def rotate_product_image(
@@ -1676,8 +1749,11 @@ async def rotate_product_image(
             detail="Image not found",
         )
 
-    # Rotate the image files
+    # Rotate the image files, first copying them if other images share them
     try:
+        image.image_url, image.thumbnail_url = await detach_image(
+            db, tenant.id, image_storage, image.image_url, image.thumbnail_url, str(product_id)
+        )
         await image_storage.rotate_image(image.image_url, image.thumbnail_url, degrees)
     except ImageStorageError as e:
         raise HTTPException(
@@ -1692,6 +1768,7 @@ async def rotate_product_image(
     image.updated_at = new_timestamp
     db.add(image)  # Ensure it's tracked
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
     await db.refresh(image)
 
     return ProductImageResponse.model_validate(image)
@@ -1986,6 +2063,7 @@ async def create_product_variant(
 
     db.add(variant)
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
     await db.refresh(variant)
     return ProductVariantResponse.model_validate(variant)
 
@@ -2020,6 +2098,7 @@ async def update_product_variant(
         setattr(variant, field, value)
 
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
     await db.refresh(variant)
     return ProductVariantResponse.model_validate(variant)
 
@@ -2051,3 +2130,4 @@ async def delete_product_variant(
 
     await db.delete(variant)
     await db.commit()
+    await invalidate_on_product_change(str(tenant.id), str(product_id))
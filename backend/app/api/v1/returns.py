@@ -30,6 +30,7 @@ from app.schemas.return_request import (
     ReturnRequestReject,
     ReturnRequestUpdate,
 )
+from app.services.cache_service import invalidate_on_inventory_change
 
 router = APIRouter()
 
@@ -405,6 +406,7 @@ async def complete_return_request(
                 product.units_in_stock += item.quantity
 
     await db.commit()
+    await invalidate_on_inventory_change(str(tenant.id))
     await db.refresh(return_request)
 
     # Send completion email to customer
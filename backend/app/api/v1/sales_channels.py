@@ -16,6 +16,7 @@ from app.schemas.sales_channel import (
     SalesChannelResponse,
     SalesChannelUpdate,
 )
+from app.services.tenant_routing import invalidate_tenant_routes
 
 router = APIRouter()
 
@@ -63,6 +64,7 @@ async def create_sales_channel(
 
     db.add(channel)
     await db.commit()
+    invalidate_tenant_routes(tenant.id)
     await db.refresh(channel)
 
     return SalesChannelResponse.model_validate(channel)
@@ -200,6 +202,7 @@ async def update_sales_channel(
         setattr(channel, field, value)
 
     await db.commit()
+    invalidate_tenant_routes(tenant.id)
     await db.refresh(channel)
 
     return SalesChannelResponse.model_validate(channel)
@@ -243,3 +246,4 @@ async def delete_sales_channel(
         # Soft delete - just mark as inactive
         channel.is_active = False
     await db.commit()
+    invalidate_tenant_routes(tenant.id)
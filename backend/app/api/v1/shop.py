@@ -14,7 +14,7 @@ from decimal import Decimal
 from typing import Optional
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
 from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel, EmailStr, Field
 from sqlalchemy import func, select, desc
@@ -28,7 +28,12 @@ from app.models.designer import Designer
 from app.models.order import Order as OrderModel, OrderItem as OrderItemModel, OrderStatus
 from app.models.product import Product
 from app.models.review import Review
+from app.models.shop_product_projection import ShopProductProjection
+from app.models.webhook import WebhookEventType
+from app.services import outbox
+from app.services.cache_service import build_cache_key, get_cache_service
 from app.services.cart import CartService, get_cart_service, CartItem
+from app.services.category_counts import get_shop_category_counts
 from app.services.checkout_session import CheckoutSessionService, get_checkout_session_service
 from app.services.stock_reservation import (
     StockReservationService,
@@ -36,8 +41,10 @@ from app.services.stock_reservation import (
     ReservationItem,
 )
 from app.services.shipping_service import ShippingService, get_shipping_service
+from app.services.shop_projection import projection_channel_filter
 from app.services.search_service import SearchService, get_search_service
 from app.core.rate_limit import limiter
+from app.utils.pagination import InvalidCursorError, encode_cursor, paginate_keyset
 
 router = APIRouter()
 
@@ -117,10 +124,12 @@ class ShopProductList(BaseModel):
     """Paginated product list response."""
 
     data: list[ShopProduct]
-    total: int
+    total: Optional[int] = None  # Omitted in cursor mode
     page: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = None  # Pass as 'after' for the next page
+    prev_cursor: Optional[str] = None  # Pass as 'before' for the previous page
 
 
 class ShopCategory(BaseModel):
@@ -247,8 +256,12 @@ async def get_products(
     designer: Optional[str] = None,
     search: Optional[str] = None,
     sort: Optional[str] = None,
+    min_price: Optional[int] = Query(None, ge=0, description="Minimum price in pence"),
+    max_price: Optional[int] = Query(None, ge=0, description="Maximum price in pence"),
     page: int = 1,
     limit: int = 200,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     search_service: SearchService = Depends(get_search_service),
 ):
@@ -260,13 +273,80 @@ async def get_products(
     Returns products with pricing from the tenant's online shop sales channel.
 
     Supports full-text search via the 'search' parameter.
-    Supports filtering by category slug or designer slug.
+    Supports filtering by category slug, designer slug and price range (pence).
+    Sorts by newest (default), 'price-asc' or 'price-desc' on the channel's
+    resolved price.
+    Pass a page's next_cursor/prev_cursor as 'after'/'before' for keyset
+    pagination (not available with search); the total is then omitted.
+    Listings are cached per tenant, channel and query until products change.
     """
     shop_tenant, channel = shop_context
+    if (after or before) and search:
+        raise HTTPException(
+            status_code=400, detail="Cursor pagination is not supported with search"
+        )
+    response.headers["Cache-Control"] = "public, s-maxage=60, stale-while-revalidate=30"
+
+    cache = await get_cache_service()
+    cache_key = build_cache_key(
+        channel_id=channel.id if channel else None,
+        category=category,
+        designer=designer,
+        search=search,
+        sort=sort,
+        min_price=min_price,
+        max_price=max_price,
+        page=page,
+        limit=limit,
+        after=after,
+        before=before,
+    )
+    cached = await cache.get_shop_products(str(shop_tenant.id), cache_key)
+    if cached is not None:
+        return cached
+
+    # Catalogue reads come from the precomputed projection rows for this channel
+    query = select(ShopProductProjection.payload).where(
+        ShopProductProjection.tenant_id == shop_tenant.id,
+        projection_channel_filter(channel),
+        ShopProductProjection.is_active.is_(True),
+    )
+
+    # Filter by category if provided (by slug)
+    if category:
+        query = (
+            query.join(
+                product_categories,
+                ShopProductProjection.product_id == product_categories.c.product_id,
+            )
+            .join(Category, Category.id == product_categories.c.category_id)
+            .where(Category.slug == category)
+            .where(Category.is_active.is_(True))
+        )
+
+    # Filter by designer if provided (by slug); only active designers are projected
+    if designer:
+        query = query.where(ShopProductProjection.designer_slug == designer)
+
+    # Price range uses the channel-resolved price stored on the projection row
+    if min_price is not None:
+        query = query.where(ShopProductProjection.price_pence >= min_price)
+    if max_price is not None:
+        query = query.where(ShopProductProjection.price_pence <= max_price)
+
+    # Sort key, with product_id as a stable tie-breaker
+    if sort in ("price-asc", "price-desc"):
+        sort_column = ShopProductProjection.price_pence
+        descending = sort == "price-desc"
+    else:  # newest
+        sort_column = ShopProductProjection.product_created_at
+        descending = True
+
+    offset = (page - 1) * limit
+    next_cursor = None
 
     # If search is provided, use full-text search
     if search:
-        offset = (page - 1) * limit
         products, total = await search_service.search_products(
             query=search,
             tenant_id=shop_tenant.id,  # Filter by shop tenant
@@ -276,202 +356,77 @@ async def get_products(
             offset=offset,
         )
 
-        # Load relationships for the found products
+        shop_products = []
         if products:
             product_ids = [p.id for p in products]
-            query = (
-                select(Product)
-                .where(Product.id.in_(product_ids))
-                .options(
-                    selectinload(Product.pricing),
-                    selectinload(Product.images),
-                    selectinload(Product.categories),
-                    selectinload(Product.designer),
+            result = await db.execute(
+                query.add_columns(ShopProductProjection.product_id).where(
+                    ShopProductProjection.product_id.in_(product_ids)
                 )
             )
-
-            # Filter by category if also provided
-            if category:
-                query = (
-                    query.join(product_categories, Product.id == product_categories.c.product_id)
-                    .join(Category, Category.id == product_categories.c.category_id)
-                    .where(Category.slug == category)
-                    .where(Category.is_active.is_(True))
-                )
-
-            # Filter by designer if also provided
-            if designer:
-                query = (
-                    query.join(Designer, Designer.id == Product.designer_id)
-                    .where(Designer.slug == designer)
-                    .where(Designer.is_active.is_(True))
-                )
-
-            result = await db.execute(query)
-            products_with_rels = {p.id: p for p in result.scalars().all()}
-            products = [products_with_rels[p.id] for p in products if p.id in products_with_rels]
-            # If category or designer filter was applied, total might be different
-            if category or designer:
-                total = len(products)
-    else:
-        # Build query for products with pricing, images, categories, and designer
-        # Filter by tenant and shop_visible (products explicitly marked for shop display)
-        query = (
-            select(Product)
-            .options(
-                selectinload(Product.pricing),
-                selectinload(Product.images),
-                selectinload(Product.categories),
-                selectinload(Product.designer),
-            )
-            .where(Product.tenant_id == shop_tenant.id)
-            .where(Product.is_active.is_(True))
-            .where(Product.shop_visible.is_(True))
-        )
-
-        # Filter by category if provided (by slug)
-        if category:
-            query = (
-                query.join(product_categories, Product.id == product_categories.c.product_id)
-                .join(Category, Category.id == product_categories.c.category_id)
-                .where(Category.slug == category)
-                .where(Category.is_active.is_(True))
-            )
-
-        # Filter by designer if provided (by slug)
-        if designer:
-            query = (
-                query.join(Designer, Designer.id == Product.designer_id)
-                .where(Designer.slug == designer)
-                .where(Designer.is_active.is_(True))
+            payloads = {product_id: payload for payload, product_id in result.all()}
+            # Keep search ranking order
+            shop_products = [payloads[pid] for pid in product_ids if pid in payloads]
+        # If category, designer or price filters were applied, total might be different
+        if category or designer or min_price is not None or max_price is not None:
+            total = len(shop_products)
+    elif after or before:
+        # Keyset pagination over (sort_column, product_id)
+        try:
+            keyset_page = await paginate_keyset(
+                db,
+                query.with_only_columns(ShopProductProjection),
+                sort_column,
+                ShopProductProjection.product_id,
+                limit,
+                after=after,
+                before=before,
+                descending=descending,
             )
-
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        product_list = {
+            "data": [row.payload for row in keyset_page.items],
+            "total": None,
+            "page": page,
+            "limit": limit,
+            "has_more": keyset_page.next_cursor is not None,
+            "next_cursor": keyset_page.next_cursor,
+            "prev_cursor": keyset_page.prev_cursor,
+        }
+        await cache.set_shop_products(str(shop_tenant.id), cache_key, product_list)
+        return product_list
+    else:
         # Get total count (with same filters)
-        count_query = (
-            select(func.count())
-            .select_from(Product)
-            .where(
-                Product.tenant_id == shop_tenant.id,
-                Product.is_active.is_(True),
-                Product.shop_visible.is_(True),
-            )
-        )
-        if category:
-            count_query = (
-                count_query.join(product_categories, Product.id == product_categories.c.product_id)
-                .join(Category, Category.id == product_categories.c.category_id)
-                .where(Category.slug == category)
-                .where(Category.is_active.is_(True))
-            )
-        if designer:
-            count_query = (
-                count_query.join(Designer, Designer.id == Product.designer_id)
-                .where(Designer.slug == designer)
-                .where(Designer.is_active.is_(True))
-            )
-        count_result = await db.execute(count_query)
+        count_result = await db.execute(query.with_only_columns(func.count()))
         total = count_result.scalar_one()
 
-        # Apply pagination
-        offset = (page - 1) * limit
-        query = query.offset(offset).limit(limit)
-
         # Apply sorting
-        if sort == "price-asc":
-            query = query.order_by(Product.created_at.asc())
-        elif sort == "price-desc":
-            query = query.order_by(Product.created_at.desc())
-        else:  # newest
-            query = query.order_by(Product.created_at.desc())
-
-        result = await db.execute(query)
-        products = result.scalars().all()
-
-    # Convert to shop products with pricing
-    shop_products = []
-    for product in products:
-        # Find pricing for tenant's shop channel (active entries only)
-        price = Decimal("0")
-        if channel:
-            for pricing in product.pricing:
-                if pricing.sales_channel_id == channel.id and pricing.is_active:
-                    price = pricing.list_price or Decimal("0")
-                    break
-
-        # If no active channel-specific price, fall back to first active pricing entry
-        if price == 0 and product.pricing:
-            active = [p for p in product.pricing if p.is_active]
-            if active:
-                price = active[0].list_price or Decimal("0")
-
-        # Check if it's a dragon item using dedicated is_dragon field
-        is_dragon = getattr(product, "is_dragon", False)
-
-        # Convert images to ShopProductImage format
-        # Use /api/v1/shop/images/ endpoint to bypass ingress routing issues
-        product_images = []
-        for img in getattr(product, "images", []):
-            # Convert /uploads/products/{id}/{filename} to /api/v1/shop/images/{id}/{filename}
-            image_url = img.image_url
-            if image_url.startswith("/uploads/products/"):
-                image_url = image_url.replace("/uploads/products/", "/api/v1/shop/images/")
-            product_images.append(
-                ShopProductImage(
-                    url=image_url,
-                    alt=img.alt_text or "",
-                    is_primary=img.is_primary,
-                )
-            )
+        if descending:
+            query = query.order_by(sort_column.desc(), ShopProductProjection.product_id.desc())
+        else:
+            query = query.order_by(sort_column.asc(), ShopProductProjection.product_id.asc())
 
-        # Convert categories to ShopProductCategory format
-        product_categories_list = [
-            ShopProductCategory(slug=cat.slug, name=cat.name)
-            for cat in getattr(product, "categories", [])
-            if cat.is_active
-        ]
-
-        # Get designer info if available
-        designer_info = None
-        if product.designer and product.designer.is_active:
-            designer_info = ShopProductDesigner(
-                id=str(product.designer.id),
-                name=product.designer.name,
-                slug=product.designer.slug,
-            )
-
-        is_print_to_order = getattr(product, "print_to_order", False)
-        shop_product = ShopProduct(
-            id=str(product.id),
-            sku=product.sku or "",
-            name=product.name,
-            description=product.description,
-            price=price * 100,  # Convert to pence
-            images=product_images,
-            categories=product_categories_list,
-            designer=designer_info,
-            in_stock=is_print_to_order or product.units_in_stock > 0,
-            stock_count=None if is_print_to_order else product.units_in_stock,
-            print_to_order=is_print_to_order,
-            free_shipping=getattr(product, "free_shipping", False),
-            is_dragon=is_dragon,
-            created_at=product.created_at.isoformat() if product.created_at else None,
-            seo_slug=getattr(product, "seo_slug", None),
-            shop_url=(
-                f"https://www.mystmereforge.co.uk/products/{product.seo_slug}"
-                if getattr(product, "seo_slug", None)
-                else f"https://www.mystmereforge.co.uk/product/{product.id}"
-            ),
+        result = await db.execute(
+            query.add_columns(sort_column, ShopProductProjection.product_id)
+            .offset(offset)
+            .limit(limit)
         )
-        shop_products.append(shop_product)
-
-    response.headers["Cache-Control"] = "public, s-maxage=60, stale-while-revalidate=30"
-    return ShopProductList(
-        data=shop_products,
-        total=total,
-        page=page,
-        limit=limit,
-        has_more=(page * limit) < total,
-    )
+        rows = result.all()
+        shop_products = [row.payload for row in rows]
+        if rows and offset + len(rows) < total:
+            next_cursor = encode_cursor(getattr(rows[-1], sort_column.key), rows[-1].product_id)
+
+    product_list = {
+        "data": shop_products,
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "has_more": (page * limit) < total,
+        "next_cursor": next_cursor,
+    }
+    await cache.set_shop_products(str(shop_tenant.id), cache_key, product_list)
+    return product_list
 
 
 @router.get("/products/{product_id}")
@@ -485,125 +440,30 @@ async def get_product(
 
     async def _fetch_product(filter_expr):
         r = await db.execute(
-            select(Product)
-            .options(
-                selectinload(Product.pricing),
-                selectinload(Product.images),
-                selectinload(Product.categories),
-                selectinload(Product.designer),
-                selectinload(Product.variants),
-            )
+            select(ShopProductProjection.detail)
             .where(filter_expr)
-            .where(Product.shop_visible.is_(True))
+            .where(ShopProductProjection.sales_channel_id.is_(None))
+            .limit(1)
         )
         return r.scalar_one_or_none()
 
     try:
         product_uuid = UUID(product_id)
-        product = await _fetch_product(Product.id == product_uuid)
+        product = await _fetch_product(ShopProductProjection.product_id == product_uuid)
     except ValueError:
         # Not a UUID — try exact seo_slug match first
-        product = await _fetch_product(Product.seo_slug == product_id)
+        product = await _fetch_product(ShopProductProjection.seo_slug == product_id)
         # Fall back: strip Shopify-style trailing -N suffix (e.g. capybara-1 → capybara)
         if not product:
             base_slug = _re.sub(r"-\d+$", "", product_id)
             if base_slug != product_id:
-                product = await _fetch_product(Product.seo_slug == base_slug)
+                product = await _fetch_product(ShopProductProjection.seo_slug == base_slug)
 
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
 
-    # Get pricing — only use active entries
-    price = Decimal("0")
-    active_pricing = [p for p in product.pricing if p.is_active]
-    if active_pricing:
-        price = active_pricing[0].list_price or Decimal("0")
-
-    base_price_pence = int(price * 100)
-    is_dragon = getattr(product, "is_dragon", False)
-
-    # Convert images - use API endpoint for reliable delivery
-    product_images = []
-    for img in getattr(product, "images", []):
-        image_url = img.image_url
-        if image_url.startswith("/uploads/products/"):
-            image_url = image_url.replace("/uploads/products/", "/api/v1/shop/images/")
-        product_images.append(
-            ShopProductImage(
-                url=image_url,
-                alt=img.alt_text or "",
-                is_primary=img.is_primary,
-            )
-        )
-
-    # Convert categories
-    product_categories_list = [
-        ShopProductCategory(slug=cat.slug, name=cat.name)
-        for cat in getattr(product, "categories", [])
-        if cat.is_active
-    ]
-
-    # Get designer info if available
-    designer_info = None
-    if product.designer and product.designer.is_active:
-        designer_info = ShopProductDesigner(
-            id=str(product.designer.id),
-            name=product.designer.name,
-            slug=product.designer.slug,
-        )
-
-    # Use shop_description if available, otherwise fall back to description
-    display_description = getattr(product, "shop_description", None) or product.description
-
-    # Build variant list (active variants only, sorted by display_order)
-    shop_variants = [
-        ShopProductVariant(
-            id=str(v.id),
-            size=v.size,
-            display_order=v.display_order,
-            sku=v.sku,
-            price_pence=base_price_pence + v.price_adjustment_pence,
-            price_adjustment_pence=v.price_adjustment_pence,
-            fulfilment_type=v.fulfilment_type,
-            units_in_stock=v.units_in_stock,
-            lead_time_days=v.lead_time_days,
-            is_active=v.is_active,
-        )
-        for v in sorted(getattr(product, "variants", []), key=lambda v: v.display_order)
-        if v.is_active
-    ]
-
-    is_print_to_order = getattr(product, "print_to_order", False)
     response.headers["Cache-Control"] = "public, s-maxage=300, stale-while-revalidate=60"
-    return {
-        "data": ShopProduct(
-            id=str(product.id),
-            sku=product.sku or "",
-            name=product.name,
-            description=display_description,
-            price=base_price_pence,
-            images=product_images,
-            categories=product_categories_list,
-            designer=designer_info,
-            in_stock=is_print_to_order or product.units_in_stock > 0,
-            stock_count=None if is_print_to_order else product.units_in_stock,
-            print_to_order=is_print_to_order,
-            free_shipping=getattr(product, "free_shipping", False),
-            is_dragon=is_dragon,
-            backstory=getattr(product, "backstory", None),
-            feature_title=getattr(product, "feature_title", None),
-            variants=shop_variants,
-            created_at=product.created_at.isoformat() if product.created_at else None,
-            seo_slug=getattr(product, "seo_slug", None),
-            seo_title=getattr(product, "seo_title", None),
-            seo_description=getattr(product, "seo_description", None),
-            shop_url=(
-                f"https://www.mystmereforge.co.uk/products/{product.seo_slug}"
-                if getattr(product, "seo_slug", None)
-                else f"https://www.mystmereforge.co.uk/product/{product.id}"
-            ),
-        )
-    }
+    return {"data": product}
 
 
 @router.get("/products/{product_id}/related")
@@ -626,50 +486,40 @@ async def get_related_products(
     try:
         product_uuid = UUID(product_id)
         source = await db.execute(
-            select(Product).where(
+            select(Product.id).where(
                 Product.id == product_uuid,
                 Product.tenant_id == shop_tenant.id,
             )
         )
     except ValueError:
         source = await db.execute(
-            select(Product).where(
+            select(Product.id).where(
                 Product.seo_slug == product_id,
                 Product.tenant_id == shop_tenant.id,
             )
         )
-    source_product = source.scalars().first()
-    if not source_product:
+    source_product_id = source.scalars().first()
+    if not source_product_id:
         raise HTTPException(status_code=404, detail="Product not found")
 
     # Get category IDs for the source product
     cat_result = await db.execute(
         select(product_categories.c.category_id).where(
-            product_categories.c.product_id == source_product.id
+            product_categories.c.product_id == source_product_id
         )
     )
     source_category_ids = [row[0] for row in cat_result.fetchall()]
 
+    query = select(ShopProductProjection.payload).where(
+        ShopProductProjection.tenant_id == shop_tenant.id,
+        projection_channel_filter(channel),
+        ShopProductProjection.is_active.is_(True),
+        ShopProductProjection.product_id != source_product_id,
+    )
+
     if not source_category_ids:
         # No categories — fall back to other shop-visible products
-        result = await db.execute(
-            select(Product)
-            .options(
-                selectinload(Product.pricing),
-                selectinload(Product.images),
-                selectinload(Product.categories),
-                selectinload(Product.designer),
-            )
-            .where(
-                Product.tenant_id == shop_tenant.id,
-                Product.shop_visible.is_(True),
-                Product.is_active.is_(True),
-                Product.id != source_product.id,
-            )
-            .order_by(func.random())
-            .limit(limit)
-        )
-        related = result.scalars().all()
+        query = query.order_by(func.random())
     else:
         # Find products sharing the most categories with the source product
         shared_count = (
@@ -681,128 +531,47 @@ async def get_related_products(
             .group_by(product_categories.c.product_id)
             .subquery()
         )
+        query = query.join(
+            shared_count, ShopProductProjection.product_id == shared_count.c.product_id
+        ).order_by(desc(shared_count.c.shared))
 
-        result = await db.execute(
-            select(Product)
-            .options(
-                selectinload(Product.pricing),
-                selectinload(Product.images),
-                selectinload(Product.categories),
-                selectinload(Product.designer),
-            )
-            .join(shared_count, Product.id == shared_count.c.product_id)
-            .where(
-                Product.tenant_id == shop_tenant.id,
-                Product.shop_visible.is_(True),
-                Product.is_active.is_(True),
-                Product.id != source_product.id,
-            )
-            .order_by(desc(shared_count.c.shared))
-            .limit(limit)
-        )
-        related = result.scalars().all()
-
-    shop_products = []
-    for product in related:
-        price = Decimal("0")
-        if channel:
-            for pricing in product.pricing:
-                if pricing.sales_channel_id == channel.id and pricing.is_active:
-                    price = pricing.list_price or Decimal("0")
-                    break
-        if price == 0 and product.pricing:
-            active = [p for p in product.pricing if p.is_active]
-            if active:
-                price = active[0].list_price or Decimal("0")
-
-        product_images = []
-        for img in getattr(product, "images", []):
-            image_url = img.image_url
-            if image_url.startswith("/uploads/products/"):
-                image_url = image_url.replace("/uploads/products/", "/api/v1/shop/images/")
-            product_images.append(
-                ShopProductImage(url=image_url, alt=img.alt_text or "", is_primary=img.is_primary)
-            )
-
-        product_categories_list = [
-            ShopProductCategory(slug=cat.slug, name=cat.name)
-            for cat in getattr(product, "categories", [])
-            if cat.is_active
-        ]
-
-        designer_info = None
-        if product.designer and product.designer.is_active:
-            designer_info = ShopProductDesigner(
-                id=str(product.designer.id),
-                name=product.designer.name,
-                slug=product.designer.slug,
-            )
-
-        is_print_to_order = getattr(product, "print_to_order", False)
-        shop_products.append(
-            ShopProduct(
-                id=str(product.id),
-                sku=product.sku or "",
-                name=product.name,
-                description=product.description,
-                price=price * 100,
-                images=product_images,
-                categories=product_categories_list,
-                designer=designer_info,
-                in_stock=is_print_to_order or product.units_in_stock > 0,
-                stock_count=None if is_print_to_order else product.units_in_stock,
-                print_to_order=is_print_to_order,
-                free_shipping=getattr(product, "free_shipping", False),
-                is_dragon=getattr(product, "is_dragon", False),
-                created_at=product.created_at.isoformat() if product.created_at else None,
-                seo_slug=getattr(product, "seo_slug", None),
-                shop_url=(
-                    f"https://www.mystmereforge.co.uk/products/{product.seo_slug}"
-                    if getattr(product, "seo_slug", None)
-                    else f"https://www.mystmereforge.co.uk/product/{product.id}"
-                ),
-            )
-        )
-
-    return {"data": shop_products}
+    result = await db.execute(query.limit(limit))
+    return {"data": list(result.scalars().all())}
 
 
 @router.get("/categories")
-async def get_categories(db: AsyncSession = Depends(get_db)):
-    """Get product categories for shop navigation."""
-    from sqlalchemy import func
-
-    # Get all active categories with product counts
-    result = await db.execute(
-        select(Category)
-        .where(Category.is_active.is_(True))
-        .order_by(Category.display_order, Category.name)
-    )
-    categories = result.scalars().all()
+async def get_categories(
+    shop_context: ShopContext,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get product categories for shop navigation.
 
-    # Build response with product counts
-    category_list = []
-    for cat in categories:
-        # Count shop-visible products in this category
-        count_result = await db.execute(
-            select(func.count())
-            .select_from(product_categories)
-            .join(Product, Product.id == product_categories.c.product_id)
-            .where(product_categories.c.category_id == cat.id)
-            .where(Product.is_active.is_(True))
-            .where(Product.shop_visible.is_(True))
-        )
-        product_count = count_result.scalar_one()
+    Tenant is resolved from X-Shop-Hostname header. Product counts come from
+    one grouped aggregate (or the materialized count table when enabled), and
+    the list is cached per tenant until categories or products change.
+    """
+    shop_tenant, _ = shop_context
 
-        category_list.append(
-            ShopCategory(
-                id=str(cat.id),
-                name=cat.name,
-                slug=cat.slug,
-                product_count=product_count,
-            )
+    cache = await get_cache_service()
+    cached = await cache.get_categories(str(shop_tenant.id))
+    if cached is not None:
+        return {"data": [ShopCategory.model_validate(cat) for cat in cached]}
+
+    rows = await get_shop_category_counts(db, shop_tenant.id)
+    category_list = [
+        ShopCategory(
+            id=str(row.id),
+            name=row.name,
+            slug=row.slug,
+            product_count=row.product_count,
         )
+        for row in rows
+    ]
 
+    await cache.set_categories(
+        str(shop_tenant.id), [cat.model_dump(mode="json") for cat in category_list]
+    )
     return {"data": category_list}
 
 
@@ -904,91 +673,13 @@ async def get_dragons(db: AsyncSession = Depends(get_db)):
     which controls whether a product appears in the general showcase/gallery.
     """
     result = await db.execute(
-        select(Product)
-        .options(
-            selectinload(Product.pricing),
-            selectinload(Product.images),
-            selectinload(Product.categories),
-            selectinload(Product.designer),
-        )
-        .where(Product.is_active.is_(True))
-        .where(Product.shop_visible.is_(True))
-        .where(Product.is_dragon.is_(True))
-        .order_by(Product.created_at.desc())
+        select(ShopProductProjection.detail)
+        .where(ShopProductProjection.sales_channel_id.is_(None))
+        .where(ShopProductProjection.is_active.is_(True))
+        .where(ShopProductProjection.is_dragon.is_(True))
+        .order_by(ShopProductProjection.product_created_at.desc())
     )
-    products = result.scalars().all()
-
-    shop_products = []
-    for product in products:
-        price = Decimal("0")
-        active_pricing = [p for p in product.pricing if p.is_active]
-        if active_pricing:
-            price = active_pricing[0].list_price or Decimal("0")
-
-        # Convert images - use API endpoint for reliable delivery
-        product_images = []
-        for img in getattr(product, "images", []):
-            image_url = img.image_url
-            if image_url.startswith("/uploads/products/"):
-                image_url = image_url.replace("/uploads/products/", "/api/v1/shop/images/")
-            product_images.append(
-                ShopProductImage(
-                    url=image_url,
-                    alt=img.alt_text or "",
-                    is_primary=img.is_primary,
-                )
-            )
-
-        # Convert categories
-        product_categories_list = [
-            ShopProductCategory(slug=cat.slug, name=cat.name)
-            for cat in getattr(product, "categories", [])
-            if cat.is_active
-        ]
-
-        # Get designer info if available
-        designer_info = None
-        if product.designer and product.designer.is_active:
-            designer_info = ShopProductDesigner(
-                id=str(product.designer.id),
-                name=product.designer.name,
-                slug=product.designer.slug,
-            )
-
-        # Use shop_description if available, otherwise fall back to description
-        display_description = getattr(product, "shop_description", None) or product.description
-
-        is_print_to_order = getattr(product, "print_to_order", False)
-
-        shop_products.append(
-            ShopProduct(
-                id=str(product.id),
-                sku=product.sku or "",
-                name=product.name,
-                description=display_description,
-                price=price * 100,
-                images=product_images,
-                categories=product_categories_list,
-                designer=designer_info,
-                in_stock=is_print_to_order or product.units_in_stock > 0,
-                stock_count=None if is_print_to_order else product.units_in_stock,
-                print_to_order=is_print_to_order,
-                free_shipping=getattr(product, "free_shipping", False),
-                is_dragon=True,
-                backstory=getattr(product, "backstory", None),
-                feature_title=getattr(product, "feature_title", None),
-                seo_slug=getattr(product, "seo_slug", None),
-                seo_title=getattr(product, "seo_title", None),
-                seo_description=getattr(product, "seo_description", None),
-                shop_url=(
-                    f"https://www.mystmereforge.co.uk/products/{product.seo_slug}"
-                    if getattr(product, "seo_slug", None)
-                    else f"https://www.mystmereforge.co.uk/product/{product.id}"
-                ),
-            )
-        )
-
-    return {"data": shop_products}
+    return {"data": list(result.scalars().all())}
 
 
 # ============================================
@@ -1475,10 +1166,12 @@ async def complete_checkout(
         payment_status="completed",
     )
     db.add(db_order)
+    await db.flush()  # Assign db_order.id for the items and outbox events
 
     # Create order items
     for item in cart.items:
         db_item = OrderItemModel(
+            tenant_id=shop_tenant.id,
             order_id=db_order.id,
             product_id=UUID(item.product_id) if item.product_id else None,
             product_sku=item.product_sku or "UNKNOWN",
@@ -1499,34 +1192,55 @@ async def complete_checkout(
             if product and product.units_in_stock is not None:
                 product.units_in_stock = max(0, product.units_in_stock - item.quantity)
 
-    await db.commit()
-    await db.refresh(db_order)
-
-    # Record discount usage if a discount was applied
+    # Record discount usage in the order's transaction
     if session.discount_code and session.discount_amount > 0:
-        try:
-            from app.api.v1.discounts import record_discount_usage, get_discount_code_by_code
+        from app.api.v1.discounts import record_discount_usage, get_discount_code_by_code
 
-            discount_code_record = await get_discount_code_by_code(
+        discount_code_record = await get_discount_code_by_code(
+            db=db,
+            tenant_id=channel.tenant_id,
+            code=session.discount_code,
+        )
+        if discount_code_record:
+            await record_discount_usage(
                 db=db,
                 tenant_id=channel.tenant_id,
-                code=session.discount_code,
+                discount_code_id=discount_code_record.id,
+                order_id=db_order.id,
+                customer_email=shipping["email"],
+                discount_amount=Decimal(str(session.discount_amount)) / 100,
             )
-            if discount_code_record:
-                await record_discount_usage(
-                    db=db,
-                    tenant_id=channel.tenant_id,
-                    discount_code_id=discount_code_record.id,
-                    order_id=db_order.id,
-                    customer_email=shipping["email"],
-                    discount_amount=Decimal(str(session.discount_amount)) / 100,
-                )
-                await db.commit()
-        except Exception as e:
-            # Log but don't fail order for discount tracking errors
-            import logging as discount_logging
 
-            discount_logging.getLogger(__name__).error(f"Failed to record discount usage: {e}")
+    # Side effects that call other services run from the outbox after commit
+    outbox.enqueue(db, shop_tenant.id, outbox.EVENT_INVENTORY_CHANGED)
+    outbox.enqueue(
+        db,
+        shop_tenant.id,
+        outbox.EVENT_ORDER_CONFIRMATION_EMAIL,
+        {
+            "order_id": str(db_order.id),
+            "receipt_url": result.receipt_url if hasattr(result, "receipt_url") else None,
+        },
+    )
+    outbox.enqueue(
+        db,
+        shop_tenant.id,
+        outbox.EVENT_WEBHOOK,
+        {
+            "event_type": WebhookEventType.ORDER_CREATED.value,
+            "data": {
+                "order_id": str(db_order.id),
+                "order_number": db_order.order_number,
+                "total": str(db_order.total),
+                "customer_email": db_order.customer_email,
+                "payment_id": db_order.payment_id,
+            },
+        },
+    )
+
+    await db.commit()
+    outbox.wake_outbox_dispatcher()
+    await db.refresh(db_order)
 
     # Record order and payment metrics
     try:
@@ -1546,46 +1260,6 @@ async def complete_checkout(
     except Exception:
         pass  # Don't fail order for metrics errors
 
-    # Send order confirmation email
-    try:
-        from app.services.email_service import get_email_service
-
-        email_service = get_email_service()
-        await email_service.send_order_confirmation(
-            to_email=shipping["email"],
-            customer_name=shipping["name"],
-            order_number=db_order.order_number,
-            order_items=[
-                {
-                    "name": item.product_name,
-                    "quantity": item.quantity,
-                    "price": float(item.unit_price) / 100,
-                }
-                for item in cart.items
-            ],
-            subtotal=float(session.subtotal) / 100,
-            shipping_cost=float(session.shipping_cost) / 100,
-            total=float(session.total) / 100,
-            shipping_address={
-                "address_line1": shipping["line1"],
-                "address_line2": shipping.get("line2"),
-                "city": shipping["city"],
-                "county": shipping.get("county"),
-                "postcode": shipping["postcode"],
-                "country": "United Kingdom",
-            },
-            receipt_url=result.receipt_url if hasattr(result, "receipt_url") else None,
-        )
-        # Track that confirmation email was sent
-        db_order.confirmation_email_sent = True
-        db_order.confirmation_email_sent_at = datetime.now(timezone.utc)
-        await db.commit()
-    except Exception as e:
-        # Log but don't fail order for email errors
-        import logging
-
-        logging.getLogger(__name__).error(f"Failed to send order confirmation email: {e}")
-
     # Create order response
     order = Order(
         order_number=db_order.order_number,
@@ -1698,6 +1372,7 @@ async def get_product_image(
     product_id: str,
     image_filename: str,
     request: Request,
+    w: Optional[int] = Query(None, ge=1, le=4000, description="Requested width in pixels"),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -1705,16 +1380,54 @@ async def get_product_image(
 
     This endpoint proxies image requests through /api/v1/shop/images/
     and works with both local storage and S3/MinIO.
+
+    Pass ``w`` for a narrower variant; clients advertising AVIF/WebP in
+    ``Accept`` get that format. Variants are rendered once, stored next to the
+    source image and served with a content-hash ETag.
     """
+    from app.services.image_derivatives import (
+        content_etag,
+        get_image_derivatives,
+        negotiate_extension,
+    )
     from app.services.image_storage import get_image_storage, ImageStorageError
+    from app.utils.file_streaming import stream_file_response
     from app.models.product_image import ProductImage
     from email.utils import formatdate, parsedate_to_datetime
     import calendar
 
     image_url = f"/uploads/products/{product_id}/{image_filename}"
+    accept = request.headers.get("accept")
+    source_extension = image_filename.rsplit(".", 1)[-1].lower()
+
+    # Responsive variant: resized and/or re-encoded for this client
+    reencode = negotiate_extension(accept, source_extension) != negotiate_extension(
+        None, source_extension
+    )
+    if w is not None or reencode:
+        try:
+            content, content_type = await get_image_derivatives().get_variant(image_url, w, accept)
+        except ImageStorageError:
+            raise HTTPException(status_code=404, detail="Image not found")
+
+        headers = {
+            "Cache-Control": "public, max-age=86400",
+            "ETag": content_etag(content),
+            "Vary": "Accept",
+        }
+        if_none_match = request.headers.get("if-none-match", "")
+        if headers["ETag"] in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+        return Response(content=content, media_type=content_type, headers=headers)
 
     # Look up image record for cache metadata
-    stmt = select(ProductImage).where(ProductImage.image_url == image_url)
+    # Identical uploads share a URL, so several records may match
+    stmt = (
+        select(ProductImage)
+        .where(ProductImage.image_url == image_url)
+        .order_by(ProductImage.created_at)
+        .limit(1)
+    )
     result = await db.execute(stmt)
     img_record = result.scalar_one_or_none()
 
@@ -1737,15 +1450,15 @@ async def get_product_image(
 
     storage = get_image_storage()
     try:
-        image_content, content_type = await storage.get_image(image_url)
-        cache_headers = {"Cache-Control": "public, max-age=86400"}
+        stored = await storage.open_image(image_url)
+        cache_headers = {"Cache-Control": "public, max-age=86400", "Vary": "Accept"}
         if etag:
             cache_headers["ETag"] = etag
         if last_modified_dt:
             cache_headers["Last-Modified"] = formatdate(
                 calendar.timegm(last_modified_dt.timetuple()), usegmt=True
             )
-        return Response(content=image_content, media_type=content_type, headers=cache_headers)
+        return stream_file_response(request, stored, cache_headers)
     except ImageStorageError:
         raise HTTPException(status_code=404, detail="Image not found")
 
@@ -14,6 +14,7 @@ from app.models.material import MaterialType
 from app.models.spool import Spool
 from app.schemas.material import MaterialTypeCreate, MaterialTypeResponse
 from app.schemas.spool import SpoolCreate, SpoolListResponse, SpoolResponse, SpoolUpdate
+from app.services.cache_service import invalidate_on_inventory_change
 
 router = APIRouter()
 
@@ -87,6 +88,7 @@ async def create_spool(
             detail="Invalid foreign key reference - check filament_type_id exists.",
         )
     await db.refresh(spool)
+    await invalidate_on_inventory_change(str(tenant.id))
 
     return SpoolResponse(**spool_to_response(spool))
 
@@ -336,6 +338,7 @@ async def update_spool(
             detail="Invalid foreign key reference - check filament_type_id exists.",
         )
     await db.refresh(spool)
+    await invalidate_on_inventory_change(str(tenant.id))
 
     return SpoolResponse(**spool_to_response(spool))
 
@@ -370,6 +373,7 @@ async def delete_spool(
 
     await db.delete(spool)
     await db.commit()
+    await invalidate_on_inventory_change(str(tenant.id))
 
 
 # export/import removed in Phase 1 (stale field names from pre-migration model)
@@ -444,5 +448,6 @@ async def duplicate_spool(
     db.add(new_spool)
     await db.commit()
     await db.refresh(new_spool)
+    await invalidate_on_inventory_change(str(tenant.id))
 
     return SpoolResponse(**spool_to_response(new_spool))
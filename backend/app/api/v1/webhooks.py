@@ -23,6 +23,7 @@ from app.schemas.webhook import (
     WebhookTestResult,
 )
 from app.services.webhook_service import WebhookService
+from app.utils.pagination import InvalidCursorError, encode_cursor
 
 router = APIRouter(tags=["Webhooks"])
 
@@ -236,11 +237,45 @@ async def list_deliveries(
     ),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
+    after: Optional[str] = Query(None, description="Cursor: return the page after this one"),
+    before: Optional[str] = Query(None, description="Cursor: return the page before this one"),
+    include_total: bool = Query(False, description="Count total matches in cursor mode"),
     tenant: Tenant = Depends(get_current_tenant),
     db: AsyncSession = Depends(get_db),
 ):
-    """List webhook deliveries with optional filtering."""
+    """
+    List webhook deliveries with optional filtering.
+
+    Passing an ``after``/``before`` cursor switches to keyset pagination over
+    (created_at, id); ``page`` is then ignored.
+    """
     service = WebhookService(db)
+
+    if after or before:
+        try:
+            keyset_page, total = await service.list_deliveries_keyset(
+                tenant_id=tenant.id,
+                subscription_id=subscription_id,
+                event_type=event_type,
+                status=delivery_status,
+                limit=limit,
+                after=after,
+                before=before,
+                include_total=include_total,
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        return WebhookDeliveryList(
+            deliveries=[WebhookDeliveryResponse.model_validate(d) for d in keyset_page.items],
+            total=total,
+            page=page,
+            limit=limit,
+            has_more=keyset_page.next_cursor is not None,
+            next_cursor=keyset_page.next_cursor,
+            prev_cursor=keyset_page.prev_cursor,
+        )
+
     offset = (page - 1) * limit
 
     deliveries, total = await service.list_deliveries(
@@ -252,12 +287,16 @@ async def list_deliveries(
         offset=offset,
     )
 
+    has_more = (offset + len(deliveries)) < total
     return WebhookDeliveryList(
         deliveries=[WebhookDeliveryResponse.model_validate(d) for d in deliveries],
         total=total,
         page=page,
         limit=limit,
-        has_more=(offset + len(deliveries)) < total,
+        has_more=has_more,
+        next_cursor=(
+            encode_cursor(deliveries[-1].created_at, deliveries[-1].id) if has_more else None
+        ),
     )
 
 
@@ -357,14 +357,22 @@ async def get_shop_tenant(
         resolve_tenant_by_custom_domain,
         resolve_tenant_by_slug,
     )
+    from app.services.tenant_routing import attach, tenant_routing_index
 
     hostname = x_shop_hostname.lower().strip()
+
+    # Fast path: in-process routing index (no SQL)
+    route = tenant_routing_index.lookup(hostname)
+    if route:
+        return await attach(db, route.tenant)
+
     logger.debug(f"Resolving shop tenant for hostname: {hostname}")
 
     # Try custom domain first
     tenant = await resolve_tenant_by_custom_domain(db, hostname)
     if tenant:
         logger.info(f"Resolved shop tenant via custom domain: {tenant.slug}")
+        tenant_routing_index.store_tenant(hostname, tenant)
         return tenant
 
     # Try subdomain extraction
@@ -373,6 +381,7 @@ async def get_shop_tenant(
         tenant = await resolve_tenant_by_slug(db, subdomain)
         if tenant:
             logger.info(f"Resolved shop tenant via subdomain: {tenant.slug}")
+            tenant_routing_index.store_tenant(hostname, tenant)
             return tenant
 
     # No tenant found
@@ -403,6 +412,12 @@ async def get_shop_sales_channel(
         HTTPException: 500 if tenant has no online shop channel configured
     """
     from app.models.sales_channel import SalesChannel
+    from app.services.tenant_routing import attach, tenant_routing_index
+
+    # Fast path: channel cached alongside the tenant's routing entry
+    cached_channel = tenant_routing_index.get_channel(shop_tenant.id)
+    if cached_channel:
+        return shop_tenant, await attach(db, cached_channel)
 
     # Find the tenant's online shop sales channel
     result = await db.execute(
@@ -421,6 +436,7 @@ async def get_shop_sales_channel(
             detail=f"Shop '{shop_tenant.slug}' is not properly configured (no sales channel)",
         )
 
+    tenant_routing_index.store_channel(shop_tenant.id, channel)
     return shop_tenant, channel
 
 
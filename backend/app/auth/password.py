@@ -1,19 +1,41 @@
-"""Password hashing utilities using bcrypt."""
+"""Password hashing utilities using bcrypt.
+
+bcrypt is deliberately slow (~250 ms at 12 rounds), so request handlers must
+use the async API (``hash_password_async``, ``verify_password_async`` and
+``verify_and_update_async``). These run bcrypt on a ``BoundedExecutor``;
+bcrypt releases the GIL while hashing, so threads give real parallelism
+without blocking the event loop. When too many calls are queued,
+``PasswordHasherBusyError`` is raised and surfaced as 503.
+
+The synchronous helpers remain for scripts and startup code.
+"""
+
+from typing import Optional
 
 import bcrypt
 
+from app.config import get_settings
+from app.utils.worker_pool import BoundedExecutor, WorkerPoolBusyError
+
+settings = get_settings()
+
+
+class PasswordHasherBusyError(WorkerPoolBusyError):
+    """Raised when the password hashing queue is full."""
+
 
-def get_password_hash(password: str) -> str:
+def get_password_hash(password: str, rounds: Optional[int] = None) -> str:
     """
     Hash a password using bcrypt.
 
     Args:
         password: Plain text password
+        rounds: bcrypt cost factor (defaults to settings.password_hash_rounds)
 
     Returns:
         Bcrypt hashed password as string
     """
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=rounds or settings.password_hash_rounds)
     hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
     return hashed.decode("utf-8")
 
@@ -29,4 +51,139 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
+    if not hashed_password:
+        return False
     return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a hash was made with a different cost than configured.
+
+    Args:
+        hashed_password: Bcrypt hashed password ("$2b$<cost>$...")
+
+    Returns:
+        True if the hash should be regenerated with the current cost
+    """
+    try:
+        cost = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return cost != settings.password_hash_rounds
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt calls in a bounded thread pool.
+
+    At most ``workers`` calls hash concurrently; up to ``max_pending`` more
+    wait in the executor queue. Beyond that, calls fail fast with
+    ``PasswordHasherBusyError`` rather than queueing unboundedly.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        """
+        Initialize the hasher.
+
+        Args:
+            workers: Number of worker threads
+            max_pending: Calls allowed to wait for a free worker
+        """
+        self._pool = BoundedExecutor("password-hash", workers, max_pending)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls running or queued."""
+        return self._pool.in_flight
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with the configured cost."""
+        return await self._pool.run(
+            "hash", get_password_hash, password, busy_error=PasswordHasherBusyError
+        )
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against a bcrypt hash."""
+        if not hashed_password:
+            return False
+        return await self._pool.run(
+            "verify",
+            verify_password,
+            plain_password,
+            hashed_password,
+            busy_error=PasswordHasherBusyError,
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker threads (waits for running calls)."""
+        self._pool.shutdown()
+
+
+# Global hasher instance
+_password_hasher: Optional[PasswordHasher] = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Get or create the global password hasher."""
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher(
+            workers=settings.password_hash_workers,
+            max_pending=settings.password_hash_max_pending,
+        )
+    return _password_hasher
+
+
+def shutdown_password_hasher() -> None:
+    """Shut down the global password hasher's thread pool."""
+    global _password_hasher
+    if _password_hasher is not None:
+        _password_hasher.shutdown()
+        _password_hasher = None
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password off the event loop.
+
+    Raises:
+        PasswordHasherBusyError: If the hashing queue is full
+    """
+    return await get_password_hasher().hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password off the event loop.
+
+    Raises:
+        PasswordHasherBusyError: If the hashing queue is full
+    """
+    return await get_password_hasher().verify(plain_password, hashed_password)
+
+
+async def verify_and_update_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if the stored cost is outdated.
+
+    Lets ``password_hash_rounds`` be raised or lowered without forcing
+    password resets: each user's hash is upgraded on their next login.
+
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Stored bcrypt hash
+
+    Returns:
+        Tuple of (password matches, new hash to store or None)
+
+    Raises:
+        PasswordHasherBusyError: If the hashing queue is full
+    """
+    if not await verify_password_async(plain_password, hashed_password):
+        return False, None
+    if needs_rehash(hashed_password):
+        return True, await hash_password_async(plain_password)
+    return True, None
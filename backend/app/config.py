@@ -53,6 +53,8 @@ class Settings(BaseSettings):
     # Caching
     cache_enabled: bool = True
     cache_default_ttl: int = 300  # 5 minutes
+    cache_local_max_entries: int = 10_000  # In-process L1 tier size (0 disables it)
+    cache_local_ttl: int = 10  # Upper bound on L1 entry lifetime (seconds)
 
     # CORS - add your tenant domains via CORS_ORIGINS environment variable
     cors_origins: list[str] = [
@@ -82,6 +84,14 @@ class Settings(BaseSettings):
     storage_s3_endpoint: str = ""  # MinIO endpoint, empty for AWS S3
     storage_s3_access_key: str = ""
     storage_s3_secret_key: str = ""
+    # Redirect model file downloads to short-lived presigned S3 URLs
+    storage_s3_presigned_downloads: bool = False
+    storage_s3_presigned_expiry_seconds: int = 300
+
+    # Image processing pools (Pillow and boto3 run off the event loop)
+    image_cpu_workers: int = 2  # Concurrent decode/resize/encode jobs per process
+    image_io_workers: int = 8  # Concurrent storage reads/writes per process
+    image_max_pending: int = 32  # Queued jobs per pool before new ones get 503
 
     # Security
     # SECURITY: No default - must be set via SECRET_KEY environment variable
@@ -89,6 +99,32 @@ class Settings(BaseSettings):
     secret_key: str
     access_token_expire_minutes: int = 60 * 24  # 24 hours
 
+    # Password hashing (bcrypt runs in a thread pool off the event loop)
+    password_hash_rounds: int = 12  # bcrypt cost; older hashes are upgraded on login
+    password_hash_workers: int = 4  # Concurrent hash/verify calls per process
+    password_hash_max_pending: int = 64  # Queued calls before new ones get 503
+
+    # Outbound HTTP (one shared keep-alive client per integration)
+    http_client_max_connections: int = 100  # Per client, across destination hosts
+    http_client_max_keepalive_connections: int = 20
+    http_client_keepalive_expiry_seconds: float = 30.0
+    http_client_connect_timeout_seconds: float = 5.0
+    http_client_timeout_seconds: float = 30.0  # Default read/write/pool; calls may override
+    http_client_http2: bool = True  # Negotiated when the h2 package is installed
+
+    # Webhook delivery worker (claims queued deliveries with FOR UPDATE SKIP LOCKED)
+    webhook_worker_in_process: bool = True  # Disable when running scripts.run_webhook_worker
+    webhook_worker_concurrency: int = 16  # Concurrent deliveries per worker process
+    webhook_worker_per_subscription: int = 2  # Concurrent deliveries per subscriber URL
+    webhook_worker_poll_interval_seconds: float = 5.0
+    webhook_worker_lease_seconds: int = 120  # Claimed rows become due again after this
+
+    # Transactional outbox dispatcher (post-commit emails, webhooks, syncs)
+    outbox_dispatcher_in_process: bool = True  # Disable when running scripts.run_outbox_dispatcher
+    outbox_dispatcher_concurrency: int = 8  # Concurrent handlers per process
+    outbox_dispatcher_poll_interval_seconds: float = 5.0
+    outbox_dispatcher_lease_seconds: int = 120  # Claimed events become due again after this
+
     # Square Payments (optional - for shop checkout)
     square_app_id: str = ""  # Application ID for Web Payments SDK
     square_access_token: str = ""
@@ -124,6 +160,10 @@ class Settings(BaseSettings):
     shop_social_handle: str = ""  # Social media handle (e.g., "@yourshop")
     shop_brand_color: str = "#6366f1"  # Primary brand color (hex) for emails
 
+    # Shop navigation: read category product counts from the materialized
+    # category_product_counts table instead of aggregating on each request
+    shop_category_counts_materialized: bool = False
+
     @model_validator(mode="after")
     def validate_secret_key(self) -> "Settings":
         """Validate that secret_key meets security requirements."""
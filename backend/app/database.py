@@ -3,7 +3,9 @@
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any, Optional
 
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -85,6 +87,20 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def set_tenant_context(session: AsyncSession, tenant_id: Optional[Any]) -> None:
+    """
+    Scope the session's current transaction to a tenant for RLS.
+
+    For background workers that serve many tenants from one session factory.
+    Like ``SET LOCAL``, the setting ends with the transaction, so call it
+    again after each commit.
+    """
+    if settings.rls_enabled and tenant_id:
+        await session.execute(
+            select(func.set_config("app.current_tenant_id", str(tenant_id), True))
+        )
+
+
 async def init_db() -> None:
     """Initialize database (create tables if they don't exist)."""
     async with engine.begin() as conn:
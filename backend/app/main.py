@@ -11,10 +11,14 @@ from fastapi.responses import JSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
+from app.auth.password import shutdown_password_hasher
 from app.config import get_settings
 from app.core.rate_limit import limiter
 from app.database import close_db, get_db, init_db
 from app.middleware.security import SecurityHeadersMiddleware
+from app.services.image_storage import shutdown_image_pools
+from app.utils.http_client import close_http_clients
+from app.utils.worker_pool import WorkerPoolBusyError
 
 settings = get_settings()
 
@@ -61,10 +65,48 @@ async def lifespan(app: FastAPI):
         setup_metrics(prometheus_port=9090)
         print("✓ OpenTelemetry metrics enabled")
 
+    # Evict in-process cache entries when other workers invalidate them
+    if settings.cache_enabled:
+        from app.services.cache_service import get_cache_service
+
+        cache = await get_cache_service()
+        await cache.start_invalidation_listener()
+        print("✓ Cache invalidation listener started")
+
+    # Send queued webhook deliveries (can also run as scripts.run_webhook_worker)
+    if settings.webhook_worker_in_process:
+        from app.services.webhook_worker import start_webhook_worker
+
+        start_webhook_worker()
+        print("✓ Webhook delivery worker started")
+
+    # Run post-commit side effects (can also run as scripts.run_outbox_dispatcher)
+    if settings.outbox_dispatcher_in_process:
+        from app.services.outbox import start_outbox_dispatcher
+
+        start_outbox_dispatcher()
+        print("✓ Outbox dispatcher started")
+
     yield
 
     # Shutdown
     print("👋 Shutting down...")
+    if settings.outbox_dispatcher_in_process:
+        from app.services.outbox import stop_outbox_dispatcher
+
+        await stop_outbox_dispatcher()
+    if settings.webhook_worker_in_process:
+        from app.services.webhook_worker import stop_webhook_worker
+
+        await stop_webhook_worker()
+    if settings.cache_enabled:
+        from app.services.cache_service import get_cache_service
+
+        cache = await get_cache_service()
+        await cache.close()
+    shutdown_password_hasher()
+    shutdown_image_pools()
+    await close_http_clients()
     await close_db()
     print("✓ Database connections closed")
 
@@ -87,6 +129,17 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+
+@app.exception_handler(WorkerPoolBusyError)
+async def worker_pool_busy_handler(request: Request, exc: WorkerPoolBusyError):
+    """Shed load when a blocking-work pool (bcrypt, images) is saturated."""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Service busy, please retry shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+
 # Early OPTIONS handler - bypass dependencies for CORS preflight
 from starlette.middleware.base import BaseHTTPMiddleware
 
@@ -399,6 +452,7 @@ async def serve_uploaded_image(
     and works with both local filesystem and S3/MinIO storage backends.
     """
     from app.services.image_storage import get_image_storage, ImageStorageError
+    from app.utils.file_streaming import stream_file_response
     from app.models.product_image import ProductImage
     from email.utils import formatdate, parsedate_to_datetime
     from sqlalchemy import select
@@ -406,7 +460,13 @@ async def serve_uploaded_image(
 
     image_url = f"/uploads/products/{product_id}/{filename}"
 
-    stmt = select(ProductImage).where(ProductImage.image_url == image_url)
+    # Identical uploads share a URL, so several records may match
+    stmt = (
+        select(ProductImage)
+        .where(ProductImage.image_url == image_url)
+        .order_by(ProductImage.created_at)
+        .limit(1)
+    )
     result = await db.execute(stmt)
     img_record = result.scalar_one_or_none()
 
@@ -428,7 +488,7 @@ async def serve_uploaded_image(
 
     storage = get_image_storage()
     try:
-        image_content, content_type = await storage.get_image(image_url)
+        stored = await storage.open_image(image_url)
         cache_headers = {"Cache-Control": "public, max-age=86400"}
         if etag:
             cache_headers["ETag"] = etag
@@ -436,7 +496,7 @@ async def serve_uploaded_image(
             cache_headers["Last-Modified"] = formatdate(
                 calendar.timegm(last_modified_dt.timetuple()), usegmt=True
             )
-        return Response(content=image_content, media_type=content_type, headers=cache_headers)
+        return stream_file_response(request, stored, cache_headers)
     except ImageStorageError:
         raise HTTPException(status_code=404, detail="Image not found")
 
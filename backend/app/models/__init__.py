@@ -1,12 +1,16 @@
 """Database models."""
 
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper
+
 from app.models.base import TimestampMixin, UUIDMixin
 from app.models.consumable import ConsumablePurchase, ConsumableType, ConsumableUsage
 from app.models.material import MaterialType
 
 # Model (printed items) - renamed from Product
 from app.models.model import Model
-from app.models.model_file import ModelFile, ModelFileType
+from app.models.model_file import ModelFile, ModelFileType, ModelFileUpload
+from app.models.storage_blob import StorageBlob
 from app.models.model_material import ModelMaterial
 from app.models.model_component import ModelComponent
 
@@ -20,7 +24,7 @@ from app.models.model_printer_config import ModelPrinterConfig
 from app.models.print_job import JobPriority, JobStatus, PrintJob
 
 # Product (sellable items composed of models and/or other products)
-from app.models.category import Category, product_categories
+from app.models.category import Category, CategoryProductCount, product_categories
 from app.models.designer import Designer
 from app.models.product import Product
 from app.models.product_component import ProductComponent
@@ -32,12 +36,21 @@ from app.models.product_variant import FulfilmentType, ProductSizeSystem, Produc
 # Sales channels
 from app.models.sales_channel import SalesChannel
 
+# Shop read model
+from app.models.shop_product_projection import ShopProductProjection
+
 # External listings (marketplace integrations)
 from app.models.external_listing import ExternalListing
 
 # Orders
 from app.models.order import Order, OrderItem, OrderStatus
 
+# Sales reporting rollup
+from app.models.daily_product_sales import DailyProductSales
+
+# Costing read model
+from app.models.cost_snapshot import ModelCostSnapshot, ProductCostSnapshot
+
 # Discounts
 from app.models.discount import DiscountCode, DiscountType, DiscountUsage
 
@@ -83,6 +96,9 @@ from app.models.webhook import (
     WebhookSubscription,
 )
 
+# Transactional outbox
+from app.models.outbox import OutboxEvent, OutboxEventStatus
+
 # Webhook Events (inbound)
 from app.models.webhook_event import (
     WebhookDeadLetter,
@@ -107,6 +123,8 @@ __all__ = [
     "Model",
     "ModelFile",
     "ModelFileType",
+    "ModelFileUpload",
+    "StorageBlob",
     "ModelMaterial",
     "ModelComponent",
     # Printers
@@ -121,6 +139,7 @@ __all__ = [
     "JobStatus",
     # Products (sellable items)
     "Category",
+    "CategoryProductCount",
     "product_categories",
     "Designer",
     "Product",
@@ -133,12 +152,17 @@ __all__ = [
     "ProductSizeSystem",
     # Sales
     "SalesChannel",
+    "ShopProductProjection",
     # External listings
     "ExternalListing",
     # Orders
     "Order",
     "OrderItem",
     "OrderStatus",
+    "DailyProductSales",
+    # Costing
+    "ModelCostSnapshot",
+    "ProductCostSnapshot",
     # Discounts
     "DiscountCode",
     "DiscountType",
@@ -187,6 +211,9 @@ __all__ = [
     "WebhookDelivery",
     "WebhookEventType",
     "WebhookSubscription",
+    # Transactional outbox
+    "OutboxEvent",
+    "OutboxEventStatus",
     # Webhook Events (inbound)
     "WebhookDeadLetter",
     "WebhookEvent",
@@ -202,3 +229,13 @@ __all__ = [
     "PlatformAdminAuditLog",
     "PlatformSetting",
 ]
+
+
+# Session hooks that keep the read models above (shop projection, daily sales
+# rollup, cost snapshots) in sync on write. Registered here, next to the
+# models, so every process that uses the ORM maintains them - not only the
+# API. The import is deferred to first mapper configuration (which precedes
+# any flush) because the hook modules import schemas that import models.
+@event.listens_for(Mapper, "after_configured", once=True)
+def _register_read_model_hooks() -> None:
+    from app.services import cost_snapshots, sales_rollup, shop_projection  # noqa: F401
@@ -97,3 +97,40 @@ class Category(Base, UUIDMixin, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<Category {self.name} ({self.slug})>"
+
+
+class CategoryProductCount(Base):
+    """
+    Materialized count of shop-visible products per category.
+
+    Optional read model for shop navigation (see
+    ``settings.shop_category_counts_materialized``). Rows are rebuilt per
+    tenant by ``app.services.category_counts.refresh_category_counts``
+    whenever product visibility or category membership changes.
+    """
+
+    __tablename__ = "category_product_counts"
+
+    category_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("categories.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # Tenant isolation
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="Tenant ID for multi-tenant isolation",
+    )
+
+    product_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Active, shop-visible products in this category",
+    )
+
+    def __repr__(self) -> str:
+        return f"<CategoryProductCount {self.category_id}: {self.product_count}>"
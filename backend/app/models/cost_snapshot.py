@@ -0,0 +1,130 @@
+"""Stored make-cost breakdowns for products and models (costing read model)."""
+
+import uuid
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import ForeignKey, Index, Integer, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.models.base import TimestampMixin, UUIDMixin
+
+
+class ModelCostSnapshot(Base, UUIDMixin, TimestampMixin):
+    """
+    The unit cost breakdown of one model, as ``CostingService`` computes it.
+
+    Rows are rebuilt by ``app.services.cost_snapshots`` whenever the model's
+    labor, overhead or batch settings, or its material and component lines,
+    change.
+    """
+
+    __tablename__ = "model_cost_snapshots"
+
+    # Tenant isolation
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Tenant ID for multi-tenant isolation",
+    )
+
+    model_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("models.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+        comment="Model costed",
+    )
+
+    material_cost: Mapped[Decimal] = mapped_column(
+        Numeric(10, 3), nullable=False, comment="Material cost per unit"
+    )
+    component_cost: Mapped[Decimal] = mapped_column(
+        Numeric(10, 3), nullable=False, comment="Component cost per unit"
+    )
+    labor_cost: Mapped[Decimal] = mapped_column(
+        Numeric(10, 3), nullable=False, comment="Labor cost per unit"
+    )
+    overhead_cost: Mapped[Decimal] = mapped_column(
+        Numeric(10, 3), nullable=False, comment="Overhead cost per unit"
+    )
+    total_cost: Mapped[Decimal] = mapped_column(
+        Numeric(10, 3), nullable=False, comment="Total cost per unit"
+    )
+
+    __table_args__ = (
+        Index("ix_model_cost_snapshots_tenant_total", "tenant_id", "total_cost"),
+        {"comment": "Computed model cost breakdowns"},
+    )
+
+    def __repr__(self) -> str:
+        return f"<ModelCostSnapshot(model={self.model_id}, total={self.total_cost})>"
+
+
+class ProductCostSnapshot(Base, UUIDMixin, TimestampMixin):
+    """
+    The make cost breakdown of one product, as ``CostingService`` computes it.
+
+    Rows are rebuilt by ``app.services.cost_snapshots`` whenever the product,
+    one of its model or child product lines, a model it uses, its packaging
+    consumable's price, or any product nested inside it changes. The product
+    list and profit calculations read ``total_make_cost`` from here instead
+    of walking the bill of materials on every request.
+    """
+
+    __tablename__ = "product_cost_snapshots"
+
+    # Tenant isolation
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Tenant ID for multi-tenant isolation",
+    )
+
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+        comment="Product costed",
+    )
+
+    models_cost: Mapped[Decimal] = mapped_column(
+        Numeric(10, 2), nullable=False, comment="Total cost of all models"
+    )
+    child_products_cost: Mapped[Decimal] = mapped_column(
+        Numeric(10, 2), nullable=False, comment="Total cost of child products"
+    )
+    packaging_cost: Mapped[Decimal] = mapped_column(
+        Numeric(10, 2), nullable=False, comment="Packaging cost"
+    )
+    assembly_cost: Mapped[Decimal] = mapped_column(
+        Numeric(10, 2), nullable=False, comment="Assembly labor cost"
+    )
+    total_make_cost: Mapped[Decimal] = mapped_column(
+        Numeric(10, 2), nullable=False, comment="Total make cost"
+    )
+
+    # Actual cost tracking from production runs
+    models_actual_cost: Mapped[Optional[Decimal]] = mapped_column(
+        Numeric(10, 2), nullable=True, comment="Actual production cost of models"
+    )
+    total_actual_cost: Mapped[Optional[Decimal]] = mapped_column(
+        Numeric(10, 2), nullable=True, comment="Actual make cost (all models have data)"
+    )
+    cost_variance_percentage: Mapped[Optional[Decimal]] = mapped_column(
+        Numeric(10, 2), nullable=True, comment="Actual vs theoretical cost variance (%)"
+    )
+    models_with_actual_cost: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="Models with actual cost data"
+    )
+    models_total: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="Distinct models in product"
+    )
+
+    __table_args__ = (
+        Index("ix_product_cost_snapshots_tenant_make_cost", "tenant_id", "total_make_cost"),
+        {"comment": "Computed product make cost breakdowns"},
+    )
+
+    def __repr__(self) -> str:
+        return f"<ProductCostSnapshot(product={self.product_id}, total={self.total_make_cost})>"
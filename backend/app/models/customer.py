@@ -9,7 +9,6 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-import bcrypt
 from sqlalchemy import Boolean, ForeignKey, String, DateTime, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -150,15 +149,35 @@ class Customer(Base, UUIDMixin, TimestampMixin):
 
     def verify_password(self, plain_password: str) -> bool:
         """Verify a plain password against the hashed password."""
-        if not self.hashed_password:
-            return False
-        return bcrypt.checkpw(plain_password.encode("utf-8"), self.hashed_password.encode("utf-8"))
+        from app.auth.password import verify_password
+
+        return verify_password(plain_password, self.hashed_password)
 
     def set_password(self, plain_password: str) -> None:
         """Hash and set the customer's password."""
-        salt = bcrypt.gensalt(rounds=12)
-        hashed = bcrypt.hashpw(plain_password.encode("utf-8"), salt)
-        self.hashed_password = hashed.decode("utf-8")
+        from app.auth.password import get_password_hash
+
+        self.hashed_password = get_password_hash(plain_password)
+
+    async def verify_password_async(self, plain_password: str) -> bool:
+        """
+        Verify a password off the event loop.
+
+        If the stored hash uses an outdated bcrypt cost, it is replaced with a
+        fresh hash; the caller commits it with the rest of the request.
+        """
+        from app.auth.password import verify_and_update_async
+
+        valid, new_hash = await verify_and_update_async(plain_password, self.hashed_password)
+        if new_hash:
+            self.hashed_password = new_hash
+        return valid
+
+    async def set_password_async(self, plain_password: str) -> None:
+        """Hash and set the customer's password off the event loop."""
+        from app.auth.password import hash_password_async
+
+        self.hashed_password = await hash_password_async(plain_password)
 
     def generate_verification_token(self) -> str:
         """Generate a new email verification token."""
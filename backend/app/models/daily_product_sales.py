@@ -0,0 +1,83 @@
+"""Daily sales rollup per product and sales channel (reporting read model)."""
+
+import uuid
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import Date, ForeignKey, Index, Integer, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.models.base import TimestampMixin, UUIDMixin
+
+
+class DailyProductSales(Base, UUIDMixin, TimestampMixin):
+    """
+    Units and revenue sold of one product through one channel on one day.
+
+    One row is kept per (tenant, product, sales channel, UTC day) that had
+    sales; ``sales_channel_id`` is NULL for orders without a channel. Only
+    orders that count as demand (pending, processing, shipped, delivered) are
+    included, so cancelling or refunding an order removes its sales.
+
+    Rows are rebuilt by ``app.services.sales_rollup`` for every day on which
+    an order or order item changes.
+    """
+
+    __tablename__ = "daily_product_sales"
+
+    # Tenant isolation
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Tenant ID for multi-tenant isolation",
+    )
+
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Product sold",
+    )
+
+    sales_channel_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        ForeignKey("sales_channels.id", ondelete="SET NULL"),
+        nullable=True,
+        comment="Channel the orders came from (NULL = no channel)",
+    )
+
+    day: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+        comment="UTC day the orders were placed",
+    )
+
+    units_sold: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Sum of order item quantities",
+    )
+
+    revenue: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        nullable=False,
+        default=Decimal("0"),
+        comment="Sum of order item totals",
+    )
+
+    order_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of distinct orders",
+    )
+
+    __table_args__ = (
+        Index("ix_daily_product_sales_tenant_day", "tenant_id", "day"),
+        Index("ix_daily_product_sales_tenant_product_day", "tenant_id", "product_id", "day"),
+        {"comment": "Daily sales rollup per product and sales channel"},
+    )
+
+    def __repr__(self) -> str:
+        return f"<DailyProductSales(product={self.product_id}, day={self.day})>"
@@ -105,6 +105,12 @@ class ModelFile(Base, UUIDMixin, TimestampMixin):
         comment="MIME content type (e.g., model/stl, model/3mf)",
     )
 
+    content_sha256: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="Hex SHA-256 of the stored content (null for local references)",
+    )
+
     # Multi-part model support
     part_name: Mapped[Optional[str]] = mapped_column(
         String(100),
@@ -162,3 +168,77 @@ class ModelFile(Base, UUIDMixin, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<ModelFile(id={self.id}, model_id={self.model_id}, type={self.file_type}, filename={self.original_filename})>"
+
+
+class ModelFileUpload(Base, UUIDMixin, TimestampMixin):
+    """
+    A resumable, chunked upload of a model file that has not completed yet.
+
+    Chunks are appended to a staging file under the storage path; once
+    ``received_size`` reaches ``total_size`` the upload is completed into a
+    regular ModelFile and this row is deleted.
+    """
+
+    __tablename__ = "model_file_uploads"
+
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="Tenant this upload belongs to",
+    )
+
+    model_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("models.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="3D model the file will be attached to",
+    )
+
+    file_type: Mapped[str] = mapped_column(
+        String(30),
+        nullable=False,
+        comment="File type of the resulting ModelFile",
+    )
+
+    original_filename: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        comment="Original filename as uploaded",
+    )
+
+    content_type: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="MIME content type declared by the client",
+    )
+
+    total_size: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        comment="Declared size of the complete file in bytes",
+    )
+
+    received_size: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        comment="Bytes received so far (the offset the next chunk must start at)",
+    )
+
+    part_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    version: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    is_primary: Mapped[bool] = mapped_column(default=False, nullable=False)
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    uploaded_by_user_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+        comment="User who started the upload",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ModelFileUpload(id={self.id}, model_id={self.model_id}, "
+            f"received={self.received_size}/{self.total_size})>"
+        )
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Optional
 from decimal import Decimal
 from datetime import datetime
 
-from sqlalchemy import Boolean, ForeignKey, Integer, Numeric, String, Text, DateTime
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, Numeric, String, Text, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -288,6 +288,11 @@ class Order(Base, UUIDMixin, TimestampMixin):
         lazy="noload",
     )
 
+    __table_args__ = (
+        # Keyset pagination of order listings (newest first)
+        Index("ix_orders_tenant_created_id", "tenant_id", "created_at", "id"),
+    )
+
 
 class OrderItem(Base, UUIDMixin, TimestampMixin):
     """
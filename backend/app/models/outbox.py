@@ -0,0 +1,96 @@
+"""Transactional outbox for side effects that follow a committed write.
+
+Rows are added in the same transaction as the business change (e.g. an
+order), so a side effect is recorded if and only if the change commits.
+``app.services.outbox`` dispatches them asynchronously with retries.
+"""
+
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.models.base import TimestampMixin, UUIDMixin
+from app.models.webhook import JSONBType
+
+
+class OutboxEventStatus(str, Enum):
+    """Dispatch status of an outbox event."""
+
+    PENDING = "pending"  # Waiting to be dispatched (or retried)
+    COMPLETED = "completed"  # Handler succeeded
+    FAILED = "failed"  # Retries exhausted, needs manual intervention
+
+
+class OutboxEvent(Base, UUIDMixin, TimestampMixin):
+    """
+    A side effect to run after the transaction that created it commits.
+
+    ``event_type`` selects the handler registered in ``app.services.outbox``;
+    ``payload`` holds the handler's arguments as JSON.
+    """
+
+    __tablename__ = "outbox_events"
+
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="Tenant the side effect belongs to",
+    )
+
+    event_type: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="Handler key (e.g. email.order_confirmation, webhook)",
+    )
+
+    payload: Mapped[dict] = mapped_column(
+        JSONBType,
+        nullable=False,
+        comment="Handler arguments",
+    )
+
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default=OutboxEventStatus.PENDING.value,
+        comment="Dispatch status (pending, completed, failed)",
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of dispatch attempts so far",
+    )
+
+    next_attempt_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Earliest time to (re)try; also the lease while being dispatched",
+    )
+
+    last_error: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Error from the most recent failed attempt",
+    )
+
+    completed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the handler succeeded or retries ran out",
+    )
+
+    __table_args__ = (
+        Index("ix_outbox_events_status_next_attempt", "status", "next_attempt_at"),
+        {"comment": "Post-commit side effects awaiting dispatch"},
+    )
+
+    def __repr__(self) -> str:
+        return f"<OutboxEvent({self.event_type}, status={self.status})>"
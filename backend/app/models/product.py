@@ -452,6 +452,8 @@ class Product(Base, UUIDMixin, TimestampMixin):
             "search_vector",
             postgresql_using="gin",
         ),
+        # Keyset pagination of product listings (newest first)
+        Index("ix_products_tenant_created_id", "tenant_id", "created_at", "id"),
         {"comment": "Sellable products composed of one or more printed models"},
     )
 
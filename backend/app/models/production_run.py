@@ -189,6 +189,7 @@ class ProductionRun(Base):
         UniqueConstraint("tenant_id", "run_number", name="unique_run_number_per_tenant"),
         Index("idx_production_runs_tenant", "tenant_id"),
         Index("idx_production_runs_started", "started_at"),
+        Index("idx_production_runs_tenant_started_id", "tenant_id", "started_at", "id"),
         Index("idx_production_runs_status", "status"),
         Index(
             "idx_production_runs_original",
@@ -0,0 +1,127 @@
+"""Denormalized storefront product projection (shop read model)."""
+
+import uuid
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.models.base import TimestampMixin, UUIDMixin
+
+
+class ShopProductProjection(Base, UUIDMixin, TimestampMixin):
+    """
+    Precomputed shop view of a product for one sales channel.
+
+    One row is kept per (product, sales channel) plus a channel-less row
+    (``sales_channel_id`` NULL) priced from the first active pricing entry.
+    Only shop-visible products are projected. ``payload`` holds the listing
+    card and ``detail`` the product page, both already shaped as the shop API
+    returns them, so catalogue reads need no relationship loading.
+
+    Rows are rebuilt by ``app.services.shop_projection`` whenever a product,
+    its pricing, images, variants or categories, or the tenant's categories,
+    designers or sales channels change.
+    """
+
+    __tablename__ = "shop_product_projections"
+
+    # Tenant isolation
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Tenant ID for multi-tenant isolation",
+    )
+
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="Projected product",
+    )
+
+    sales_channel_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        ForeignKey("sales_channels.id", ondelete="CASCADE"),
+        nullable=True,
+        comment="Channel the price was resolved for (NULL = default pricing)",
+    )
+
+    # Filter / sort columns
+    is_active: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        comment="Product is active (inactive products are only reachable by direct link)",
+    )
+
+    is_dragon: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        comment="Product appears in the Dragons collection",
+    )
+
+    designer_slug: Mapped[Optional[str]] = mapped_column(
+        String(100),
+        nullable=True,
+        comment="Slug of the product's designer (NULL if none or inactive)",
+    )
+
+    seo_slug: Mapped[Optional[str]] = mapped_column(
+        String(200),
+        nullable=True,
+        index=True,
+        comment="Product seo_slug for slug lookups",
+    )
+
+    price_pence: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Resolved price for this channel in pence",
+    )
+
+    product_created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Product creation time (listing sort key)",
+    )
+
+    # Pre-shaped API responses
+    payload: Mapped[dict[str, Any]] = mapped_column(
+        JSON,
+        nullable=False,
+        comment="Listing card as returned by GET /shop/products",
+    )
+
+    detail: Mapped[dict[str, Any]] = mapped_column(
+        JSON,
+        nullable=False,
+        comment="Product page as returned by GET /shop/products/{id}",
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_shop_product_projections_listing",
+            "tenant_id",
+            "sales_channel_id",
+            "is_active",
+            "product_created_at",
+            "product_id",
+        ),
+        Index(
+            "ix_shop_product_projections_price",
+            "tenant_id",
+            "sales_channel_id",
+            "is_active",
+            "price_pence",
+            "product_id",
+        ),
+        {"comment": "Denormalized shop product read model, one row per product and channel"},
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ShopProductProjection(product={self.product_id}, channel={self.sales_channel_id})>"
+        )
@@ -0,0 +1,80 @@
+"""Storage blob model for content-addressed, refcounted uploads."""
+
+import uuid
+from typing import Optional
+
+from sqlalchemy import BigInteger, ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.models.base import TimestampMixin, UUIDMixin
+
+
+class StorageBlob(Base, UUIDMixin, TimestampMixin):
+    """
+    One stored copy of an uploaded file, shared by every record with the same content.
+
+    Blobs are keyed by the SHA-256 of the uploaded bytes within a tenant and
+    kind. Each ModelFile or ProductImage pointing at ``url`` holds one
+    reference; the stored content is deleted when ``ref_count`` drops to
+    zero (see ``app.services.blob_store``).
+    """
+
+    __tablename__ = "storage_blobs"
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "kind", "sha256", name="uq_storage_blob_tenant_kind_sha256"),
+        Index("ix_storage_blobs_tenant_url", "tenant_id", "url"),
+    )
+
+    # Tenant isolation
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Tenant ID for multi-tenant isolation",
+    )
+
+    kind: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        comment="What the blob stores: 'model_file' or 'image'",
+    )
+
+    sha256: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        comment="Hex SHA-256 of the uploaded content",
+    )
+
+    url: Mapped[str] = mapped_column(
+        String(500),
+        nullable=False,
+        comment="/uploads/ URL of the stored content",
+    )
+
+    thumbnail_url: Mapped[Optional[str]] = mapped_column(
+        String(500),
+        nullable=True,
+        comment="/uploads/ URL of the derived thumbnail (images only)",
+    )
+
+    size: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        comment="Size of the uploaded content in bytes",
+    )
+
+    content_type: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="MIME content type of the stored content",
+    )
+
+    ref_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+        comment="Records referencing this blob",
+    )
+
+    def __repr__(self) -> str:
+        return f"<StorageBlob({self.kind} {self.sha256[:12]} refs={self.ref_count})>"
@@ -281,7 +281,12 @@ class WebhookDelivery(Base, UUIDMixin, TimestampMixin):
 
     __table_args__ = (
         Index("ix_webhook_deliveries_status_retry", "status", "next_retry_at"),
-        Index("ix_webhook_deliveries_subscription_created", "subscription_id", "created_at"),
+        Index(
+            "ix_webhook_deliveries_subscription_created",
+            "subscription_id",
+            "created_at",
+            "id",
+        ),
         {"comment": "Webhook delivery attempts and responses"},
     )
 
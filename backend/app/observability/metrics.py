@@ -1,5 +1,7 @@
 """OpenTelemetry metrics and Prometheus exporter setup."""
 
+from typing import Optional
+
 from opentelemetry import metrics
 from opentelemetry.exporter.prometheus import PrometheusMetricReader
 from opentelemetry.sdk.metrics import MeterProvider
@@ -116,6 +118,57 @@ payment_processed_counter = meter.create_counter(
     unit="1",
 )
 
+# Cache Metrics
+cache_lookup_counter = meter.create_counter(
+    name="batchivo.cache.lookups",
+    description="Cache lookups by namespace, tier and result (hit/miss)",
+    unit="1",
+)
+
+cache_lookup_duration = meter.create_histogram(
+    name="batchivo.cache.lookup.duration",
+    description="Cache lookup latency in seconds",
+    unit="s",
+)
+
+# Worker Pool Metrics (blocking work offloaded from the event loop)
+worker_pool_task_duration = meter.create_histogram(
+    name="batchivo.worker_pool.task.duration",
+    description="Offloaded task latency by pool and stage, including queueing, in seconds",
+    unit="s",
+)
+
+worker_pool_in_flight = meter.create_up_down_counter(
+    name="batchivo.worker_pool.in_flight",
+    description="Offloaded tasks running or queued, by pool",
+    unit="1",
+)
+
+worker_pool_rejected_counter = meter.create_counter(
+    name="batchivo.worker_pool.rejected",
+    description="Offloaded tasks rejected because the pool's queue was full",
+    unit="1",
+)
+
+# Outbound HTTP Metrics (shared integration clients)
+outbound_http_request_counter = meter.create_counter(
+    name="batchivo.outbound_http.requests",
+    description="Outbound HTTP requests by client, destination host and outcome",
+    unit="1",
+)
+
+outbound_http_request_duration = meter.create_histogram(
+    name="batchivo.outbound_http.request.duration",
+    description="Outbound HTTP latency to response headers by client and host, in seconds",
+    unit="s",
+)
+
+outbound_http_error_counter = meter.create_counter(
+    name="batchivo.outbound_http.errors",
+    description="Outbound HTTP requests that failed without a response, by error type",
+    unit="1",
+)
+
 # Error Metrics
 error_counter = meter.create_counter(
     name="batchivo.errors",
@@ -244,6 +297,78 @@ def record_payment_processed(
     )
 
 
+def record_cache_lookup(namespace: str, hit: bool, duration: float, tier: str = "redis") -> None:
+    """
+    Record a cache lookup.
+
+    Args:
+        namespace: Cache namespace (e.g., product, category, dashboard)
+        hit: Whether a fresh value was found in the cache
+        duration: Lookup duration in seconds
+        tier: Cache tier that answered (local or redis)
+    """
+    attributes = {
+        "cache.namespace": namespace,
+        "cache.result": "hit" if hit else "miss",
+        "cache.tier": tier,
+    }
+    cache_lookup_counter.add(1, attributes=attributes)
+    cache_lookup_duration.record(duration, attributes=attributes)
+
+
+def record_worker_pool_task(pool: str, stage: str, duration: float) -> None:
+    """
+    Record an offloaded task.
+
+    Args:
+        pool: Worker pool name (e.g. password-hash, image-cpu)
+        stage: Stage within the pool (e.g. verify, resize, upload)
+        duration: Task duration in seconds, including time queued
+    """
+    worker_pool_task_duration.record(duration, attributes={"pool": pool, "stage": stage})
+
+
+def record_worker_pool_queue(pool: str, delta: int, rejected_stage: Optional[str] = None) -> None:
+    """
+    Record a change in worker pool depth or a rejection.
+
+    Args:
+        pool: Worker pool name
+        delta: Change in tasks running or queued (+1/-1)
+        rejected_stage: Stage rejected because the queue was full
+    """
+    if delta:
+        worker_pool_in_flight.add(delta, attributes={"pool": pool})
+    if rejected_stage:
+        worker_pool_rejected_counter.add(1, attributes={"pool": pool, "stage": rejected_stage})
+
+
+def record_outbound_http_request(
+    client: str,
+    host: str,
+    outcome: str,
+    duration: float,
+    error_type: Optional[str] = None,
+) -> None:
+    """
+    Record an outbound HTTP request.
+
+    Args:
+        client: Shared client name (e.g. webhooks, email, shopify)
+        host: Destination host
+        outcome: Status class (2xx, 4xx, 5xx) or "error" when no response arrived
+        duration: Time to response headers in seconds
+        error_type: Exception class name when outcome is "error"
+    """
+    attributes = {"client": client, "host": host, "outcome": outcome}
+    outbound_http_request_counter.add(1, attributes=attributes)
+    outbound_http_request_duration.record(duration, attributes=attributes)
+    if error_type:
+        outbound_http_error_counter.add(
+            1, attributes={"client": client, "host": host, "error.type": error_type}
+        )
+
+
 def record_error(error_type: str, endpoint: str = "", tenant_id: str = "") -> None:
     """
     Record application error.
@@ -62,6 +62,16 @@ class ModelFileLocalCreate(BaseModel):
     notes: Optional[str] = Field(None, description="User notes about the file")
 
 
+class ModelFileUploadSessionCreate(ModelFileCreate):
+    """Schema for starting a resumable, chunked upload."""
+
+    filename: str = Field(..., max_length=255, description="Original filename")
+    content_type: str = Field(
+        "application/octet-stream", max_length=100, description="MIME content type"
+    )
+    total_size: int = Field(..., ge=0, description="Size of the complete file in bytes")
+
+
 class ModelFileUpdate(BaseModel):
     """Schema for updating file metadata."""
 
@@ -94,6 +104,7 @@ class ModelFileResponse(BaseModel):
     original_filename: str = Field(..., description="Original filename")
     file_size: Optional[int] = Field(None, description="File size in bytes")
     content_type: Optional[str] = Field(None, description="MIME content type")
+    content_sha256: Optional[str] = Field(None, description="SHA-256 of the stored content")
     part_name: Optional[str] = Field(None, description="Part name for multi-part models")
     version: Optional[str] = Field(None, description="Version identifier")
     is_primary: bool = Field(..., description="Whether this is the primary file")
@@ -120,6 +131,22 @@ class ModelFileUploadResponse(BaseModel):
     message: str = Field("File uploaded successfully", description="Success message")
 
 
+class ModelFileUploadSessionResponse(BaseModel):
+    """State of a resumable upload; the next chunk starts at received_size."""
+
+    id: UUID
+    model_id: UUID
+    file_type: str = Field(..., description="Type of file")
+    original_filename: str = Field(..., description="Original filename")
+    content_type: str = Field(..., description="MIME content type")
+    total_size: int = Field(..., description="Size of the complete file in bytes")
+    received_size: int = Field(..., description="Bytes received so far")
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class LocalPathValidationRequest(BaseModel):
     """Request to validate a local file path."""
 
@@ -334,9 +334,11 @@ class ProductListResponse(BaseModel):
     """Schema for paginated product list."""
 
     products: list[ProductResponse]
-    total: int
+    total: Optional[int] = Field(None, description="Total matches (omitted in cursor mode)")
     skip: int
     limit: int
+    next_cursor: Optional[str] = Field(None, description="Pass as 'after' for the next page")
+    prev_cursor: Optional[str] = Field(None, description="Pass as 'before' for the previous page")
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -91,10 +91,12 @@ class WebhookDeliveryList(BaseModel):
     """Paginated list of webhook deliveries."""
 
     deliveries: list[WebhookDeliveryResponse]
-    total: int
+    total: Optional[int] = Field(None, description="Total matches (omitted in cursor mode)")
     page: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = Field(None, description="Pass as 'after' for the next page")
+    prev_cursor: Optional[str] = Field(None, description="Pass as 'before' for the previous page")
 
 
 class WebhookSubscriptionList(BaseModel):
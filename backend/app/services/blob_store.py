@@ -0,0 +1,239 @@
+"""Content-addressed, refcounted storage blobs.
+
+Identical uploads within a tenant are stored once. Each upload is hashed
+(SHA-256) before it is written; if a ``StorageBlob`` with that hash already
+exists its reference count is bumped and the existing URL reused, so a
+re-upload costs one hash pass instead of a storage write. Deleting a record
+releases its reference, and the stored content is only removed when the
+last reference goes.
+
+Blob URLs are the ordinary UUID-named ``/uploads/`` paths of the first
+upload, so serving, derivatives and presigned downloads are unchanged.
+Content that predates this table has no blob and is owned by its record.
+"""
+
+import hashlib
+import logging
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.storage_blob import StorageBlob
+from app.services.image_storage import ImageStorage, get_image_cpu_pool
+
+logger = logging.getLogger(__name__)
+
+BLOB_KIND_MODEL_FILE = "model_file"
+BLOB_KIND_IMAGE = "image"
+
+
+def _sha256_hex(content: bytes) -> str:
+    """Hex SHA-256 of in-memory content (runs on the CPU pool)."""
+    return hashlib.sha256(content).hexdigest()
+
+
+async def acquire_blob(
+    db: AsyncSession, tenant_id: UUID, kind: str, sha256: str
+) -> Optional[StorageBlob]:
+    """
+    Take a reference to an existing blob with this content, if there is one.
+
+    Args:
+        db: Database session (the reference is committed with the caller's record)
+        tenant_id: Owning tenant
+        kind: BLOB_KIND_MODEL_FILE or BLOB_KIND_IMAGE
+        sha256: Hex SHA-256 of the content
+
+    Returns:
+        The blob with its ref_count incremented, or None if the content is new
+    """
+    result = await db.execute(
+        select(StorageBlob)
+        .where(
+            StorageBlob.tenant_id == tenant_id,
+            StorageBlob.kind == kind,
+            StorageBlob.sha256 == sha256,
+        )
+        .with_for_update()
+    )
+    blob = result.scalar_one_or_none()
+    if blob is not None:
+        blob.ref_count += 1
+    return blob
+
+
+async def register_blob(
+    db: AsyncSession,
+    tenant_id: UUID,
+    kind: str,
+    sha256: str,
+    url: str,
+    size: int,
+    content_type: str,
+    thumbnail_url: Optional[str] = None,
+) -> StorageBlob:
+    """
+    Record newly stored content as a blob holding one reference.
+
+    If a concurrent upload of the same content registered first, a reference
+    to that blob is taken instead. Callers should compare the returned URL
+    with their own and delete their now-redundant copy when they differ.
+
+    Returns:
+        The blob the caller's record should point at
+    """
+    blob = StorageBlob(
+        tenant_id=tenant_id,
+        kind=kind,
+        sha256=sha256,
+        url=url,
+        thumbnail_url=thumbnail_url,
+        size=size,
+        content_type=content_type,
+        ref_count=1,
+    )
+    try:
+        async with db.begin_nested():
+            db.add(blob)
+    except IntegrityError:
+        existing = await acquire_blob(db, tenant_id, kind, sha256)
+        if existing is None:
+            raise
+        logger.debug(f"Concurrent upload of {kind} {sha256[:12]}; reusing {existing.url}")
+        return existing
+    return blob
+
+
+async def release_blob(db: AsyncSession, tenant_id: UUID, kind: str, url: str) -> bool:
+    """
+    Drop one reference to the blob stored at ``url``.
+
+    Call in the same transaction that deletes (or repoints) the record.
+
+    Returns:
+        True if the caller should delete the stored content: the last
+        reference is gone, or the content predates blobs and is unshared
+    """
+    result = await db.execute(
+        select(StorageBlob)
+        .where(
+            StorageBlob.tenant_id == tenant_id,
+            StorageBlob.kind == kind,
+            StorageBlob.url == url,
+        )
+        .with_for_update()
+    )
+    blob = result.scalar_one_or_none()
+    if blob is None:
+        return True
+
+    blob.ref_count -= 1
+    if blob.ref_count > 0:
+        return False
+    await db.delete(blob)
+    return True
+
+
+async def store_image(
+    db: AsyncSession,
+    tenant_id: UUID,
+    storage: ImageStorage,
+    file_content: bytes,
+    content_type: str,
+    product_id: str,
+    original_filename: Optional[str] = None,
+) -> dict:
+    """
+    Save an image through ``storage``, reusing an identical earlier upload.
+
+    Takes the same arguments and returns the same dict as
+    ``ImageStorage.save_image``; a reused image also reuses its rendered
+    thumbnail and any generated derivatives.
+
+    Raises:
+        ImageStorageError: If validation or save fails
+        WorkerPoolBusyError: If the image pools are saturated
+    """
+    sha256 = await get_image_cpu_pool().run("hash", _sha256_hex, file_content)
+    blob = await acquire_blob(db, tenant_id, BLOB_KIND_IMAGE, sha256)
+    if blob is None:
+        result = await storage.save_image(
+            file_content=file_content,
+            content_type=content_type,
+            product_id=product_id,
+            original_filename=original_filename,
+        )
+        blob = await register_blob(
+            db,
+            tenant_id,
+            BLOB_KIND_IMAGE,
+            sha256,
+            url=result["image_url"],
+            size=result["file_size"],
+            content_type=result["content_type"],
+            thumbnail_url=result["thumbnail_url"],
+        )
+        if blob.url == result["image_url"]:
+            return result
+        await storage.delete_image(result["image_url"], result["thumbnail_url"])
+
+    logger.info(f"Reusing stored image {blob.url} for product {product_id}")
+    return {
+        "image_url": blob.url,
+        "thumbnail_url": blob.thumbnail_url,
+        "file_size": blob.size,
+        "content_type": blob.content_type,
+    }
+
+
+async def release_image(db: AsyncSession, tenant_id: UUID, image_url: str) -> bool:
+    """
+    Drop a product image's reference to its stored content.
+
+    Returns:
+        True if the image and thumbnail should be deleted from storage
+        once the caller has committed
+    """
+    return await release_blob(db, tenant_id, BLOB_KIND_IMAGE, image_url)
+
+
+async def detach_image(
+    db: AsyncSession,
+    tenant_id: UUID,
+    storage: ImageStorage,
+    image_url: str,
+    thumbnail_url: Optional[str],
+    product_id: str,
+) -> tuple[str, Optional[str]]:
+    """
+    Give an image exclusive, unaddressed storage before it is edited in place.
+
+    Edits such as rotation change the content, so the image must no longer
+    be found by the hash of its original upload. An unshared image just
+    drops out of the blob table; a shared one is copied for this product.
+
+    Returns:
+        The (image_url, thumbnail_url) the caller should edit and store
+    """
+    result = await db.execute(
+        select(StorageBlob)
+        .where(
+            StorageBlob.tenant_id == tenant_id,
+            StorageBlob.kind == BLOB_KIND_IMAGE,
+            StorageBlob.url == image_url,
+        )
+        .with_for_update()
+    )
+    blob = result.scalar_one_or_none()
+    if blob is None:
+        return image_url, thumbnail_url
+
+    if blob.ref_count <= 1:
+        await db.delete(blob)
+        return image_url, thumbnail_url
+
+    blob.ref_count -= 1
+    return await storage.copy_image(image_url, thumbnail_url, product_id)
@@ -2,13 +2,30 @@
 
 Provides a simple interface for caching with TTL, pattern invalidation,
 and a decorator for caching function results.
+
+Reads go through two tiers: a bounded in-process LRU (L1) in front of
+Redis (L2). Invalidations evict L1 locally and are broadcast over Redis
+pub/sub so other worker processes evict their L1 copies too.
+``get_or_set`` adds single-flight recomputation and stale-while-revalidate
+serving for hot keys.
+
+Tenant-scoped keys embed a per-tenant generation number; invalidating a
+tenant's products, categories, costs or dashboard is a single INCR rather
+than a SCAN over the keyspace.
 """
 
+import asyncio
+import contextlib
 import functools
 import hashlib
 import json
 import logging
-from typing import Any, Callable, Optional, TypeVar, ParamSpec
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar, ParamSpec
 
 import redis.asyncio as redis
 
@@ -28,6 +45,7 @@ PRODUCT_CATALOG_TTL = 300  # 5 minutes
 CATEGORY_TTL = 600  # 10 minutes
 COST_CALCULATION_TTL = 3600  # 1 hour
 DASHBOARD_TTL = 60  # 1 minute
+DASHBOARD_STALE_TTL = 30  # Serve stale dashboard data while one request refreshes it
 
 # Cache key prefixes for organization and invalidation
 CACHE_PREFIX = "batchivo:cache"
@@ -36,27 +54,163 @@ CATEGORY_PREFIX = f"{CACHE_PREFIX}:category"
 DASHBOARD_PREFIX = f"{CACHE_PREFIX}:dashboard"
 COST_PREFIX = f"{CACHE_PREFIX}:cost"
 
+# Pub/sub channel used to broadcast L1 evictions across worker processes
+INVALIDATION_CHANNEL = f"{CACHE_PREFIX}:invalidate"
+
+# Per-tenant generation counters embedded in tenant-scoped keys. Bumping a
+# generation orphans every key written under the previous one (they expire
+# via their TTL), so invalidation is O(1) regardless of cache size.
+GENERATION_PREFIX = f"{CACHE_PREFIX}:gen"
+
+
+def _namespace(key: str) -> str:
+    """Extract the namespace segment from a cache key (e.g. 'product')."""
+    if key.startswith(f"{CACHE_PREFIX}:"):
+        key = key[len(CACHE_PREFIX) + 1 :]
+    return key.split(":", 1)[0]
+
+
+def _record_lookup(key: str, hit: bool, duration: float, tier: str = "redis") -> None:
+    """Record hit/miss and latency metrics for a cache lookup."""
+    try:
+        from app.observability.metrics import record_cache_lookup
+
+        record_cache_lookup(_namespace(key), hit, duration, tier=tier)
+    except Exception as e:
+        logger.debug(f"Failed to record cache metrics: {e}")
+
+
+@dataclass
+class CacheEntry:
+    """A cached value with its freshness window (wall-clock timestamps)."""
+
+    value: Any
+    fresh_until: float
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.fresh_until > time.time()
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with per-entry expiry.
+
+    Used as the L1 tier in front of Redis. Not shared between processes;
+    cross-process consistency relies on pub/sub evictions and a short TTL.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        """
+        Initialize the local cache.
+
+        Args:
+            max_entries: Maximum number of entries (least recently used are evicted)
+            ttl: Upper bound on the lifetime of any entry in seconds
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0 and self._ttl > 0
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get an unexpired entry (fresh or stale), or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, capping its lifetime at the local TTL."""
+        if not self.enabled:
+            return
+        now = time.time()
+        local_expiry = now + self._ttl
+        self._entries[key] = CacheEntry(
+            value=entry.value,
+            fresh_until=min(entry.fresh_until, local_expiry),
+            expires_at=min(entry.expires_at, local_expiry),
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def set_value(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a plain value that is fresh until it expires."""
+        if not self.enabled:
+            return
+        expires_at = time.time() + (ttl if ttl is not None else self._ttl)
+        self.set(key, CacheEntry(value, expires_at, expires_at))
+
+    def delete(self, key: str) -> None:
+        """Drop a single entry."""
+        self._entries.pop(key, None)
+
+    def delete_pattern(self, pattern: str) -> int:
+        """Drop all entries whose key matches a Redis-style glob pattern."""
+        stale = [key for key in self._entries if fnmatchcase(key, pattern)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+@dataclass
+class _Flight:
+    """An in-progress recomputation of a key shared by concurrent callers."""
+
+    lock: asyncio.Lock
+    users: int = 0
+
 
 class CacheService:
     """
-    Redis-based caching service with TTL support.
+    Two-tier (in-process LRU + Redis) caching service with TTL support.
 
     Provides methods for:
     - Getting/setting cached values
+    - Single-flight get-or-compute with stale-while-revalidate
     - Deleting specific keys
     - Deleting keys by pattern (for invalidation)
+    - Broadcasting L1 evictions to other workers via pub/sub
     - Decorator for caching function results
     """
 
-    def __init__(self, redis_client: Optional[redis.Redis] = None):
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        local_cache: Optional[LocalCache] = None,
+    ):
         """
         Initialize the cache service.
 
         Args:
             redis_client: Optional Redis client (for testing)
+            local_cache: Optional L1 cache (defaults to one sized from settings)
         """
         self._redis = redis_client
         self._enabled = settings.cache_enabled
+        self._local = local_cache or LocalCache(
+            max_entries=settings.cache_local_max_entries,
+            ttl=settings.cache_local_ttl,
+        )
+        self._flights: dict[str, _Flight] = {}
+        self._instance_id = uuid.uuid4().hex
+        self._listener: Optional[asyncio.Task] = None
 
     async def _get_redis(self) -> redis.Redis:
         """Get or create Redis connection."""
@@ -90,15 +244,26 @@ class CacheService:
         if not self._enabled:
             return None
 
+        started = time.perf_counter()
+        entry = self._local.get(key)
+        if entry is not None:
+            _record_lookup(key, True, time.perf_counter() - started, tier="local")
+            return entry.value
+
+        value = None
         try:
             client = await self._get_redis()
             value = await client.get(key)
             if value is not None:
-                return self._deserialize(value)
+                deserialized = self._deserialize(value)
+                self._local.set_value(key, deserialized)
+                return deserialized
             return None
         except redis.RedisError as e:
             logger.warning(f"Cache get error for key {key}: {e}")
             return None
+        finally:
+            _record_lookup(key, value is not None, time.perf_counter() - started)
 
     async def set(self, key: str, value: Any, ttl: int = DEFAULT_TTL) -> bool:
         """
@@ -115,15 +280,138 @@ class CacheService:
         if not self._enabled:
             return False
 
+        serialized = self._serialize(value)
+        if self._local.enabled:
+            # Round-trip through JSON so L1 hits return the same shape as Redis hits
+            self._local.set_value(key, json.loads(serialized), ttl)
+
         try:
             client = await self._get_redis()
-            serialized = self._serialize(value)
             await client.setex(key, ttl, serialized)
             return True
         except redis.RedisError as e:
             logger.warning(f"Cache set error for key {key}: {e}")
             return False
 
+    async def _get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Read a get_or_set entry (with freshness metadata) from L1, then Redis."""
+        started = time.perf_counter()
+        entry = self._local.get(key)
+        if entry is not None:
+            _record_lookup(key, entry.is_fresh, time.perf_counter() - started, tier="local")
+            return entry
+
+        try:
+            client = await self._get_redis()
+            raw = await client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Cache get error for key {key}: {e}")
+            raw = None
+
+        envelope = self._deserialize(raw) if raw is not None else None
+        if not isinstance(envelope, dict) or "fresh_until" not in envelope:
+            _record_lookup(key, False, time.perf_counter() - started)
+            return None
+
+        entry = CacheEntry(
+            value=envelope.get("value"),
+            fresh_until=envelope["fresh_until"],
+            expires_at=envelope.get("expires_at", envelope["fresh_until"]),
+        )
+        _record_lookup(key, entry.is_fresh, time.perf_counter() - started)
+        self._local.set(key, entry)
+        return entry
+
+    async def _set_entry(self, key: str, value: Any, ttl: int, stale_ttl: int) -> None:
+        """Write a get_or_set entry to both tiers."""
+        now = time.time()
+        serialized = self._serialize(
+            {"value": value, "fresh_until": now + ttl, "expires_at": now + ttl + stale_ttl}
+        )
+        if self._local.enabled:
+            envelope = json.loads(serialized)
+            self._local.set(
+                key,
+                CacheEntry(envelope["value"], envelope["fresh_until"], envelope["expires_at"]),
+            )
+
+        try:
+            client = await self._get_redis()
+            await client.setex(key, max(ttl + stale_ttl, 1), serialized)
+        except redis.RedisError as e:
+            logger.warning(f"Cache set error for key {key}: {e}")
+
+    @contextlib.asynccontextmanager
+    async def _single_flight(self, key: str) -> AsyncIterator[None]:
+        """Serialize recomputation of a key across coroutines in this process."""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._flights[key] = _Flight(lock=asyncio.Lock())
+        flight.users += 1
+        try:
+            async with flight.lock:
+                yield
+        finally:
+            flight.users -= 1
+            if flight.users == 0:
+                self._flights.pop(key, None)
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int = DEFAULT_TTL,
+        stale_ttl: int = 0,
+    ) -> Any:
+        """
+        Get a cached value, computing and caching it on a miss.
+
+        Only one coroutine per process runs ``loader`` for a given key;
+        concurrent callers wait for its result instead of recomputing. Once
+        an entry is older than ``ttl`` it is served stale for up to
+        ``stale_ttl`` more seconds to every caller except the one refreshing
+        it, so a hot key expiring never stalls (or stampedes) readers.
+
+        Keys written here carry freshness metadata and must only be read
+        through ``get_or_set``.
+
+        Args:
+            key: Cache key
+            loader: Coroutine function producing a JSON-serializable value
+            ttl: Seconds the value is considered fresh
+            stale_ttl: Extra seconds a stale value may be served while refreshing
+
+        Returns:
+            Cached or freshly computed value
+        """
+        if not self._enabled:
+            return await loader()
+
+        entry = await self._get_entry(key)
+        if entry is not None and entry.is_fresh:
+            return entry.value
+
+        # Someone is already refreshing this key: serve the stale value
+        if entry is not None and key in self._flights:
+            return entry.value
+
+        async with self._single_flight(key):
+            # The value may have been refreshed while we waited for the lock
+            latest = await self._get_entry(key)
+            if latest is not None and latest.is_fresh:
+                return latest.value
+
+            try:
+                value = await loader()
+            except Exception:
+                if entry is not None:
+                    logger.warning(f"Cache refresh failed for key {key}, serving stale value")
+                    return entry.value
+                raise
+
+            await self._set_entry(key, value, ttl, stale_ttl)
+            return value
+
     async def delete(self, key: str) -> bool:
         """
         Delete a cached value.
@@ -137,9 +425,11 @@ class CacheService:
         if not self._enabled:
             return False
 
+        self._local.delete(key)
         try:
             client = await self._get_redis()
             result = await client.delete(key)
+            await self._publish_invalidation(client, key)
             return result > 0
         except redis.RedisError as e:
             logger.warning(f"Cache delete error for key {key}: {e}")
@@ -160,19 +450,79 @@ class CacheService:
         if not self._enabled:
             return 0
 
+        self._local.delete_pattern(pattern)
         try:
             client = await self._get_redis()
             keys = []
             async for key in client.scan_iter(match=pattern):
                 keys.append(key)
 
-            if keys:
-                return await client.delete(*keys)
-            return 0
+            deleted = await client.delete(*keys) if keys else 0
+            await self._publish_invalidation(client, pattern)
+            return deleted
         except redis.RedisError as e:
             logger.warning(f"Cache delete_pattern error for pattern {pattern}: {e}")
             return 0
 
+    async def _publish_invalidation(self, client: redis.Redis, pattern: str) -> None:
+        """Tell other workers to evict L1 entries matching a key or pattern."""
+        message = json.dumps({"origin": self._instance_id, "pattern": pattern})
+        await client.publish(INVALIDATION_CHANNEL, message)
+
+    def _handle_invalidation(self, data: Any) -> None:
+        """Apply an eviction broadcast by another worker to the local tier."""
+        try:
+            message = json.loads(data)
+        except (json.JSONDecodeError, TypeError):
+            logger.warning(f"Ignoring malformed cache invalidation message: {data!r}")
+            return
+        if message.get("origin") == self._instance_id:
+            return
+        pattern = message.get("pattern")
+        if pattern:
+            self._local.delete_pattern(pattern)
+
+    async def _listen_for_invalidations(self) -> None:
+        """Consume the invalidation channel, reconnecting with backoff on errors."""
+        backoff = 1.0
+        while True:
+            pubsub = None
+            try:
+                client = await self._get_redis()
+                pubsub = client.pubsub()
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                backoff = 1.0
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._handle_invalidation(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Evictions may have been missed while disconnected
+                self._local.clear()
+                logger.warning(f"Cache invalidation listener error: {e}; retrying in {backoff}s")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                if pubsub is not None:
+                    with contextlib.suppress(Exception):
+                        await pubsub.aclose()
+
+    async def start_invalidation_listener(self) -> None:
+        """Start consuming cross-worker L1 evictions (idempotent)."""
+        if not self._enabled or not self._local.enabled:
+            return
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen_for_invalidations())
+
+    async def stop_invalidation_listener(self) -> None:
+        """Stop consuming cross-worker L1 evictions."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+
     async def exists(self, key: str) -> bool:
         """
         Check if a key exists in cache.
@@ -214,77 +564,172 @@ class CacheService:
             return -2
 
     async def close(self) -> None:
-        """Close Redis connection."""
+        """Stop the invalidation listener and close the Redis connection."""
+        await self.stop_invalidation_listener()
+        self._local.clear()
         if self._redis:
             await self._redis.close()
             self._redis = None
 
+    # Generation-versioned, tenant-scoped keys
+
+    def _generation_key(self, prefix: str, tenant_id: str) -> str:
+        return f"{GENERATION_PREFIX}:{_namespace(prefix)}:{tenant_id}"
+
+    async def get_generation(self, prefix: str, tenant_id: str) -> int:
+        """
+        Get the current generation for a tenant's cache namespace.
+
+        Generations are cached in L1 (evicted via pub/sub when bumped). A
+        missing counter is seeded with the current time in milliseconds so a
+        lost counter can never fall back to a generation that is still cached.
+        """
+        key = self._generation_key(prefix, tenant_id)
+        entry = self._local.get(key)
+        if entry is not None:
+            return entry.value
+
+        try:
+            client = await self._get_redis()
+            value = await client.get(key)
+            if value is None:
+                await client.set(key, time.time_ns() // 1_000_000, nx=True)
+                value = await client.get(key)
+            generation = int(value)
+        except redis.RedisError as e:
+            logger.warning(f"Cache generation read error for {key}: {e}")
+            return 0
+
+        self._local.set_value(key, generation)
+        return generation
+
+    async def bump_generations(self, tenant_id: str, *prefixes: str) -> None:
+        """
+        Invalidate tenant namespaces by advancing their generation counters.
+
+        One pipelined round-trip (SET NX + INCR + PUBLISH per namespace),
+        independent of how many keys are cached.
+
+        Args:
+            tenant_id: Tenant whose caches should be invalidated
+            prefixes: Key prefixes to invalidate (e.g. PRODUCT_PREFIX)
+        """
+        if not self._enabled:
+            return
+
+        keys = [self._generation_key(prefix, tenant_id) for prefix in prefixes]
+        for key in keys:
+            self._local.delete(key)
+
+        try:
+            client = await self._get_redis()
+            seed = time.time_ns() // 1_000_000
+            async with client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.set(key, seed, nx=True)
+                    pipe.incr(key)
+                    pipe.publish(
+                        INVALIDATION_CHANNEL,
+                        json.dumps({"origin": self._instance_id, "pattern": key}),
+                    )
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Cache generation bump error for tenant {tenant_id}: {e}")
+
+    async def _scoped_key(self, prefix: str, tenant_id: str, *parts: str) -> str:
+        """Build a tenant-scoped key embedding the namespace's current generation."""
+        generation = await self.get_generation(prefix, tenant_id)
+        return ":".join([prefix, tenant_id, f"v{generation}", *parts])
+
     # Convenience methods for specific cache types
 
     async def get_product(self, product_id: str, tenant_id: str) -> Optional[dict]:
         """Get cached product data."""
-        key = f"{PRODUCT_PREFIX}:{tenant_id}:{product_id}"
+        key = await self._scoped_key(PRODUCT_PREFIX, tenant_id, product_id)
         return await self.get(key)
 
     async def set_product(self, product_id: str, tenant_id: str, data: dict) -> bool:
         """Cache product data."""
-        key = f"{PRODUCT_PREFIX}:{tenant_id}:{product_id}"
+        key = await self._scoped_key(PRODUCT_PREFIX, tenant_id, product_id)
         return await self.set(key, data, PRODUCT_CATALOG_TTL)
 
-    async def invalidate_product(self, product_id: str, tenant_id: str) -> int:
-        """Invalidate product cache."""
-        pattern = f"{PRODUCT_PREFIX}:{tenant_id}:{product_id}"
-        return await self.delete_pattern(f"{pattern}*")
+    async def invalidate_product(self, product_id: str, tenant_id: str) -> bool:
+        """Invalidate a single product's cached detail."""
+        key = await self._scoped_key(PRODUCT_PREFIX, tenant_id, product_id)
+        return await self.delete(key)
 
-    async def invalidate_tenant_products(self, tenant_id: str) -> int:
-        """Invalidate all products for a tenant."""
-        pattern = f"{PRODUCT_PREFIX}:{tenant_id}:*"
-        return await self.delete_pattern(pattern)
+    async def get_product_list(self, tenant_id: str, params_key: str) -> Optional[dict]:
+        """Get a cached product listing page."""
+        key = await self._scoped_key(PRODUCT_PREFIX, tenant_id, "list", params_key)
+        return await self.get(key)
+
+    async def set_product_list(self, tenant_id: str, params_key: str, data: dict) -> bool:
+        """Cache a product listing page."""
+        key = await self._scoped_key(PRODUCT_PREFIX, tenant_id, "list", params_key)
+        return await self.set(key, data, PRODUCT_CATALOG_TTL)
+
+    async def get_shop_products(self, tenant_id: str, params_key: str) -> Optional[dict]:
+        """Get a cached storefront product listing page."""
+        key = await self._scoped_key(PRODUCT_PREFIX, tenant_id, "shop", params_key)
+        return await self.get(key)
+
+    async def set_shop_products(self, tenant_id: str, params_key: str, data: dict) -> bool:
+        """Cache a storefront product listing page."""
+        key = await self._scoped_key(PRODUCT_PREFIX, tenant_id, "shop", params_key)
+        return await self.set(key, data, PRODUCT_CATALOG_TTL)
+
+    async def invalidate_tenant_products(self, tenant_id: str) -> None:
+        """Invalidate all products (details and listings) for a tenant."""
+        await self.bump_generations(tenant_id, PRODUCT_PREFIX)
 
     async def get_categories(self, tenant_id: str) -> Optional[list]:
         """Get cached categories."""
-        key = f"{CATEGORY_PREFIX}:{tenant_id}:all"
+        key = await self._scoped_key(CATEGORY_PREFIX, tenant_id, "all")
         return await self.get(key)
 
     async def set_categories(self, tenant_id: str, data: list) -> bool:
         """Cache categories."""
-        key = f"{CATEGORY_PREFIX}:{tenant_id}:all"
+        key = await self._scoped_key(CATEGORY_PREFIX, tenant_id, "all")
         return await self.set(key, data, CATEGORY_TTL)
 
-    async def invalidate_categories(self, tenant_id: str) -> int:
+    async def invalidate_categories(self, tenant_id: str) -> None:
         """Invalidate category cache."""
-        pattern = f"{CATEGORY_PREFIX}:{tenant_id}:*"
-        return await self.delete_pattern(pattern)
+        await self.bump_generations(tenant_id, CATEGORY_PREFIX)
 
     async def get_dashboard(self, tenant_id: str, metric: str) -> Optional[Any]:
         """Get cached dashboard metric."""
-        key = f"{DASHBOARD_PREFIX}:{tenant_id}:{metric}"
+        key = await self._scoped_key(DASHBOARD_PREFIX, tenant_id, metric)
         return await self.get(key)
 
     async def set_dashboard(self, tenant_id: str, metric: str, data: Any) -> bool:
         """Cache dashboard metric."""
-        key = f"{DASHBOARD_PREFIX}:{tenant_id}:{metric}"
+        key = await self._scoped_key(DASHBOARD_PREFIX, tenant_id, metric)
         return await self.set(key, data, DASHBOARD_TTL)
 
-    async def invalidate_dashboard(self, tenant_id: str) -> int:
+    async def get_or_set_dashboard(
+        self, tenant_id: str, metric: str, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Get a dashboard metric, computing it once per expiry across concurrent requests."""
+        key = await self._scoped_key(DASHBOARD_PREFIX, tenant_id, metric)
+        return await self.get_or_set(key, loader, DASHBOARD_TTL, DASHBOARD_STALE_TTL)
+
+    async def invalidate_dashboard(self, tenant_id: str) -> None:
         """Invalidate dashboard cache."""
-        pattern = f"{DASHBOARD_PREFIX}:{tenant_id}:*"
-        return await self.delete_pattern(pattern)
+        await self.bump_generations(tenant_id, DASHBOARD_PREFIX)
 
     async def get_cost_breakdown(self, product_id: str, tenant_id: str) -> Optional[dict]:
         """Get cached cost breakdown."""
-        key = f"{COST_PREFIX}:{tenant_id}:{product_id}"
+        key = await self._scoped_key(COST_PREFIX, tenant_id, product_id)
         return await self.get(key)
 
     async def set_cost_breakdown(self, product_id: str, tenant_id: str, data: dict) -> bool:
         """Cache cost breakdown."""
-        key = f"{COST_PREFIX}:{tenant_id}:{product_id}"
+        key = await self._scoped_key(COST_PREFIX, tenant_id, product_id)
         return await self.set(key, data, COST_CALCULATION_TTL)
 
-    async def invalidate_cost(self, tenant_id: str) -> int:
+    async def invalidate_cost(self, tenant_id: str) -> None:
         """Invalidate all cost calculations for a tenant."""
-        pattern = f"{COST_PREFIX}:{tenant_id}:*"
-        return await self.delete_pattern(pattern)
+        await self.bump_generations(tenant_id, COST_PREFIX)
 
 
 def build_cache_key(*args, **kwargs) -> str:
@@ -336,26 +781,9 @@ def cached(
 
             cache_key = f"{CACHE_PREFIX}:{prefix}:{key_suffix}"
 
-            # Try to get from cache
-            cache = CacheService()
-            try:
-                cached_value = await cache.get(cache_key)
-                if cached_value is not None:
-                    logger.debug(f"Cache hit for {cache_key}")
-                    return cached_value
-            except Exception as e:
-                logger.warning(f"Cache read error: {e}")
-
-            # Call function and cache result
-            result = await func(*args, **kwargs)
-
-            try:
-                await cache.set(cache_key, result, ttl)
-                logger.debug(f"Cached result for {cache_key}")
-            except Exception as e:
-                logger.warning(f"Cache write error: {e}")
-
-            return result
+            # Single-flight through the shared two-tier cache
+            cache = await get_cache_service()
+            return await cache.get_or_set(cache_key, lambda: func(*args, **kwargs), ttl)
 
         return wrapper
 
@@ -378,12 +806,26 @@ async def invalidate_on_product_change(tenant_id: str, product_id: str) -> None:
     """
     Invalidate all caches related to a product change.
 
-    Call this when a product is created, updated, or deleted.
+    Call this when a product (or its pricing, images, models, components,
+    variants or categories) is created, updated, or deleted. Listings and
+    bundle details embed other products, so the whole tenant product
+    namespace is dropped rather than just this product's entry.
     """
     cache = await get_cache_service()
-    await cache.invalidate_product(product_id, tenant_id)
-    await cache.invalidate_cost(tenant_id)
-    await cache.invalidate_dashboard(tenant_id)
+    await cache.bump_generations(
+        tenant_id, PRODUCT_PREFIX, CATEGORY_PREFIX, COST_PREFIX, DASHBOARD_PREFIX
+    )
+
+
+async def invalidate_category_change(tenant_id: str) -> None:
+    """
+    Invalidate caches related to a category change.
+
+    Call this when a category is created, updated, or deleted. Product
+    listings filter and embed categories, so they are dropped as well.
+    """
+    cache = await get_cache_service()
+    await cache.bump_generations(tenant_id, CATEGORY_PREFIX, PRODUCT_PREFIX)
 
 
 async def invalidate_on_order_complete(tenant_id: str) -> None:
@@ -396,12 +838,25 @@ async def invalidate_on_order_complete(tenant_id: str) -> None:
     await cache.invalidate_dashboard(tenant_id)
 
 
+async def invalidate_on_production_change(tenant_id: str) -> None:
+    """
+    Invalidate caches after a production run changes.
+
+    Call this when a production run, or its items, materials or plates, is
+    created, updated or deleted. Runs that move spool stock should use
+    invalidate_on_inventory_change instead.
+    """
+    cache = await get_cache_service()
+    await cache.invalidate_dashboard(tenant_id)
+
+
 async def invalidate_on_inventory_change(tenant_id: str) -> None:
     """
     Invalidate caches after inventory changes.
 
-    Call this when stock levels change.
+    Call this when stock levels or cost inputs (spools, consumables, model
+    bills of materials) change, including when a production run is
+    completed, cancelled or failed and deducts spool weight.
     """
     cache = await get_cache_service()
-    await cache.invalidate_tenant_products(tenant_id)
-    await cache.invalidate_dashboard(tenant_id)
+    await cache.bump_generations(tenant_id, PRODUCT_PREFIX, COST_PREFIX, DASHBOARD_PREFIX)
@@ -0,0 +1,109 @@
+"""Shop category product counts.
+
+Shop navigation shows each active category with the number of active,
+shop-visible products in it. Counts are computed with a single grouped
+aggregate over ``product_categories`` joined to ``Product``. When
+``settings.shop_category_counts_materialized`` is enabled they are instead
+read from the ``category_product_counts`` table, which is rebuilt per tenant
+by ``refresh_category_counts`` whenever product visibility or category
+membership changes.
+"""
+
+import logging
+from uuid import UUID
+
+from sqlalchemy import Row, Subquery, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.category import Category, CategoryProductCount, product_categories
+from app.models.product import Product
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+def _visible_counts(tenant_id: UUID) -> Subquery:
+    """Per-category counts of a tenant's active, shop-visible products."""
+    return (
+        select(
+            product_categories.c.category_id,
+            func.count().label("product_count"),
+        )
+        .join(Product, Product.id == product_categories.c.product_id)
+        .where(
+            product_categories.c.tenant_id == tenant_id,
+            Product.tenant_id == tenant_id,
+            Product.is_active.is_(True),
+            Product.shop_visible.is_(True),
+        )
+        .group_by(product_categories.c.category_id)
+        .subquery("visible_counts")
+    )
+
+
+async def get_shop_category_counts(db: AsyncSession, tenant_id: UUID) -> list[Row]:
+    """
+    Get active categories for a tenant with their shop-visible product counts.
+
+    Args:
+        db: Database session
+        tenant_id: Shop tenant
+
+    Returns:
+        Rows with id, name, slug and product_count, in display order
+    """
+    if settings.shop_category_counts_materialized:
+        product_count = func.coalesce(CategoryProductCount.product_count, 0).label("product_count")
+        query = select(Category.id, Category.name, Category.slug, product_count).outerjoin(
+            CategoryProductCount, CategoryProductCount.category_id == Category.id
+        )
+    else:
+        counts = _visible_counts(tenant_id)
+        product_count = func.coalesce(counts.c.product_count, 0).label("product_count")
+        query = select(Category.id, Category.name, Category.slug, product_count).outerjoin(
+            counts, counts.c.category_id == Category.id
+        )
+
+    result = await db.execute(
+        query.where(Category.tenant_id == tenant_id)
+        .where(Category.is_active.is_(True))
+        .order_by(Category.display_order, Category.name)
+    )
+    return list(result.all())
+
+
+async def refresh_category_counts(db: AsyncSession, tenant_id: UUID) -> None:
+    """
+    Rebuild the materialized category counts for a tenant.
+
+    Runs in the caller's transaction (flushing pending changes first), so
+    call it before committing a change to product visibility or category
+    membership. No-op unless materialized counts are enabled.
+
+    Args:
+        db: Database session
+        tenant_id: Tenant whose counts should be rebuilt
+    """
+    if not settings.shop_category_counts_materialized:
+        return
+
+    await db.flush()
+    counts = _visible_counts(tenant_id)
+    await db.execute(
+        delete(CategoryProductCount).where(CategoryProductCount.tenant_id == tenant_id)
+    )
+    await db.execute(
+        insert(CategoryProductCount).from_select(
+            ["category_id", "tenant_id", "product_count"],
+            select(
+                Category.id,
+                Category.tenant_id,
+                func.coalesce(counts.c.product_count, 0),
+            )
+            .outerjoin(counts, counts.c.category_id == Category.id)
+            .where(Category.tenant_id == tenant_id),
+        )
+    )
+    logger.debug(f"Refreshed category product counts for tenant {tenant_id}")
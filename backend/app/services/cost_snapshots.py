@@ -0,0 +1,341 @@
+"""Product and model cost snapshot maintenance.
+
+The product list and profit calculations read ``ProductCostSnapshot`` rows
+(and model costs ``ModelCostSnapshot`` rows) instead of recomputing make
+cost from the bill of materials on every request.
+
+Rows are maintained on write by SQLAlchemy session hooks, in the same way
+as the shop projection and the sales rollup. ``after_flush`` records which
+models, products and packaging consumables had a cost input changed, and
+``before_commit`` recomputes only the snapshots that depend on them, in the
+same transaction:
+
+- a model's labor, overhead, batch or actual cost settings, or one of its
+  material or component lines → that model, and every product using it
+- a product's packaging or assembly settings, or one of its model or child
+  product lines → that product
+- a consumable's unit cost → every product packaged with it
+
+and then every bundle that contains an affected product, however deeply
+nested. The indexed ``product_models.model_id``,
+``product_components.child_product_id`` and
+``products.packaging_consumable_id`` columns serve as the reverse
+dependency index. The hooks are registered when this module is imported
+(the product API imports it).
+
+Material lines store their own ``cost_per_gram`` (copied from the spool when
+the line is added), so a spool's price is not itself a cost input.
+"""
+
+import hashlib
+import logging
+from itertools import chain
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, event, func, insert, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, lazyload, selectinload
+
+from app.models.consumable import ConsumableType
+from app.models.cost_snapshot import ModelCostSnapshot, ProductCostSnapshot
+from app.models.model import Model
+from app.models.model_component import ModelComponent
+from app.models.model_material import ModelMaterial
+from app.models.product import Product
+from app.models.product_component import ProductComponent
+from app.models.product_model import ProductModel
+from app.schemas.model import CostBreakdown
+from app.schemas.product import ProductCostBreakdown
+from app.services.costing import (
+    MAX_RECURSION_DEPTH,
+    CircularReferenceError,
+    MaxDepthExceededError,
+    ProductCostCalculator,
+)
+from app.services.product_graph import load_product_graph_sync
+
+logger = logging.getLogger(__name__)
+
+# Key in Session.info holding (model_ids, product_ids, consumable_ids) awaiting a rebuild
+_PENDING_KEY = "cost_snapshots_pending"
+
+# Changes to other columns (names, descriptions, stock levels) leave costs alone
+_MODEL_FIELDS = (
+    "prints_per_plate",
+    "labor_hours",
+    "labor_rate_override",
+    "overhead_percentage",
+    "actual_production_cost",
+)
+_MODEL_MATERIAL_FIELDS = ("model_id", "weight_grams", "cost_per_gram")
+_MODEL_COMPONENT_FIELDS = ("model_id", "quantity", "unit_cost")
+_PRODUCT_FIELDS = (
+    "packaging_cost",
+    "packaging_consumable_id",
+    "packaging_quantity",
+    "assembly_minutes",
+)
+_PRODUCT_MODEL_FIELDS = ("product_id", "model_id", "quantity")
+_PRODUCT_COMPONENT_FIELDS = ("parent_product_id", "child_product_id", "quantity")
+_CONSUMABLE_FIELDS = ("current_cost_per_unit",)
+
+
+def _lock_key(kind: str, object_id: UUID) -> int:
+    """Stable signed 64-bit advisory lock key for one snapshot."""
+    digest = hashlib.blake2b(f"cost_snapshot:{kind}:{object_id}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _lock(session: Session, kind: str, ids: Iterable[UUID]) -> None:
+    """
+    Serialize concurrent rebuilds of the same snapshots (PostgreSQL only).
+
+    Taken before the inputs are read, so a transaction waiting on the lock
+    recomputes from the inputs the other one committed.
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    for object_id in sorted(ids):
+        session.execute(select(func.pg_advisory_xact_lock(_lock_key(kind, object_id))))
+
+
+def _with_bundles(session: Session, product_ids: set[UUID]) -> set[UUID]:
+    """
+    Add every bundle that contains one of the products, however deeply nested.
+
+    Follows product component links upwards until no new products appear.
+    The seen set stops cycles, and links deeper than the costing depth limit
+    are not followed.
+    """
+    found = set(product_ids)
+    frontier = set(product_ids)
+    for _ in range(MAX_RECURSION_DEPTH + 1):
+        if not frontier:
+            break
+        parents = set(
+            session.scalars(
+                select(ProductComponent.parent_product_id).where(
+                    ProductComponent.child_product_id.in_(frontier)
+                )
+            )
+        )
+        frontier = parents - found
+        found |= frontier
+    return found
+
+
+def _model_rows(session: Session, model_ids: set[UUID]) -> list[dict]:
+    """Compute snapshot rows for the models that still exist."""
+    models = session.scalars(
+        select(Model)
+        .where(Model.id.in_(model_ids))
+        .options(selectinload(Model.materials), selectinload(Model.components), lazyload("*"))
+    ).all()
+    costs = ProductCostCalculator()
+    rows = []
+    for model in models:
+        cost = costs.model_cost(model)
+        rows.append({"tenant_id": model.tenant_id, "model_id": model.id, **cost.model_dump()})
+    return rows
+
+
+def _product_rows(session: Session, product_ids: set[UUID]) -> list[dict]:
+    """Compute snapshot rows for the products that still exist."""
+    graph = load_product_graph_sync(session, product_ids, root_options=(lazyload("*"),))
+
+    costs = ProductCostCalculator()
+    rows = []
+    for product in graph.values():
+        if product.id not in product_ids:
+            continue  # a nested product that did not change
+        try:
+            cost = costs.product_cost(product)
+        except (CircularReferenceError, MaxDepthExceededError) as e:
+            # Readers fall back to costing on demand, which reports the error
+            logger.warning(f"Cannot snapshot cost of product {product.id}: {e}")
+            continue
+        rows.append({"tenant_id": product.tenant_id, "product_id": product.id, **cost.model_dump()})
+    return rows
+
+
+def _rebuild(
+    session: Session,
+    model_ids: Iterable[UUID] = (),
+    product_ids: Iterable[UUID] = (),
+    consumable_ids: Iterable[UUID] = (),
+) -> tuple[int, int]:
+    """
+    Recompute the snapshots affected by changed models, products and consumables.
+
+    The snapshots are written with core statements in the session's current
+    transaction. Cost inputs are read through a second session on the same
+    connection, so the caller's loaded objects are neither refreshed nor
+    dirtied, and relationship collections the caller did not update (lines
+    added by foreign key alone) are seen as committed.
+
+    Returns:
+        Number of (model, product) snapshots written
+    """
+    model_ids = set(model_ids)
+    product_ids = set(product_ids)
+
+    with Session(bind=session.connection(), autoflush=False) as reader:
+        if model_ids:
+            product_ids.update(
+                reader.scalars(
+                    select(ProductModel.product_id).where(ProductModel.model_id.in_(model_ids))
+                )
+            )
+        if consumable_ids:
+            product_ids.update(
+                reader.scalars(
+                    select(Product.id).where(
+                        Product.packaging_consumable_id.in_(set(consumable_ids))
+                    )
+                )
+            )
+        if product_ids:
+            product_ids = _with_bundles(reader, product_ids)
+
+        _lock(reader, "model", model_ids)
+        _lock(reader, "product", product_ids)
+        model_rows = _model_rows(reader, model_ids) if model_ids else []
+        product_rows = _product_rows(reader, product_ids) if product_ids else []
+
+    if model_ids:
+        session.execute(delete(ModelCostSnapshot).where(ModelCostSnapshot.model_id.in_(model_ids)))
+        if model_rows:
+            session.execute(insert(ModelCostSnapshot), model_rows)
+    if product_ids:
+        session.execute(
+            delete(ProductCostSnapshot).where(ProductCostSnapshot.product_id.in_(product_ids))
+        )
+        if product_rows:
+            session.execute(insert(ProductCostSnapshot), product_rows)
+    logger.debug(f"Rebuilt {len(model_rows)} model and {len(product_rows)} product cost snapshots")
+    return len(model_rows), len(product_rows)
+
+
+def _pending(session: Session) -> tuple[set[UUID], set[UUID], set[UUID]]:
+    """Get the (model_ids, product_ids, consumable_ids) awaiting a rebuild for a session."""
+    return session.info.setdefault(_PENDING_KEY, (set(), set(), set()))
+
+
+def _changed(obj, fields: tuple[str, ...], session: Session) -> bool:
+    """Whether a flushed object is new/deleted or one of ``fields`` was modified."""
+    if obj in session.new or obj in session.deleted:
+        return True
+    attrs = inspect(obj).attrs
+    return any(attrs[field].history.has_changes() for field in fields)
+
+
+def _ids(obj, field: str) -> list[UUID]:
+    """An object's current and (if it was moved) previous value of a reference."""
+    history = inspect(obj).attrs[field].history
+    return [value for value in chain([getattr(obj, field)], history.deleted or ()) if value]
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, flush_context) -> None:
+    """Record the models, products and consumables whose cost inputs a flush changed."""
+    model_ids, product_ids, consumable_ids = _pending(session)
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Model) and _changed(obj, _MODEL_FIELDS, session):
+            model_ids.add(obj.id)
+        elif isinstance(obj, ModelMaterial) and _changed(obj, _MODEL_MATERIAL_FIELDS, session):
+            model_ids.update(_ids(obj, "model_id"))
+        elif isinstance(obj, ModelComponent) and _changed(obj, _MODEL_COMPONENT_FIELDS, session):
+            model_ids.update(_ids(obj, "model_id"))
+        elif isinstance(obj, Product) and _changed(obj, _PRODUCT_FIELDS, session):
+            product_ids.add(obj.id)
+        elif isinstance(obj, ProductModel) and _changed(obj, _PRODUCT_MODEL_FIELDS, session):
+            product_ids.update(_ids(obj, "product_id"))
+        elif isinstance(obj, ProductComponent) and _changed(
+            obj, _PRODUCT_COMPONENT_FIELDS, session
+        ):
+            product_ids.update(_ids(obj, "parent_product_id"))
+        elif isinstance(obj, ConsumableType) and _changed(obj, _CONSUMABLE_FIELDS, session):
+            consumable_ids.add(obj.id)
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_before_commit(session: Session) -> None:
+    """Recompute affected snapshots as part of the committing transaction."""
+    if session.new or session.dirty or session.deleted:
+        session.flush()
+    model_ids, product_ids, consumable_ids = session.info.pop(_PENDING_KEY, (set(), set(), set()))
+    if model_ids or product_ids or consumable_ids:
+        _rebuild(session, model_ids, product_ids, consumable_ids)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, previous_transaction) -> None:
+    """Forget pending rebuilds when the outermost transaction rolls back."""
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+async def get_product_costs(
+    db: AsyncSession, product_ids: Iterable[UUID]
+) -> dict[UUID, ProductCostBreakdown]:
+    """
+    Stored cost breakdowns for products, keyed by product ID.
+
+    Products without a snapshot (not yet backfilled, or in a circular
+    bundle) are left out; callers cost those on demand.
+    """
+    product_ids = set(product_ids)
+    if not product_ids:
+        return {}
+    result = await db.execute(
+        select(ProductCostSnapshot).where(ProductCostSnapshot.product_id.in_(product_ids))
+    )
+    return {
+        snapshot.product_id: ProductCostBreakdown.model_validate(snapshot)
+        for snapshot in result.scalars().all()
+    }
+
+
+async def get_model_costs(db: AsyncSession, model_ids: Iterable[UUID]) -> dict[UUID, CostBreakdown]:
+    """Stored unit cost breakdowns for models, keyed by model ID."""
+    model_ids = set(model_ids)
+    if not model_ids:
+        return {}
+    result = await db.execute(
+        select(ModelCostSnapshot).where(ModelCostSnapshot.model_id.in_(model_ids))
+    )
+    return {
+        snapshot.model_id: CostBreakdown.model_validate(snapshot)
+        for snapshot in result.scalars().all()
+    }
+
+
+async def rebuild_cost_snapshots(
+    db: AsyncSession, tenant_id: Optional[UUID] = None
+) -> tuple[int, int]:
+    """
+    Recompute every model and product cost snapshot of a tenant, or every tenant.
+
+    Used to backfill existing catalogues and to repair drift. Runs in the
+    caller's transaction; the caller commits.
+
+    Args:
+        db: Database session
+        tenant_id: Tenant to rebuild (None = all tenants)
+
+    Returns:
+        Number of (model, product) snapshots written
+    """
+    model_query = select(Model.id)
+    product_query = select(Product.id)
+    if tenant_id is not None:
+        model_query = model_query.where(Model.tenant_id == tenant_id)
+        product_query = product_query.where(Product.tenant_id == tenant_id)
+    model_ids = set((await db.execute(model_query)).scalars().all())
+    product_ids = set((await db.execute(product_query)).scalars().all())
+
+    def rebuild_all(session: Session) -> tuple[int, int]:
+        return _rebuild(session, model_ids, product_ids)
+
+    return await db.run_sync(rebuild_all)
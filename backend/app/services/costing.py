@@ -1,7 +1,7 @@
 """Costing service for calculating model and product costs."""
 
 from decimal import Decimal
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 from uuid import UUID
 
 if TYPE_CHECKING:
@@ -43,6 +43,11 @@ DEFAULT_LABOR_RATE = Decimal("10.00")
 MAX_RECURSION_DEPTH = 20
 
 
+def _to_decimal(value) -> Decimal:
+    """Convert a numeric field to Decimal (Numeric columns already are)."""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
 class CostingService:
     """Service for calculating model and product costs."""
 
@@ -71,7 +76,7 @@ class CostingService:
 
         # Get prints per plate (for batch printing cost division)
         prints_per_plate = (
-            Decimal(str(model.prints_per_plate))
+            _to_decimal(model.prints_per_plate)
             if model.prints_per_plate and model.prints_per_plate > 0
             else Decimal("1")
         )
@@ -81,8 +86,8 @@ class CostingService:
         material_cost = Decimal("0")
         if hasattr(model, "materials"):
             for material in model.materials:
-                plate_cost = Decimal(str(material.weight_grams)) * Decimal(
-                    str(material.cost_per_gram)
+                plate_cost = _to_decimal(material.weight_grams) * _to_decimal(
+                    material.cost_per_gram
                 )
                 material_cost += plate_cost / prints_per_plate
 
@@ -90,22 +95,20 @@ class CostingService:
         component_cost = Decimal("0")
         if hasattr(model, "components"):
             for component in model.components:
-                component_cost += Decimal(str(component.quantity)) * Decimal(
-                    str(component.unit_cost)
-                )
+                component_cost += _to_decimal(component.quantity) * _to_decimal(component.unit_cost)
 
         # 3. Calculate labor cost
         labor_rate = (
-            Decimal(str(model.labor_rate_override))
+            _to_decimal(model.labor_rate_override)
             if model.labor_rate_override is not None
             else tenant_default_labor_rate
         )
-        labor_hours = Decimal(str(model.labor_hours)) if model.labor_hours else Decimal("0")
+        labor_hours = _to_decimal(model.labor_hours) if model.labor_hours else Decimal("0")
         labor_cost = labor_hours * labor_rate
 
         # 4. Calculate overhead cost (percentage of material + labor)
         overhead_pct = (
-            Decimal(str(model.overhead_percentage))
+            _to_decimal(model.overhead_percentage)
             if model.overhead_percentage and model.overhead_percentage > 0
             else tenant_default_overhead_pct
         )
@@ -150,14 +153,150 @@ class CostingService:
             CircularReferenceError: If a circular reference is detected in product hierarchy
             MaxDepthExceededError: If product hierarchy exceeds MAX_RECURSION_DEPTH
         """
-        if labor_rate is None:
-            labor_rate = DEFAULT_LABOR_RATE
+        return ProductCostCalculator(labor_rate).product_cost(
+            product, _visited=_visited, _depth=_depth
+        )
+
+    @staticmethod
+    def calculate_product_costs(
+        products: Iterable["Product"],
+        labor_rate: Optional[Decimal] = None,
+    ) -> dict[UUID, ProductCostBreakdown]:
+        """
+        Calculate cost breakdowns for many products at once.
+
+        Models and child products shared between the products (or appearing
+        several times within one bundle) are costed once.
+
+        Args:
+            products: Product instances with product_models and child_products loaded
+            labor_rate: Labor rate (£/hour), defaults to DEFAULT_LABOR_RATE
+
+        Returns:
+            Mapping of product ID to its ProductCostBreakdown
+        """
+        return ProductCostCalculator(labor_rate).product_costs(products)
+
+    @staticmethod
+    def calculate_profit(
+        list_price: Decimal,
+        make_cost: Decimal,
+        fee_percentage: Decimal = Decimal("0"),
+        fee_fixed: Decimal = Decimal("0"),
+    ) -> dict:
+        """
+        Calculate profit and margin for a product at a given price.
+
+        Args:
+            list_price: Selling price
+            make_cost: Total make cost
+            fee_percentage: Platform percentage fee (0-100)
+            fee_fixed: Fixed platform fee per transaction
+
+        Returns:
+            Dict with platform_fee, net_revenue, profit, margin_percentage
+        """
+        # Calculate platform fees
+        percentage_fee = list_price * (fee_percentage / Decimal("100"))
+        platform_fee = percentage_fee + fee_fixed
+
+        # Net revenue after platform takes their cut
+        net_revenue = list_price - platform_fee
+
+        # Profit after deducting make cost
+        profit = net_revenue - make_cost
+
+        # Margin percentage (profit / list_price * 100)
+        margin_percentage = (
+            (profit / list_price * Decimal("100")) if list_price > 0 else Decimal("0")
+        )
+
+        return {
+            "platform_fee": platform_fee.quantize(Decimal("0.01")),
+            "net_revenue": net_revenue.quantize(Decimal("0.01")),
+            "profit": profit.quantize(Decimal("0.01")),
+            "margin_percentage": margin_percentage.quantize(Decimal("0.01")),
+        }
+
+    @staticmethod
+    def calculate_cost_per_gram_from_spool(
+        purchase_price: Optional[Decimal],
+        initial_weight: Decimal,
+    ) -> Decimal:
+        """
+        Calculate cost per gram from spool purchase information.
+
+        Args:
+            purchase_price: Purchase price of spool
+            initial_weight: Initial weight of spool in grams
+
+        Returns:
+            Cost per gram
+        """
+        if purchase_price is None or purchase_price <= 0:
+            return Decimal("0")
+
+        if initial_weight <= 0:
+            return Decimal("0")
+
+        return (Decimal(str(purchase_price)) / Decimal(str(initial_weight))).quantize(
+            Decimal("0.0001")
+        )
+
+
+class ProductCostCalculator:
+    """
+    Memoized cost calculation over the product → child product → model graph.
+
+    Each model and product breakdown is computed once per calculator and
+    reused wherever it appears again: in another product of the same
+    listing, as a child of several bundles, or several times within one
+    bundle. Costing a set of products is therefore linear in the number of
+    distinct products and models rather than in the number of paths through
+    the bundle hierarchy. Children are costed before their parents (a
+    depth-first topological order), with the same cycle and depth checks as
+    ``CostingService.calculate_product_cost``.
+
+    A calculator caches results for the objects it is given, so use one per
+    request and discard it after the products change.
+    """
+
+    def __init__(self, labor_rate: Optional[Decimal] = None):
+        self.labor_rate = labor_rate if labor_rate is not None else DEFAULT_LABOR_RATE
+        self._model_costs: dict[UUID, CostBreakdown] = {}
+        self._product_costs: dict[UUID, ProductCostBreakdown] = {}
+        # Longest chain of child products below each costed product
+        self._heights: dict[UUID, int] = {}
+
+    def model_cost(self, model: "Model") -> CostBreakdown:
+        """Get a model's unit cost breakdown (computed on first use)."""
+        cost = self._model_costs.get(model.id)
+        if cost is None:
+            cost = self._model_costs[model.id] = CostingService.calculate_model_cost(model)
+        return cost
+
+    def product_costs(self, products: Iterable["Product"]) -> dict[UUID, ProductCostBreakdown]:
+        """Cost breakdowns for several products, keyed by product ID."""
+        return {product.id: self.product_cost(product) for product in products}
+
+    def product_cost(
+        self,
+        product: "Product",
+        _visited: Optional[set] = None,
+        _depth: int = 0,
+    ) -> ProductCostBreakdown:
+        """
+        Get a product's cost breakdown (computed on first use).
 
+        Raises:
+            CircularReferenceError: If a circular reference is detected in product hierarchy
+            MaxDepthExceededError: If product hierarchy exceeds MAX_RECURSION_DEPTH
+        """
         # Check recursion depth limit
         if _depth > MAX_RECURSION_DEPTH:
             raise MaxDepthExceededError(_depth, MAX_RECURSION_DEPTH)
 
-        # Initialize visited set for cycle detection
+        # Initialize visited set (products on the current path) for cycle detection
         if _visited is None:
             _visited = set()
 
@@ -165,10 +304,22 @@ class CostingService:
         if product.id in _visited:
             raise CircularReferenceError(product.id, _visited)
 
-        # Add current product to visited set
-        _visited = _visited.copy()  # Create copy to not affect sibling branches
-        _visited.add(product.id)
-
+        cached = self._product_costs.get(product.id)
+        if cached is not None:
+            # Reached along a longer path than before; its subtree may now be too deep
+            if _depth + self._heights[product.id] > MAX_RECURSION_DEPTH:
+                raise MaxDepthExceededError(MAX_RECURSION_DEPTH + 1, MAX_RECURSION_DEPTH)
+            return cached
+
+        cost, height = self._compute_product_cost(product, _visited | {product.id}, _depth)
+        self._product_costs[product.id] = cost
+        self._heights[product.id] = height
+        return cost
+
+    def _compute_product_cost(
+        self, product: "Product", path: set, depth: int
+    ) -> tuple[ProductCostBreakdown, int]:
+        """Cost one product whose children may already be memoized."""
         # 1. Calculate total model cost (sum of all models × quantity × model unit cost)
         # Phase 3: Also track actual production costs from models
         models_cost = Decimal("0")
@@ -180,63 +331,56 @@ class CostingService:
         if hasattr(product, "product_models"):
             for pm in product.product_models:
                 if hasattr(pm, "model") and pm.model:
-                    # Calculate model's unit cost (BOM-based theoretical)
-                    model_cost = CostingService.calculate_model_cost(pm.model)
-                    models_cost += Decimal(str(pm.quantity)) * model_cost.total_cost
+                    quantity = _to_decimal(pm.quantity)
+                    # Model's unit cost (BOM-based theoretical)
+                    models_cost += quantity * self.model_cost(pm.model).total_cost
 
                     # Track unique models for actual cost calculation
                     if pm.model.id not in seen_model_ids:
                         seen_model_ids.add(pm.model.id)
                         models_total += 1
-
-                        # Phase 3: Add actual production cost if available
                         if pm.model.actual_production_cost is not None:
-                            models_actual_cost += Decimal(str(pm.quantity)) * Decimal(
-                                str(pm.model.actual_production_cost)
-                            )
                             models_with_actual_cost += 1
-                    elif pm.model.actual_production_cost is not None:
-                        # Same model appears multiple times - just add the cost
-                        models_actual_cost += Decimal(str(pm.quantity)) * Decimal(
-                            str(pm.model.actual_production_cost)
+
+                    # Phase 3: Add actual production cost if available
+                    if pm.model.actual_production_cost is not None:
+                        models_actual_cost += quantity * _to_decimal(
+                            pm.model.actual_production_cost
                         )
 
         # 2. Calculate total child product cost (for bundles)
-        # This is recursive - child products may contain other products
+        # Children are costed (or reused) before the parent
         child_products_cost = Decimal("0")
+        height = 0
         if hasattr(product, "child_products"):
             for pc in product.child_products:
                 if hasattr(pc, "child_product") and pc.child_product:
-                    # Recursively calculate child product's cost
-                    child_cost = CostingService.calculate_product_cost(
-                        pc.child_product,
-                        labor_rate=labor_rate,
-                        _visited=_visited,
-                        _depth=_depth + 1,
-                    )
-                    child_products_cost += Decimal(str(pc.quantity)) * child_cost.total_make_cost
+                    child = pc.child_product
+                    child_cost = self.product_cost(child, _visited=path, _depth=depth + 1)
+                    child_products_cost += _to_decimal(pc.quantity) * child_cost.total_make_cost
+                    height = max(height, self._heights[child.id] + 1)
 
         # 3. Packaging cost - use consumable cost if linked, otherwise manual cost
         if hasattr(product, "packaging_consumable") and product.packaging_consumable:
             consumable = product.packaging_consumable
             unit_cost = (
-                Decimal(str(consumable.current_cost_per_unit))
+                _to_decimal(consumable.current_cost_per_unit)
                 if consumable.current_cost_per_unit
                 else Decimal("0")
             )
             quantity = product.packaging_quantity if product.packaging_quantity else 1
-            packaging_cost = unit_cost * Decimal(str(quantity))
+            packaging_cost = unit_cost * _to_decimal(quantity)
         else:
             packaging_cost = (
-                Decimal(str(product.packaging_cost)) if product.packaging_cost else Decimal("0")
+                _to_decimal(product.packaging_cost) if product.packaging_cost else Decimal("0")
             )
 
         # 4. Assembly cost (minutes to hours × labor rate)
         assembly_minutes = (
-            Decimal(str(product.assembly_minutes)) if product.assembly_minutes else Decimal("0")
+            _to_decimal(product.assembly_minutes) if product.assembly_minutes else Decimal("0")
         )
         assembly_hours = assembly_minutes / Decimal("60")
-        assembly_cost = assembly_hours * labor_rate
+        assembly_cost = assembly_hours * self.labor_rate
 
         # 5. Total make cost (now includes child products cost)
         total_make_cost = models_cost + child_products_cost + packaging_cost + assembly_cost
@@ -257,7 +401,7 @@ class CostingService:
                         (total_actual_cost - total_make_cost) / total_make_cost * Decimal("100")
                     )
 
-        return ProductCostBreakdown(
+        cost = ProductCostBreakdown(
             models_cost=models_cost.quantize(Decimal("0.01")),
             child_products_cost=child_products_cost.quantize(Decimal("0.01")),
             packaging_cost=packaging_cost.quantize(Decimal("0.01")),
@@ -276,69 +420,4 @@ class CostingService:
             models_with_actual_cost=models_with_actual_cost,
             models_total=models_total,
         )
-
-    @staticmethod
-    def calculate_profit(
-        list_price: Decimal,
-        make_cost: Decimal,
-        fee_percentage: Decimal = Decimal("0"),
-        fee_fixed: Decimal = Decimal("0"),
-    ) -> dict:
-        """
-        Calculate profit and margin for a product at a given price.
-
-        Args:
-            list_price: Selling price
-            make_cost: Total make cost
-            fee_percentage: Platform percentage fee (0-100)
-            fee_fixed: Fixed platform fee per transaction
-
-        Returns:
-            Dict with platform_fee, net_revenue, profit, margin_percentage
-        """
-        # Calculate platform fees
-        percentage_fee = list_price * (fee_percentage / Decimal("100"))
-        platform_fee = percentage_fee + fee_fixed
-
-        # Net revenue after platform takes their cut
-        net_revenue = list_price - platform_fee
-
-        # Profit after deducting make cost
-        profit = net_revenue - make_cost
-
-        # Margin percentage (profit / list_price * 100)
-        margin_percentage = (
-            (profit / list_price * Decimal("100")) if list_price > 0 else Decimal("0")
-        )
-
-        return {
-            "platform_fee": platform_fee.quantize(Decimal("0.01")),
-            "net_revenue": net_revenue.quantize(Decimal("0.01")),
-            "profit": profit.quantize(Decimal("0.01")),
-            "margin_percentage": margin_percentage.quantize(Decimal("0.01")),
-        }
-
-    @staticmethod
-    def calculate_cost_per_gram_from_spool(
-        purchase_price: Optional[Decimal],
-        initial_weight: Decimal,
-    ) -> Decimal:
-        """
-        Calculate cost per gram from spool purchase information.
-
-        Args:
-            purchase_price: Purchase price of spool
-            initial_weight: Initial weight of spool in grams
-
-        Returns:
-            Cost per gram
-        """
-        if purchase_price is None or purchase_price <= 0:
-            return Decimal("0")
-
-        if initial_weight <= 0:
-            return Decimal("0")
-
-        return (Decimal(str(purchase_price)) / Decimal(str(initial_weight))).quantize(
-            Decimal("0.0001")
-        )
+        return cost, height
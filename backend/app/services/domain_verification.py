@@ -10,6 +10,7 @@ from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.tenant import Tenant
+from app.services.tenant_routing import invalidate_tenant_routes
 
 logger = logging.getLogger(__name__)
 
@@ -343,6 +344,9 @@ class DomainVerificationService:
         await self.db.execute(stmt)
         await self.db.commit()
 
+        # Custom domains, shop settings and branding feed public shop routing
+        invalidate_tenant_routes(tenant_id)
+
 
 # Factory function for dependency injection
 async def get_domain_verification_service(
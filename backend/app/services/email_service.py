@@ -7,6 +7,7 @@ from typing import Optional
 import httpx
 
 from app.config import get_settings
+from app.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -65,9 +66,10 @@ class EmailService:
                 if reply_to:
                     payload["replyTo"] = {"email": reply_to}
 
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.post(BREVO_EMAIL_API_URL, json=payload, headers=headers)
-                    response.raise_for_status()
+                response = await get_http_client("email").post(
+                    BREVO_EMAIL_API_URL, json=payload, headers=headers, timeout=30.0
+                )
+                response.raise_for_status()
                 return True
             except Exception as e:
                 logger.error(f"Failed to send email to {to_email} via Brevo: {e}")
@@ -87,9 +89,10 @@ class EmailService:
                 if reply_to:
                     payload["reply_to"] = reply_to
 
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.post(RESEND_EMAIL_API_URL, json=payload, headers=headers)
-                    response.raise_for_status()
+                response = await get_http_client("email").post(
+                    RESEND_EMAIL_API_URL, json=payload, headers=headers, timeout=30.0
+                )
+                response.raise_for_status()
                 return True
             except Exception as e:
                 logger.error(f"Failed to send email to {to_email} via Resend: {e}")
@@ -134,26 +137,27 @@ class EmailService:
             if attributes:
                 payload["attributes"] = attributes
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(BREVO_CONTACTS_API_URL, json=payload, headers=headers)
-
-                if response.status_code == 201:
-                    logger.info(f"Newsletter subscription created for {email}")
-                    return True, "Successfully subscribed to newsletter"
-                elif response.status_code == 204:
-                    logger.info(f"Newsletter subscription updated for {email}")
-                    return True, "Subscription updated"
-                elif response.status_code == 400:
-                    error_data = response.json()
-                    error_msg = error_data.get("message", "Invalid request")
-                    if "Contact already exist" in error_msg:
-                        logger.info(f"Contact already exists: {email}")
-                        return True, "Already subscribed"
-                    logger.warning(f"Newsletter subscription failed for {email}: {error_msg}")
-                    return False, error_msg
-                else:
-                    response.raise_for_status()
-                    return True, "Subscribed"
+            response = await get_http_client("email").post(
+                BREVO_CONTACTS_API_URL, json=payload, headers=headers, timeout=30.0
+            )
+
+            if response.status_code == 201:
+                logger.info(f"Newsletter subscription created for {email}")
+                return True, "Successfully subscribed to newsletter"
+            elif response.status_code == 204:
+                logger.info(f"Newsletter subscription updated for {email}")
+                return True, "Subscription updated"
+            elif response.status_code == 400:
+                error_data = response.json()
+                error_msg = error_data.get("message", "Invalid request")
+                if "Contact already exist" in error_msg:
+                    logger.info(f"Contact already exists: {email}")
+                    return True, "Already subscribed"
+                logger.warning(f"Newsletter subscription failed for {email}: {error_msg}")
+                return False, error_msg
+            else:
+                response.raise_for_status()
+                return True, "Subscribed"
 
         except httpx.HTTPStatusError as e:
             logger.error(f"Newsletter subscription HTTP error for {email}: {e}")
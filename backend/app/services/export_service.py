@@ -3,16 +3,23 @@ CSV Export Service for Shopify-compatible exports.
 
 Generates CSV files for products, orders, and inventory in formats
 compatible with Shopify's import system.
+
+Exports are produced as streams of CSV text: rows are read on a server-side
+cursor in batches of ``EXPORT_BATCH_SIZE`` (relationships are selectin-loaded
+per batch) and flushed every ``EXPORT_CHUNK_SIZE`` characters, so memory use
+does not grow with the number of rows. The ``export_*_csv`` methods collect
+a stream into one string.
 """
 
 import csv
 import io
 import logging
+import zlib
 from datetime import datetime, date
 from decimal import Decimal
-from typing import Optional
+from typing import AsyncIterator, Optional
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -22,6 +29,30 @@ from app.models.tenant import Tenant
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per server-side cursor batch
+EXPORT_BATCH_SIZE = 500
+
+# Buffered CSV characters per streamed chunk
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+async def gzip_chunks(chunks: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """
+    Gzip-compress a stream of CSV text chunks as they arrive.
+
+    Args:
+        chunks: Text chunks, e.g. from ``ExportService.stream_products_csv``
+
+    Yields:
+        Consecutive pieces of one gzip file
+    """
+    compressor = zlib.compressobj(wbits=31)  # 16 + 15: gzip header and trailer
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk.encode("utf-8"))
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
 
 class ExportService:
     """Service for generating CSV exports in Shopify-compatible format."""
@@ -48,6 +79,15 @@ class ExportService:
         Returns:
             CSV string ready for Shopify import
         """
+        return await self._join(self.stream_products_csv())
+
+    async def stream_products_csv(self) -> AsyncIterator[str]:
+        """
+        Stream all products in Shopify CSV format.
+
+        Yields:
+            CSV text chunks ready for Shopify import
+        """
         # Shopify product CSV columns
         fieldnames = [
             "Handle",
@@ -91,8 +131,8 @@ class ExportService:
         writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction="ignore")
         writer.writeheader()
 
-        # Fetch all products with related data including variants
-        result = await self.db.execute(
+        # Stream all products with related data including variants
+        products = await self._stream(
             select(Product)
             .where(Product.tenant_id == self.tenant.id)
             .options(
@@ -103,9 +143,8 @@ class ExportService:
             )
             .order_by(Product.created_at.desc())
         )
-        products = result.scalars().all()
 
-        for product in products:
+        async for product in products:
             # Generate handle from SKU or name
             handle = self._generate_handle(product.sku or product.name)
 
@@ -253,7 +292,10 @@ class ExportService:
                     img_row["Image Alt Text"] = img.alt_text or ""
                     writer.writerow(img_row)
 
-        return output.getvalue()
+            if output.tell() >= EXPORT_CHUNK_SIZE:
+                yield self._drain(output)
+
+        yield output.getvalue()
 
     # ============================================
     # Inventory Export (Shopify Inventory CSV Format)
@@ -269,6 +311,18 @@ class ExportService:
         Returns:
             CSV string ready for Shopify inventory import
         """
+        return await self._join(self.stream_inventory_csv(location=location))
+
+    async def stream_inventory_csv(self, location: str = "Default") -> AsyncIterator[str]:
+        """
+        Stream inventory in Shopify CSV format.
+
+        Args:
+            location: Inventory location name
+
+        Yields:
+            CSV text chunks ready for Shopify inventory import
+        """
         # Shopify inventory CSV columns
         fieldnames = [
             "Handle",
@@ -289,13 +343,12 @@ class ExportService:
         writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction="ignore")
         writer.writeheader()
 
-        # Fetch all products
-        result = await self.db.execute(
+        # Stream all products
+        products = await self._stream(
             select(Product).where(Product.tenant_id == self.tenant.id).order_by(Product.sku)
         )
-        products = result.scalars().all()
 
-        for product in products:
+        async for product in products:
             handle = self._generate_handle(product.sku or product.name)
 
             row = {
@@ -314,7 +367,10 @@ class ExportService:
             }
             writer.writerow(row)
 
-        return output.getvalue()
+            if output.tell() >= EXPORT_CHUNK_SIZE:
+                yield self._drain(output)
+
+        yield output.getvalue()
 
     # ============================================
     # Order Export (Shopify Order CSV Format)
@@ -337,6 +393,27 @@ class ExportService:
         Returns:
             CSV string in Shopify order format
         """
+        return await self._join(
+            self.stream_orders_csv(start_date=start_date, end_date=end_date, status=status)
+        )
+
+    async def stream_orders_csv(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        status: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream orders in Shopify CSV format.
+
+        Args:
+            start_date: Filter orders from this date (inclusive)
+            end_date: Filter orders to this date (inclusive)
+            status: Filter by order status
+
+        Yields:
+            CSV text chunks in Shopify order format
+        """
         # Shopify order CSV columns
         fieldnames = [
             "Name",
@@ -429,10 +506,9 @@ class ExportService:
         if status:
             query = query.where(Order.status == status)
 
-        result = await self.db.execute(query)
-        orders = result.scalars().all()
+        orders = await self._stream(query)
 
-        for order in orders:
+        async for order in orders:
             # Map our status to Shopify financial status
             financial_status = self._map_financial_status(order.status, order.payment_status)
             fulfillment_status = self._map_fulfillment_status(order.status)
@@ -526,7 +602,10 @@ class ExportService:
                 }
                 writer.writerow(row)
 
-        return output.getvalue()
+            if output.tell() >= EXPORT_CHUNK_SIZE:
+                yield self._drain(output)
+
+        yield output.getvalue()
 
     # ============================================
     # Accounting Export (Simple format for bookkeeping)
@@ -549,6 +628,25 @@ class ExportService:
         Returns:
             CSV string for accounting import
         """
+        return await self._join(
+            self.stream_orders_accounting_csv(start_date=start_date, end_date=end_date)
+        )
+
+    async def stream_orders_accounting_csv(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream orders in a simple accounting format.
+
+        Args:
+            start_date: Filter orders from this date
+            end_date: Filter orders to this date
+
+        Yields:
+            CSV text chunks for accounting import
+        """
         fieldnames = [
             "Date",
             "Invoice Number",
@@ -598,10 +696,9 @@ class ExportService:
         # Exclude cancelled orders for accounting
         query = query.where(Order.status != OrderStatus.CANCELLED)
 
-        result = await self.db.execute(query)
-        orders = result.scalars().all()
+        orders = await self._stream(query)
 
-        for order in orders:
+        async for order in orders:
             order_date = order.created_at.strftime("%Y-%m-%d") if order.created_at else ""
 
             for idx, item in enumerate(order.items):
@@ -626,12 +723,32 @@ class ExportService:
                 }
                 writer.writerow(row)
 
-        return output.getvalue()
+            if output.tell() >= EXPORT_CHUNK_SIZE:
+                yield self._drain(output)
+
+        yield output.getvalue()
 
     # ============================================
     # Helper Methods
     # ============================================
 
+    async def _stream(self, query: Select):
+        """Run a query on a server-side cursor, fetching EXPORT_BATCH_SIZE rows at a time."""
+        return await self.db.stream_scalars(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+
+    @staticmethod
+    def _drain(output: io.StringIO) -> str:
+        """Take the CSV text buffered so far and empty the buffer."""
+        chunk = output.getvalue()
+        output.seek(0)
+        output.truncate(0)
+        return chunk
+
+    @staticmethod
+    async def _join(chunks: AsyncIterator[str]) -> str:
+        """Collect a CSV stream into one string."""
+        return "".join([chunk async for chunk in chunks])
+
     def _generate_handle(self, text: str) -> str:
         """Generate a URL-friendly handle from text."""
         import re
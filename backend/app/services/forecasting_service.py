@@ -1,6 +1,8 @@
 """Inventory forecasting service for demand prediction and reorder recommendations.
 
 Uses Simple Moving Average with safety stock calculations for inventory planning.
+Sales history is read from the ``daily_product_sales`` rollup maintained by
+``app.services.sales_rollup``.
 """
 
 import math
@@ -12,8 +14,10 @@ from uuid import UUID
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.order import Order, OrderItem, OrderStatus
+from app.models.daily_product_sales import DailyProductSales
+from app.models.order import Order, OrderItem
 from app.models.product import Product
+from app.services.sales_rollup import SALES_STATUSES
 
 
 @dataclass
@@ -97,46 +101,70 @@ class ForecastingService:
         days: int = DEFAULT_ANALYSIS_DAYS,
     ) -> list[DailyDemand]:
         """Get daily sales history for a product."""
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+        cutoff_day = (datetime.now(timezone.utc) - timedelta(days=days)).date()
 
-        # Query completed orders with this product
+        # One pre-summed row per channel and day with sales
         result = await self.db.execute(
             select(
-                func.date(Order.created_at).label("sale_date"),
-                func.sum(OrderItem.quantity).label("total_qty"),
+                DailyProductSales.day.label("sale_date"),
+                func.sum(DailyProductSales.units_sold).label("total_qty"),
             )
-            .join(OrderItem, Order.id == OrderItem.order_id)
             .where(
-                Order.tenant_id == tenant_id,
-                OrderItem.product_id == product_id,
-                Order.created_at >= cutoff_date,
-                Order.status.in_(
-                    [
-                        OrderStatus.PENDING,
-                        OrderStatus.PROCESSING,
-                        OrderStatus.SHIPPED,
-                        OrderStatus.DELIVERED,
-                    ]
-                ),
+                DailyProductSales.tenant_id == tenant_id,
+                DailyProductSales.product_id == product_id,
+                DailyProductSales.day > cutoff_day,
             )
-            .group_by(func.date(Order.created_at))
-            .order_by(func.date(Order.created_at))
+            .group_by(DailyProductSales.day)
+            .order_by(DailyProductSales.day)
         )
 
-        rows = result.all()
-        demands = []
-        for row in rows:
-            # Handle both date objects (PostgreSQL) and strings (SQLite)
-            sale_date = row.sale_date
-            if isinstance(sale_date, str):
-                sale_date = datetime.strptime(sale_date, "%Y-%m-%d").date()
-            demands.append(
-                DailyDemand(
-                    date=datetime.combine(sale_date, datetime.min.time()),
-                    quantity=int(row.total_qty),
-                )
+        return [
+            DailyDemand(date=self._sale_day(row.sale_date), quantity=int(row.total_qty))
+            for row in result.all()
+        ]
+
+    async def get_tenant_sales_history(
+        self,
+        tenant_id: UUID,
+        days: int = DEFAULT_ANALYSIS_DAYS,
+    ) -> dict[UUID, list[DailyDemand]]:
+        """Get daily sales history for every product of a tenant in one query.
+
+        The window covers the last ``days`` UTC days, including today.
+
+        Returns a mapping of product ID to its daily demand, oldest first.
+        Products without sales in the window are absent.
+        """
+        cutoff_day = (datetime.now(timezone.utc) - timedelta(days=days)).date()
+
+        result = await self.db.execute(
+            select(
+                DailyProductSales.product_id,
+                DailyProductSales.day.label("sale_date"),
+                func.sum(DailyProductSales.units_sold).label("total_qty"),
+            )
+            .where(
+                DailyProductSales.tenant_id == tenant_id,
+                DailyProductSales.day > cutoff_day,
             )
-        return demands
+            .group_by(DailyProductSales.product_id, DailyProductSales.day)
+            .order_by(DailyProductSales.product_id, DailyProductSales.day)
+        )
+
+        history: dict[UUID, list[DailyDemand]] = {}
+        for row in result.all():
+            history.setdefault(row.product_id, []).append(
+                DailyDemand(date=self._sale_day(row.sale_date), quantity=int(row.total_qty))
+            )
+        return history
+
+    @staticmethod
+    def _sale_day(sale_date) -> datetime:
+        """Normalise a rollup day to midnight."""
+        # Handle both date objects (PostgreSQL) and strings (SQLite)
+        if isinstance(sale_date, str):
+            sale_date = datetime.strptime(sale_date, "%Y-%m-%d").date()
+        return datetime.combine(sale_date, datetime.min.time())
 
     def _calculate_statistics(
         self, sales_history: list[DailyDemand], analysis_days: int
@@ -154,21 +182,20 @@ class ForecastingService:
         if len(sales_history) < 2:
             return avg_daily, 0.0, total_sold
 
-        # Calculate std deviation of daily sales
-        # Include zero-sale days in calculation
+        # Std deviation of daily sales over the window, including zero-sale
+        # days. Only days with sales are visited; the zero days contribute
+        # (0 - mean)^2 each, so the cost is independent of the window length.
+        # Same window as the history queries: the last ``analysis_days`` UTC
+        # days, including today
         daily_quantities = {d.date.date(): d.quantity for d in sales_history}
+        end_day = datetime.now(timezone.utc).date()
+        start_day = end_day - timedelta(days=analysis_days - 1)
+        window = [qty for day, qty in daily_quantities.items() if start_day <= day <= end_day]
 
-        # Create full range of days
-        all_days = []
-        start_date = datetime.now(timezone.utc) - timedelta(days=analysis_days)
-        for i in range(analysis_days):
-            day = (start_date + timedelta(days=i)).date()
-            all_days.append(daily_quantities.get(day, 0))
-
-        # Calculate standard deviation
-        mean = sum(all_days) / len(all_days)
-        variance = sum((x - mean) ** 2 for x in all_days) / len(all_days)
-        std_dev = math.sqrt(variance)
+        mean = sum(window) / analysis_days
+        squared_deviation = sum((x - mean) ** 2 for x in window)
+        squared_deviation += (analysis_days - len(window)) * mean**2
+        std_dev = math.sqrt(squared_deviation / analysis_days)
 
         return avg_daily, std_dev, total_sold
 
@@ -209,6 +236,16 @@ class ForecastingService:
         # Get sales history
         sales_history = await self.get_sales_history(product_id, tenant_id, analysis_days)
 
+        return self._build_forecast(product, sales_history, forecast_days, analysis_days)
+
+    def _build_forecast(
+        self,
+        product: Product,
+        sales_history: list[DailyDemand],
+        forecast_days: int,
+        analysis_days: int,
+    ) -> DemandForecast:
+        """Build a product's forecast from its sales history."""
         # Calculate statistics
         avg_daily, std_dev, total_sold = self._calculate_statistics(sales_history, analysis_days)
 
@@ -238,6 +275,31 @@ class ForecastingService:
             confidence_level=self._get_confidence_level(sales_history, analysis_days),
         )
 
+    async def predict_all_demand(
+        self,
+        tenant_id: UUID,
+        forecast_days: int = DEFAULT_FORECAST_DAYS,
+        analysis_days: int = DEFAULT_ANALYSIS_DAYS,
+    ) -> list[DemandForecast]:
+        """Predict demand for every active product of a tenant.
+
+        Equivalent to calling ``predict_demand`` per product, but loads all
+        sales history with a single grouped query.
+        """
+        products_result = await self.db.execute(
+            select(Product).where(
+                Product.tenant_id == tenant_id,
+                Product.is_active.is_(True),
+            )
+        )
+        products = products_result.scalars().all()
+        history = await self.get_tenant_sales_history(tenant_id, analysis_days)
+
+        return [
+            self._build_forecast(product, history.get(product.id, []), forecast_days, analysis_days)
+            for product in products
+        ]
+
     async def calculate_reorder_point(
         self,
         product_id: UUID,
@@ -250,6 +312,12 @@ class ForecastingService:
         if not forecast:
             return None
 
+        return self._build_reorder_recommendation(forecast, lead_time_days)
+
+    def _build_reorder_recommendation(
+        self, forecast: DemandForecast, lead_time_days: int
+    ) -> ReorderRecommendation:
+        """Derive safety stock, reorder point and urgency from a forecast."""
         avg_daily = forecast.avg_daily_demand
         std_dev = forecast.std_deviation
 
@@ -292,19 +360,10 @@ class ForecastingService:
         lead_time_days: int = DEFAULT_LEAD_TIME_DAYS,
     ) -> list[ReorderRecommendation]:
         """Get reorder recommendations for all products that need attention."""
-        # Get all active products
-        products_result = await self.db.execute(
-            select(Product).where(
-                Product.tenant_id == tenant_id,
-                Product.is_active.is_(True),
-            )
-        )
-        products = products_result.scalars().all()
-
         recommendations = []
-        for product in products:
-            rec = await self.calculate_reorder_point(product.id, tenant_id, lead_time_days)
-            if rec and rec.urgency in ["critical", "soon"]:
+        for forecast in await self.predict_all_demand(tenant_id):
+            rec = self._build_reorder_recommendation(forecast, lead_time_days)
+            if rec.urgency in ["critical", "soon"]:
                 recommendations.append(rec)
 
         # Sort by urgency (critical first) then by days until stockout
@@ -320,52 +379,38 @@ class ForecastingService:
 
     async def get_stock_health(self, tenant_id: UUID) -> list[StockHealthItem]:
         """Get stock health status for all products."""
-        # Get all active products
-        products_result = await self.db.execute(
-            select(Product).where(
-                Product.tenant_id == tenant_id,
-                Product.is_active.is_(True),
-            )
-        )
-        products = products_result.scalars().all()
+        forecasts = await self.predict_all_demand(tenant_id)
+        last_sales = await self._get_last_sale_dates(tenant_id)
 
         health_items = []
-        for product in products:
-            forecast = await self.predict_demand(product.id, tenant_id)
-            if not forecast:
-                continue
-
-            reorder_point = await self.calculate_reorder_point(product.id, tenant_id)
+        for forecast in forecasts:
+            reorder_point = self._build_reorder_recommendation(
+                forecast, self.DEFAULT_LEAD_TIME_DAYS
+            ).reorder_point
 
             # Determine status
             if forecast.avg_daily_demand == 0:
-                # Check if there were any sales ever
-                last_sale = await self._get_last_sale_date(product.id, tenant_id)
                 status = "no_sales"
             elif forecast.current_stock <= 0:
                 status = "critical"
-                last_sale = await self._get_last_sale_date(product.id, tenant_id)
-            elif reorder_point and forecast.current_stock <= reorder_point.reorder_point:
+            elif forecast.current_stock <= reorder_point:
                 status = "low"
-                last_sale = await self._get_last_sale_date(product.id, tenant_id)
             elif forecast.days_of_stock and forecast.days_of_stock > 180:
                 status = "overstocked"
-                last_sale = await self._get_last_sale_date(product.id, tenant_id)
             else:
                 status = "adequate"
-                last_sale = await self._get_last_sale_date(product.id, tenant_id)
 
             health_items.append(
                 StockHealthItem(
-                    product_id=product.id,
-                    product_name=product.name,
-                    product_sku=product.sku,
-                    current_stock=product.units_in_stock,
+                    product_id=forecast.product_id,
+                    product_name=forecast.product_name,
+                    product_sku=forecast.product_sku,
+                    current_stock=forecast.current_stock,
                     avg_daily_demand=forecast.avg_daily_demand,
                     days_of_stock=forecast.days_of_stock,
-                    reorder_point=reorder_point.reorder_point if reorder_point else 0,
+                    reorder_point=reorder_point,
                     status=status,
-                    last_sale_date=last_sale,
+                    last_sale_date=last_sales.get(forecast.product_id),
                 )
             )
 
@@ -389,14 +434,21 @@ class ForecastingService:
             .where(
                 Order.tenant_id == tenant_id,
                 OrderItem.product_id == product_id,
-                Order.status.in_(
-                    [
-                        OrderStatus.PENDING,
-                        OrderStatus.PROCESSING,
-                        OrderStatus.SHIPPED,
-                        OrderStatus.DELIVERED,
-                    ]
-                ),
+                Order.status.in_(SALES_STATUSES),
             )
         )
         return result.scalar()
+
+    async def _get_last_sale_dates(self, tenant_id: UUID) -> dict[UUID, datetime]:
+        """Get the date of the last sale for every product of a tenant."""
+        result = await self.db.execute(
+            select(OrderItem.product_id, func.max(Order.created_at))
+            .join(OrderItem, Order.id == OrderItem.order_id)
+            .where(
+                Order.tenant_id == tenant_id,
+                OrderItem.product_id.is_not(None),
+                Order.status.in_(SALES_STATUSES),
+            )
+            .group_by(OrderItem.product_id)
+        )
+        return {product_id: last_sale for product_id, last_sale in result.all()}
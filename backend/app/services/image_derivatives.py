@@ -0,0 +1,211 @@
+"""
+Responsive image derivatives for the shop.
+
+Product images are stored once at display size. Storefront clients request
+``?w=<width>`` and advertise AVIF/WebP support in ``Accept``; this service
+maps the request onto a fixed width bucket and format, renders the variant
+from the display image on first request and stores it under a deterministic
+key (``image_storage.derivative_url``). Later requests read the stored
+variant, so each variant costs origin CPU once.
+
+Concurrent first requests for the same variant share one render.
+"""
+
+import asyncio
+import hashlib
+import logging
+from io import BytesIO
+from typing import Optional
+
+from PIL import Image, features
+
+from app.services.image_storage import (
+    DERIVATIVE_WIDTHS,
+    ImageStorage,
+    ImageStorageError,
+    derivative_url,
+    get_image_cpu_pool,
+    get_image_storage,
+)
+from app.utils.worker_pool import WorkerPoolBusyError
+
+logger = logging.getLogger(__name__)
+
+# Negotiable output formats, best first: extension -> (MIME type, Pillow format)
+NEGOTIATED_FORMATS = {
+    "avif": ("image/avif", "AVIF"),
+    "webp": ("image/webp", "WEBP"),
+}
+
+# Fallback formats matching the stored source extension
+SOURCE_FORMATS = {
+    "jpg": ("image/jpeg", "JPEG"),
+    "jpeg": ("image/jpeg", "JPEG"),
+    "png": ("image/png", "PNG"),
+    "webp": ("image/webp", "WEBP"),
+}
+
+# Encoder quality per Pillow format
+ENCODE_QUALITY = {"AVIF": 60, "WEBP": 80, "JPEG": 82, "PNG": 0}
+
+
+def _accepted_types(accept: str) -> set[str]:
+    """MIME types in an Accept header, excluding those with q=0."""
+    accepted = set()
+    for part in accept.split(","):
+        media_type, *params = [item.strip() for item in part.split(";")]
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type and quality > 0:
+            accepted.add(media_type.lower())
+    return accepted
+
+
+def negotiate_extension(accept: Optional[str], source_extension: str) -> str:
+    """
+    Pick the derivative format for a request.
+
+    Args:
+        accept: The request's Accept header
+        source_extension: Extension of the stored image (jpg, png, webp)
+
+    Returns:
+        Extension of the best format the client accepts (avif, webp or the
+        source format)
+    """
+    accepted = _accepted_types(accept or "")
+    for extension, (media_type, pil_format) in NEGOTIATED_FORMATS.items():
+        if media_type in accepted and features.check(pil_format.lower()):
+            return extension
+    source_extension = source_extension.lower()
+    return "jpg" if source_extension == "jpeg" else source_extension
+
+
+def width_bucket(width: Optional[int]) -> int:
+    """Smallest derivative width covering the requested width (largest if none)."""
+    if width is not None:
+        for bucket in DERIVATIVE_WIDTHS:
+            if bucket >= width:
+                return bucket
+    return DERIVATIVE_WIDTHS[-1]
+
+
+def content_etag(content: bytes) -> str:
+    """Strong ETag derived from the response bytes."""
+    return '"' + hashlib.sha256(content).hexdigest()[:32] + '"'
+
+
+def _format_for(extension: str) -> tuple[str, str]:
+    return NEGOTIATED_FORMATS.get(extension) or SOURCE_FORMATS[extension]
+
+
+def _render_derivative(source: bytes, width: int, extension: str) -> bytes:
+    """Resize and encode one derivative (runs on the image CPU pool)."""
+    _, pil_format = _format_for(extension)
+    with Image.open(BytesIO(source)) as img:
+        img.load()
+        if img.width > width:
+            height = max(1, round(img.height * width / img.width))
+            img = img.resize((width, height), Image.Resampling.LANCZOS)
+
+        if pil_format == "JPEG" and img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        elif img.mode == "P":
+            img = img.convert("RGBA")
+
+        buffer = BytesIO()
+        if pil_format == "PNG":
+            img.save(buffer, format=pil_format, optimize=True)
+        else:
+            img.save(buffer, format=pil_format, quality=ENCODE_QUALITY[pil_format])
+    return buffer.getvalue()
+
+
+class ImageDerivativeService:
+    """Serves width-bucketed, format-negotiated variants of stored images."""
+
+    def __init__(self, storage: ImageStorage):
+        self.storage = storage
+        self._renders: dict[str, asyncio.Future] = {}
+
+    async def get_variant(
+        self, image_url: str, width: Optional[int], accept: Optional[str]
+    ) -> tuple[bytes, str]:
+        """
+        Get (rendering on first use) the variant of an image for a request.
+
+        Args:
+            image_url: Stored display image URL (/uploads/...)
+            width: Requested width in pixels (None for full display width)
+            accept: The request's Accept header
+
+        Returns:
+            Tuple of (image bytes, content type)
+
+        Raises:
+            ImageStorageError: If the source image is missing or undecodable
+            WorkerPoolBusyError: If the image pools are saturated
+        """
+        source_extension = image_url.rsplit(".", 1)[-1].lower()
+        if source_extension not in SOURCE_FORMATS:
+            raise ImageStorageError("Unsupported image type")
+
+        extension = negotiate_extension(accept, source_extension)
+        bucket = width_bucket(width)
+        variant_url = derivative_url(image_url, bucket, extension)
+        content_type, _ = _format_for(extension)
+
+        try:
+            content, _ = await self.storage.get_image(variant_url)
+            return content, content_type
+        except ImageStorageError:
+            pass
+
+        # Single-flight: concurrent misses for the same variant share one render
+        pending = self._renders.get(variant_url)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                self._render_and_store(image_url, variant_url, bucket, extension, content_type)
+            )
+            self._renders[variant_url] = pending
+            pending.add_done_callback(lambda _: self._renders.pop(variant_url, None))
+        content = await asyncio.shield(pending)
+        return content, content_type
+
+    async def _render_and_store(
+        self, image_url: str, variant_url: str, width: int, extension: str, content_type: str
+    ) -> bytes:
+        source, _ = await self.storage.get_image(image_url)
+        try:
+            content = await get_image_cpu_pool().run(
+                "derive", _render_derivative, source, width, extension
+            )
+        except WorkerPoolBusyError:
+            raise
+        except Exception as e:
+            raise ImageStorageError(f"Failed to render image variant: {e}") from e
+
+        try:
+            await self.storage.put_image(variant_url, content, content_type)
+        except ImageStorageError as e:
+            # Still serve the render; it is retried on the next miss
+            logger.warning(f"Failed to store image variant {variant_url}: {e}")
+        return content
+
+
+# Singleton instance
+_image_derivatives: Optional[ImageDerivativeService] = None
+
+
+def get_image_derivatives() -> ImageDerivativeService:
+    """Get image derivative service singleton."""
+    global _image_derivatives
+    if _image_derivatives is None:
+        _image_derivatives = ImageDerivativeService(get_image_storage())
+    return _image_derivatives
@@ -2,9 +2,16 @@
 Image storage service for product images.
 
 Supports local filesystem storage and S3/MinIO storage.
+
+Pillow decoding/resizing/encoding runs on a CPU pool and filesystem/boto3
+calls on an I/O pool (see ``app.utils.worker_pool``), so large uploads do
+not block the event loop. Both pools are bounded and reject work with 503
+when saturated.
 """
 
+import asyncio
 import logging
+import os
 import uuid
 from io import BytesIO
 from pathlib import Path
@@ -15,6 +22,8 @@ from botocore.exceptions import ClientError
 from PIL import Image
 
 from app.config import get_settings
+from app.utils.file_streaming import StoredFile, s3_range_reader
+from app.utils.worker_pool import BoundedExecutor, WorkerPoolBusyError
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +39,32 @@ MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 THUMBNAIL_SIZE = (300, 300)
 DISPLAY_SIZE = (800, 800)
 
+# Responsive derivatives: widths and formats generated on demand from the
+# display image (see app.services.image_derivatives)
+DERIVATIVE_WIDTHS = (160, 320, 480, 640, 800)
+DERIVATIVE_EXTENSIONS = ("avif", "webp", "jpg", "png")
+
+
+def derivative_url(image_url: str, width: int, extension: str) -> str:
+    """
+    Deterministic storage URL of an image's derivative.
+
+    ``/uploads/products/<id>/<name>.jpg`` at 320px WebP maps to
+    ``/uploads/products/<id>/variants/<name>_w320.webp``.
+    """
+    directory, _, filename = image_url.rpartition("/")
+    stem = filename.rsplit(".", 1)[0]
+    return f"{directory}/variants/{stem}_w{width}.{extension}"
+
+
+def derivative_urls(image_url: str) -> list[str]:
+    """All derivative URLs that may exist for an image."""
+    return [
+        derivative_url(image_url, width, extension)
+        for width in DERIVATIVE_WIDTHS
+        for extension in DERIVATIVE_EXTENSIONS
+    ]
+
 
 class ImageStorageError(Exception):
     """Error during image storage operation."""
@@ -37,6 +72,131 @@ class ImageStorageError(Exception):
     pass
 
 
+# Worker pools shared by all ImageStorage instances
+_cpu_pool: Optional[BoundedExecutor] = None
+_io_pool: Optional[BoundedExecutor] = None
+
+
+def get_image_cpu_pool() -> BoundedExecutor:
+    """Get the pool for Pillow decode/resize/encode work."""
+    global _cpu_pool
+    if _cpu_pool is None:
+        settings = get_settings()
+        _cpu_pool = BoundedExecutor(
+            "image-cpu", settings.image_cpu_workers, settings.image_max_pending
+        )
+    return _cpu_pool
+
+
+def get_image_io_pool() -> BoundedExecutor:
+    """Get the pool for blocking filesystem and boto3 calls."""
+    global _io_pool
+    if _io_pool is None:
+        settings = get_settings()
+        _io_pool = BoundedExecutor(
+            "image-io", settings.image_io_workers, settings.image_max_pending
+        )
+    return _io_pool
+
+
+def shutdown_image_pools() -> None:
+    """Shut down the image worker pools."""
+    global _cpu_pool, _io_pool
+    for pool in (_cpu_pool, _io_pool):
+        if pool is not None:
+            pool.shutdown()
+    _cpu_pool = _io_pool = None
+
+
+def _save_format(extension: str) -> str:
+    """Pillow save format for a file extension (with or without the dot)."""
+    ext = extension.lower().lstrip(".")
+    return "JPEG" if ext in ("jpg", "jpeg") else "PNG" if ext == "png" else "WEBP"
+
+
+def _verify_image(file_content: bytes) -> None:
+    """Check the bytes decode as an image (runs on the CPU pool)."""
+    img = Image.open(BytesIO(file_content))
+    img.verify()
+
+
+def _encode(img: Image.Image, save_format: str, quality: int) -> bytes:
+    """Encode an image, dropping alpha/palette for JPEG."""
+    if save_format == "JPEG" and img.mode in ("RGBA", "P"):
+        img = img.convert("RGB")
+    buffer = BytesIO()
+    img.save(buffer, format=save_format, quality=quality, optimize=True)
+    return buffer.getvalue()
+
+
+def _render_variants(file_content: bytes, content_type: str) -> tuple[bytes, bytes]:
+    """
+    Render the display image and thumbnail (runs on the CPU pool).
+
+    Returns:
+        Tuple of (display image bytes, thumbnail bytes)
+    """
+    save_format = _save_format(ALLOWED_CONTENT_TYPES[content_type])
+    with Image.open(BytesIO(file_content)) as img:
+        # Resize for display (if larger than DISPLAY_SIZE)
+        display_img = img.copy()
+        display_img.thumbnail(DISPLAY_SIZE, Image.Resampling.LANCZOS)
+
+        thumb_img = img.copy()
+        thumb_img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+
+    return _encode(display_img, save_format, 85), _encode(thumb_img, save_format, 80)
+
+
+def _rotate_bytes(image_data: bytes, extension: str, pil_degrees: int, quality: int) -> bytes:
+    """Rotate encoded image bytes (runs on the CPU pool)."""
+    with Image.open(BytesIO(image_data)) as img:
+        rotated = img.rotate(pil_degrees, expand=True)
+    return _encode(rotated, _save_format(extension), quality)
+
+
+def _write_file(path: Path, content: bytes) -> None:
+    """Write a file, creating its directory (runs on the I/O pool)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+
+
+def _unlink_if_exists(path: Path) -> None:
+    """Delete a file if present (runs on the I/O pool)."""
+    if path.exists():
+        path.unlink()
+
+
+def _read_if_exists(path: Path) -> Optional[bytes]:
+    """Read a file, or None if missing (runs on the I/O pool)."""
+    if not path.exists():
+        return None
+    return path.read_bytes()
+
+
+def _stat_if_file(path: Path) -> Optional[os.stat_result]:
+    """Stat a regular file, or None if missing (runs on the I/O pool)."""
+    if not path.is_file():
+        return None
+    return path.stat()
+
+
+def _local_content_type(path: Path) -> str:
+    """Content type of a locally stored image, from its extension."""
+    ext = path.suffix.lower()
+    return (
+        "image/jpeg"
+        if ext in (".jpg", ".jpeg")
+        else "image/png"
+        if ext == ".png"
+        else "image/webp"
+        if ext == ".webp"
+        else "image/avif"
+        if ext == ".avif"
+        else "application/octet-stream"
+    )
+
+
 class ImageStorage:
     """
     Image storage service for product images.
@@ -78,6 +238,32 @@ class ImageStorage:
         )
         self._bucket = self.settings.storage_s3_bucket
 
+    # Blocking S3 calls (run on the I/O pool)
+
+    def _s3_upload(self, key: str, content: bytes, content_type: str) -> None:
+        self._s3_client.upload_fileobj(
+            BytesIO(content),
+            self._bucket,
+            key,
+            ExtraArgs={"ContentType": content_type},
+        )
+
+    def _s3_download(self, key: str) -> tuple[bytes, Optional[str]]:
+        response = self._s3_client.get_object(Bucket=self._bucket, Key=key)
+        return response["Body"].read(), response.get("ContentType")
+
+    def _s3_head(self, key: str) -> dict:
+        return self._s3_client.head_object(Bucket=self._bucket, Key=key)
+
+    def _s3_delete(self, key: str) -> None:
+        self._s3_client.delete_object(Bucket=self._bucket, Key=key)
+
+    def _s3_delete_many(self, keys: list[str]) -> None:
+        self._s3_client.delete_objects(
+            Bucket=self._bucket,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+
     async def save_image(
         self,
         file_content: bytes,
@@ -103,6 +289,7 @@ class ImageStorage:
 
         Raises:
             ImageStorageError: If validation or save fails
+            WorkerPoolBusyError: If the image pools are saturated
         """
         # Validate content type
         if content_type not in ALLOWED_CONTENT_TYPES:
@@ -116,15 +303,20 @@ class ImageStorage:
                 f"File too large: {len(file_content)} bytes. Maximum: {MAX_FILE_SIZE} bytes"
             )
 
+        cpu_pool = get_image_cpu_pool()
+
         # Validate it's actually an image
         try:
-            img = Image.open(BytesIO(file_content))
-            img.verify()
-            # Reopen for processing (verify closes the file)
-            img = Image.open(BytesIO(file_content))
+            await cpu_pool.run("decode", _verify_image, file_content)
+        except WorkerPoolBusyError:
+            raise
         except Exception as e:
             raise ImageStorageError(f"Invalid image file: {e}")
 
+        display_content, thumb_content = await cpu_pool.run(
+            "resize", _render_variants, file_content, content_type
+        )
+
         # Generate unique filename
         extension = ALLOWED_CONTENT_TYPES[content_type]
         image_id = str(uuid.uuid4())
@@ -135,139 +327,137 @@ class ImageStorage:
         product_dir = f"products/{product_id}"
 
         if self.storage_type == "local":
-            return await self._save_local(
-                img, file_content, product_dir, filename, thumbnail_filename, content_type
+            await self._save_local(
+                display_content, thumb_content, product_dir, filename, thumbnail_filename
             )
         else:
-            return await self._save_s3(
-                img, file_content, product_dir, filename, thumbnail_filename, content_type
+            await self._save_s3(
+                display_content,
+                thumb_content,
+                product_dir,
+                filename,
+                thumbnail_filename,
+                content_type,
             )
 
+        # Generate URLs (/uploads/ prefix for local files and the S3 backend proxy)
+        return {
+            "image_url": f"/uploads/{product_dir}/{filename}",
+            "thumbnail_url": f"/uploads/{product_dir}/{thumbnail_filename}",
+            "file_size": len(file_content),
+            "content_type": content_type,
+        }
+
     async def _save_local(
         self,
-        img: Image.Image,
-        original_content: bytes,
+        display_content: bytes,
+        thumb_content: bytes,
         product_dir: str,
         filename: str,
         thumbnail_filename: str,
-        content_type: str,
-    ) -> dict:
-        """Save image to local filesystem."""
-        # Create product directory
+    ) -> None:
+        """Write the rendered images to the local filesystem."""
+        io_pool = get_image_io_pool()
         full_dir = self.base_path / product_dir
-        full_dir.mkdir(parents=True, exist_ok=True)
-
-        # Resize for display (if larger than DISPLAY_SIZE)
-        display_img = img.copy()
-        display_img.thumbnail(DISPLAY_SIZE, Image.Resampling.LANCZOS)
-
-        # Convert to RGB if necessary (for JPEG)
-        if content_type == "image/jpeg" and display_img.mode in ("RGBA", "P"):
-            display_img = display_img.convert("RGB")
-
-        # Save display image
-        display_path = full_dir / filename
-        save_format = (
-            "JPEG"
-            if content_type == "image/jpeg"
-            else "PNG"
-            if content_type == "image/png"
-            else "WEBP"
-        )
-        display_img.save(display_path, format=save_format, quality=85, optimize=True)
-
-        # Create and save thumbnail
-        thumb_img = img.copy()
-        thumb_img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-        if content_type == "image/jpeg" and thumb_img.mode in ("RGBA", "P"):
-            thumb_img = thumb_img.convert("RGB")
-        thumb_path = full_dir / thumbnail_filename
-        thumb_img.save(thumb_path, format=save_format, quality=80, optimize=True)
-
-        # Generate URLs (relative paths for local storage)
-        image_url = f"/uploads/{product_dir}/{filename}"
-        thumbnail_url = f"/uploads/{product_dir}/{thumbnail_filename}"
-
-        return {
-            "image_url": image_url,
-            "thumbnail_url": thumbnail_url,
-            "file_size": len(original_content),
-            "content_type": content_type,
-        }
+        await io_pool.run("write", _write_file, full_dir / filename, display_content)
+        await io_pool.run("write", _write_file, full_dir / thumbnail_filename, thumb_content)
 
     async def _save_s3(
         self,
-        img: Image.Image,
-        original_content: bytes,
+        display_content: bytes,
+        thumb_content: bytes,
         product_dir: str,
         filename: str,
         thumbnail_filename: str,
         content_type: str,
-    ) -> dict:
-        """Save image to S3/MinIO storage."""
+    ) -> None:
+        """Upload the rendered images to S3/MinIO storage."""
+        io_pool = get_image_io_pool()
         try:
-            # Resize for display (if larger than DISPLAY_SIZE)
-            display_img = img.copy()
-            display_img.thumbnail(DISPLAY_SIZE, Image.Resampling.LANCZOS)
-
-            # Convert to RGB if necessary (for JPEG)
-            if content_type == "image/jpeg" and display_img.mode in ("RGBA", "P"):
-                display_img = display_img.convert("RGB")
-
-            # Determine save format
-            save_format = (
-                "JPEG"
-                if content_type == "image/jpeg"
-                else "PNG"
-                if content_type == "image/png"
-                else "WEBP"
+            await asyncio.gather(
+                io_pool.run(
+                    "upload",
+                    self._s3_upload,
+                    f"{product_dir}/{filename}",
+                    display_content,
+                    content_type,
+                ),
+                io_pool.run(
+                    "upload",
+                    self._s3_upload,
+                    f"{product_dir}/{thumbnail_filename}",
+                    thumb_content,
+                    content_type,
+                ),
             )
+        except ClientError as e:
+            raise ImageStorageError(f"Failed to upload to S3: {e}")
 
-            # Save display image to bytes
-            display_buffer = BytesIO()
-            display_img.save(display_buffer, format=save_format, quality=85, optimize=True)
-            display_buffer.seek(0)
-
-            # Create and save thumbnail to bytes
-            thumb_img = img.copy()
-            thumb_img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-            if content_type == "image/jpeg" and thumb_img.mode in ("RGBA", "P"):
-                thumb_img = thumb_img.convert("RGB")
-            thumb_buffer = BytesIO()
-            thumb_img.save(thumb_buffer, format=save_format, quality=80, optimize=True)
-            thumb_buffer.seek(0)
-
-            # S3 keys (paths within bucket)
-            image_key = f"{product_dir}/{filename}"
-            thumbnail_key = f"{product_dir}/{thumbnail_filename}"
-
-            # Upload to S3
-            self._s3_client.upload_fileobj(
-                display_buffer,
-                self._bucket,
-                image_key,
-                ExtraArgs={"ContentType": content_type},
-            )
-            self._s3_client.upload_fileobj(
-                thumb_buffer,
-                self._bucket,
-                thumbnail_key,
-                ExtraArgs={"ContentType": content_type},
-            )
+    async def put_image(self, image_url: str, content: bytes, content_type: str) -> None:
+        """
+        Store already-encoded image bytes at a /uploads/ URL.
+
+        Used for generated derivatives; uploads go through ``save_image``.
 
-            # Generate URLs (using /uploads/ prefix for backend proxy)
-            image_url = f"/uploads/{image_key}"
-            thumbnail_url = f"/uploads/{thumbnail_key}"
+        Raises:
+            ImageStorageError: If the URL is invalid or the write fails
+        """
+        if not image_url.startswith("/uploads/"):
+            raise ImageStorageError("Invalid image URL")
 
-            return {
-                "image_url": image_url,
-                "thumbnail_url": thumbnail_url,
-                "file_size": len(original_content),
-                "content_type": content_type,
-            }
+        io_pool = get_image_io_pool()
+        if self.storage_type == "local":
+            await io_pool.run("write", _write_file, self.base_path / image_url[9:], content)
+            return
+        try:
+            await io_pool.run("upload", self._s3_upload, image_url[9:], content, content_type)
         except ClientError as e:
             raise ImageStorageError(f"Failed to upload to S3: {e}")
 
+    async def copy_image(
+        self, image_url: str, thumbnail_url: Optional[str], product_id: str
+    ) -> tuple[str, Optional[str]]:
+        """
+        Copy an image and its thumbnail to new URLs under a product.
+
+        Used to give a product its own copy of a shared image before editing it.
+
+        Returns:
+            (image_url, thumbnail_url) of the copies
+
+        Raises:
+            ImageStorageError: If the source is missing or the write fails
+        """
+        image_id = str(uuid.uuid4())
+        extension = Path(image_url).suffix
+        new_image_url = f"/uploads/products/{product_id}/{image_id}{extension}"
+        content, content_type = await self.get_image(image_url)
+        await self.put_image(new_image_url, content, content_type)
+
+        new_thumbnail_url = None
+        if thumbnail_url:
+            new_thumbnail_url = f"/uploads/products/{product_id}/{image_id}_thumb{extension}"
+            content, content_type = await self.get_image(thumbnail_url)
+            await self.put_image(new_thumbnail_url, content, content_type)
+
+        return new_image_url, new_thumbnail_url
+
+    async def delete_derivatives(self, image_url: str) -> None:
+        """Delete every generated derivative of an image (missing ones are ignored)."""
+        if not image_url.startswith("/uploads/"):
+            return
+
+        io_pool = get_image_io_pool()
+        urls = derivative_urls(image_url)
+        try:
+            if self.storage_type == "local":
+                for url in urls:
+                    await io_pool.run("delete", _unlink_if_exists, self.base_path / url[9:])
+            else:
+                await io_pool.run("delete", self._s3_delete_many, [url[9:] for url in urls])
+        except (OSError, ClientError) as e:
+            logger.warning(f"Failed to delete derivatives of {image_url}: {e}")
+
     async def delete_image(self, image_url: str, thumbnail_url: Optional[str] = None) -> bool:
         """
         Delete an image and its thumbnail.
@@ -279,6 +469,7 @@ class ImageStorage:
         Returns:
             True if deleted successfully
         """
+        await self.delete_derivatives(image_url)
         if self.storage_type == "local":
             return await self._delete_local(image_url, thumbnail_url)
         else:
@@ -286,33 +477,31 @@ class ImageStorage:
 
     async def _delete_local(self, image_url: str, thumbnail_url: Optional[str] = None) -> bool:
         """Delete image from local filesystem."""
+        io_pool = get_image_io_pool()
         try:
             # Convert URL to file path
             if image_url.startswith("/uploads/"):
                 image_path = self.base_path / image_url[9:]  # Remove /uploads/ prefix
-                if image_path.exists():
-                    image_path.unlink()
+                await io_pool.run("delete", _unlink_if_exists, image_path)
 
             if thumbnail_url and thumbnail_url.startswith("/uploads/"):
                 thumb_path = self.base_path / thumbnail_url[9:]
-                if thumb_path.exists():
-                    thumb_path.unlink()
+                await io_pool.run("delete", _unlink_if_exists, thumb_path)
 
             return True
-        except Exception:
+        except OSError:
             return False
 
     async def _delete_s3(self, image_url: str, thumbnail_url: Optional[str] = None) -> bool:
         """Delete image from S3/MinIO storage."""
+        io_pool = get_image_io_pool()
         try:
             # Convert URL to S3 key
             if image_url.startswith("/uploads/"):
-                image_key = image_url[9:]  # Remove /uploads/ prefix
-                self._s3_client.delete_object(Bucket=self._bucket, Key=image_key)
+                await io_pool.run("delete", self._s3_delete, image_url[9:])
 
             if thumbnail_url and thumbnail_url.startswith("/uploads/"):
-                thumb_key = thumbnail_url[9:]
-                self._s3_client.delete_object(Bucket=self._bucket, Key=thumb_key)
+                await io_pool.run("delete", self._s3_delete, thumbnail_url[9:])
 
             return True
         except ClientError:
@@ -333,138 +522,81 @@ class ImageStorage:
             True if rotated successfully
         """
         if self.storage_type == "local":
-            return await self._rotate_local(image_url, thumbnail_url, degrees)
+            rotated = await self._rotate_local(image_url, thumbnail_url, degrees)
         else:
-            return await self._rotate_s3(image_url, thumbnail_url, degrees)
+            rotated = await self._rotate_s3(image_url, thumbnail_url, degrees)
+        # Derivatives are regenerated from the rotated image on next request
+        await self.delete_derivatives(image_url)
+        return rotated
+
+    @staticmethod
+    def _pil_degrees(degrees: int) -> int:
+        """Validate a clockwise rotation and convert it for PIL."""
+        # Normalize degrees to 90, 180, or 270
+        degrees = degrees % 360
+        if degrees not in (90, 180, 270):
+            raise ImageStorageError(f"Invalid rotation: {degrees}. Use 90, 180, or 270.")
+
+        # PIL uses counter-clockwise, so negate for clockwise rotation
+        return -degrees
 
     async def _rotate_local(
         self, image_url: str, thumbnail_url: Optional[str], degrees: int
     ) -> bool:
         """Rotate image on local filesystem."""
+        cpu_pool = get_image_cpu_pool()
+        io_pool = get_image_io_pool()
         try:
-            # Normalize degrees to 90, 180, or 270
-            degrees = degrees % 360
-            if degrees not in (90, 180, 270):
-                raise ImageStorageError(f"Invalid rotation: {degrees}. Use 90, 180, or 270.")
-
-            # PIL uses counter-clockwise, so negate for clockwise rotation
-            pil_degrees = -degrees
-
-            # Rotate main image
-            if image_url.startswith("/uploads/"):
-                image_path = self.base_path / image_url[9:]
-                if image_path.exists():
-                    with Image.open(image_path) as img:
-                        rotated = img.rotate(pil_degrees, expand=True)
-                        # Determine format from extension
-                        ext = image_path.suffix.lower()
-                        save_format = (
-                            "JPEG"
-                            if ext in (".jpg", ".jpeg")
-                            else "PNG"
-                            if ext == ".png"
-                            else "WEBP"
-                        )
-                        if save_format == "JPEG" and rotated.mode in ("RGBA", "P"):
-                            rotated = rotated.convert("RGB")
-                        rotated.save(image_path, format=save_format, quality=85, optimize=True)
-
-            # Rotate thumbnail
-            if thumbnail_url and thumbnail_url.startswith("/uploads/"):
-                thumb_path = self.base_path / thumbnail_url[9:]
-                if thumb_path.exists():
-                    with Image.open(thumb_path) as img:
-                        rotated = img.rotate(pil_degrees, expand=True)
-                        ext = thumb_path.suffix.lower()
-                        save_format = (
-                            "JPEG"
-                            if ext in (".jpg", ".jpeg")
-                            else "PNG"
-                            if ext == ".png"
-                            else "WEBP"
-                        )
-                        if save_format == "JPEG" and rotated.mode in ("RGBA", "P"):
-                            rotated = rotated.convert("RGB")
-                        rotated.save(thumb_path, format=save_format, quality=80, optimize=True)
+            pil_degrees = self._pil_degrees(degrees)
+
+            # Rotate main image, then thumbnail
+            targets = [(image_url, 85), (thumbnail_url, 80)]
+            for url, quality in targets:
+                if not url or not url.startswith("/uploads/"):
+                    continue
+                path = self.base_path / url[9:]
+                content = await io_pool.run("read", _read_if_exists, path)
+                if content is None:
+                    continue
+                rotated = await cpu_pool.run(
+                    "rotate", _rotate_bytes, content, path.suffix, pil_degrees, quality
+                )
+                await io_pool.run("write", _write_file, path, rotated)
 
             return True
+        except WorkerPoolBusyError:
+            raise
         except Exception as e:
             raise ImageStorageError(f"Failed to rotate image: {e}")
 
     async def _rotate_s3(self, image_url: str, thumbnail_url: Optional[str], degrees: int) -> bool:
         """Rotate image in S3/MinIO storage."""
+        cpu_pool = get_image_cpu_pool()
+        io_pool = get_image_io_pool()
         try:
             logger.debug(f"_rotate_s3: Starting rotation of {image_url} by {degrees} degrees")
-            # Normalize degrees to 90, 180, or 270
-            degrees = degrees % 360
-            if degrees not in (90, 180, 270):
-                raise ImageStorageError(f"Invalid rotation: {degrees}. Use 90, 180, or 270.")
-
-            # PIL uses counter-clockwise, so negate for clockwise rotation
-            pil_degrees = -degrees
-
-            # Rotate main image
-            if image_url.startswith("/uploads/"):
-                image_key = image_url[9:]
-                # Download image
-                response = self._s3_client.get_object(Bucket=self._bucket, Key=image_key)
-                image_data = response["Body"].read()
-                content_type = response.get("ContentType", "image/jpeg")
-
-                # Rotate
-                with Image.open(BytesIO(image_data)) as img:
-                    rotated = img.rotate(pil_degrees, expand=True)
-                    ext = image_key.split(".")[-1].lower()
-                    save_format = (
-                        "JPEG" if ext in ("jpg", "jpeg") else "PNG" if ext == "png" else "WEBP"
-                    )
-                    if save_format == "JPEG" and rotated.mode in ("RGBA", "P"):
-                        rotated = rotated.convert("RGB")
-
-                    # Save to buffer and re-upload (use high quality to minimize loss)
-                    buffer = BytesIO()
-                    rotated.save(buffer, format=save_format, quality=95, optimize=True)
-                    buffer.seek(0)
-                    logger.debug(
-                        f"_rotate_s3: Uploading rotated image {image_key}, size={rotated.width}x{rotated.height}"
-                    )
-                    self._s3_client.upload_fileobj(
-                        buffer,
-                        self._bucket,
-                        image_key,
-                        ExtraArgs={"ContentType": content_type},
-                    )
-                    logger.debug(f"_rotate_s3: Upload complete for {image_key}")
-
-            # Rotate thumbnail
-            if thumbnail_url and thumbnail_url.startswith("/uploads/"):
-                thumb_key = thumbnail_url[9:]
-                response = self._s3_client.get_object(Bucket=self._bucket, Key=thumb_key)
-                thumb_data = response["Body"].read()
-                content_type = response.get("ContentType", "image/jpeg")
-
-                with Image.open(BytesIO(thumb_data)) as img:
-                    rotated = img.rotate(pil_degrees, expand=True)
-                    ext = thumb_key.split(".")[-1].lower()
-                    save_format = (
-                        "JPEG" if ext in ("jpg", "jpeg") else "PNG" if ext == "png" else "WEBP"
-                    )
-                    if save_format == "JPEG" and rotated.mode in ("RGBA", "P"):
-                        rotated = rotated.convert("RGB")
-
-                    buffer = BytesIO()
-                    rotated.save(buffer, format=save_format, quality=90, optimize=True)
-                    buffer.seek(0)
-                    self._s3_client.upload_fileobj(
-                        buffer,
-                        self._bucket,
-                        thumb_key,
-                        ExtraArgs={"ContentType": content_type},
-                    )
+            pil_degrees = self._pil_degrees(degrees)
+
+            # Rotate main image, then thumbnail (high quality to minimize loss)
+            targets = [(image_url, 95), (thumbnail_url, 90)]
+            for url, quality in targets:
+                if not url or not url.startswith("/uploads/"):
+                    continue
+                key = url[9:]
+                content, content_type = await io_pool.run("download", self._s3_download, key)
+                rotated = await cpu_pool.run(
+                    "rotate", _rotate_bytes, content, key.rsplit(".", 1)[-1], pil_degrees, quality
+                )
+                await io_pool.run(
+                    "upload", self._s3_upload, key, rotated, content_type or "image/jpeg"
+                )
+                logger.debug(f"_rotate_s3: Upload complete for {key}")
 
             return True
         except ClientError as e:
             raise ImageStorageError(f"Failed to rotate S3 image: {e}")
+        except WorkerPoolBusyError:
+            raise
         except Exception as e:
             raise ImageStorageError(f"Failed to rotate image: {e}")
 
@@ -486,28 +618,60 @@ class ImageStorage:
         else:
             return await self._get_s3(image_url)
 
+    async def open_image(self, image_url: str) -> StoredFile:
+        """
+        Locate an image for streaming without reading it into memory.
+
+        Args:
+            image_url: URL/path to the image
+
+        Returns:
+            StoredFile to pass to ``stream_file_response``
+
+        Raises:
+            ImageStorageError: If image not found or lookup fails
+        """
+        if not image_url.startswith("/uploads/"):
+            raise ImageStorageError("Invalid image URL")
+        image_key = image_url[9:]  # Remove /uploads/ prefix
+
+        if self.storage_type == "local":
+            image_path = self.base_path / image_key
+            stat = await get_image_io_pool().run("stat", _stat_if_file, image_path)
+            if stat is None:
+                raise ImageStorageError("Image not found")
+            return StoredFile(
+                size=stat.st_size,
+                content_type=_local_content_type(image_path),
+                path=image_path,
+            )
+
+        try:
+            head = await get_image_io_pool().run("head", self._s3_head, image_key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                raise ImageStorageError("Image not found")
+            raise ImageStorageError(f"Failed to get image from S3: {e}")
+        return StoredFile(
+            size=head["ContentLength"],
+            content_type=head.get("ContentType") or "application/octet-stream",
+            read_range=s3_range_reader(
+                self._s3_client, self._bucket, image_key, get_image_io_pool()
+            ),
+            etag=head.get("ETag"),
+        )
+
     async def _get_local(self, image_url: str) -> tuple[bytes, str]:
         """Get image from local filesystem."""
         if not image_url.startswith("/uploads/"):
             raise ImageStorageError("Invalid image URL")
 
         image_path = self.base_path / image_url[9:]
-        if not image_path.exists():
+        content = await get_image_io_pool().run("read", _read_if_exists, image_path)
+        if content is None:
             raise ImageStorageError("Image not found")
 
-        # Determine content type from extension
-        ext = image_path.suffix.lower()
-        content_type = (
-            "image/jpeg"
-            if ext in (".jpg", ".jpeg")
-            else "image/png"
-            if ext == ".png"
-            else "image/webp"
-            if ext == ".webp"
-            else "application/octet-stream"
-        )
-
-        return image_path.read_bytes(), content_type
+        return content, _local_content_type(image_path)
 
     async def _get_s3(self, image_url: str) -> tuple[bytes, str]:
         """Get image from S3/MinIO storage."""
@@ -516,10 +680,10 @@ class ImageStorage:
 
         try:
             image_key = image_url[9:]  # Remove /uploads/ prefix
-            response = self._s3_client.get_object(Bucket=self._bucket, Key=image_key)
-            content = response["Body"].read()
-            content_type = response.get("ContentType", "application/octet-stream")
-            return content, content_type
+            content, content_type = await get_image_io_pool().run(
+                "download", self._s3_download, image_key
+            )
+            return content, content_type or "application/octet-stream"
         except ClientError as e:
             if e.response["Error"]["Code"] == "NoSuchKey":
                 raise ImageStorageError("Image not found")
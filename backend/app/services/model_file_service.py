@@ -1,25 +1,38 @@
 """Model file service for managing 3D model files (STL, 3MF, gcode, etc.)."""
 
+import hashlib
 import logging
+import shutil
 import uuid
 import zipfile
 from datetime import UTC, datetime
+from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from stat import S_ISREG
+from typing import AsyncIterator, BinaryIO, Optional, Union
 from uuid import UUID
 
 import boto3
 from botocore.exceptions import ClientError
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.models.model import Model
-from app.models.model_file import FileLocation, ModelFile, ModelFileType
+from app.models.model_file import FileLocation, ModelFile, ModelFileType, ModelFileUpload
 from app.models.tenant import Tenant
 from app.models.user import User
-from app.services.image_storage import ImageStorageError, get_image_storage
+from app.services.blob_store import (
+    BLOB_KIND_MODEL_FILE,
+    acquire_blob,
+    register_blob,
+    release_blob,
+    store_image,
+)
+from app.services.image_storage import ImageStorageError, get_image_io_pool, get_image_storage
+from app.utils.file_streaming import StoredFile, s3_range_reader
+from app.utils.worker_pool import WorkerPoolBusyError
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +58,9 @@ ALLOWED_EXTENSIONS = {".stl", ".3mf", ".gcode", ".gco", ".g"}
 # File size limits
 MAX_FILE_SIZE = 500 * 1024 * 1024  # 500MB for large gcode files
 
+# Bytes copied, hashed or written per step when streaming uploads
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class ModelFileStorageError(Exception):
     """Error during model file storage operation."""
@@ -52,7 +68,15 @@ class ModelFileStorageError(Exception):
     pass
 
 
-def extract_3mf_thumbnail(file_content: bytes) -> Optional[tuple[bytes, str]]:
+class UploadOffsetError(ModelFileStorageError):
+    """A resumable upload chunk did not start where the previous one ended."""
+
+    def __init__(self, expected_offset: int):
+        super().__init__(f"Chunk must start at offset {expected_offset}")
+        self.expected_offset = expected_offset
+
+
+def extract_3mf_thumbnail(file_content: Union[bytes, BinaryIO]) -> Optional[tuple[bytes, str]]:
     """
     Extract embedded thumbnail from a 3MF file.
 
@@ -62,7 +86,8 @@ def extract_3mf_thumbnail(file_content: bytes) -> Optional[tuple[bytes, str]]:
     - 3D/Metadata/thumbnail.png (some slicers)
 
     Args:
-        file_content: Raw bytes of the 3MF file
+        file_content: Raw bytes of the 3MF file, or a seekable file holding it
+            (read in place, so spooled uploads are not loaded into memory)
 
     Returns:
         Tuple of (thumbnail_bytes, content_type) if found, None otherwise
@@ -79,8 +104,12 @@ def extract_3mf_thumbnail(file_content: bytes) -> Optional[tuple[bytes, str]]:
         "Metadata/top.png",
     ]
 
+    if isinstance(file_content, bytes):
+        file_content = BytesIO(file_content)
+
     try:
-        with zipfile.ZipFile(BytesIO(file_content), "r") as zf:
+        file_content.seek(0)
+        with zipfile.ZipFile(file_content, "r") as zf:
             # Get list of files in the archive (case-insensitive search)
             namelist = zf.namelist()
             namelist_lower = {n.lower(): n for n in namelist}
@@ -114,6 +143,65 @@ def extract_3mf_thumbnail(file_content: bytes) -> Optional[tuple[bytes, str]]:
         return None
 
 
+def _source_size(source: BinaryIO) -> int:
+    """Size of a seekable file object, leaving it positioned at the start."""
+    size = source.seek(0, 2)
+    source.seek(0)
+    return size
+
+
+def _hash_source(source: BinaryIO) -> str:
+    """SHA-256 of a seekable file object, read in chunks (runs on the I/O pool)."""
+    digest = hashlib.sha256()
+    source.seek(0)
+    while chunk := source.read(UPLOAD_CHUNK_SIZE):
+        digest.update(chunk)
+    source.seek(0)
+    return digest.hexdigest()
+
+
+def _copy_to_path(source: BinaryIO, dest: Path) -> str:
+    """
+    Copy a file object to ``dest`` in chunks and return its SHA-256.
+
+    Writes to a temporary sibling first so a failed copy never leaves a
+    truncated file at ``dest`` (runs on the I/O pool).
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dest.with_name(f"{dest.name}.partial")
+    digest = hashlib.sha256()
+    source.seek(0)
+    try:
+        with open(tmp_path, "wb") as out:
+            while chunk := source.read(UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                out.write(chunk)
+        tmp_path.replace(dest)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return digest.hexdigest()
+
+
+def _create_staging_file(path: Path) -> None:
+    """Create an empty staging file for a resumable upload (runs on the I/O pool)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
+
+
+def _append_to_staging_file(path: Path, chunk_path: Path, offset: int) -> None:
+    """
+    Copy a received chunk onto a staging file at ``offset`` (runs on the I/O pool).
+
+    Anything past ``offset`` is the tail of a chunk that was never
+    acknowledged, so it is discarded.
+    """
+    with open(path, "r+b") as staging, open(chunk_path, "rb") as chunk:
+        staging.truncate(offset)
+        staging.seek(offset)
+        shutil.copyfileobj(chunk, staging, UPLOAD_CHUNK_SIZE)
+
+
 class ModelFileService:
     """
     Service for managing 3D model files.
@@ -204,13 +292,29 @@ class ModelFileService:
         Returns:
             Validated file extension
 
+        Raises:
+            ModelFileStorageError: If validation fails
+        """
+        return self._validate_upload(len(file_content), original_filename)
+
+    def _validate_upload(self, file_size: int, original_filename: str) -> str:
+        """
+        Validate an upload's size and filename and determine its extension.
+
+        Args:
+            file_size: Size of the upload in bytes
+            original_filename: Original filename
+
+        Returns:
+            Validated file extension
+
         Raises:
             ModelFileStorageError: If validation fails
         """
         # Check file size
-        if len(file_content) > MAX_FILE_SIZE:
+        if file_size > MAX_FILE_SIZE:
             raise ModelFileStorageError(
-                f"File too large: {len(file_content)} bytes. Maximum: {MAX_FILE_SIZE} bytes"
+                f"File too large: {file_size} bytes. Maximum: {MAX_FILE_SIZE} bytes"
             )
 
         # Get extension from filename
@@ -235,11 +339,49 @@ class ModelFileService:
         notes: Optional[str] = None,
     ) -> ModelFile:
         """
-        Upload a 3D model file.
+        Upload a 3D model file held in memory.
+
+        Thin wrapper around ``upload_file_stream`` for callers that already
+        have the content as bytes.
+
+        Raises:
+            ModelFileStorageError: If upload fails
+        """
+        return await self.upload_file_stream(
+            model_id=model_id,
+            source=BytesIO(file_content),
+            content_type=content_type,
+            original_filename=original_filename,
+            file_type=file_type,
+            part_name=part_name,
+            version=version,
+            is_primary=is_primary,
+            notes=notes,
+        )
+
+    async def upload_file_stream(
+        self,
+        model_id: UUID,
+        source: BinaryIO,
+        content_type: str,
+        original_filename: str,
+        file_type: ModelFileType,
+        part_name: Optional[str] = None,
+        version: Optional[str] = None,
+        is_primary: bool = False,
+        notes: Optional[str] = None,
+    ) -> ModelFile:
+        """
+        Upload a 3D model file from a seekable file object.
+
+        The content is copied to storage in ``UPLOAD_CHUNK_SIZE`` pieces
+        (a chunked managed transfer for S3) while its SHA-256 is computed,
+        and 3MF thumbnails are read from the file in place, so memory use
+        does not grow with the file size.
 
         Args:
             model_id: UUID of the model to attach file to
-            file_content: Raw file bytes
+            source: Seekable file object, e.g. a spooled upload or staged file
             content_type: MIME type
             original_filename: Original filename
             file_type: Type of file (source_stl, slicer_project, etc.)
@@ -254,9 +396,10 @@ class ModelFileService:
         Raises:
             ModelFileStorageError: If upload fails
         """
+        file_size = _source_size(source)
         logger.debug(
             f"upload_file called: model_id={model_id}, filename={original_filename}, "
-            f"file_type={file_type}, size={len(file_content)}, storage={self.storage_type}"
+            f"file_type={file_type}, size={file_size}, storage={self.storage_type}"
         )
 
         # Validate the model exists and belongs to this tenant
@@ -266,22 +409,27 @@ class ModelFileService:
             raise ModelFileStorageError(f"Model not found: {model_id}")
 
         # Validate file
-        extension = self._validate_file(file_content, content_type, original_filename)
+        extension = self._validate_upload(file_size, original_filename)
 
         # Generate unique filename
         file_id = str(uuid.uuid4())
         filename = f"{file_id}{extension}"
         model_dir = f"models/{model_id}"
 
-        # Upload to storage
-        if self.storage_type == "local":
-            file_url = await self._save_local(file_content, model_dir, filename)
+        # Identical content already stored for this tenant is reused, not rewritten
+        content_sha256 = await get_image_io_pool().run("hash", _hash_source, source)
+        blob = await acquire_blob(self.db, self.tenant.id, BLOB_KIND_MODEL_FILE, content_sha256)
+        if blob is not None:
+            file_url = blob.url
+            logger.info(f"Reusing stored file {file_url} for '{original_filename}'")
         else:
-            file_url = await self._save_s3(file_content, model_dir, filename, content_type)
+            file_url = await self._store_new_content(
+                source, model_dir, filename, content_type, content_sha256, file_size
+            )
 
         # Extract and save thumbnail from 3MF files if model has no image
         if extension == ".3mf" and not model.image_url:
-            await self._extract_and_save_3mf_thumbnail(model, file_content)
+            await self._extract_and_save_3mf_thumbnail(model, source)
 
         # If setting as primary, unset other primary files of same type
         if is_primary:
@@ -296,8 +444,9 @@ class ModelFileService:
             file_url=file_url,
             local_path=None,
             original_filename=original_filename,
-            file_size=len(file_content),
+            file_size=file_size,
             content_type=content_type,
+            content_sha256=content_sha256,
             part_name=part_name,
             version=version,
             is_primary=is_primary,
@@ -312,10 +461,291 @@ class ModelFileService:
 
         logger.info(
             f"Uploaded file '{original_filename}' for model {model_id} "
-            f"(file_id={model_file.id}, size={len(file_content)})"
+            f"(file_id={model_file.id}, size={file_size})"
         )
         return model_file
 
+    async def _store_new_content(
+        self,
+        source: BinaryIO,
+        model_dir: str,
+        filename: str,
+        content_type: str,
+        content_sha256: str,
+        file_size: int,
+    ) -> str:
+        """Write content not seen before to storage and register its blob."""
+        if self.storage_type == "local":
+            file_url, _ = await self._save_local_stream(source, model_dir, filename)
+        else:
+            file_url = await self._save_s3(source, model_dir, filename, content_type)
+
+        blob = await register_blob(
+            self.db,
+            self.tenant.id,
+            BLOB_KIND_MODEL_FILE,
+            content_sha256,
+            url=file_url,
+            size=file_size,
+            content_type=content_type,
+        )
+        if blob.url != file_url:
+            # A concurrent upload of the same content registered first
+            await self._delete_stored(file_url)
+        return blob.url
+
+    async def _delete_stored(self, file_url: str) -> bool:
+        """Delete uploaded content from the storage backend."""
+        if self.storage_type == "local":
+            return await self._delete_local(file_url)
+        return await self._delete_s3(file_url)
+
+    def _staging_path(self, upload_id: UUID) -> Path:
+        """Staging file holding the chunks received so far for an upload."""
+        return self.base_path / "staging" / f"{upload_id}.part"
+
+    def _chunk_path(self, upload_id: UUID) -> Path:
+        """Private file one PUT request streams its chunk into before it is accepted."""
+        return self.base_path / "staging" / f"{upload_id}.{uuid.uuid4().hex}.chunk"
+
+    async def start_upload(
+        self,
+        model_id: UUID,
+        original_filename: str,
+        content_type: str,
+        total_size: int,
+        file_type: ModelFileType,
+        part_name: Optional[str] = None,
+        version: Optional[str] = None,
+        is_primary: bool = False,
+        notes: Optional[str] = None,
+    ) -> ModelFileUpload:
+        """
+        Start a resumable, chunked upload.
+
+        Chunks are staged under the storage path, so with several API
+        replicas that path must be a shared volume.
+
+        Args:
+            model_id: UUID of the model to attach the file to
+            original_filename: Original filename
+            content_type: MIME type
+            total_size: Size of the complete file in bytes
+            file_type: Type of file (source_stl, slicer_project, etc.)
+            part_name: Optional part name for multi-part models
+            version: Optional version string
+            is_primary: Whether this is the primary file
+            notes: Optional user notes
+
+        Returns:
+            Created ModelFileUpload with nothing received yet
+
+        Raises:
+            ModelFileStorageError: If the model is missing or the file is invalid
+        """
+        model = await self._get_model(model_id)
+        if not model:
+            raise ModelFileStorageError(f"Model not found: {model_id}")
+
+        self._validate_upload(total_size, original_filename)
+
+        upload = ModelFileUpload(
+            tenant_id=self.tenant.id,
+            model_id=model_id,
+            file_type=file_type.value,
+            original_filename=original_filename,
+            content_type=content_type,
+            total_size=total_size,
+            received_size=0,
+            part_name=part_name,
+            version=version,
+            is_primary=is_primary,
+            notes=notes,
+            uploaded_by_user_id=self.user.id if self.user else None,
+        )
+        self.db.add(upload)
+        await self.db.flush()
+
+        await get_image_io_pool().run("write", _create_staging_file, self._staging_path(upload.id))
+        await self.db.commit()
+        await self.db.refresh(upload)
+
+        logger.info(
+            f"Started upload {upload.id} of '{original_filename}' for model {model_id} "
+            f"({total_size} bytes)"
+        )
+        return upload
+
+    async def get_upload(
+        self, upload_id: UUID, for_update: bool = False
+    ) -> Optional[ModelFileUpload]:
+        """
+        Get an in-progress upload by ID within tenant.
+
+        Pass ``for_update`` to lock the row until the transaction ends, e.g.
+        to complete or abort the upload without a chunk landing in between.
+        """
+        query = (
+            select(ModelFileUpload)
+            .where(ModelFileUpload.id == upload_id)
+            .where(ModelFileUpload.tenant_id == self.tenant.id)
+        )
+        if for_update:
+            query = query.with_for_update()
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def append_upload_chunk(
+        self,
+        upload: ModelFileUpload,
+        offset: int,
+        chunks: AsyncIterator[bytes],
+    ) -> ModelFileUpload:
+        """
+        Append a chunk of a resumable upload.
+
+        The body is streamed into a private chunk file with no transaction
+        open, so a slow client holds neither a row lock nor a connection.
+        The chunk is then accepted by advancing received_size only if it is
+        still ``offset``, and copied onto the staging file under that row
+        lock. Progress is recorded even if the client disconnects mid-chunk,
+        so it can resume from ``received_size`` rather than resend the whole
+        chunk.
+
+        Args:
+            upload: The upload to append to
+            offset: Byte offset the chunk starts at; must equal received_size
+            chunks: The chunk's body, e.g. ``request.stream()``
+
+        Returns:
+            The upload with its updated received_size
+
+        Raises:
+            UploadOffsetError: If offset does not match the bytes received
+            ModelFileStorageError: If the chunk runs past the declared size
+        """
+        if offset != upload.received_size:
+            raise UploadOffsetError(upload.received_size)
+        # End the read transaction before waiting on the client
+        await self.db.commit()
+
+        pool = get_image_io_pool()
+        chunk_path = self._chunk_path(upload.id)
+        handle = await pool.run("write", open, chunk_path, "wb")
+        written = 0
+        buffer = bytearray()
+        try:
+            async for chunk in chunks:
+                if offset + written + len(buffer) + len(chunk) > upload.total_size:
+                    raise ModelFileStorageError(
+                        f"Chunk runs past the declared size of {upload.total_size} bytes"
+                    )
+                buffer += chunk
+                if len(buffer) >= UPLOAD_CHUNK_SIZE:
+                    await pool.run("write", handle.write, bytes(buffer), bounded=False)
+                    written += len(buffer)
+                    buffer.clear()
+        finally:
+            try:
+                if buffer:
+                    await pool.run("write", handle.write, bytes(buffer), bounded=False)
+                    written += len(buffer)
+            finally:
+                await pool.run("write", handle.close, bounded=False)
+            try:
+                if written:
+                    await self._accept_chunk(upload, offset, written, chunk_path)
+            finally:
+                await pool.run("delete", partial(chunk_path.unlink, missing_ok=True), bounded=False)
+
+        await self.db.refresh(upload)
+        return upload
+
+    async def _accept_chunk(
+        self, upload: ModelFileUpload, offset: int, written: int, chunk_path: Path
+    ) -> None:
+        """
+        Advance received_size past a streamed chunk and stage its bytes.
+
+        The conditional update makes a concurrent chunk for the same offset
+        lose with UploadOffsetError instead of interleaving its bytes.
+        """
+        upload_id = upload.id
+        result = await self.db.execute(
+            update(ModelFileUpload)
+            .where(ModelFileUpload.id == upload_id)
+            .where(ModelFileUpload.received_size == offset)
+            .values(received_size=offset + written)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            received_size = await self.db.scalar(
+                select(ModelFileUpload.received_size).where(ModelFileUpload.id == upload_id)
+            )
+            await self.db.commit()
+            if received_size is None:
+                raise ModelFileStorageError("Upload was completed or aborted")
+            raise UploadOffsetError(received_size)
+
+        try:
+            await get_image_io_pool().run(
+                "write",
+                _append_to_staging_file,
+                self._staging_path(upload_id),
+                chunk_path,
+                offset,
+                bounded=False,
+            )
+        except BaseException:
+            await self.db.rollback()
+            raise
+        await self.db.commit()
+
+    async def complete_upload(self, upload: ModelFileUpload) -> ModelFile:
+        """
+        Turn a fully received upload into a ModelFile.
+
+        The staged file is streamed to storage exactly like a direct upload,
+        then the staging file and upload row are removed.
+
+        Raises:
+            ModelFileStorageError: If bytes are missing or storing fails
+        """
+        if upload.received_size != upload.total_size:
+            raise ModelFileStorageError(
+                f"Upload incomplete: {upload.received_size} of {upload.total_size} bytes received"
+            )
+
+        pool = get_image_io_pool()
+        staging_path = self._staging_path(upload.id)
+        source = await pool.run("read", open, staging_path, "rb")
+        try:
+            # Deleted in the same commit that creates the ModelFile
+            await self.db.delete(upload)
+            model_file = await self.upload_file_stream(
+                model_id=upload.model_id,
+                source=source,
+                content_type=upload.content_type,
+                original_filename=upload.original_filename,
+                file_type=ModelFileType(upload.file_type),
+                part_name=upload.part_name,
+                version=upload.version,
+                is_primary=upload.is_primary,
+                notes=upload.notes,
+            )
+        finally:
+            await pool.run("read", source.close, bounded=False)
+
+        await pool.run("delete", partial(staging_path.unlink, missing_ok=True), bounded=False)
+        return model_file
+
+    async def abort_upload(self, upload: ModelFileUpload) -> None:
+        """Discard an in-progress upload and its staged chunks."""
+        staging_path = self._staging_path(upload.id)
+        await self.db.delete(upload)
+        await self.db.commit()
+        await get_image_io_pool().run("delete", partial(staging_path.unlink, missing_ok=True))
+
     async def create_local_reference(
         self,
         model_id: UUID,
@@ -457,9 +887,20 @@ class ModelFileService:
 
         return f"/uploads/{model_dir}/{filename}"
 
+    async def _save_local_stream(
+        self,
+        source: BinaryIO,
+        model_dir: str,
+        filename: str,
+    ) -> tuple[str, str]:
+        """Copy a file object to local storage, returning (file_url, sha256)."""
+        dest = self.base_path / model_dir / filename
+        content_sha256 = await get_image_io_pool().run("write", _copy_to_path, source, dest)
+        return f"/uploads/{model_dir}/{filename}", content_sha256
+
     async def _save_s3(
         self,
-        file_content: bytes,
+        file_content: Union[bytes, BinaryIO],
         model_dir: str,
         filename: str,
         content_type: str,
@@ -480,11 +921,19 @@ class ModelFileService:
             file_key = f"{model_dir}/{filename}"
             logger.debug(f"Uploading to S3: bucket={self._bucket}, key={file_key}")
 
-            self._s3_client.upload_fileobj(
-                BytesIO(file_content),
-                self._bucket,
-                file_key,
-                ExtraArgs={"ContentType": content_type},
+            # upload_fileobj switches to a multipart upload for large files
+            # and reads the source one part at a time
+            source = BytesIO(file_content) if isinstance(file_content, bytes) else file_content
+            source.seek(0)
+            await get_image_io_pool().run(
+                "upload",
+                partial(
+                    self._s3_client.upload_fileobj,
+                    source,
+                    self._bucket,
+                    file_key,
+                    ExtraArgs={"ContentType": content_type},
+                ),
             )
 
             logger.info(f"Successfully uploaded to S3: {file_key}")
@@ -517,6 +966,9 @@ class ModelFileService:
             else:
                 raise ModelFileStorageError(f"S3 upload failed: {error_code} - {error_msg}")
 
+        except WorkerPoolBusyError:
+            raise
+
         except Exception as e:
             logger.exception(f"Unexpected error during S3 upload: {e}")
             raise ModelFileStorageError(f"Unexpected error during file upload: {e}")
@@ -543,20 +995,26 @@ class ModelFileService:
     async def _extract_and_save_3mf_thumbnail(
         self,
         model: Model,
-        file_content: bytes,
+        file_content: Union[bytes, BinaryIO],
     ) -> bool:
         """
         Extract thumbnail from 3MF file and save as model preview image.
 
         Args:
             model: The Model instance to update
-            file_content: Raw bytes of the 3MF file
+            file_content: Raw bytes of the 3MF file, or a seekable file holding it
 
         Returns:
             True if thumbnail was extracted and saved, False otherwise
         """
         # Extract thumbnail from 3MF
-        thumbnail_result = extract_3mf_thumbnail(file_content)
+        try:
+            thumbnail_result = await get_image_io_pool().run(
+                "thumbnail", extract_3mf_thumbnail, file_content
+            )
+        except WorkerPoolBusyError:
+            logger.warning(f"Skipped 3MF thumbnail for model {model.id}: I/O pool busy")
+            return False
         if not thumbnail_result:
             logger.debug(f"No thumbnail found in 3MF for model {model.id}")
             return False
@@ -564,9 +1022,12 @@ class ModelFileService:
         thumbnail_data, content_type = thumbnail_result
 
         try:
-            # Use ImageStorage to save the thumbnail
-            image_storage = get_image_storage()
-            result = await image_storage.save_image(
+            # Save via the blob store so a 3MF uploaded to several models
+            # shares one stored thumbnail
+            result = await store_image(
+                self.db,
+                self.tenant.id,
+                get_image_storage(),
                 file_content=thumbnail_data,
                 content_type=content_type,
                 product_id=str(model.id),  # Use model ID for the image path
@@ -719,18 +1180,22 @@ class ModelFileService:
         if not model_file:
             return False
 
-        # Delete from storage (only for uploaded files, not local references)
+        # Release this file's share of the stored content (uploaded files only;
+        # local references just remove the DB record, not the actual file)
+        delete_stored = False
         if model_file.file_location != FileLocation.LOCAL_REFERENCE.value:
-            if self.storage_type == "local":
-                await self._delete_local(model_file.file_url)
-            else:
-                await self._delete_s3(model_file.file_url)
-        # Note: Local references just remove the DB record, not the actual file
+            delete_stored = await release_blob(
+                self.db, self.tenant.id, BLOB_KIND_MODEL_FILE, model_file.file_url
+            )
 
         # Delete database record
         await self.db.delete(model_file)
         await self.db.commit()
 
+        # Delete from storage once no other file uses the content
+        if delete_stored:
+            await self._delete_stored(model_file.file_url)
+
         logger.info(f"Deleted file {file_id} ({model_file.original_filename})")
         return True
 
@@ -790,6 +1255,87 @@ class ModelFileService:
             model_file.original_filename,
         )
 
+    async def open_file(self, model_file: ModelFile) -> StoredFile:
+        """
+        Locate a model file for streaming without reading it into memory.
+
+        Args:
+            model_file: The file record to open
+
+        Returns:
+            StoredFile to pass to ``stream_file_response``
+
+        Raises:
+            ModelFileStorageError: If the file is missing or lookup fails
+        """
+        content_type = model_file.content_type or "application/octet-stream"
+
+        if model_file.file_location == FileLocation.LOCAL_REFERENCE.value:
+            if not model_file.local_path:
+                raise ModelFileStorageError("Local path not set for local reference file")
+            path = Path(model_file.local_path)
+        elif not model_file.file_url or not model_file.file_url.startswith("/uploads/"):
+            raise ModelFileStorageError("Invalid file URL")
+        elif self.storage_type == "local":
+            path = self.base_path / model_file.file_url[9:]
+        else:
+            return await self._open_s3(model_file.file_url[9:], content_type)
+
+        try:
+            stat = await get_image_io_pool().run("stat", path.stat)
+        except OSError:
+            raise ModelFileStorageError("File not found on disk")
+        if not S_ISREG(stat.st_mode):
+            raise ModelFileStorageError(f"Path is not a file: {path}")
+        return StoredFile(size=stat.st_size, content_type=content_type, path=path)
+
+    async def _open_s3(self, file_key: str, content_type: str) -> StoredFile:
+        """Look up an S3 object's size for a ranged, chunked download."""
+        try:
+            head = await get_image_io_pool().run(
+                "head", partial(self._s3_client.head_object, Bucket=self._bucket, Key=file_key)
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                raise ModelFileStorageError("File not found in S3")
+            raise ModelFileStorageError(f"Failed to get file from S3: {e}")
+        return StoredFile(
+            size=head["ContentLength"],
+            content_type=content_type,
+            read_range=s3_range_reader(
+                self._s3_client, self._bucket, file_key, get_image_io_pool()
+            ),
+            etag=head.get("ETag"),
+        )
+
+    def presigned_download_url(self, model_file: ModelFile) -> Optional[str]:
+        """
+        Short-lived presigned S3 URL for a file, if redirects are enabled.
+
+        Returns None for local storage, local references, or when
+        ``storage_s3_presigned_downloads`` is off, so the caller streams the
+        file itself instead.
+        """
+        if (
+            self.storage_type != "s3"
+            or not self.settings.storage_s3_presigned_downloads
+            or model_file.file_location == FileLocation.LOCAL_REFERENCE.value
+            or not model_file.file_url
+            or not model_file.file_url.startswith("/uploads/")
+        ):
+            return None
+        filename = model_file.original_filename.replace('"', "")
+        return self._s3_client.generate_presigned_url(
+            "get_object",
+            Params={
+                "Bucket": self._bucket,
+                "Key": model_file.file_url[9:],
+                "ResponseContentDisposition": f'attachment; filename="{filename}"',
+                "ResponseContentType": model_file.content_type or "application/octet-stream",
+            },
+            ExpiresIn=self.settings.storage_s3_presigned_expiry_seconds,
+        )
+
     async def _get_local_reference(self, local_path: str) -> bytes:
         """Get file from local filesystem reference path."""
         path_obj = Path(local_path)
@@ -10,6 +10,7 @@ from typing import Any, Optional
 import httpx
 
 from app.services.printer_adapter import PrinterAdapterState
+from app.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -55,12 +56,13 @@ class MoonrakerAdapter:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _client(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(
-            base_url=self._base_url,
-            headers=self._headers,
-            timeout=5.0,
+    async def _request(self, method: str, path: str) -> httpx.Response:
+        """Send a request over the shared printers client and raise on HTTP errors."""
+        resp = await get_http_client("printers").request(
+            method, f"{self._base_url}{path}", headers=self._headers, timeout=5.0
         )
+        resp.raise_for_status()
+        return resp
 
     @staticmethod
     def _parse_status(data: dict[str, Any]) -> PrinterAdapterState:
@@ -132,31 +134,23 @@ class MoonrakerAdapter:
         Never raises exceptions.
         """
         try:
-            async with self._client() as client:
-                resp = await client.get(f"/printer/objects/query?{_STATUS_OBJECTS}")
-                resp.raise_for_status()
-                return self._parse_status(resp.json())
+            resp = await self._request("GET", f"/printer/objects/query?{_STATUS_OBJECTS}")
+            return self._parse_status(resp.json())
         except Exception as exc:
             logger.debug("Moonraker unreachable at %s: %s", self._base_url, exc)
             return PrinterAdapterState(status="offline")
 
     async def pause(self) -> None:
         """Send pause command to Moonraker."""
-        async with self._client() as client:
-            resp = await client.post("/printer/print/pause")
-            resp.raise_for_status()
+        await self._request("POST", "/printer/print/pause")
 
     async def resume(self) -> None:
         """Send resume command to Moonraker."""
-        async with self._client() as client:
-            resp = await client.post("/printer/print/resume")
-            resp.raise_for_status()
+        await self._request("POST", "/printer/print/resume")
 
     async def cancel(self) -> None:
         """Send cancel command to Moonraker."""
-        async with self._client() as client:
-            resp = await client.post("/printer/print/cancel")
-            resp.raise_for_status()
+        await self._request("POST", "/printer/print/cancel")
 
     async def get_toolheads(self) -> list[str]:
         """
@@ -166,15 +160,13 @@ class MoonrakerAdapter:
         Returns empty list if unavailable.
         """
         try:
-            async with self._client() as client:
-                resp = await client.get("/printer/objects/query?toolhead")
-                resp.raise_for_status()
-                result = resp.json().get("result", {}).get("status", {})
-                toolhead = result.get("toolhead", {})
-                extruder = toolhead.get("extruder")
-                if extruder:
-                    return [extruder]
-                return []
+            resp = await self._request("GET", "/printer/objects/query?toolhead")
+            result = resp.json().get("result", {}).get("status", {})
+            toolhead = result.get("toolhead", {})
+            extruder = toolhead.get("extruder")
+            if extruder:
+                return [extruder]
+            return []
         except Exception as exc:
             logger.debug("Could not query toolheads from %s: %s", self._base_url, exc)
             return []
@@ -8,7 +8,7 @@ from typing import Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.auth.password import get_password_hash
+from app.auth.password import hash_password_async
 from app.core.security import create_access_token, create_refresh_token
 from app.models.email_verification import (
     EmailVerificationToken,
@@ -108,7 +108,7 @@ class OnboardingService:
         # Store registration data in token (completed on verification)
         registration_data = {
             "email": email,
-            "password_hash": get_password_hash(request.password),
+            "password_hash": await hash_password_async(request.password),
             "full_name": request.full_name,
             "business_name": request.business_name,
             "tenant_type": request.tenant_type.value,
@@ -0,0 +1,375 @@
+"""Transactional outbox: post-commit side effects dispatched with retries.
+
+Request handlers call ``enqueue`` inside the transaction that makes a change
+(e.g. creating an order), so the side effect is recorded exactly when the
+change commits. After committing they call ``wake_outbox_dispatcher``.
+
+``OutboxDispatcher`` claims due events with ``FOR UPDATE SKIP LOCKED``,
+leases them by pushing ``next_attempt_at`` forward (as the webhook delivery
+worker does), and runs the handler registered for each ``event_type``.
+Failures are retried after ``OUTBOX_RETRY_INTERVALS``; once those are used
+up the event is marked failed for manual follow-up. Handlers must therefore
+be safe to run more than once.
+
+The dispatcher runs inside the API process by default (started from the app
+lifespan) or standalone via ``python -m scripts.run_outbox_dispatcher``.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
+
+from app.config import get_settings
+from app.database import async_session_maker, set_tenant_context
+from app.models.order import Order
+from app.models.outbox import OutboxEvent, OutboxEventStatus
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Backoff between attempts (seconds); an event gets len + 1 attempts in total
+OUTBOX_RETRY_INTERVALS = [10, 60, 300, 900, 3600]
+MAX_ERROR_LENGTH = 2000
+
+# Event types
+EVENT_ORDER_CONFIRMATION_EMAIL = "email.order_confirmation"
+EVENT_WEBHOOK = "webhook"
+EVENT_SHOPIFY_FULFILLMENT = "shopify.fulfillment"
+EVENT_INVENTORY_CHANGED = "cache.inventory_changed"
+
+OutboxHandler = Callable[[AsyncSession, UUID, dict[str, Any]], Awaitable[None]]
+
+_handlers: dict[str, OutboxHandler] = {}
+
+
+def outbox_handler(event_type: str) -> Callable[[OutboxHandler], OutboxHandler]:
+    """Register the handler for an event type."""
+
+    def register(handler: OutboxHandler) -> OutboxHandler:
+        _handlers[event_type] = handler
+        return handler
+
+    return register
+
+
+def enqueue(
+    db: AsyncSession,
+    tenant_id: UUID,
+    event_type: str,
+    payload: Optional[dict[str, Any]] = None,
+) -> OutboxEvent:
+    """Add an outbox event to the session; it is committed with the caller's transaction.
+
+    Args:
+        db: Session holding the business change
+        tenant_id: Tenant the side effect belongs to
+        event_type: Registered handler key (one of the EVENT_* constants)
+        payload: JSON-serialisable handler arguments
+    """
+    if event_type not in _handlers:
+        raise ValueError(f"No outbox handler registered for {event_type!r}")
+
+    event = OutboxEvent(
+        tenant_id=tenant_id,
+        event_type=event_type,
+        payload=payload or {},
+        status=OutboxEventStatus.PENDING.value,
+        attempts=0,
+    )
+    db.add(event)
+    return event
+
+
+# ==================== Handlers ====================
+
+
+@outbox_handler(EVENT_ORDER_CONFIRMATION_EMAIL)
+async def _send_order_confirmation(db: AsyncSession, tenant_id: UUID, payload: dict) -> None:
+    """Email the customer their order confirmation (once)."""
+    from app.services.email_service import get_email_service
+
+    result = await db.execute(
+        select(Order)
+        .where(Order.id == UUID(payload["order_id"]), Order.tenant_id == tenant_id)
+        .options(selectinload(Order.items))
+    )
+    order = result.scalar_one_or_none()
+    if order is None or order.confirmation_email_sent:
+        return
+
+    email_service = get_email_service()
+    if not email_service.is_configured:
+        logger.warning(f"Email not configured; skipping confirmation for {order.order_number}")
+        return
+
+    sent = await email_service.send_order_confirmation(
+        to_email=order.customer_email,
+        customer_name=order.customer_name,
+        order_number=order.order_number,
+        order_items=[
+            {
+                "name": item.product_name,
+                "quantity": item.quantity,
+                "price": float(item.unit_price),
+            }
+            for item in order.items
+        ],
+        subtotal=float(order.subtotal),
+        shipping_cost=float(order.shipping_cost),
+        total=float(order.total),
+        shipping_address={
+            "address_line1": order.shipping_address_line1,
+            "address_line2": order.shipping_address_line2,
+            "city": order.shipping_city,
+            "county": order.shipping_county,
+            "postcode": order.shipping_postcode,
+            "country": order.shipping_country,
+        },
+        receipt_url=payload.get("receipt_url"),
+    )
+    if not sent:
+        raise RuntimeError(f"Order confirmation email not sent for {order.order_number}")
+
+    order.confirmation_email_sent = True
+    order.confirmation_email_sent_at = datetime.now(timezone.utc)
+
+
+@outbox_handler(EVENT_WEBHOOK)
+async def _trigger_webhook(db: AsyncSession, tenant_id: UUID, payload: dict) -> None:
+    """Queue outbound webhook deliveries for the event."""
+    from app.models.webhook import WebhookEventType
+    from app.services.webhook_service import trigger_webhook_event
+
+    await trigger_webhook_event(
+        db, tenant_id, WebhookEventType(payload["event_type"]), payload["data"]
+    )
+
+
+@outbox_handler(EVENT_SHOPIFY_FULFILLMENT)
+async def _sync_shopify_fulfillment(db: AsyncSession, tenant_id: UUID, payload: dict) -> None:
+    """Push a shipment back to Shopify."""
+    from app.services.shopify_sync import sync_order_fulfillment
+
+    await sync_order_fulfillment(
+        shopify_order_id=payload["shopify_order_id"],
+        tracking_number=payload.get("tracking_number"),
+        tracking_url=payload.get("tracking_url"),
+        shipping_method=payload.get("shipping_method"),
+    )
+
+
+@outbox_handler(EVENT_INVENTORY_CHANGED)
+async def _invalidate_inventory_caches(db: AsyncSession, tenant_id: UUID, payload: dict) -> None:
+    """Evict product, cost and dashboard caches after stock changed."""
+    from app.services.cache_service import invalidate_on_inventory_change
+
+    await invalidate_on_inventory_change(str(tenant_id))
+
+
+# ==================== Dispatcher ====================
+
+
+class OutboxDispatcher:
+    """Claims due outbox events and runs their handlers with bounded concurrency."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_maker,
+        *,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        lease_seconds: Optional[int] = None,
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            session_factory: Session factory for claiming and running events
+            concurrency: Maximum handlers running in this process
+            poll_interval: Seconds to sleep when no events are due
+            lease_seconds: How long a claimed event is hidden from other dispatchers
+        """
+        self._session_factory = session_factory
+        self.concurrency = concurrency or settings.outbox_dispatcher_concurrency
+        self.poll_interval = poll_interval or settings.outbox_dispatcher_poll_interval_seconds
+        self.lease_seconds = lease_seconds or settings.outbox_dispatcher_lease_seconds
+
+        self._tasks: set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
+        self._runner: Optional[asyncio.Task] = None
+
+    async def claim_due(self, limit: int) -> list[UUID]:
+        """Lease up to ``limit`` due events and return their IDs."""
+        now = datetime.now(timezone.utc)
+        async with self._session_factory() as db:
+            result = await db.execute(
+                select(OutboxEvent.id)
+                .where(
+                    OutboxEvent.status == OutboxEventStatus.PENDING.value,
+                    or_(
+                        OutboxEvent.next_attempt_at.is_(None),
+                        OutboxEvent.next_attempt_at <= now,
+                    ),
+                )
+                .order_by(OutboxEvent.created_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            event_ids = list(result.scalars().all())
+
+            if event_ids:
+                await db.execute(
+                    update(OutboxEvent)
+                    .where(OutboxEvent.id.in_(event_ids))
+                    .values(next_attempt_at=now + timedelta(seconds=self.lease_seconds))
+                )
+            await db.commit()
+
+        return event_ids
+
+    async def dispatch(self, event_id: UUID) -> None:
+        """Run one claimed event's handler and record the outcome."""
+        async with self._session_factory() as db:
+            event = await db.get(OutboxEvent, event_id)
+            if event is None or event.status != OutboxEventStatus.PENDING.value:
+                return
+
+            tenant_id, event_type, payload = event.tenant_id, event.event_type, event.payload
+            attempts = event.attempts + 1
+            handler = _handlers.get(event_type)
+
+            error: Optional[str] = None
+            if handler is None:
+                error = f"No handler registered for {event_type!r}"
+            else:
+                try:
+                    await set_tenant_context(db, tenant_id)
+                    await handler(db, tenant_id, payload)
+                    await db.commit()
+                except Exception as e:
+                    await db.rollback()
+                    logger.warning(f"Outbox {event_type} attempt {attempts} failed: {e}")
+                    error = f"{type(e).__name__}: {e}"[:MAX_ERROR_LENGTH]
+
+            now = datetime.now(timezone.utc)
+            values: dict[str, Any] = {"attempts": attempts, "last_error": error}
+            if error is None:
+                values.update(status=OutboxEventStatus.COMPLETED.value, completed_at=now)
+            elif handler is not None and attempts <= len(OUTBOX_RETRY_INTERVALS):
+                retry_in = OUTBOX_RETRY_INTERVALS[attempts - 1]
+                values["next_attempt_at"] = now + timedelta(seconds=retry_in)
+            else:
+                values.update(status=OutboxEventStatus.FAILED.value, completed_at=now)
+                logger.error(f"Outbox {event_type} event {event_id} failed permanently: {error}")
+
+            await db.execute(update(OutboxEvent).where(OutboxEvent.id == event_id).values(**values))
+            await db.commit()
+
+    async def _dispatch_tracked(self, event_id: UUID) -> None:
+        try:
+            await self.dispatch(event_id)
+        except Exception:
+            # The lease expires and another poll retries the event
+            logger.exception(f"Outbox dispatcher failed to process event {event_id}")
+        finally:
+            self._wakeup.set()
+
+    async def run_once(self) -> int:
+        """Claim as many due events as there is free capacity and start them.
+
+        Returns:
+            Number of events started
+        """
+        free = self.concurrency - len(self._tasks)
+        if free <= 0:
+            return 0
+
+        event_ids = await self.claim_due(free)
+        for event_id in event_ids:
+            task = asyncio.create_task(self._dispatch_tracked(event_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        return len(event_ids)
+
+    async def run_forever(self) -> None:
+        """Poll for due events until cancelled."""
+        while True:
+            self._wakeup.clear()
+            try:
+                started = await self.run_once()
+            except Exception:
+                logger.exception("Outbox dispatcher poll failed")
+                started = 0
+
+            # More may be due; keep claiming while there is capacity
+            if started and len(self._tasks) < self.concurrency:
+                continue
+
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+
+    def wake(self) -> None:
+        """Poll immediately instead of waiting for the next interval."""
+        self._wakeup.set()
+
+    def start(self) -> None:
+        """Start the run loop on the current event loop (idempotent)."""
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(self.run_forever())
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """Stop claiming and give running handlers ``timeout`` seconds to finish.
+
+        Handlers still running after that are cancelled; their leases expire
+        and the events are dispatched again by the next poll.
+        """
+        if self._runner is not None:
+            self._runner.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._runner
+            self._runner = None
+
+        if self._tasks:
+            _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+# In-process dispatcher (started from the app lifespan)
+_dispatcher: Optional[OutboxDispatcher] = None
+
+
+def start_outbox_dispatcher() -> OutboxDispatcher:
+    """Start the in-process outbox dispatcher."""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = OutboxDispatcher()
+    _dispatcher.start()
+    return _dispatcher
+
+
+async def stop_outbox_dispatcher() -> None:
+    """Stop the in-process outbox dispatcher, if running."""
+    global _dispatcher
+    if _dispatcher is not None:
+        await _dispatcher.stop()
+        _dispatcher = None
+
+
+def wake_outbox_dispatcher() -> None:
+    """Nudge the in-process dispatcher after committing new events.
+
+    A no-op when events are dispatched by a separate process; that process
+    picks them up on its next poll.
+    """
+    if _dispatcher is not None:
+        _dispatcher.wake()
@@ -13,6 +13,7 @@ from app.models.platform_admin import PlatformAdminAuditLog, PlatformSetting
 from app.models.product import Product
 from app.models.tenant import Tenant
 from app.models.user import User, UserTenant
+from app.services.tenant_routing import invalidate_tenant_routes
 
 
 class PlatformAdminService:
@@ -181,6 +182,7 @@ class PlatformAdminService:
 
         tenant.is_active = False
         await self.db.flush()
+        invalidate_tenant_routes(tenant_id)
 
         await self._log_audit(
             action="deactivate_tenant",
@@ -207,6 +209,7 @@ class PlatformAdminService:
 
         tenant.is_active = True
         await self.db.flush()
+        invalidate_tenant_routes(tenant_id)
 
         await self._log_audit(
             action="reactivate_tenant",
@@ -0,0 +1,140 @@
+"""Bill of materials graph loading for products.
+
+Costing a product walks its models (with their material and component
+lines), its packaging consumable and, for bundles, every product nested
+inside it. Loading that graph with chained ``selectinload`` paths costs a
+round trip per path per nesting level, and caps nesting at however many
+levels were spelled out.
+
+``load_product_graph`` instead finds every nested product with one
+recursive CTE over ``product_components``, loads all of them with the same
+flat set of loader options (one query per relationship, whatever the
+depth), and links each component line to its child product in memory.
+"""
+
+from typing import Iterable, Sequence
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Integer, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, lazyload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.models.model import Model
+from app.models.product import Product
+from app.models.product_component import ProductComponent
+from app.models.product_model import ProductModel
+from app.services.costing import MAX_RECURSION_DEPTH
+
+# Just the relationships costing walks; component lines are linked to their
+# child products in memory, so those are not joined in again
+PRODUCT_COST_OPTIONS: tuple[LoaderOption, ...] = (
+    selectinload(Product.product_models)
+    .joinedload(ProductModel.model)
+    .selectinload(Model.materials),
+    selectinload(Product.product_models)
+    .joinedload(ProductModel.model)
+    .selectinload(Model.components),
+    selectinload(Product.child_products).lazyload(ProductComponent.child_product),
+    selectinload(Product.packaging_consumable),
+)
+
+
+def _descendant_ids(product_ids: Iterable[UUID]):
+    """
+    Select the IDs of every product nested (at any depth) in the given products.
+
+    The depth column bounds the recursion, so a circular bundle terminates
+    one level past the costing depth limit (where costing reports it), and
+    UNION keeps one row per product and depth however many paths reach it.
+    """
+    tree = (
+        select(
+            ProductComponent.child_product_id.label("product_id"),
+            literal_column("1", Integer).label("depth"),
+        )
+        .where(ProductComponent.parent_product_id.in_(product_ids))
+        .cte("product_tree", recursive=True)
+    )
+    tree = tree.union(
+        select(ProductComponent.child_product_id, tree.c.depth + 1)
+        .join(tree, ProductComponent.parent_product_id == tree.c.product_id)
+        .where(tree.c.depth <= MAX_RECURSION_DEPTH)
+    )
+    return select(tree.c.product_id).distinct()
+
+
+def load_product_graph_sync(
+    session: Session,
+    product_ids: Iterable[UUID],
+    *criteria: ColumnElement[bool],
+    root_options: Sequence[LoaderOption] = (),
+) -> dict[UUID, Product]:
+    """
+    Load products and everything needed to cost them, keyed by product ID.
+
+    The requested products are loaded with ``root_options`` on top of the
+    costing relationships; products nested in them get only the costing
+    relationships. Objects already in the session are refreshed, so call
+    this with no pending changes.
+
+    Args:
+        session: Database session
+        product_ids: Products to load
+        *criteria: Extra filters for the requested products (e.g. tenant)
+        root_options: Extra loader options for the requested products
+
+    Returns:
+        The requested products that matched, and every product nested in them
+    """
+    product_ids = set(product_ids)
+    if not product_ids:
+        return {}
+
+    roots = session.scalars(
+        select(Product)
+        .where(Product.id.in_(product_ids), *criteria)
+        .options(*PRODUCT_COST_OPTIONS, *root_options)
+        .execution_options(populate_existing=True)
+    ).all()
+    graph = {product.id: product for product in roots}
+    if not graph:
+        return graph
+
+    nested = session.scalars(
+        select(Product)
+        .where(
+            Product.id.in_(_descendant_ids(list(graph))),
+            Product.id.not_in(list(graph)),
+        )
+        .options(*PRODUCT_COST_OPTIONS, lazyload("*"))
+        .execution_options(populate_existing=True)
+    ).all()
+    graph.update((product.id, product) for product in nested)
+
+    for product in graph.values():
+        for line in product.child_products:
+            child = graph.get(line.child_product_id)
+            if child is not None:
+                set_committed_value(line, "child_product", child)
+    return graph
+
+
+async def load_product_graph(
+    db: AsyncSession,
+    product_ids: Iterable[UUID],
+    *criteria: ColumnElement[bool],
+    root_options: Sequence[LoaderOption] = (),
+) -> dict[UUID, Product]:
+    """
+    Load products and everything needed to cost them, keyed by product ID.
+
+    See ``load_product_graph_sync``.
+    """
+    product_ids = list(product_ids)
+
+    def load(session: Session) -> dict[UUID, Product]:
+        return load_product_graph_sync(session, product_ids, *criteria, root_options=root_options)
+
+    return await db.run_sync(load)
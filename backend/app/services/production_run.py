@@ -8,7 +8,7 @@ from uuid import UUID
 
 from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
-from sqlalchemy import func, or_, select, update
+from sqlalchemy import Select, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -26,6 +26,7 @@ from app.schemas.production_run import (
     ProductionRunMaterialCreate,
     ProductionRunMaterialUpdate,
 )
+from app.utils.pagination import KeysetPage, paginate_keyset
 
 logger = logging.getLogger(__name__)
 
@@ -174,29 +175,14 @@ class ProductionRunService:
         )
         return result.scalar_one_or_none()
 
-    async def list_production_runs(
+    def _filtered_runs_query(
         self,
-        page: int = 1,
-        page_size: int = 20,
         status: Optional[str] = None,
         started_after: Optional[datetime] = None,
         started_before: Optional[datetime] = None,
         search: Optional[str] = None,
-    ) -> tuple[list[ProductionRun], int]:
-        """
-        List production runs with pagination and filtering.
-
-        Args:
-            page: Page number (1-indexed)
-            page_size: Number of items per page
-            status: Filter by status
-            started_after: Filter runs started after this datetime
-            started_before: Filter runs started before this datetime
-            search: Search by run_number, printer_name, or notes
-
-        Returns:
-            Tuple of (list of ProductionRun instances, total count)
-        """
+    ) -> Select:
+        """Build the tenant-scoped, filtered production run query for listings."""
         # Base query with tenant isolation
         query = select(ProductionRun).where(ProductionRun.tenant_id == self.tenant.id)
 
@@ -218,6 +204,44 @@ class ProductionRunService:
             )
             query = query.where(search_filter)
 
+        return query
+
+    @staticmethod
+    def _list_load_options() -> tuple:
+        """Eager-load options for production runs returned by listings."""
+        return (
+            selectinload(ProductionRun.items).selectinload(ProductionRunItem.model),
+            selectinload(ProductionRun.materials)
+            .selectinload(ProductionRunMaterial.spool)
+            .selectinload(Spool.filament_type)
+            .selectinload(FilamentType.material_type),
+        )
+
+    async def list_production_runs(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        status: Optional[str] = None,
+        started_after: Optional[datetime] = None,
+        started_before: Optional[datetime] = None,
+        search: Optional[str] = None,
+    ) -> tuple[list[ProductionRun], int]:
+        """
+        List production runs with pagination and filtering.
+
+        Args:
+            page: Page number (1-indexed)
+            page_size: Number of items per page
+            status: Filter by status
+            started_after: Filter runs started after this datetime
+            started_before: Filter runs started before this datetime
+            search: Search by run_number, printer_name, or notes
+
+        Returns:
+            Tuple of (list of ProductionRun instances, total count)
+        """
+        query = self._filtered_runs_query(status, started_after, started_before, search)
+
         # Get total count
         count_query = select(func.count()).select_from(query.subquery())
         count_result = await self.db.execute(count_query)
@@ -225,16 +249,10 @@ class ProductionRunService:
 
         # Apply pagination and ordering
         query = (
-            query.order_by(ProductionRun.started_at.desc())
+            query.order_by(ProductionRun.started_at.desc(), ProductionRun.id.desc())
             .offset((page - 1) * page_size)
             .limit(page_size)
-            .options(
-                selectinload(ProductionRun.items).selectinload(ProductionRunItem.model),
-                selectinload(ProductionRun.materials)
-                .selectinload(ProductionRunMaterial.spool)
-                .selectinload(Spool.filament_type)
-                .selectinload(FilamentType.material_type),
-            )
+            .options(*self._list_load_options())
         )
 
         result = await self.db.execute(query)
@@ -242,6 +260,57 @@ class ProductionRunService:
 
         return list(runs), total
 
+    async def list_production_runs_keyset(
+        self,
+        limit: int = 20,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        include_total: bool = False,
+        status: Optional[str] = None,
+        started_after: Optional[datetime] = None,
+        started_before: Optional[datetime] = None,
+        search: Optional[str] = None,
+    ) -> tuple[KeysetPage[ProductionRun], Optional[int]]:
+        """
+        List production runs with keyset pagination over (started_at, id).
+
+        Every page costs the same regardless of depth. Filters match
+        ``list_production_runs``.
+
+        Args:
+            limit: Number of items per page
+            after: Cursor to continue after (from ``next_cursor``)
+            before: Cursor to go back before (from ``prev_cursor``)
+            include_total: Also count all matching runs
+            status: Filter by status
+            started_after: Filter runs started after this datetime
+            started_before: Filter runs started before this datetime
+            search: Search by run_number, printer_name, or notes
+
+        Returns:
+            Tuple of (KeysetPage of ProductionRun instances, total count or None)
+
+        Raises:
+            InvalidCursorError: If a cursor is malformed
+        """
+        query = self._filtered_runs_query(status, started_after, started_before, search)
+
+        total = None
+        if include_total:
+            count_query = select(func.count()).select_from(query.subquery())
+            total = (await self.db.execute(count_query)).scalar_one()
+
+        page = await paginate_keyset(
+            self.db,
+            query.options(*self._list_load_options()),
+            ProductionRun.started_at,
+            ProductionRun.id,
+            limit,
+            after=after,
+            before=before,
+        )
+        return page, total
+
     async def update_production_run(
         self,
         run_id: UUID,
@@ -0,0 +1,238 @@
+"""Daily product sales rollup maintenance.
+
+Forecasting reads ``DailyProductSales`` rows (units, revenue and order count
+per tenant, product, sales channel and UTC day) instead of aggregating the
+order history on every request.
+
+Rows are maintained on write by SQLAlchemy session hooks, in the same way
+as the shop projection. ``after_flush`` records which (tenant, day) pairs
+were touched by new, changed or deleted orders and order items, and
+``before_commit`` re-aggregates those days from the orders in the same
+transaction. Re-aggregating a whole day rather than applying +/- deltas
+makes every write path (checkout, manual orders, marketplace webhooks,
+cancellations, refunds, item edits) correct without it knowing about the
+rollup. The hooks are registered when this module is imported (the
+forecasting service imports it).
+"""
+
+import hashlib
+import logging
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+from itertools import chain
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import Date, cast, delete, event, func, insert, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.daily_product_sales import DailyProductSales
+from app.models.order import Order, OrderItem, OrderStatus
+
+logger = logging.getLogger(__name__)
+
+# Key in Session.info holding (tenant, day) pairs and order IDs awaiting a rebuild
+_PENDING_KEY = "sales_rollup_pending"
+
+# Orders that count as sales; cancelled and refunded orders drop out
+SALES_STATUSES = [
+    OrderStatus.PENDING,
+    OrderStatus.PROCESSING,
+    OrderStatus.SHIPPED,
+    OrderStatus.DELIVERED,
+]
+
+# Changes to other columns (tracking numbers, emails, notes) leave the rollup alone
+_ORDER_FIELDS = ("tenant_id", "status", "sales_channel_id", "created_at")
+_ORDER_ITEM_FIELDS = ("order_id", "product_id", "quantity", "total_price")
+
+
+def utc_day(value: datetime) -> date:
+    """The UTC calendar day of a timestamp (naive timestamps are taken as UTC)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.date()
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def _day_bucket(dialect: str, column):
+    """
+    Truncate a timestamp column to its UTC calendar day.
+
+    PostgreSQL converts to UTC before casting to DATE; SQLite stores UTC and
+    uses date(), which returns an ISO 'YYYY-MM-DD' string.
+    """
+    if dialect == "postgresql":
+        return cast(func.timezone("UTC", column), Date)
+    return func.date(column)
+
+
+def _as_date(value) -> date:
+    """Normalize a day bucket (date on PostgreSQL, str on SQLite) to a date."""
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    return value
+
+
+def _lock_key(tenant_id: UUID, day: date) -> int:
+    """Stable signed 64-bit advisory lock key for a tenant-day."""
+    digest = hashlib.blake2b(f"sales_rollup:{tenant_id}:{day}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _rebuild(session: Session, tenant_id: UUID, days: Optional[Iterable[date]] = None) -> int:
+    """
+    Re-aggregate rollup rows for some days of a tenant, or its whole history.
+
+    Runs in the session's current transaction using core statements only, so
+    it neither loads ORM objects nor dirties the session. On PostgreSQL a
+    transaction-level advisory lock per day serializes concurrent rebuilds,
+    so two checkouts on the same day cannot both insert that day's rows.
+
+    Returns:
+        Number of rollup rows written
+    """
+    dialect = session.get_bind().dialect.name
+    bucket = _day_bucket(dialect, Order.created_at)
+    scope = [Order.tenant_id == tenant_id]
+    stale = [DailyProductSales.tenant_id == tenant_id]
+
+    if days is not None:
+        days = sorted(set(days))
+        if not days:
+            return 0
+        if dialect == "postgresql":
+            for day in days:
+                session.execute(select(func.pg_advisory_xact_lock(_lock_key(tenant_id, day))))
+        # The created_at range keeps the order scan on the index
+        scope += [
+            Order.created_at >= _day_start(days[0]),
+            Order.created_at < _day_start(days[-1] + timedelta(days=1)),
+            # SQLite buckets are ISO strings
+            bucket.in_(days if dialect == "postgresql" else [d.isoformat() for d in days]),
+        ]
+        stale.append(DailyProductSales.day.in_(days))
+
+    session.execute(delete(DailyProductSales).where(*stale))
+
+    result = session.execute(
+        select(
+            OrderItem.product_id,
+            Order.sales_channel_id,
+            bucket.label("day"),
+            func.sum(OrderItem.quantity).label("units_sold"),
+            func.sum(OrderItem.total_price).label("revenue"),
+            func.count(func.distinct(Order.id)).label("order_count"),
+        )
+        .join(OrderItem, Order.id == OrderItem.order_id)
+        .where(
+            *scope,
+            OrderItem.product_id.is_not(None),
+            Order.status.in_(SALES_STATUSES),
+        )
+        .group_by(OrderItem.product_id, Order.sales_channel_id, bucket)
+    )
+    rows = [
+        {
+            "tenant_id": tenant_id,
+            "product_id": row.product_id,
+            "sales_channel_id": row.sales_channel_id,
+            "day": _as_date(row.day),
+            "units_sold": int(row.units_sold or 0),
+            "revenue": row.revenue or 0,
+            "order_count": int(row.order_count or 0),
+        }
+        for row in result
+    ]
+    if rows:
+        session.execute(insert(DailyProductSales), rows)
+    logger.debug(f"Rebuilt {len(rows)} daily sales rows for tenant {tenant_id}")
+    return len(rows)
+
+
+def _pending(session: Session) -> tuple[set[tuple[UUID, date]], set[UUID]]:
+    """Get the ((tenant_id, day) pairs, order_ids) awaiting a rebuild for a session."""
+    return session.info.setdefault(_PENDING_KEY, (set(), set()))
+
+
+def _changed(obj, fields: tuple[str, ...], session: Session) -> bool:
+    """Whether a flushed object is new/deleted or one of ``fields`` was modified."""
+    if obj in session.new or obj in session.deleted:
+        return True
+    attrs = inspect(obj).attrs
+    return any(attrs[field].history.has_changes() for field in fields)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, flush_context) -> None:
+    """Record the tenant-days whose rollup rows are affected by a flush."""
+    tenant_days, order_ids = _pending(session)
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Order) and _changed(obj, _ORDER_FIELDS, session):
+            # Include the previous day if created_at was moved
+            previous = inspect(obj).attrs.created_at.history.deleted or ()
+            for created_at in chain([obj.created_at], previous):
+                if created_at is not None:
+                    tenant_days.add((obj.tenant_id, utc_day(created_at)))
+        elif isinstance(obj, OrderItem) and _changed(obj, _ORDER_ITEM_FIELDS, session):
+            # The item's order may not be loaded; resolve its day before commit
+            order_ids.add(obj.order_id)
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_before_commit(session: Session) -> None:
+    """Re-aggregate affected days as part of the committing transaction."""
+    if session.new or session.dirty or session.deleted:
+        session.flush()
+    tenant_days, order_ids = session.info.pop(_PENDING_KEY, (set(), set()))
+    if order_ids:
+        for tenant_id, created_at in session.execute(
+            select(Order.tenant_id, Order.created_at).where(Order.id.in_(order_ids))
+        ):
+            tenant_days.add((tenant_id, utc_day(created_at)))
+
+    by_tenant: dict[UUID, set[date]] = defaultdict(set)
+    for tenant_id, day in tenant_days:
+        by_tenant[tenant_id].add(day)
+    for tenant_id in sorted(by_tenant):
+        _rebuild(session, tenant_id, by_tenant[tenant_id])
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, previous_transaction) -> None:
+    """Forget pending rebuilds when the outermost transaction rolls back."""
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+async def rebuild_sales_rollup(db: AsyncSession, tenant_id: Optional[UUID] = None) -> int:
+    """
+    Rebuild the rollup from the full order history of a tenant, or every tenant.
+
+    Used to backfill existing order history and to repair drift. Runs in the
+    caller's transaction; the caller commits.
+
+    Args:
+        db: Database session
+        tenant_id: Tenant to rebuild (None = all tenants)
+
+    Returns:
+        Number of rollup rows written
+    """
+    if tenant_id is not None:
+        tenant_ids = [tenant_id]
+    else:
+        # Include tenants whose orders are gone so their stale rows are removed
+        result = await db.execute(
+            select(Order.tenant_id).union(select(DailyProductSales.tenant_id))
+        )
+        tenant_ids = list(result.scalars().all())
+
+    def rebuild_all(session: Session) -> int:
+        return sum(_rebuild(session, tid) for tid in tenant_ids)
+
+    return await db.run_sync(rebuild_all)
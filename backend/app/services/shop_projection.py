@@ -0,0 +1,443 @@
+"""Storefront product projection maintenance.
+
+The shop catalogue endpoints read ``ShopProductProjection`` rows: one per
+shop-visible product and sales channel (plus a channel-less default row),
+with the resolved price, image URLs, categories, designer and variants
+already shaped as the shop API returns them.
+
+Rows are maintained on write by SQLAlchemy session hooks. ``before_flush``
+resolves category, designer and sales channel changes to the products they
+affect (while memberships of rows about to be deleted can still be read),
+``after_flush`` records products whose own rows were touched, and
+``before_commit`` rebuilds the affected rows in the same transaction. Core
+DML bypasses the flush, so callers writing ``product_categories`` directly
+name the products with ``mark_products_changed``. The hooks are registered
+when this module is imported (the shop API imports it).
+"""
+
+import logging
+from collections import defaultdict
+from decimal import Decimal
+from itertools import chain
+from typing import Any, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Select, delete, event, insert, inspect, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.category import Category, product_categories
+from app.models.designer import Designer
+from app.models.product import Product
+from app.models.product_image import ProductImage
+from app.models.product_pricing import ProductPricing
+from app.models.product_variant import ProductVariant
+from app.models.sales_channel import SalesChannel
+from app.models.shop_product_projection import ShopProductProjection
+
+logger = logging.getLogger(__name__)
+
+# Key in Session.info holding products/tenants/dropped channels awaiting a rebuild
+_PENDING_KEY = "shop_projection_pending"
+
+# Columns copied into projection documents; edits to other columns are ignored
+_CATEGORY_FIELDS = ("name", "slug", "display_order", "is_active")
+_DESIGNER_FIELDS = ("name", "slug", "is_active")
+
+SHOP_BASE_URL = "https://www.mystmereforge.co.uk"
+
+
+def _shop_image_url(image_url: str) -> str:
+    """Serve uploaded images through the shop image endpoint (bypasses ingress routing)."""
+    if image_url.startswith("/uploads/products/"):
+        return image_url.replace("/uploads/products/", "/api/v1/shop/images/")
+    return image_url
+
+
+def _shop_url(product_id: UUID, seo_slug: Optional[str]) -> str:
+    """Canonical storefront URL for a product."""
+    if seo_slug:
+        return f"{SHOP_BASE_URL}/products/{seo_slug}"
+    return f"{SHOP_BASE_URL}/product/{product_id}"
+
+
+def _build_documents(
+    product: Any,
+    price: Decimal,
+    images: list[dict],
+    categories: list[dict],
+    designer: Optional[dict],
+    variants: list[Any],
+) -> tuple[dict, dict]:
+    """
+    Shape the listing card and product page for one product at one price.
+
+    Values are JSON-ready and match ``ShopProduct`` as serialized by the shop
+    API (Decimal prices as strings).
+    """
+    base_price_pence = int(price * 100)
+    in_stock = product.print_to_order or product.units_in_stock > 0
+    stock_count = None if product.print_to_order else product.units_in_stock
+    created_at = product.created_at.isoformat() if product.created_at else None
+    common = {
+        "id": str(product.id),
+        "sku": product.sku or "",
+        "name": product.name,
+        "currency": "GBP",
+        "images": images,
+        "categories": categories,
+        "designer": designer,
+        "in_stock": in_stock,
+        "stock_count": stock_count,
+        "print_to_order": product.print_to_order,
+        "free_shipping": product.free_shipping,
+        "is_dragon": product.is_dragon,
+        "created_at": created_at,
+        "seo_slug": product.seo_slug,
+        "shop_url": _shop_url(product.id, product.seo_slug),
+    }
+
+    payload = {
+        **common,
+        "description": product.description,
+        "price": str(price * 100),
+        "backstory": None,
+        "feature_title": None,
+        "variants": [],
+        "seo_title": None,
+        "seo_description": None,
+    }
+    detail = {
+        **common,
+        # Use shop_description if available, otherwise fall back to description
+        "description": product.shop_description or product.description,
+        "price": str(base_price_pence),
+        "backstory": product.backstory,
+        "feature_title": product.feature_title,
+        "variants": [
+            {
+                "id": str(v.id),
+                "size": v.size,
+                "display_order": v.display_order,
+                "sku": v.sku,
+                "price_pence": base_price_pence + v.price_adjustment_pence,
+                "price_adjustment_pence": v.price_adjustment_pence,
+                "fulfilment_type": v.fulfilment_type,
+                "units_in_stock": v.units_in_stock,
+                "lead_time_days": v.lead_time_days,
+                "is_active": v.is_active,
+            }
+            for v in variants
+        ],
+        "seo_title": product.seo_title,
+        "seo_description": product.seo_description,
+    }
+    return payload, detail
+
+
+def _rebuild(
+    session: Session,
+    product_ids: Iterable[UUID] = (),
+    tenant_ids: Iterable[UUID] = (),
+) -> int:
+    """
+    Rebuild projection rows for the given products and/or whole tenants.
+
+    Runs in the session's current transaction using core statements only, so
+    it neither loads ORM relationships nor dirties the session.
+
+    Returns:
+        Number of projection rows written
+    """
+    product_ids = set(product_ids)
+    tenant_ids = set(tenant_ids)
+    if not product_ids and not tenant_ids:
+        return 0
+
+    scope = or_(Product.id.in_(product_ids), Product.tenant_id.in_(tenant_ids))
+    in_scope = select(Product.id).where(scope)
+
+    session.execute(
+        delete(ShopProductProjection).where(
+            or_(
+                ShopProductProjection.product_id.in_(product_ids),
+                ShopProductProjection.tenant_id.in_(tenant_ids),
+            )
+        )
+    )
+
+    products = session.execute(
+        select(
+            Product.id,
+            Product.tenant_id,
+            Product.designer_id,
+            Product.sku,
+            Product.name,
+            Product.description,
+            Product.shop_description,
+            Product.is_active,
+            Product.units_in_stock,
+            Product.print_to_order,
+            Product.free_shipping,
+            Product.is_dragon,
+            Product.backstory,
+            Product.feature_title,
+            Product.seo_slug,
+            Product.seo_title,
+            Product.seo_description,
+            Product.created_at,
+        ).where(scope, Product.shop_visible.is_(True))
+    ).all()
+    if not products:
+        return 0
+
+    def _group(query: Select) -> dict[UUID, list]:
+        grouped: dict[UUID, list] = defaultdict(list)
+        for row in session.execute(query):
+            grouped[row.product_id].append(row)
+        return grouped
+
+    pricing = _group(
+        select(
+            ProductPricing.product_id, ProductPricing.sales_channel_id, ProductPricing.list_price
+        )
+        .where(ProductPricing.product_id.in_(in_scope), ProductPricing.is_active.is_(True))
+        .order_by(ProductPricing.created_at, ProductPricing.id)
+    )
+    images = _group(
+        select(
+            ProductImage.product_id,
+            ProductImage.image_url,
+            ProductImage.alt_text,
+            ProductImage.is_primary,
+        )
+        .where(ProductImage.product_id.in_(in_scope))
+        .order_by(ProductImage.display_order, ProductImage.created_at)
+    )
+    categories = _group(
+        select(product_categories.c.product_id, Category.slug, Category.name)
+        .join(Category, Category.id == product_categories.c.category_id)
+        .where(product_categories.c.product_id.in_(in_scope), Category.is_active.is_(True))
+        .order_by(Category.display_order, Category.name)
+    )
+    variants = _group(
+        select(
+            ProductVariant.product_id,
+            ProductVariant.id,
+            ProductVariant.size,
+            ProductVariant.display_order,
+            ProductVariant.sku,
+            ProductVariant.price_adjustment_pence,
+            ProductVariant.fulfilment_type,
+            ProductVariant.units_in_stock,
+            ProductVariant.lead_time_days,
+            ProductVariant.is_active,
+        )
+        .where(ProductVariant.product_id.in_(in_scope), ProductVariant.is_active.is_(True))
+        .order_by(ProductVariant.display_order)
+    )
+    designers = {
+        row.id: {"id": str(row.id), "name": row.name, "slug": row.slug}
+        for row in session.execute(
+            select(Designer.id, Designer.name, Designer.slug).where(
+                Designer.id.in_(select(Product.designer_id).where(scope)),
+                Designer.is_active.is_(True),
+            )
+        )
+    }
+    channels: dict[UUID, list[UUID]] = defaultdict(list)
+    for row in session.execute(
+        select(SalesChannel.id, SalesChannel.tenant_id).where(
+            SalesChannel.tenant_id.in_({p.tenant_id for p in products})
+        )
+    ):
+        channels[row.tenant_id].append(row.id)
+
+    rows = []
+    for product in products:
+        product_pricing = pricing[product.id]
+        # Default price: first active pricing entry
+        default_price = (product_pricing[0].list_price or Decimal("0")) if product_pricing else None
+        channel_prices = {p.sales_channel_id: p.list_price for p in product_pricing}
+        product_images = [
+            {
+                "url": _shop_image_url(i.image_url),
+                "alt": i.alt_text or "",
+                "is_primary": i.is_primary,
+            }
+            for i in images[product.id]
+        ]
+        product_categories_list = [{"slug": c.slug, "name": c.name} for c in categories[product.id]]
+        designer = designers.get(product.designer_id)
+
+        # Channel price if set, otherwise fall back to the default price
+        for channel_id in [None, *channels[product.tenant_id]]:
+            price = channel_prices.get(channel_id) or default_price or Decimal("0")
+            payload, detail = _build_documents(
+                product,
+                price,
+                product_images,
+                product_categories_list,
+                designer,
+                variants[product.id],
+            )
+            rows.append(
+                {
+                    "tenant_id": product.tenant_id,
+                    "product_id": product.id,
+                    "sales_channel_id": channel_id,
+                    "is_active": product.is_active,
+                    "is_dragon": product.is_dragon,
+                    "designer_slug": designer["slug"] if designer else None,
+                    "seo_slug": product.seo_slug,
+                    "price_pence": int(price * 100),
+                    "product_created_at": product.created_at,
+                    "payload": payload,
+                    "detail": detail,
+                }
+            )
+
+    session.execute(insert(ShopProductProjection), rows)
+    logger.debug(f"Rebuilt {len(rows)} shop projection rows for {len(products)} products")
+    return len(rows)
+
+
+def _pending(session: Session | AsyncSession) -> tuple[set[UUID], set[UUID], set[UUID]]:
+    """Get the (product_ids, tenant_ids, dropped channel_ids) awaiting a rebuild."""
+    return session.info.setdefault(_PENDING_KEY, (set(), set(), set()))
+
+
+def _changed(obj: Any, fields: Iterable[str]) -> bool:
+    """Whether any of the given column attributes has unflushed changes."""
+    attrs = inspect(obj).attrs
+    return any(attrs[field].history.has_changes() for field in fields)
+
+
+def mark_products_changed(session: Session | AsyncSession, *product_ids: UUID) -> None:
+    """
+    Queue projection rebuilds for products changed with core DML.
+
+    ORM writes are picked up by the flush hooks; statements such as
+    ``product_categories.insert()`` bypass them, so their callers name the
+    products they touched. The rows are rebuilt when the session commits.
+    """
+    _pending(session)[0].update(product_ids)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_shared_changes(session: Session, flush_context, instances) -> None:
+    """Record products affected by category, designer and sales channel changes."""
+    product_ids, tenant_ids, dropped_channel_ids = _pending(session)
+    category_ids: set[UUID] = set()
+    designer_ids: set[UUID] = set()
+
+    for obj in session.dirty:
+        if isinstance(obj, Category):
+            members = inspect(obj).attrs.products.history
+            product_ids.update(p.id for p in chain(members.added, members.deleted) if p.id)
+            if _changed(obj, _CATEGORY_FIELDS):
+                category_ids.add(obj.id)
+        elif isinstance(obj, Designer) and _changed(obj, _DESIGNER_FIELDS):
+            designer_ids.add(obj.id)
+    for obj in session.deleted:
+        if isinstance(obj, Category):
+            category_ids.add(obj.id)
+        elif isinstance(obj, Designer):
+            designer_ids.add(obj.id)
+        elif isinstance(obj, SalesChannel):
+            dropped_channel_ids.add(obj.id)
+    # A new channel needs a row for every product of its tenant
+    tenant_ids.update(obj.tenant_id for obj in session.new if isinstance(obj, SalesChannel))
+
+    with session.no_autoflush:
+        if category_ids:
+            product_ids.update(
+                session.scalars(
+                    select(product_categories.c.product_id).where(
+                        product_categories.c.category_id.in_(category_ids)
+                    )
+                )
+            )
+        if designer_ids:
+            product_ids.update(
+                session.scalars(select(Product.id).where(Product.designer_id.in_(designer_ids)))
+            )
+        if dropped_channel_ids:
+            # The channel's price may have been a product's default price
+            product_ids.update(
+                session.scalars(
+                    select(ProductPricing.product_id).where(
+                        ProductPricing.sales_channel_id.in_(dropped_channel_ids)
+                    )
+                )
+            )
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, flush_context) -> None:
+    """Record products whose projection rows are affected by a flush."""
+    product_ids = _pending(session)[0]
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Product):
+            product_ids.add(obj.id)
+        elif isinstance(obj, (ProductPricing, ProductImage, ProductVariant)):
+            product_ids.add(obj.product_id)
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_before_commit(session: Session) -> None:
+    """Rebuild affected projection rows as part of the committing transaction."""
+    if session.new or session.dirty or session.deleted:
+        session.flush()
+    product_ids, tenant_ids, dropped_channel_ids = session.info.pop(
+        _PENDING_KEY, (set(), set(), set())
+    )
+    if dropped_channel_ids:
+        session.execute(
+            delete(ShopProductProjection).where(
+                ShopProductProjection.sales_channel_id.in_(dropped_channel_ids)
+            )
+        )
+    if product_ids or tenant_ids:
+        _rebuild(session, product_ids, tenant_ids)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, previous_transaction) -> None:
+    """Forget pending rebuilds when the outermost transaction rolls back."""
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+def projection_channel_filter(channel: Optional[SalesChannel]) -> ColumnElement[bool]:
+    """
+    Select projection rows priced for a shop's sales channel.
+
+    Args:
+        channel: The shop's online_shop channel, or None for default pricing
+    """
+    if channel:
+        return ShopProductProjection.sales_channel_id == channel.id
+    return ShopProductProjection.sales_channel_id.is_(None)
+
+
+async def rebuild_shop_projections(db: AsyncSession, tenant_id: Optional[UUID] = None) -> int:
+    """
+    Rebuild projection rows for a tenant, or for every tenant.
+
+    Used to backfill existing catalogues. Runs in the caller's transaction;
+    the caller commits.
+
+    Args:
+        db: Database session
+        tenant_id: Tenant to rebuild (None = all tenants)
+
+    Returns:
+        Number of projection rows written
+    """
+    if tenant_id is not None:
+        tenant_ids = [tenant_id]
+    else:
+        result = await db.execute(select(Product.tenant_id).distinct())
+        tenant_ids = list(result.scalars().all())
+    return await db.run_sync(lambda session: _rebuild(session, tenant_ids=tenant_ids))
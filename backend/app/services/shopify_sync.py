@@ -22,6 +22,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import get_settings
 from app.models.external_listing import ExternalListing
 from app.models.product import Product
+from app.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -317,66 +318,66 @@ class ShopifySyncService:
         payload = self._build_product_payload(product)
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                if existing_listing and existing_listing.external_id:
-                    # UPDATE existing Shopify product
-                    shopify_id = existing_listing.external_id
-                    resp = await self._shopify_request(
-                        client,
-                        "PUT",
-                        f"{base_url}/products/{shopify_id}.json",
-                        headers=headers,
-                        json=payload,
-                    )
-                    action = "updated"
-                else:
-                    # CREATE new Shopify product
-                    resp = await self._shopify_request(
-                        client,
-                        "POST",
-                        f"{base_url}/products.json",
-                        headers=headers,
-                        json=payload,
-                    )
-                    action = "created"
-
-                if resp.status_code not in (200, 201):
-                    error_body = resp.text[:500]
-                    logger.error(
-                        "Shopify sync failed for product %s: %s %s",
-                        product.id,
-                        resp.status_code,
-                        error_body,
-                    )
-                    listing = await self._upsert_listing(
-                        product,
-                        existing_listing.external_id if existing_listing else "unknown",
-                        "",
-                        status="error",
-                        error=f"HTTP {resp.status_code}: {error_body}",
-                    )
-                    return False, f"Shopify API error {resp.status_code}: {error_body}", listing
-
-                data = resp.json()
-                shopify_product = data["product"]
-                shopify_id = str(shopify_product["id"])
-                shopify_handle = shopify_product.get("handle", "")
-
-                listing = await self._upsert_listing(
-                    product, shopify_id, shopify_handle, status="synced"
+            client = get_http_client("shopify")
+            if existing_listing and existing_listing.external_id:
+                # UPDATE existing Shopify product
+                shopify_id = existing_listing.external_id
+                resp = await self._shopify_request(
+                    client,
+                    "PUT",
+                    f"{base_url}/products/{shopify_id}.json",
+                    headers=headers,
+                    json=payload,
+                )
+                action = "updated"
+            else:
+                # CREATE new Shopify product
+                resp = await self._shopify_request(
+                    client,
+                    "POST",
+                    f"{base_url}/products.json",
+                    headers=headers,
+                    json=payload,
                 )
+                action = "created"
 
-                logger.info(
-                    "Shopify sync %s product %s → Shopify ID %s",
-                    action,
+            if resp.status_code not in (200, 201):
+                error_body = resp.text[:500]
+                logger.error(
+                    "Shopify sync failed for product %s: %s %s",
                     product.id,
-                    shopify_id,
+                    resp.status_code,
+                    error_body,
                 )
-                return (
-                    True,
-                    f"Product {action} on Shopify (ID {shopify_id})",
-                    listing,
+                listing = await self._upsert_listing(
+                    product,
+                    existing_listing.external_id if existing_listing else "unknown",
+                    "",
+                    status="error",
+                    error=f"HTTP {resp.status_code}: {error_body}",
                 )
+                return False, f"Shopify API error {resp.status_code}: {error_body}", listing
+
+            data = resp.json()
+            shopify_product = data["product"]
+            shopify_id = str(shopify_product["id"])
+            shopify_handle = shopify_product.get("handle", "")
+
+            listing = await self._upsert_listing(
+                product, shopify_id, shopify_handle, status="synced"
+            )
+
+            logger.info(
+                "Shopify sync %s product %s → Shopify ID %s",
+                action,
+                product.id,
+                shopify_id,
+            )
+            return (
+                True,
+                f"Product {action} on Shopify (ID {shopify_id})",
+                listing,
+            )
 
         except httpx.HTTPError as exc:
             error_msg = f"HTTP error syncing to Shopify: {exc}"
@@ -389,3 +390,67 @@ class ShopifySyncService:
                 error=error_msg,
             )
             raise ShopifySyncError(error_msg) from exc
+
+
+async def sync_order_fulfillment(
+    shopify_order_id: str,
+    tracking_number: Optional[str],
+    tracking_url: Optional[str],
+    shipping_method: Optional[str],
+) -> None:
+    """Call Shopify Admin API to create a fulfilment for a Shopify order.
+
+    Only runs when SHOPIFY_STORE_DOMAIN and SHOPIFY_ACCESS_TOKEN are configured.
+    Dispatched from the outbox after an order ships; HTTP errors propagate so
+    the dispatcher retries.
+    """
+    cfg = get_settings()
+    if not cfg.shopify_store_domain or not cfg.shopify_access_token:
+        return
+
+    base = f"https://{cfg.shopify_store_domain}/admin/api/{SHOPIFY_API_VERSION}"
+    headers = {
+        "X-Shopify-Access-Token": cfg.shopify_access_token,
+        "Content-Type": "application/json",
+    }
+
+    fulfillment_payload: dict = {
+        "fulfillment": {
+            "notify_customer": True,
+            "line_items_by_fulfillment_order": [],
+        }
+    }
+
+    if tracking_number:
+        fulfillment_payload["fulfillment"]["tracking_info"] = {
+            "number": tracking_number,
+            "url": tracking_url or "",
+            "company": shipping_method or "Carrier",
+        }
+
+    client = get_http_client("shopify")
+    # Fetch open fulfillment orders from Shopify
+    fo_resp = await client.get(
+        f"{base}/orders/{shopify_order_id}/fulfillment_orders.json",
+        headers=headers,
+        timeout=10,
+    )
+    fo_resp.raise_for_status()
+    fulfillment_orders = fo_resp.json().get("fulfillment_orders", [])
+
+    for fo in fulfillment_orders:
+        if fo.get("status") in ("open", "in_progress"):
+            fulfillment_payload["fulfillment"]["line_items_by_fulfillment_order"].append(
+                {"fulfillment_order_id": fo["id"]}
+            )
+
+    if not fulfillment_payload["fulfillment"]["line_items_by_fulfillment_order"]:
+        return
+
+    resp = await client.post(
+        f"{base}/fulfillments.json",
+        headers=headers,
+        json=fulfillment_payload,
+        timeout=10,
+    )
+    resp.raise_for_status()
@@ -17,6 +17,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.spoolmandb import SpoolmanDBFilament, SpoolmanDBManufacturer
+from app.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -33,17 +34,15 @@ class SpoolmanDBSyncService:
 
     async def fetch_filaments_data(self) -> list[dict[str, Any]]:
         """Fetch the compiled filaments.json from SpoolmanDB."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(SPOOLMANDB_FILAMENTS_URL)
-            response.raise_for_status()
-            return response.json()
+        response = await get_http_client("spoolmandb").get(SPOOLMANDB_FILAMENTS_URL)
+        response.raise_for_status()
+        return response.json()
 
     async def fetch_materials_data(self) -> list[dict[str, Any]]:
         """Fetch the materials.json from SpoolmanDB."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(SPOOLMANDB_MATERIALS_URL)
-            response.raise_for_status()
-            return response.json()
+        response = await get_http_client("spoolmandb").get(SPOOLMANDB_MATERIALS_URL)
+        response.raise_for_status()
+        return response.json()
 
     async def sync(self) -> dict[str, int]:
         """
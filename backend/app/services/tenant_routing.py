@@ -0,0 +1,209 @@
+"""In-process tenant routing index for public shop resolution.
+
+Storefront requests resolve their tenant from the X-Shop-Hostname header on
+every call. Resolving a custom domain means several JSON-path lookups over
+``Tenant.settings`` that cannot use an index, followed by a lookup of the
+tenant's online_shop sales channel. This module keeps a per-process map of
+hostname -> (tenant, online_shop channel) so that the hot path is a dict
+lookup.
+
+Entries are stored as detached snapshots and merged into the request session
+with ``load=False``, so no SQL is emitted on a hit. Entries are dropped when
+tenant settings, custom domains, tenant status or sales channels change via
+the services and routes that own them, and expire after a short TTL so that
+changes made by other worker processes are eventually picked up.
+"""
+
+import copy
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TypeVar
+from uuid import UUID
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.models.sales_channel import SalesChannel
+from app.models.tenant import Tenant
+
+logger = logging.getLogger(__name__)
+
+# Default lifetime of a routing entry (seconds). Bounds staleness across workers.
+ROUTE_TTL = 60.0
+
+# Maximum number of hostnames kept in the index (least recently used are evicted)
+MAX_HOSTNAMES = 10_000
+
+ModelT = TypeVar("ModelT", Tenant, SalesChannel)
+
+
+def normalize_hostname(hostname: str) -> str:
+    """Normalize a shop hostname (strip port/whitespace, lowercase)."""
+    return hostname.strip().split(":")[0].lower()
+
+
+def _snapshot(instance: ModelT) -> ModelT:
+    """
+    Build a detached, session-independent copy of a loaded ORM instance.
+
+    Only column attributes are copied; relationships are left unloaded.
+    Mutable JSON values are deep-copied so the snapshot never aliases state
+    owned by the session that loaded the original.
+    """
+    mapper = inspect(instance).mapper
+    values = {attr.key: copy.deepcopy(getattr(instance, attr.key)) for attr in mapper.column_attrs}
+    snapshot = mapper.class_(**values)
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+@dataclass
+class TenantRoute:
+    """A cached routing entry for one tenant."""
+
+    tenant: Tenant
+    channel: SalesChannel | None
+    expires_at: float
+
+
+class TenantRoutingIndex:
+    """
+    Per-process hostname -> (tenant, online_shop channel) index.
+
+    The index is populated lazily: a miss falls back to the database
+    resolution in ``get_shop_tenant`` / ``get_shop_sales_channel``, which
+    then stores the result here.
+    """
+
+    def __init__(self, ttl: float = ROUTE_TTL, max_hostnames: int = MAX_HOSTNAMES):
+        """
+        Initialize the routing index.
+
+        Args:
+            ttl: Lifetime of an entry in seconds
+            max_hostnames: Maximum number of hostnames to keep
+        """
+        self._ttl = ttl
+        self._max_hostnames = max_hostnames
+        self._hostnames: OrderedDict[str, UUID] = OrderedDict()
+        self._routes: dict[UUID, TenantRoute] = {}
+
+    def __len__(self) -> int:
+        return len(self._hostnames)
+
+    def _get_route(self, tenant_id: UUID) -> TenantRoute | None:
+        route = self._routes.get(tenant_id)
+        if route is None:
+            return None
+        if route.expires_at <= time.monotonic():
+            self.invalidate_tenant(tenant_id)
+            return None
+        return route
+
+    def lookup(self, hostname: str) -> TenantRoute | None:
+        """
+        Look up the routing entry for a hostname.
+
+        Args:
+            hostname: Shop hostname (as sent in X-Shop-Hostname)
+
+        Returns:
+            TenantRoute if cached and not expired, None otherwise
+        """
+        hostname = normalize_hostname(hostname)
+        tenant_id = self._hostnames.get(hostname)
+        if tenant_id is None:
+            return None
+
+        route = self._get_route(tenant_id)
+        if route is None:
+            self._hostnames.pop(hostname, None)
+            return None
+
+        self._hostnames.move_to_end(hostname)
+        return route
+
+    def store_tenant(self, hostname: str, tenant: Tenant) -> None:
+        """
+        Record that a hostname resolves to a tenant.
+
+        Args:
+            hostname: Shop hostname that was resolved
+            tenant: Tenant loaded from the database
+        """
+        hostname = normalize_hostname(hostname)
+        route = self._get_route(tenant.id)
+        if route is None:
+            route = TenantRoute(
+                tenant=_snapshot(tenant),
+                channel=None,
+                expires_at=time.monotonic() + self._ttl,
+            )
+            self._routes[tenant.id] = route
+
+        self._hostnames[hostname] = tenant.id
+        self._hostnames.move_to_end(hostname)
+        while len(self._hostnames) > self._max_hostnames:
+            self._hostnames.popitem(last=False)
+
+    def store_channel(self, tenant_id: UUID, channel: SalesChannel) -> None:
+        """
+        Attach the resolved online_shop sales channel to a tenant's entry.
+
+        Args:
+            tenant_id: Tenant the channel belongs to
+            channel: SalesChannel loaded from the database
+        """
+        route = self._get_route(tenant_id)
+        if route is not None:
+            route.channel = _snapshot(channel)
+
+    def get_channel(self, tenant_id: UUID) -> SalesChannel | None:
+        """Get the cached online_shop channel snapshot for a tenant, if any."""
+        route = self._get_route(tenant_id)
+        return route.channel if route is not None else None
+
+    def invalidate_tenant(self, tenant_id: UUID) -> None:
+        """
+        Drop every entry belonging to a tenant.
+
+        Call this whenever a tenant's settings, domains, status or sales
+        channels change.
+        """
+        self._routes.pop(tenant_id, None)
+        stale = [host for host, tid in self._hostnames.items() if tid == tenant_id]
+        for host in stale:
+            del self._hostnames[host]
+        if stale:
+            logger.debug(f"Invalidated {len(stale)} shop routes for tenant {tenant_id}")
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._hostnames.clear()
+        self._routes.clear()
+
+
+async def attach(db: AsyncSession, snapshot: ModelT) -> ModelT:
+    """
+    Attach a cached snapshot to a request session without emitting SQL.
+
+    Args:
+        db: Request database session
+        snapshot: Detached snapshot from the routing index
+
+    Returns:
+        Persistent instance bound to ``db``
+    """
+    return await db.merge(snapshot, load=False)
+
+
+# Process-wide index used by the shop dependencies
+tenant_routing_index = TenantRoutingIndex()
+
+
+def invalidate_tenant_routes(tenant_id: UUID) -> None:
+    """Invalidate cached shop routing for a tenant."""
+    tenant_routing_index.invalidate_tenant(tenant_id)
@@ -11,6 +11,7 @@ from square.core.api_error import ApiError
 
 from app.core.encryption import encrypt_value, mask_credential, safe_decrypt
 from app.models.tenant import Tenant
+from app.services.tenant_routing import invalidate_tenant_routes
 from app.services.square_payment import get_square_environment
 from app.schemas.tenant_settings import (
     BrandingSettingsResponse,
@@ -584,6 +585,7 @@ class TenantSettingsService:
             stmt = update(Tenant).where(Tenant.id == tenant_id).values(**updates)
             await self.db.execute(stmt)
             await self.db.commit()
+            invalidate_tenant_routes(tenant_id)
 
         # Refresh and return
         await self.db.refresh(tenant)
@@ -629,6 +631,9 @@ class TenantSettingsService:
         await self.db.execute(stmt)
         await self.db.commit()
 
+        # Custom domains, shop settings and branding feed public shop routing
+        invalidate_tenant_routes(tenant_id)
+
 
 # Factory function for dependency injection
 async def get_tenant_settings_service(db: AsyncSession) -> TenantSettingsService:
@@ -3,22 +3,22 @@
 Handles:
 - Sending webhooks to subscriber URLs
 - HMAC signature generation
-- Retry logic with exponential backoff
+- Retry logic with exponential backoff (sent by app.services.webhook_worker)
 - Auto-disabling failed subscriptions
 """
 
-import asyncio
 import hashlib
 import hmac
 import json
 import logging
 import secrets
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
 import httpx
-from sqlalchemy import select, update
+from sqlalchemy import Select, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.webhook import (
@@ -27,6 +27,8 @@ from app.models.webhook import (
     WebhookEventType,
     WebhookSubscription,
 )
+from app.utils.http_client import get_http_client
+from app.utils.pagination import KeysetPage, paginate_keyset
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +42,20 @@ MAX_RESPONSE_BODY_LENGTH = 2000
 RETRY_INTERVALS = [60, 300, 900]  # 1 min, 5 min, 15 min
 
 
+@dataclass
+class DeliveryAttempt:
+    """Outcome of a single POST to a subscriber URL."""
+
+    response_code: Optional[int] = None
+    response_body: Optional[str] = None
+    response_time_ms: Optional[int] = None
+    error_message: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error_message is None
+
+
 class WebhookService:
     """Service for managing and delivering webhooks."""
 
@@ -194,7 +210,7 @@ class WebhookService:
         # Generate unique event ID
         event_id = str(uuid4())
 
-        # Create delivery records and send webhooks
+        # Create delivery records; the delivery worker sends them
         deliveries = []
         for subscription in subscriptions:
             delivery = await self._create_delivery(
@@ -206,9 +222,9 @@ class WebhookService:
             )
             deliveries.append(delivery)
 
-            # Send webhook asynchronously (don't block)
-            asyncio.create_task(self._send_webhook(delivery, subscription))
+        from app.services.webhook_worker import wake_webhook_worker
 
+        wake_webhook_worker()
         return deliveries
 
     async def _get_subscriptions_for_event(
@@ -263,6 +279,15 @@ class WebhookService:
         subscription: WebhookSubscription,
     ) -> None:
         """Send webhook and update delivery status."""
+        attempt = await self._attempt_delivery(delivery, subscription)
+        await self._record_attempt(delivery, subscription, attempt)
+
+    async def _attempt_delivery(
+        self,
+        delivery: WebhookDelivery,
+        subscription: WebhookSubscription,
+    ) -> DeliveryAttempt:
+        """POST a delivery to its subscriber without touching the database."""
         try:
             # Generate signature
             payload_bytes = json.dumps(delivery.payload).encode("utf-8")
@@ -283,42 +308,56 @@ class WebhookService:
 
             # Send request
             start_time = datetime.now(timezone.utc)
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    subscription.url,
-                    content=payload_bytes,
-                    headers=headers,
-                    timeout=DELIVERY_TIMEOUT_SECONDS,
-                )
+            response = await get_http_client("webhooks").post(
+                subscription.url,
+                content=payload_bytes,
+                headers=headers,
+                timeout=DELIVERY_TIMEOUT_SECONDS,
+            )
 
             response_time_ms = int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000)
 
-            # Update delivery status
-            if 200 <= response.status_code < 300:
-                await self._mark_success(
-                    delivery,
-                    subscription,
-                    response.status_code,
-                    response.text[:MAX_RESPONSE_BODY_LENGTH],
-                    response_time_ms,
-                )
-            else:
-                await self._mark_failed(
-                    delivery,
-                    subscription,
-                    f"HTTP {response.status_code}",
-                    response.status_code,
-                    response.text[:MAX_RESPONSE_BODY_LENGTH],
-                    response_time_ms,
-                )
+            return DeliveryAttempt(
+                response_code=response.status_code,
+                response_body=response.text[:MAX_RESPONSE_BODY_LENGTH],
+                response_time_ms=response_time_ms,
+                error_message=None
+                if 200 <= response.status_code < 300
+                else f"HTTP {response.status_code}",
+            )
 
         except httpx.TimeoutException:
-            await self._mark_failed(delivery, subscription, "Request timed out")
+            return DeliveryAttempt(error_message="Request timed out")
         except httpx.ConnectError as e:
-            await self._mark_failed(delivery, subscription, f"Connection error: {str(e)}")
+            return DeliveryAttempt(error_message=f"Connection error: {str(e)}")
         except Exception as e:
             logger.exception(f"Webhook delivery error: {e}")
-            await self._mark_failed(delivery, subscription, f"Error: {str(e)}")
+            return DeliveryAttempt(error_message=f"Error: {str(e)}")
+
+    async def _record_attempt(
+        self,
+        delivery: WebhookDelivery,
+        subscription: WebhookSubscription,
+        attempt: DeliveryAttempt,
+    ) -> None:
+        """Persist the outcome of a delivery attempt."""
+        if attempt.succeeded:
+            await self._mark_success(
+                delivery,
+                subscription,
+                attempt.response_code,
+                attempt.response_body,
+                attempt.response_time_ms,
+            )
+        else:
+            await self._mark_failed(
+                delivery,
+                subscription,
+                attempt.error_message,
+                attempt.response_code,
+                attempt.response_body,
+                attempt.response_time_ms,
+            )
 
     def _generate_signature(self, payload: bytes, secret: str) -> str:
         """Generate HMAC-SHA256 signature for payload."""
@@ -438,16 +477,14 @@ class WebhookService:
 
     # ==================== Delivery Management ====================
 
-    async def list_deliveries(
-        self,
+    @staticmethod
+    def _deliveries_query(
         tenant_id: UUID,
         subscription_id: Optional[UUID] = None,
         event_type: Optional[str] = None,
         status: Optional[DeliveryStatus] = None,
-        limit: int = 50,
-        offset: int = 0,
-    ) -> tuple[list[WebhookDelivery], int]:
-        """List webhook deliveries with filtering."""
+    ) -> Select:
+        """Build the filtered delivery query, scoped to the tenant's subscriptions."""
         # Build base query through subscriptions for tenant isolation
         query = (
             select(WebhookDelivery)
@@ -462,27 +499,32 @@ class WebhookService:
         if status:
             query = query.where(WebhookDelivery.status == status.value)
 
-        # Get total count
-        from sqlalchemy import func
+        return query
 
-        count_query = (
-            select(func.count())
-            .select_from(WebhookDelivery)
-            .join(WebhookSubscription)
-            .where(WebhookSubscription.tenant_id == tenant_id)
+    async def _count_deliveries(self, query: Select) -> int:
+        """Count the rows matched by a delivery query."""
+        total_result = await self.db.execute(
+            select(func.count()).select_from(query.order_by(None).subquery())
         )
-        if subscription_id:
-            count_query = count_query.where(WebhookDelivery.subscription_id == subscription_id)
-        if event_type:
-            count_query = count_query.where(WebhookDelivery.event_type == event_type)
-        if status:
-            count_query = count_query.where(WebhookDelivery.status == status.value)
+        return total_result.scalar() or 0
 
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
+    async def list_deliveries(
+        self,
+        tenant_id: UUID,
+        subscription_id: Optional[UUID] = None,
+        event_type: Optional[str] = None,
+        status: Optional[DeliveryStatus] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[WebhookDelivery], int]:
+        """List webhook deliveries with filtering."""
+        query = self._deliveries_query(tenant_id, subscription_id, event_type, status)
+
+        # Get total count
+        total = await self._count_deliveries(query)
 
         # Get deliveries
-        query = query.order_by(WebhookDelivery.created_at.desc())
+        query = query.order_by(WebhookDelivery.created_at.desc(), WebhookDelivery.id.desc())
         query = query.offset(offset).limit(limit)
 
         result = await self.db.execute(query)
@@ -490,6 +532,39 @@ class WebhookService:
 
         return deliveries, total
 
+    async def list_deliveries_keyset(
+        self,
+        tenant_id: UUID,
+        subscription_id: Optional[UUID] = None,
+        event_type: Optional[str] = None,
+        status: Optional[DeliveryStatus] = None,
+        limit: int = 50,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        include_total: bool = False,
+    ) -> tuple[KeysetPage[WebhookDelivery], Optional[int]]:
+        """
+        List webhook deliveries with keyset pagination over (created_at, id).
+
+        The total is only counted when ``include_total`` is set.
+
+        Raises:
+            InvalidCursorError: If a cursor is malformed
+        """
+        query = self._deliveries_query(tenant_id, subscription_id, event_type, status)
+
+        total = await self._count_deliveries(query) if include_total else None
+        page = await paginate_keyset(
+            self.db,
+            query,
+            WebhookDelivery.created_at,
+            WebhookDelivery.id,
+            limit,
+            after=after,
+            before=before,
+        )
+        return page, total
+
     async def get_delivery(self, delivery_id: UUID, tenant_id: UUID) -> Optional[WebhookDelivery]:
         """Get a specific delivery by ID."""
         result = await self.db.execute(
@@ -525,8 +600,9 @@ class WebhookService:
 
         await self.db.commit()
 
-        # Send webhook
-        asyncio.create_task(self._send_webhook(delivery, subscription))
+        from app.services.webhook_worker import wake_webhook_worker
+
+        wake_webhook_worker()
 
         return delivery
 
@@ -570,13 +646,12 @@ class WebhookService:
 
         try:
             start_time = datetime.now(timezone.utc)
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    subscription.url,
-                    content=payload_bytes,
-                    headers=headers,
-                    timeout=DELIVERY_TIMEOUT_SECONDS,
-                )
+            response = await get_http_client("webhooks").post(
+                subscription.url,
+                content=payload_bytes,
+                headers=headers,
+                timeout=DELIVERY_TIMEOUT_SECONDS,
+            )
 
             response_time_ms = int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000)
 
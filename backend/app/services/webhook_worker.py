@@ -0,0 +1,272 @@
+"""Background delivery worker for outbound webhooks.
+
+``WebhookService.trigger_event`` only writes ``pending`` delivery rows; this
+worker sends them. Each poll claims due rows with ``FOR UPDATE SKIP LOCKED``
+and pushes their ``next_retry_at`` forward by a lease before committing, so
+any number of worker processes can share the queue without double-sending,
+and a delivery whose worker dies becomes due again once its lease expires.
+Failed attempts are rescheduled by ``WebhookService._mark_failed`` using
+``RETRY_INTERVALS``.
+
+The worker runs inside the API process by default (started from the app
+lifespan) or standalone via ``python -m scripts.run_webhook_worker``.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import raiseload
+
+from app.config import get_settings
+from app.database import async_session_maker, set_tenant_context
+from app.models.webhook import DeliveryStatus, WebhookDelivery, WebhookSubscription
+from app.services.webhook_service import DELIVERY_TIMEOUT_SECONDS, WebhookService
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class WebhookDeliveryWorker:
+    """Claims due webhook deliveries and sends them with bounded concurrency."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_maker,
+        *,
+        concurrency: Optional[int] = None,
+        per_subscription: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        lease_seconds: Optional[int] = None,
+    ):
+        """Initialize the worker.
+
+        Args:
+            session_factory: Session factory for claiming and recording deliveries
+            concurrency: Maximum deliveries in flight in this process
+            per_subscription: Maximum deliveries in flight per subscription
+            poll_interval: Seconds to sleep when no work is due
+            lease_seconds: How long a claimed delivery is hidden from other workers
+        """
+        self._session_factory = session_factory
+        self.concurrency = concurrency or settings.webhook_worker_concurrency
+        self.per_subscription = per_subscription or settings.webhook_worker_per_subscription
+        self.poll_interval = poll_interval or settings.webhook_worker_poll_interval_seconds
+        self.lease_seconds = lease_seconds or settings.webhook_worker_lease_seconds
+
+        self._in_flight: Counter[UUID] = Counter()
+        self._tasks: set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
+        self._runner: Optional[asyncio.Task] = None
+
+    # ==================== Claiming ====================
+
+    async def claim_due(self, limit: int) -> list[tuple[UUID, UUID]]:
+        """Lease up to ``limit`` due deliveries.
+
+        Rows for subscriptions already at their concurrency cap are left
+        unclaimed so another worker (or a later poll) can pick them up.
+
+        Returns:
+            (delivery_id, subscription_id) pairs now leased to this worker
+        """
+        now = datetime.now(timezone.utc)
+        query = (
+            select(WebhookDelivery.id, WebhookDelivery.subscription_id)
+            .where(
+                WebhookDelivery.status == DeliveryStatus.PENDING.value,
+                or_(
+                    WebhookDelivery.next_retry_at.is_(None),
+                    WebhookDelivery.next_retry_at <= now,
+                ),
+            )
+            .order_by(
+                WebhookDelivery.next_retry_at.asc().nulls_first(),
+                WebhookDelivery.created_at,
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        saturated = [
+            subscription_id
+            for subscription_id, count in self._in_flight.items()
+            if count >= self.per_subscription
+        ]
+        if saturated:
+            query = query.where(WebhookDelivery.subscription_id.notin_(saturated))
+
+        async with self._session_factory() as db:
+            rows = (await db.execute(query)).all()
+
+            claimed: list[tuple[UUID, UUID]] = []
+            taken: Counter[UUID] = Counter()
+            for delivery_id, subscription_id in rows:
+                if self._in_flight[subscription_id] + taken[subscription_id] >= (
+                    self.per_subscription
+                ):
+                    continue
+                taken[subscription_id] += 1
+                claimed.append((delivery_id, subscription_id))
+
+            if claimed:
+                await db.execute(
+                    update(WebhookDelivery)
+                    .where(WebhookDelivery.id.in_([delivery_id for delivery_id, _ in claimed]))
+                    .values(next_retry_at=now + timedelta(seconds=self.lease_seconds))
+                )
+            await db.commit()
+
+        return claimed
+
+    # ==================== Delivery ====================
+
+    async def deliver(self, delivery_id: UUID) -> None:
+        """Send one claimed delivery and record the outcome.
+
+        The HTTP request runs between transactions so no database connection
+        is held while waiting on the subscriber.
+        """
+        async with self._session_factory() as db:
+            delivery = await db.get(
+                WebhookDelivery, delivery_id, options=[raiseload(WebhookDelivery.subscription)]
+            )
+            if delivery is None or delivery.status != DeliveryStatus.PENDING.value:
+                return
+
+            tenant_id = delivery.payload.get("tenant_id")
+            await set_tenant_context(db, tenant_id)
+            subscription = await db.get(WebhookSubscription, delivery.subscription_id)
+
+            if subscription is None or not subscription.is_active:
+                await db.execute(
+                    update(WebhookDelivery)
+                    .where(WebhookDelivery.id == delivery.id)
+                    .values(
+                        status=DeliveryStatus.FAILED.value,
+                        error_message="Subscription is inactive",
+                        completed_at=datetime.now(timezone.utc),
+                    )
+                )
+                await db.commit()
+                return
+            await db.commit()
+
+            service = WebhookService(db)
+            attempt = await service._attempt_delivery(delivery, subscription)
+
+            await set_tenant_context(db, tenant_id)
+            await service._record_attempt(delivery, subscription, attempt)
+
+    async def _deliver_tracked(self, delivery_id: UUID, subscription_id: UUID) -> None:
+        try:
+            await self.deliver(delivery_id)
+        except Exception:
+            # The lease expires and another poll retries the delivery
+            logger.exception(f"Webhook worker failed to process delivery {delivery_id}")
+        finally:
+            self._in_flight[subscription_id] -= 1
+            if self._in_flight[subscription_id] <= 0:
+                del self._in_flight[subscription_id]
+            self._wakeup.set()
+
+    # ==================== Run Loop ====================
+
+    async def run_once(self) -> int:
+        """Claim as many due deliveries as there is free capacity and start them.
+
+        Returns:
+            Number of deliveries started
+        """
+        free = self.concurrency - len(self._tasks)
+        if free <= 0:
+            return 0
+
+        claimed = await self.claim_due(free)
+        for delivery_id, subscription_id in claimed:
+            self._in_flight[subscription_id] += 1
+            task = asyncio.create_task(self._deliver_tracked(delivery_id, subscription_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        return len(claimed)
+
+    async def run_forever(self) -> None:
+        """Poll for due deliveries until cancelled."""
+        while True:
+            self._wakeup.clear()
+            try:
+                started = await self.run_once()
+            except Exception:
+                logger.exception("Webhook worker poll failed")
+                started = 0
+
+            # More may be due; keep claiming while there is capacity
+            if started and len(self._tasks) < self.concurrency:
+                continue
+
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+
+    def wake(self) -> None:
+        """Poll immediately instead of waiting for the next interval."""
+        self._wakeup.set()
+
+    def start(self) -> None:
+        """Start the run loop on the current event loop (idempotent)."""
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(self.run_forever())
+
+    async def stop(self, timeout: float = DELIVERY_TIMEOUT_SECONDS) -> None:
+        """Stop claiming and give in-flight deliveries ``timeout`` seconds to finish.
+
+        Deliveries still running after that are cancelled; their leases expire
+        and they are sent again by the next worker to poll.
+        """
+        if self._runner is not None:
+            self._runner.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._runner
+            self._runner = None
+
+        if self._tasks:
+            _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+# In-process worker (started from the app lifespan)
+_worker: Optional[WebhookDeliveryWorker] = None
+
+
+def start_webhook_worker() -> WebhookDeliveryWorker:
+    """Start the in-process delivery worker."""
+    global _worker
+    if _worker is None:
+        _worker = WebhookDeliveryWorker()
+    _worker.start()
+    return _worker
+
+
+async def stop_webhook_worker() -> None:
+    """Stop the in-process delivery worker, if running."""
+    global _worker
+    if _worker is not None:
+        await _worker.stop()
+        _worker = None
+
+
+def wake_webhook_worker() -> None:
+    """Nudge the in-process worker after new deliveries are queued.
+
+    A no-op when deliveries are sent by a separate worker process; that
+    process picks them up on its next poll.
+    """
+    if _worker is not None:
+        _worker.wake()
@@ -0,0 +1,172 @@
+"""Streaming file responses with HTTP Range support.
+
+Storage backends describe an object as a ``StoredFile``: local files by
+path, remote objects by a ``read_range`` callable that yields the chunks of
+a byte range. ``stream_file_response`` turns either into a response whose
+memory use does not depend on the object's size:
+
+- Local files are served by Starlette's ``FileResponse``, which handles
+  ``Range``/``If-Range`` itself and hands the file to the server's
+  zero-copy path (``http.response.pathsend``) when the server supports it.
+- Remote objects are streamed in ``CHUNK_SIZE`` pieces. A single ``Range``
+  is forwarded to the backend so only the requested bytes are fetched.
+"""
+
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import AsyncIterator, Callable, Optional
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+from app.utils.worker_pool import BoundedExecutor
+
+# Bytes read from remote storage per chunk
+CHUNK_SIZE = 1024 * 1024
+
+
+class RangeNotSatisfiableError(ValueError):
+    """Raised when a Range header lies entirely outside the object."""
+
+
+@dataclass
+class StoredFile:
+    """A stored object ready to be streamed to a client."""
+
+    size: int
+    content_type: str
+    path: Optional[Path] = None
+    read_range: Optional[Callable[[int, int], AsyncIterator[bytes]]] = None
+    etag: Optional[str] = None
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[tuple[int, int]]:
+    """
+    Parse a single-range ``Range`` header.
+
+    Args:
+        header: The request's Range header
+        size: Object size in bytes
+
+    Returns:
+        Inclusive (start, end) byte positions, or None to serve the whole
+        object (no header, malformed header or multiple ranges)
+
+    Raises:
+        RangeNotSatisfiableError: If the range starts beyond the object
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, separator, last = spec.strip().partition("-")
+    if not separator:
+        return None
+
+    try:
+        start = int(first) if first else None
+        end = int(last) if last else None
+    except ValueError:
+        return None
+
+    if start is None:
+        # Suffix range: the last ``end`` bytes
+        if end is None or end < 0:
+            return None
+        if end == 0 or size == 0:
+            raise RangeNotSatisfiableError(header)
+        return max(size - end, 0), size - 1
+
+    if start < 0 or (end is not None and end < start):
+        return None
+    if start >= size:
+        raise RangeNotSatisfiableError(header)
+    end = size - 1 if end is None else min(end, size - 1)
+    return start, end
+
+
+def s3_range_reader(
+    client, bucket: str, key: str, pool: BoundedExecutor
+) -> Callable[[int, int], AsyncIterator[bytes]]:
+    """
+    Build a ``read_range`` callable for an S3/MinIO object.
+
+    Each range is fetched with one ranged ``GetObject`` and read in
+    ``CHUNK_SIZE`` pieces on ``pool``. Only the first call is subject to the
+    pool's queue cap, so an admitted download is not cut off midway.
+    """
+
+    async def read_range(start: int, end: int) -> AsyncIterator[bytes]:
+        get_object = partial(
+            client.get_object, Bucket=bucket, Key=key, Range=f"bytes={start}-{end}"
+        )
+        response = await pool.run("stream", get_object)
+        body = response["Body"]
+        try:
+            while True:
+                chunk = await pool.run("stream", body.read, CHUNK_SIZE, bounded=False)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            body.close()
+
+    return read_range
+
+
+def stream_file_response(
+    request: Request,
+    stored: StoredFile,
+    headers: Optional[dict[str, str]] = None,
+) -> Response:
+    """
+    Build a streaming response for a stored object, honouring ``Range``.
+
+    Args:
+        request: The incoming request (for Range/If-Range)
+        stored: Object to serve
+        headers: Extra response headers (caching, Content-Disposition). An
+            ETag given here takes precedence over the stored one.
+
+    Returns:
+        200 with the whole object, 206 with the requested range, or 416 if
+        the range is not satisfiable
+    """
+    headers = dict(headers or {})
+    if stored.etag:
+        headers.setdefault("ETag", stored.etag)
+
+    if stored.path is not None:
+        return FileResponse(stored.path, media_type=stored.content_type, headers=headers)
+
+    headers["Accept-Ranges"] = "bytes"
+    byte_range = None
+    if_range = request.headers.get("if-range")
+    if if_range is None or if_range == headers.get("ETag"):
+        try:
+            byte_range = parse_range(request.headers.get("range"), stored.size)
+        except RangeNotSatisfiableError:
+            return Response(
+                status_code=416,
+                headers={"Content-Range": f"bytes */{stored.size}", "Accept-Ranges": "bytes"},
+            )
+
+    if stored.size == 0:
+        return Response(content=b"", media_type=stored.content_type, headers=headers)
+
+    status_code = 200
+    start, end = 0, stored.size - 1
+    if byte_range is not None:
+        status_code = 206
+        start, end = byte_range
+        headers["Content-Range"] = f"bytes {start}-{end}/{stored.size}"
+    headers["Content-Length"] = str(end - start + 1)
+
+    return StreamingResponse(
+        stored.read_range(start, end),
+        status_code=status_code,
+        media_type=stored.content_type,
+        headers=headers,
+    )
@@ -0,0 +1,138 @@
+"""Shared outbound HTTP clients.
+
+Opening an ``httpx.AsyncClient`` per call throws away its connection pool, so
+every request pays a fresh TCP and TLS handshake. Integrations instead call
+``get_http_client(name)`` and reuse one long-lived client per integration
+(webhooks, email, shopify, ...). Each client keeps a keep-alive pool per
+destination host, negotiates HTTP/2 when the optional ``h2`` package is
+installed, and uses the limits and timeouts from settings; calls may still
+pass a per-request ``timeout``. Separate clients per integration keep a slow
+destination from exhausting the pool another integration depends on.
+
+Every request is timed and counted per client and destination host. Clients
+are created on first use and closed from the application lifespan.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import time
+from typing import Optional
+
+import httpx
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def _record_request(
+    client: str, host: str, outcome: str, duration: float, error_type: Optional[str] = None
+) -> None:
+    """Record latency and outcome metrics for an outbound request."""
+    try:
+        from app.observability.metrics import record_outbound_http_request
+
+        record_outbound_http_request(client, host, outcome, duration, error_type=error_type)
+    except Exception as e:
+        logger.debug(f"Failed to record outbound HTTP metrics: {e}")
+
+
+class _InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that times each request per destination host.
+
+    Timing covers connection setup and waiting for response headers, which
+    is where pooling pays off; body streaming is left to the caller.
+    """
+
+    def __init__(self, name: str, transport: httpx.AsyncBaseTransport):
+        self._name = name
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        host = request.url.host
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception as e:
+            _record_request(
+                self._name,
+                host,
+                "error",
+                time.perf_counter() - start,
+                error_type=type(e).__name__,
+            )
+            raise
+        _record_request(
+            self._name, host, f"{response.status_code // 100}xx", time.perf_counter() - start
+        )
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def create_http_client(name: str) -> httpx.AsyncClient:
+    """Create a pooled, instrumented client configured from settings."""
+    settings = get_settings()
+    http2 = settings.http_client_http2 and _http2_available()
+    limits = httpx.Limits(
+        max_connections=settings.http_client_max_connections,
+        max_keepalive_connections=settings.http_client_max_keepalive_connections,
+        keepalive_expiry=settings.http_client_keepalive_expiry_seconds,
+    )
+    transport = httpx.AsyncHTTPTransport(limits=limits, http2=http2, retries=0)
+    return httpx.AsyncClient(
+        transport=_InstrumentedTransport(name, transport),
+        timeout=httpx.Timeout(
+            settings.http_client_timeout_seconds,
+            connect=settings.http_client_connect_timeout_seconds,
+        ),
+    )
+
+
+class HttpClientRegistry:
+    """One shared client per integration name.
+
+    Clients are bound to the event loop they were created on; a call from a
+    different loop (e.g. a script running ``asyncio.run`` twice) gets a new
+    client rather than one whose connections belong to a closed loop.
+    """
+
+    def __init__(self):
+        self._clients: dict[str, tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(name)
+        if entry is None or entry[0].is_closed or entry[1] is not loop:
+            entry = (create_http_client(name), loop)
+            self._clients[name] = entry
+        return entry[0]
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        clients, self._clients = self._clients, {}
+        for client, client_loop in clients.values():
+            if client_loop is loop:
+                await client.aclose()
+
+
+_registry = HttpClientRegistry()
+
+
+def get_http_client(name: str = "default") -> httpx.AsyncClient:
+    """Get the shared client for an integration (created on first use).
+
+    Do not close the returned client or use it as a context manager.
+    """
+    return _registry.get(name)
+
+
+async def close_http_clients() -> None:
+    """Close all shared clients (called on application shutdown)."""
+    await _registry.aclose()
@@ -0,0 +1,161 @@
+"""Keyset (cursor) pagination helpers.
+
+Offset paging makes the database walk and discard every row before the
+requested page, so deep pages get slower as a listing grows. Keyset paging
+instead filters on the last row seen: ``(sort_value, id) < cursor`` for a
+descending listing. With a composite index on the sort columns, every page
+costs the same as the first.
+
+Cursors are opaque URL-safe tokens that encode the sort value and id of the
+boundary row. Pass a page's ``next_cursor`` as ``after`` to get the following
+page and its ``prev_cursor`` as ``before`` to go back.
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, Optional, TypeVar, Union
+from uuid import UUID
+
+from sqlalchemy import Select, literal, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+T = TypeVar("T")
+
+# Sort values a cursor can carry: timestamps or integer amounts (e.g. pence)
+SortValue = Union[datetime, int]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position of a boundary row in a keyset-paginated listing."""
+
+    sort_value: SortValue
+    id: UUID
+
+
+def encode_cursor(sort_value: SortValue, row_id: UUID) -> str:
+    """
+    Encode a boundary row as an opaque cursor token.
+
+    Args:
+        sort_value: Value of the row's sort column
+        row_id: Row primary key (tie-breaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    value = sort_value.isoformat() if isinstance(sort_value, datetime) else sort_value
+    raw = json.dumps({"v": value, "id": str(row_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """
+    Decode a cursor token produced by ``encode_cursor``.
+
+    Raises:
+        InvalidCursorError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value = data["v"]
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        elif isinstance(value, bool) or not isinstance(value, int):
+            raise TypeError("Unsupported cursor sort value")
+        return Cursor(sort_value=value, id=UUID(data["id"]))
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+@dataclass
+class KeysetPage(Generic[T]):
+    """One page of a keyset-paginated listing."""
+
+    items: list[T]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+async def paginate_keyset(
+    db: AsyncSession,
+    query: Select,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    limit: int,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    descending: bool = True,
+) -> KeysetPage[Any]:
+    """
+    Fetch one page of ``query`` ordered by ``(sort_column, id_column)``.
+
+    ``query`` must not already be ordered or limited. Rows are returned as
+    ``scalars()`` of the query, so it should select a single entity or column.
+
+    Args:
+        db: Database session
+        query: Filtered select to paginate
+        sort_column: Column the listing is ordered by (e.g. ``created_at``);
+            must hold timestamps or integers
+        id_column: Unique tie-breaker column (primary key)
+        limit: Page size
+        after: Cursor of the row to continue after (next page)
+        before: Cursor of the row to stop before (previous page)
+        descending: Order newest first (default) or oldest first
+
+    Returns:
+        KeysetPage with the rows and cursors for the adjacent pages
+
+    Raises:
+        InvalidCursorError: If ``after`` or ``before`` is malformed
+    """
+    if after and before:
+        raise InvalidCursorError("Pass either 'after' or 'before', not both")
+
+    key = tuple_(sort_column, id_column)
+    # Paging backwards walks the index in the opposite direction, then flips
+    backwards = bool(before)
+    walk_descending = descending != backwards
+
+    cursor_token = before if backwards else after
+    if cursor_token:
+        cursor = decode_cursor(cursor_token)
+        boundary = tuple_(
+            literal(cursor.sort_value, sort_column.type), literal(cursor.id, id_column.type)
+        )
+        query = query.where(key < boundary if walk_descending else key > boundary)
+
+    if walk_descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    result = await db.execute(query.limit(limit + 1))
+    rows = list(result.scalars().all())
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if backwards:
+        rows.reverse()
+
+    def _cursor_for(row: Any) -> str:
+        return encode_cursor(getattr(row, sort_column.key), getattr(row, id_column.key))
+
+    next_cursor = prev_cursor = None
+    if rows:
+        if backwards:
+            prev_cursor = _cursor_for(rows[0]) if has_more else None
+            next_cursor = _cursor_for(rows[-1])
+        else:
+            next_cursor = _cursor_for(rows[-1]) if has_more else None
+            prev_cursor = _cursor_for(rows[0]) if after else None
+
+    return KeysetPage(items=rows, next_cursor=next_cursor, prev_cursor=prev_cursor)
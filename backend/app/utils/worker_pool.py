@@ -0,0 +1,125 @@
+"""Bounded thread pools for blocking work called from async code.
+
+CPU-heavy libraries (bcrypt, Pillow) and blocking clients (boto3) must not
+run on the event loop. ``BoundedExecutor`` runs them on a fixed number of
+threads with a cap on queued calls: once ``workers + max_pending`` calls are
+in flight, new ones fail fast with ``WorkerPoolBusyError`` (surfaced as 503)
+instead of piling up. Each call is timed per pool and stage.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class WorkerPoolBusyError(Exception):
+    """Raised when a worker pool's queue is full."""
+
+
+def _record_task(pool: str, stage: str, duration: float) -> None:
+    """Record latency metrics for a pooled call."""
+    try:
+        from app.observability.metrics import record_worker_pool_task
+
+        record_worker_pool_task(pool, stage, duration)
+    except Exception as e:
+        logger.debug(f"Failed to record worker pool metrics: {e}")
+
+
+def _record_queue_change(pool: str, delta: int, rejected_stage: Optional[str] = None) -> None:
+    """Record queue depth changes and rejections."""
+    try:
+        from app.observability.metrics import record_worker_pool_queue
+
+        record_worker_pool_queue(pool, delta, rejected_stage=rejected_stage)
+    except Exception as e:
+        logger.debug(f"Failed to record worker pool metrics: {e}")
+
+
+class BoundedExecutor:
+    """
+    Thread pool with bounded concurrency and a bounded queue.
+
+    At most ``workers`` calls run concurrently; up to ``max_pending`` more
+    wait for a free thread. Threads are started lazily on first use.
+    """
+
+    def __init__(self, name: str, workers: int, max_pending: int):
+        """
+        Initialize the executor.
+
+        Args:
+            name: Pool name used for thread names and metrics
+            workers: Number of worker threads
+            max_pending: Calls allowed to wait for a free worker
+        """
+        self.name = name
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls running or queued."""
+        return self._in_flight
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix=self.name
+            )
+        return self._executor
+
+    async def run(
+        self,
+        stage: str,
+        fn: Callable[..., T],
+        *args,
+        busy_error: type[WorkerPoolBusyError] = WorkerPoolBusyError,
+        bounded: bool = True,
+    ) -> T:
+        """
+        Run ``fn(*args)`` on the pool and await its result.
+
+        Args:
+            stage: Stage name recorded in metrics (e.g. resize, upload)
+            fn: Blocking callable
+            *args: Positional arguments for ``fn``
+            busy_error: Exception type raised when the queue is full
+            bounded: Apply the queue cap. Pass False for calls that continue
+                work already admitted (e.g. later chunks of a streamed
+                download), which must not fail halfway through.
+
+        Returns:
+            The callable's return value (its exceptions propagate)
+
+        Raises:
+            WorkerPoolBusyError: If the pool's queue is full
+        """
+        if bounded and self._in_flight >= self.workers + self.max_pending:
+            _record_queue_change(self.name, 0, rejected_stage=stage)
+            raise busy_error(f"Too many queued {self.name} tasks")
+
+        self._in_flight += 1
+        _record_queue_change(self.name, 1)
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self._in_flight -= 1
+            _record_queue_change(self.name, -1)
+            _record_task(self.name, stage, time.perf_counter() - start)
+
+    def shutdown(self) -> None:
+        """Stop the worker threads (waits for running calls)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,33 @@
+"""Backfill or rebuild the product and model cost snapshots.
+
+Run once after applying the cost snapshots migration. Edits to models, bills
+of materials, products and consumable prices keep the snapshots up to date
+automatically; this recomputes every one of them, and can be re-run at any
+time to repair drift (e.g. after editing costs directly in the database).
+
+Usage:
+    python -m scripts.backfill_cost_snapshots [TENANT_ID]
+"""
+
+import asyncio
+import sys
+from uuid import UUID
+
+from app.database import async_session_maker
+from app.services.cost_snapshots import rebuild_cost_snapshots
+
+
+async def main():
+    """Main backfill function."""
+    tenant_id = UUID(sys.argv[1]) if len(sys.argv) > 1 else None
+    print(f"Rebuilding cost snapshots for {tenant_id or 'all tenants'}...")
+
+    async with async_session_maker() as db:
+        models, products = await rebuild_cost_snapshots(db, tenant_id)
+        await db.commit()
+
+    print(f"\nBackfill complete: {models} model and {products} product snapshots written")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
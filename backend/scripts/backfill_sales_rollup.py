@@ -0,0 +1,33 @@
+"""Backfill or rebuild the daily product sales rollup.
+
+Run once after applying the daily_product_sales migration. New orders,
+cancellations and refunds keep the rollup up to date automatically; this
+re-aggregates it from the full order history, and can be re-run at any time
+to repair drift (e.g. after editing orders directly in the database).
+
+Usage:
+    python -m scripts.backfill_sales_rollup [TENANT_ID]
+"""
+
+import asyncio
+import sys
+from uuid import UUID
+
+from app.database import async_session_maker
+from app.services.sales_rollup import rebuild_sales_rollup
+
+
+async def main():
+    """Main backfill function."""
+    tenant_id = UUID(sys.argv[1]) if len(sys.argv) > 1 else None
+    print(f"Rebuilding daily sales rollup for {tenant_id or 'all tenants'}...")
+
+    async with async_session_maker() as db:
+        rows = await rebuild_sales_rollup(db, tenant_id)
+        await db.commit()
+
+    print(f"\nBackfill complete: {rows} rollup rows written")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,32 @@
+"""Backfill shop product projections for existing catalogues.
+
+Run once after applying the shop_product_projections migration. New writes
+keep the projection up to date automatically; this rebuilds rows for
+products that existed before the table did.
+
+Usage:
+    python -m scripts.backfill_shop_projections [TENANT_ID]
+"""
+
+import asyncio
+import sys
+from uuid import UUID
+
+from app.database import async_session_maker
+from app.services.shop_projection import rebuild_shop_projections
+
+
+async def main():
+    """Main backfill function."""
+    tenant_id = UUID(sys.argv[1]) if len(sys.argv) > 1 else None
+    print(f"Rebuilding shop projections for {tenant_id or 'all tenants'}...")
+
+    async with async_session_maker() as db:
+        rows = await rebuild_shop_projections(db, tenant_id)
+        await db.commit()
+
+    print(f"\nBackfill complete: {rows} projection rows written")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
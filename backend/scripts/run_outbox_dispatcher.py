@@ -0,0 +1,39 @@
+"""Run the transactional outbox dispatcher as a standalone process.
+
+Dispatchers claim events with FOR UPDATE SKIP LOCKED, so several can run
+side by side. Set OUTBOX_DISPATCHER_IN_PROCESS=false on the API to leave
+dispatch entirely to these processes.
+
+Usage:
+    python -m scripts.run_outbox_dispatcher
+"""
+
+import asyncio
+import signal
+
+from app.database import close_db
+from app.services.outbox import OutboxDispatcher
+from app.utils.http_client import close_http_clients
+
+
+async def main():
+    """Run the dispatcher until SIGINT/SIGTERM."""
+    dispatcher = OutboxDispatcher()
+    stop = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    dispatcher.start()
+    print(f"Outbox dispatcher running (concurrency={dispatcher.concurrency})")
+
+    await stop.wait()
+    print("Stopping outbox dispatcher...")
+    await dispatcher.stop()
+    await close_http_clients()
+    await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
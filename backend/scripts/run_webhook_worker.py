@@ -0,0 +1,43 @@
+"""Run the webhook delivery worker as a standalone process.
+
+Start as many of these as needed to scale delivery throughput; workers claim
+rows with FOR UPDATE SKIP LOCKED so they never send the same delivery twice.
+Set WEBHOOK_WORKER_IN_PROCESS=false on the API to leave delivery entirely to
+these processes.
+
+Usage:
+    python -m scripts.run_webhook_worker
+"""
+
+import asyncio
+import signal
+
+from app.database import close_db
+from app.services.webhook_worker import WebhookDeliveryWorker
+from app.utils.http_client import close_http_clients
+
+
+async def main():
+    """Run the worker until SIGINT/SIGTERM."""
+    worker = WebhookDeliveryWorker()
+    stop = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    worker.start()
+    print(
+        f"Webhook worker running (concurrency={worker.concurrency}, "
+        f"per_subscription={worker.per_subscription})"
+    )
+
+    await stop.wait()
+    print("Stopping webhook worker...")
+    await worker.stop()
+    await close_http_clients()
+    await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -132,6 +132,37 @@ class TestCustomerLogin:
         assert "refresh_token" in data
         assert data["customer"]["email"] == "login@example.com"
 
+    @pytest.mark.asyncio
+    async def test_login_upgrades_outdated_hash(
+        self,
+        unauthenticated_client: AsyncClient,
+        test_tenant,
+        db_session,
+    ):
+        """Test that logging in rehashes a password stored with an old bcrypt cost."""
+        from app.auth.password import get_password_hash, needs_rehash, settings
+
+        old_rounds = 4 if settings.password_hash_rounds != 4 else 5
+        customer = Customer(
+            tenant_id=test_tenant.id,
+            email="rehash@example.com",
+            full_name="Rehash Test",
+            hashed_password=get_password_hash("correctpassword", rounds=old_rounds),
+        )
+        db_session.add(customer)
+        await db_session.commit()
+
+        response = await unauthenticated_client.post(
+            "/api/v1/customer/auth/login",
+            json={"email": "rehash@example.com", "password": "correctpassword"},
+            headers={"X-Shop-Hostname": f"{test_tenant.slug}.batchivo.com"},
+        )
+
+        assert response.status_code == 200
+        await db_session.refresh(customer)
+        assert not needs_rehash(customer.hashed_password)
+        assert customer.verify_password("correctpassword")
+
     @pytest.mark.asyncio
     async def test_login_wrong_password(
         self,
@@ -6,6 +6,7 @@ from uuid import uuid4
 
 import pytest_asyncio
 from httpx import AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.filament_type import FilamentType
@@ -198,6 +199,41 @@ class TestDashboardSummary:
         response = await client.get("/api/v1/dashboard/summary?low_stock_threshold=20")
         assert response.status_code == 200
 
+    async def test_summary_refreshed_after_production_run_write(
+        self,
+        client: AsyncClient,
+    ):
+        """Test that creating a run is visible despite the cached summary."""
+        response = await client.get("/api/v1/dashboard/summary")
+        assert response.json()["active_prints"] == 0
+
+        response = await client.post(
+            "/api/v1/production-runs",
+            json={"started_at": datetime.now(timezone.utc).isoformat(), "status": "in_progress"},
+        )
+        assert response.status_code == 201
+
+        response = await client.get("/api/v1/dashboard/summary")
+        assert response.json()["active_prints"] == 1
+
+    async def test_summary_refreshed_after_spool_write(
+        self,
+        client: AsyncClient,
+        low_stock_spool: Spool,
+    ):
+        """Test that a spool top-up is visible despite the cached summary."""
+        response = await client.get("/api/v1/dashboard/summary?low_stock_threshold=10")
+        assert response.json()["low_stock_count"] == 1
+
+        response = await client.put(
+            f"/api/v1/spools/{low_stock_spool.id}",
+            json={"current_weight": 900.0},
+        )
+        assert response.status_code == 200
+
+        response = await client.get("/api/v1/dashboard/summary?low_stock_threshold=10")
+        assert response.json()["low_stock_count"] == 0
+
     async def test_summary_unauthenticated(
         self,
         unauthenticated_client: AsyncClient,
@@ -406,6 +442,53 @@ class TestPerformanceCharts:
         response = await unauthenticated_client.get("/api/v1/dashboard/performance-charts")
         assert response.status_code == 401
 
+    async def test_performance_charts_counts_per_day(
+        self,
+        client: AsyncClient,
+        completed_run: ProductionRun,
+        failed_run: ProductionRun,
+    ):
+        """Test that today's bucket reflects the completed and failed runs."""
+        response = await client.get("/api/v1/dashboard/performance-charts?days=7")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert len(data["success_rate_trend"]) == 7
+        assert len(data["daily_production"]) == 7
+        totals = {
+            "completed": sum(d["completed"] for d in data["success_rate_trend"]),
+            "failed": sum(d["failed"] for d in data["success_rate_trend"]),
+            "runs_completed": sum(d["runs_completed"] for d in data["daily_production"]),
+        }
+        assert totals == {"completed": 1, "failed": 1, "runs_completed": 1}
+
+    async def test_performance_charts_query_count_constant(
+        self,
+        client: AsyncClient,
+        db_engine,
+        completed_run: ProductionRun,
+        failed_run: ProductionRun,
+    ):
+        """Benchmark: query count must not grow with the number of days."""
+        statements: list[str] = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db_engine.sync_engine, "before_cursor_execute", _count)
+        try:
+            counts = {}
+            for days in (1, 7, 30, 90):
+                statements.clear()
+                response = await client.get(f"/api/v1/dashboard/performance-charts?days={days}")
+                assert response.status_code == 200
+                counts[days] = len(statements)
+        finally:
+            event.remove(db_engine.sync_engine, "before_cursor_execute", _count)
+
+        assert len(set(counts.values())) == 1, counts
+        assert counts[90] <= 3
+
 
 class TestFailureAnalytics:
     """Tests for failure analytics endpoint."""
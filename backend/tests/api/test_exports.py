@@ -1,6 +1,7 @@
 """Tests for CSV export API endpoints."""
 
 import csv
+import gzip
 import io
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -218,6 +219,43 @@ class TestExportInventory:
         assert len(test_rows) == 1
         assert test_rows[0]["Default"] == "25"
 
+    @pytest.mark.asyncio
+    async def test_export_inventory_gzip(
+        self,
+        async_client: AsyncClient,
+        auth_headers: dict,
+        test_tenant,
+        db_session,
+    ):
+        """Test downloading the inventory export gzip-compressed."""
+        for i in range(3):
+            db_session.add(
+                Product(
+                    tenant_id=test_tenant.id,
+                    name=f"Gzip Product {i}",
+                    sku=f"GZIP-{i:03d}",
+                    units_in_stock=i,
+                )
+            )
+        await db_session.commit()
+
+        response = await async_client.get(
+            "/api/v1/exports/inventory?gzip=true",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert ".csv.gz" in response.headers["content-disposition"]
+
+        csv_content = gzip.decompress(response.content).decode("utf-8")
+        rows = list(csv.DictReader(io.StringIO(csv_content)))
+        assert sorted(r["SKU"] for r in rows if r["SKU"].startswith("GZIP-")) == [
+            "GZIP-000",
+            "GZIP-001",
+            "GZIP-002",
+        ]
+
     @pytest.mark.asyncio
     async def test_export_inventory_custom_location(
         self,
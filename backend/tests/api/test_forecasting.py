@@ -334,3 +334,25 @@ class TestForecastingEndpoints:
         assert low_stock_item is not None
         # With 5 units and ~5/day demand, should be critical or low
         assert low_stock_item["status"] in ["critical", "low"]
+
+    @pytest.mark.asyncio
+    async def test_stock_health_matches_per_product_forecast(
+        self,
+        client: AsyncClient,
+        product_with_sales,
+        low_stock_product,
+    ):
+        """Test the batch stock health agrees with the per-product endpoints."""
+        response = await client.get("/api/v1/forecasting/stock-health")
+        assert response.status_code == 200
+        items = {item["product_id"]: item for item in response.json()["items"]}
+
+        for product in (product_with_sales, low_stock_product):
+            forecast = (await client.get(f"/api/v1/forecasting/demand/{product.id}")).json()
+            reorder = (await client.get(f"/api/v1/forecasting/reorder/{product.id}")).json()
+            item = items[str(product.id)]
+
+            assert item["avg_daily_demand"] == forecast["avg_daily_demand"]
+            assert item["days_of_stock"] == forecast["days_of_stock"]
+            assert item["reorder_point"] == reorder["reorder_point"]
+            assert item["last_sale_date"] is not None
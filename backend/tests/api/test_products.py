@@ -414,6 +414,76 @@ class TestListProducts:
         for product in data["products"]:
             assert product.get("designer_id") == str(test_designer.id)
 
+    async def test_list_products_cached_until_product_change(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        test_product: Product,
+    ):
+        """Test that listings are served from cache and invalidated on write."""
+        first = await client.get("/api/v1/products")
+        assert first.status_code == 200
+
+        # Direct DB changes bypass invalidation, so the cached page is served
+        test_product.name = "Renamed Outside API"
+        await db_session.commit()
+        cached = await client.get("/api/v1/products")
+        assert cached.json() == first.json()
+
+        # Writes through the API invalidate the tenant's product caches
+        response = await client.put(
+            f"/api/v1/products/{test_product.id}", json={"name": "Renamed Via API"}
+        )
+        assert response.status_code == 200
+        fresh = await client.get("/api/v1/products")
+        names = [p["name"] for p in fresh.json()["products"]]
+        assert "Renamed Via API" in names
+
+    async def test_list_products_cursor_pagination(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        test_tenant: Tenant,
+    ):
+        """Test walking the listing with after/before cursors."""
+        for i in range(5):
+            db_session.add(
+                Product(id=uuid4(), tenant_id=test_tenant.id, sku=f"CURSOR-{i}", name=f"P{i}")
+            )
+        await db_session.commit()
+
+        first = (await client.get("/api/v1/products?limit=2")).json()
+        assert first["total"] == 5
+        expected = [
+            p["id"] for p in (await client.get("/api/v1/products?limit=5")).json()["products"]
+        ]
+
+        seen = [p["id"] for p in first["products"]]
+        page = first
+        while page["next_cursor"]:
+            page = (
+                await client.get(f"/api/v1/products?limit=2&after={page['next_cursor']}")
+            ).json()
+            assert page["total"] is None
+            seen.extend(p["id"] for p in page["products"])
+        assert seen == expected
+
+        back = await client.get(f"/api/v1/products?limit=2&before={page['prev_cursor']}")
+        assert [p["id"] for p in back.json()["products"]] == expected[2:4]
+
+        counted = await client.get(
+            f"/api/v1/products?limit=2&after={first['next_cursor']}&include_total=true"
+        )
+        assert counted.json()["total"] == 5
+
+    async def test_list_products_invalid_cursor(
+        self,
+        client: AsyncClient,
+    ):
+        """Test that a malformed cursor is rejected."""
+        response = await client.get("/api/v1/products?after=not-a-cursor")
+        assert response.status_code == 400
+
     async def test_list_products_unauthenticated(
         self,
         unauthenticated_client: AsyncClient,
@@ -980,8 +1050,6 @@ class TestImportImageFromUrl:
         mock_resp.raise_for_status = MagicMock()
 
         mock_http = AsyncMock()
-        mock_http.__aenter__ = AsyncMock(return_value=mock_http)
-        mock_http.__aexit__ = AsyncMock(return_value=None)
         mock_http.get = AsyncMock(return_value=mock_resp)
 
         storage_result = {
@@ -992,7 +1060,7 @@ class TestImportImageFromUrl:
         }
 
         with (
-            patch("app.api.v1.products.httpx.AsyncClient", return_value=mock_http),
+            patch("app.api.v1.products.get_http_client", return_value=mock_http),
             patch("app.api.v1.products._is_private_ip", return_value=False),
             patch(
                 "app.services.image_storage.ImageStorage.save_image",
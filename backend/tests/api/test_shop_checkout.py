@@ -19,6 +19,7 @@ from app.services.cart import CartService, get_cart_service
 from app.services.checkout_session import CheckoutSessionService, get_checkout_session_service
 from app.services.stock_reservation import StockReservationService, get_stock_reservation_service
 from app.main import app
+from app.services.shop_projection import mark_products_changed
 from tests.utils.mock_redis import MockRedis
 
 
@@ -1063,9 +1064,9 @@ class TestDragons:
 class TestShopCategories:
     """Tests for shop category endpoints."""
 
-    async def test_list_categories(self, client: AsyncClient):
+    async def test_list_categories(self, shop_client: AsyncClient):
         """Test listing categories."""
-        response = await client.get("/api/v1/shop/categories")
+        response = await shop_client.get("/api/v1/shop/categories")
         assert response.status_code == 200
         data = response.json()
         assert "data" in data
@@ -1309,6 +1310,26 @@ class TestImageProxy:
         # Should return 404, not expose file system
         assert response.status_code == 404
 
+    async def test_get_image_variant_negotiated(self, client: AsyncClient, test_product_with_image):
+        """Test width-bucketed, format-negotiated variants with content ETags."""
+        _, product_image = test_product_with_image
+        image_url = product_image.image_url.replace("/uploads/products/", "")
+        url = f"/api/v1/shop/images/{image_url}?w=100"
+
+        response = await client.get(url, headers={"Accept": "image/webp,*/*"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/webp"
+        assert response.headers["vary"] == "Accept"
+        etag = response.headers["etag"]
+
+        cached = await client.get(url, headers={"Accept": "image/webp", "If-None-Match": etag})
+        assert cached.status_code == 304
+
+        fallback = await client.get(url, headers={"Accept": "image/jpeg"})
+        assert fallback.headers["content-type"] == "image/jpeg"
+        assert fallback.headers["etag"] != etag
+
 
 # ============================================
 # Category Filtering Tests
@@ -1374,6 +1395,7 @@ async def product_with_category(
             category_id=test_category.id,
         )
     )
+    mark_products_changed(db_session, product.id)
     await db_session.commit()
     await db_session.refresh(product)
     return product
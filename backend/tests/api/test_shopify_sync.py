@@ -286,7 +286,7 @@ class TestShopifySyncEndpoints:
 
         with (
             patch("app.services.shopify_sync.get_settings") as mock_cfg,
-            patch("app.services.shopify_sync.httpx.AsyncClient") as mock_client_cls,
+            patch("app.services.shopify_sync.get_http_client") as mock_get_client,
         ):
             cfg = MagicMock()
             cfg.shopify_store_domain = "mystmereforge.myshopify.com"
@@ -298,10 +298,8 @@ class TestShopifySyncEndpoints:
             mock_response.json.return_value = fake_shopify_response
 
             mock_http = AsyncMock()
-            mock_http.__aenter__ = AsyncMock(return_value=mock_http)
-            mock_http.__aexit__ = AsyncMock(return_value=None)
             mock_http.request = AsyncMock(return_value=mock_response)
-            mock_client_cls.return_value = mock_http
+            mock_get_client.return_value = mock_http
 
             resp = await client.post(
                 f"/api/v1/products/{product_id}/sync/shopify",
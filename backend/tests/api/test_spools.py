@@ -424,6 +424,27 @@ class TestUpdateSpool:
         assert data["current_weight"] == 600.0
         assert data["remaining_percentage"] == 60.0
 
+    async def test_update_spool_invalidates_cost_caches(
+        self,
+        client: AsyncClient,
+        test_tenant: Tenant,
+        test_spool: Spool,
+        isolated_cache_service,
+    ):
+        """Test that a spool edit drops cached costs and dashboard metrics."""
+        tenant_id = str(test_tenant.id)
+        await isolated_cache_service.set_cost_breakdown("prod1", tenant_id, {"total": "1.00"})
+        await isolated_cache_service.set_dashboard(tenant_id, "summary", {"low_stock_count": 0})
+
+        response = await client.put(
+            f"/api/v1/spools/{test_spool.id}",
+            json={"current_weight": 50.0},
+        )
+        assert response.status_code == 200
+
+        assert await isolated_cache_service.get_cost_breakdown("prod1", tenant_id) is None
+        assert await isolated_cache_service.get_dashboard(tenant_id, "summary") is None
+
     async def test_update_spool_deactivate(
         self,
         client: AsyncClient,
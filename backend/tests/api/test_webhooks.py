@@ -257,13 +257,11 @@ class TestWebhookTest:
         subscription_id = create_response.json()["id"]
 
         # Mock the HTTP request
-        with patch("app.services.webhook_service.httpx.AsyncClient") as mock_client:
+        with patch("app.services.webhook_service.get_http_client") as mock_client:
             mock_response = AsyncMock()
             mock_response.status_code = 200
             mock_response.text = '{"success": true}'
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
             response = await client.post(
                 f"/api/v1/webhooks/subscriptions/{subscription_id}/test",
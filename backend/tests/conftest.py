@@ -39,6 +39,44 @@ def anyio_backend():
     return "asyncio"
 
 
+@pytest.fixture(autouse=True)
+def isolated_local_storage(tmp_path, monkeypatch):
+    """Write uploaded images and model files under tmp_path instead of ./uploads."""
+    from app.config import get_settings
+    from app.services.image_storage import get_image_storage
+
+    storage_path = tmp_path / "uploads"
+    monkeypatch.setattr(get_settings(), "storage_path", str(storage_path))
+    monkeypatch.setattr(get_image_storage(), "base_path", storage_path)
+    (storage_path / "products").mkdir(parents=True, exist_ok=True)
+
+
+@pytest.fixture(autouse=True)
+def clear_tenant_routing_index():
+    """Reset the in-process shop routing index so tenants never leak between tests."""
+    from app.services.tenant_routing import tenant_routing_index
+
+    tenant_routing_index.clear()
+    yield
+    tenant_routing_index.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_service():
+    """Give every test its own empty in-memory Redis behind the shared cache service."""
+    import fakeredis.aioredis
+
+    from app.services import cache_service
+
+    cache = cache_service.CacheService(
+        redis_client=fakeredis.aioredis.FakeRedis(decode_responses=True)
+    )
+    original = cache_service._cache_service
+    cache_service._cache_service = cache
+    yield cache
+    cache_service._cache_service = original
+
+
 # Test database URL - use DATABASE_URL from env (CI uses PostgreSQL),
 # fallback to SQLite for local testing (but SQLite doesn't support JSONB)
 _BASE_DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
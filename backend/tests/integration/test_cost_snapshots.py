@@ -0,0 +1,157 @@
+"""Integration tests for dependency-driven product and model cost snapshots."""
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.consumable import ConsumableType
+from app.models.cost_snapshot import ModelCostSnapshot, ProductCostSnapshot
+from app.models.model import Model
+from app.models.model_component import ModelComponent
+from app.models.product import Product
+from app.models.product_component import ProductComponent
+from app.models.product_model import ProductModel
+from app.models.tenant import Tenant
+from app.services.cost_snapshots import get_product_costs, rebuild_cost_snapshots
+
+
+@pytest_asyncio.fixture
+async def catalogue(db_session: AsyncSession, test_tenant: Tenant) -> dict:
+    """A model used twice by a product, that product in a bundle, and an unrelated product."""
+    model = Model(
+        id=uuid4(),
+        tenant_id=test_tenant.id,
+        sku="SNAP-MODEL-001",
+        name="Snapshot Dragon Body",
+        labor_hours=Decimal("0"),
+        is_active=True,
+    )
+    magnet = ModelComponent(
+        id=uuid4(), model_id=model.id, component_name="Magnet", quantity=2, unit_cost=1.50
+    )
+    box = ConsumableType(
+        id=uuid4(),
+        tenant_id=test_tenant.id,
+        sku="SNAP-BOX-001",
+        name="Gift Box",
+        current_cost_per_unit=0.40,
+        quantity_on_hand=100,
+    )
+    product = Product(
+        id=uuid4(),
+        tenant_id=test_tenant.id,
+        sku="SNAP-PROD-001",
+        name="Snapshot Dragon",
+        packaging_consumable_id=box.id,
+        packaging_quantity=1,
+    )
+    bundle = Product(id=uuid4(), tenant_id=test_tenant.id, sku="SNAP-BUNDLE-001", name="Hoard")
+    other = Product(
+        id=uuid4(),
+        tenant_id=test_tenant.id,
+        sku="SNAP-OTHER-001",
+        name="Unrelated",
+        packaging_cost=Decimal("1.00"),
+    )
+    db_session.add_all([model, magnet, box, product, bundle, other])
+    await db_session.flush()
+    db_session.add_all(
+        [
+            ProductModel(product_id=product.id, model_id=model.id, quantity=2),
+            ProductComponent(parent_product_id=bundle.id, child_product_id=product.id, quantity=3),
+        ]
+    )
+    await db_session.commit()
+    return {
+        "model": model,
+        "magnet": magnet,
+        "box": box,
+        "product": product,
+        "bundle": bundle,
+        "other": other,
+    }
+
+
+async def _snapshot(db: AsyncSession, product: Product) -> ProductCostSnapshot:
+    result = await db.execute(
+        select(ProductCostSnapshot).where(ProductCostSnapshot.product_id == product.id)
+    )
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_snapshots_written_on_create(db_session, catalogue):
+    product = await _snapshot(db_session, catalogue["product"])
+    bundle = await _snapshot(db_session, catalogue["bundle"])
+    model = (
+        await db_session.execute(
+            select(ModelCostSnapshot).where(ModelCostSnapshot.model_id == catalogue["model"].id)
+        )
+    ).scalar_one()
+
+    assert model.total_cost == Decimal("3.000")
+    # 2 models × £3.00 + one £0.40 box
+    assert (product.models_cost, product.packaging_cost) == (Decimal("6.00"), Decimal("0.40"))
+    assert product.total_make_cost == Decimal("6.40")
+    assert bundle.child_products_cost == Decimal("19.20")
+
+
+@pytest.mark.asyncio
+async def test_bom_change_updates_products_and_bundles(db_session, catalogue):
+    # Only the component line is dirty; products and bundles are found through it
+    catalogue["magnet"].unit_cost = 2.00
+    await db_session.commit()
+
+    assert (await _snapshot(db_session, catalogue["product"])).total_make_cost == Decimal("8.40")
+    assert (await _snapshot(db_session, catalogue["bundle"])).total_make_cost == Decimal("25.20")
+
+
+@pytest.mark.asyncio
+async def test_consumable_price_change_updates_packaged_products(db_session, catalogue):
+    catalogue["box"].current_cost_per_unit = 1.00
+    await db_session.commit()
+
+    assert (await _snapshot(db_session, catalogue["product"])).packaging_cost == Decimal("1.00")
+    assert (await _snapshot(db_session, catalogue["bundle"])).total_make_cost == Decimal("21.00")
+
+
+@pytest.mark.asyncio
+async def test_unaffected_snapshots_are_not_rewritten(db_session, catalogue):
+    before = (await _snapshot(db_session, catalogue["other"])).id
+    rebuilt_before = (await _snapshot(db_session, catalogue["product"])).id
+
+    catalogue["model"].labor_rate_override = Decimal("20.00")
+    catalogue["model"].labor_hours = Decimal("0.5")
+    await db_session.commit()
+
+    assert (await _snapshot(db_session, catalogue["other"])).id == before
+    assert (await _snapshot(db_session, catalogue["product"])).id != rebuilt_before
+
+
+@pytest.mark.asyncio
+async def test_non_cost_changes_leave_snapshots_alone(db_session, catalogue):
+    before = (await _snapshot(db_session, catalogue["product"])).id
+
+    catalogue["product"].name = "Renamed Dragon"
+    catalogue["model"].description = "New notes"
+    await db_session.commit()
+
+    assert (await _snapshot(db_session, catalogue["product"])).id == before
+
+
+@pytest.mark.asyncio
+async def test_rebuild_restores_snapshots(db_session, test_tenant, catalogue):
+    await db_session.execute(delete(ProductCostSnapshot))
+    await db_session.execute(delete(ModelCostSnapshot))
+    await db_session.commit()
+
+    counts = await rebuild_cost_snapshots(db_session, test_tenant.id)
+    await db_session.commit()
+
+    assert counts == (1, 3)
+    costs = await get_product_costs(db_session, [catalogue["product"].id])
+    assert costs[catalogue["product"].id].total_make_cost == Decimal("6.40")
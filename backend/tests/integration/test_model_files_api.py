@@ -6,12 +6,15 @@ Tests:
 - File listing endpoint
 - File details endpoint
 - File download endpoint
+- Resumable chunked uploads
+- Content deduplication
 - File update endpoint
 - File delete endpoint
 - Invalid file type rejection
 - Tenant isolation
 """
 
+import hashlib
 import io
 import zipfile
 from uuid import uuid4
@@ -292,6 +295,159 @@ class TestModelFileDetails:
         assert response.status_code == 404
 
 
+# =============================================================================
+# Resumable Upload Tests
+# =============================================================================
+
+
+class TestResumableUpload:
+    """Test cases for chunked, resumable uploads."""
+
+    async def _start(self, client: AsyncClient, model_id, content: bytes) -> str:
+        response = await client.post(
+            f"/api/v1/models/{model_id}/files/uploads",
+            json={
+                "filename": "print.gcode",
+                "content_type": "text/x-gcode",
+                "total_size": len(content),
+                "file_type": "gcode",
+            },
+        )
+        assert response.status_code == 201
+        assert response.json()["received_size"] == 0
+        return response.json()["id"]
+
+    @pytest.mark.asyncio
+    async def test_chunked_upload_and_complete(self, client: AsyncClient, test_model):
+        """Test uploading a file in chunks and completing it."""
+        content = create_minimal_gcode() * 50
+        upload_id = await self._start(client, test_model.id, content)
+        base = f"/api/v1/models/{test_model.id}/files/uploads/{upload_id}"
+
+        first = await client.put(f"{base}?offset=0", content=content[:100])
+        assert first.status_code == 200
+        assert first.json()["received_size"] == 100
+
+        # Resume from the reported offset
+        progress = await client.get(base)
+        assert progress.json()["received_size"] == 100
+        rest = await client.put(f"{base}?offset=100", content=content[100:])
+        assert rest.json()["received_size"] == len(content)
+
+        response = await client.post(f"{base}/complete")
+
+        assert response.status_code == 201
+        file = response.json()["file"]
+        assert file["file_size"] == len(content)
+        assert file["content_sha256"] == hashlib.sha256(content).hexdigest()
+        download = await client.get(f"/api/v1/models/{test_model.id}/files/{file['id']}/download")
+        assert download.content == content
+        assert (await client.get(base)).status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_chunk_at_wrong_offset_conflicts(self, client: AsyncClient, test_model):
+        """Test that a chunk not starting at received_size is rejected."""
+        content = create_minimal_gcode()
+        upload_id = await self._start(client, test_model.id, content)
+
+        response = await client.put(
+            f"/api/v1/models/{test_model.id}/files/uploads/{upload_id}?offset=10",
+            content=content[10:],
+        )
+
+        assert response.status_code == 409
+
+    @pytest.mark.asyncio
+    async def test_racing_chunk_at_same_offset_conflicts(self, client: AsyncClient, test_model):
+        """Test that a chunk overtaken while streaming is rejected, not interleaved."""
+        content = create_minimal_gcode() * 50
+        upload_id = await self._start(client, test_model.id, content)
+        base = f"/api/v1/models/{test_model.id}/files/uploads/{upload_id}"
+
+        async def slow_body():
+            yield content[:50]
+            # Another request sends the same offset while this one is still streaming
+            overtaking = await client.put(f"{base}?offset=0", content=content[:100])
+            assert overtaking.status_code == 200
+            yield b"x" * 30
+
+        response = await client.put(f"{base}?offset=0", content=slow_body())
+
+        assert response.status_code == 409
+        assert (await client.get(base)).json()["received_size"] == 100
+        await client.put(f"{base}?offset=100", content=content[100:])
+        complete = await client.post(f"{base}/complete")
+        assert complete.status_code == 201
+        file = complete.json()["file"]
+        assert file["content_sha256"] == hashlib.sha256(content).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_complete_incomplete_upload_fails(self, client: AsyncClient, test_model):
+        """Test that completing before all bytes arrive is rejected."""
+        content = create_minimal_gcode()
+        upload_id = await self._start(client, test_model.id, content)
+        base = f"/api/v1/models/{test_model.id}/files/uploads/{upload_id}"
+        await client.put(f"{base}?offset=0", content=content[:5])
+
+        response = await client.post(f"{base}/complete")
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_abort_upload(self, client: AsyncClient, test_model):
+        """Test discarding an upload."""
+        upload_id = await self._start(client, test_model.id, create_minimal_gcode())
+        base = f"/api/v1/models/{test_model.id}/files/uploads/{upload_id}"
+
+        response = await client.delete(base)
+
+        assert response.status_code == 204
+        assert (await client.get(base)).status_code == 404
+
+
+# =============================================================================
+# Deduplication Tests
+# =============================================================================
+
+
+class TestModelFileDeduplication:
+    """Test that identical uploads share one stored copy."""
+
+    async def _upload(self, client: AsyncClient, model_id, content: bytes) -> dict:
+        response = await client.post(
+            f"/api/v1/models/{model_id}/files",
+            files={"file": ("model.stl", content, "model/stl")},
+            data={"file_type": "source_stl"},
+        )
+        assert response.status_code == 201
+        return response.json()["file"]
+
+    @pytest.mark.asyncio
+    async def test_identical_upload_reuses_stored_file(self, client: AsyncClient, test_model):
+        """Test that re-uploading the same content reuses the stored file."""
+        content = create_minimal_stl()
+
+        first = await self._upload(client, test_model.id, content)
+        second = await self._upload(client, test_model.id, content)
+
+        assert second["id"] != first["id"]
+        assert second["file_url"] == first["file_url"]
+        assert second["content_sha256"] == first["content_sha256"]
+
+    @pytest.mark.asyncio
+    async def test_delete_keeps_shared_content(self, client: AsyncClient, test_model):
+        """Test that deleting one of two identical files keeps the other downloadable."""
+        content = create_minimal_stl() + b"\n; dedup"
+        first = await self._upload(client, test_model.id, content)
+        second = await self._upload(client, test_model.id, content)
+
+        await client.delete(f"/api/v1/models/{test_model.id}/files/{first['id']}")
+        response = await client.get(f"/api/v1/models/{test_model.id}/files/{second['id']}/download")
+
+        assert response.status_code == 200
+        assert response.content == content
+
+
 # =============================================================================
 # File Download Tests
 # =============================================================================
@@ -317,6 +473,26 @@ class TestModelFileDownload:
         assert response.content == stl_content
         assert "model.stl" in response.headers.get("content-disposition", "")
 
+    @pytest.mark.asyncio
+    async def test_download_file_range(self, client: AsyncClient, test_model):
+        """Test downloading part of a file with a Range header."""
+        stl_content = create_minimal_stl()
+        upload_response = await client.post(
+            f"/api/v1/models/{test_model.id}/files",
+            files={"file": ("model.stl", stl_content, "model/stl")},
+            data={"file_type": "source_stl"},
+        )
+        file_id = upload_response.json()["file"]["id"]
+
+        response = await client.get(
+            f"/api/v1/models/{test_model.id}/files/{file_id}/download",
+            headers={"Range": "bytes=0-9"},
+        )
+
+        assert response.status_code == 206
+        assert response.content == stl_content[:10]
+        assert response.headers["content-range"] == f"bytes 0-9/{len(stl_content)}"
+
     @pytest.mark.asyncio
     async def test_download_nonexistent_file(self, client: AsyncClient, test_model):
         """Test downloading non-existent file."""
@@ -0,0 +1,78 @@
+"""Integration tests for loading product bill of materials graphs."""
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.model import Model
+from app.models.model_component import ModelComponent
+from app.models.product import Product
+from app.models.product_component import ProductComponent
+from app.models.product_model import ProductModel
+from app.models.tenant import Tenant
+from app.services.costing import CircularReferenceError, CostingService
+from app.services.product_graph import load_product_graph
+
+
+async def _chain(db: AsyncSession, tenant: Tenant, depth: int) -> list[Product]:
+    """Products nested ``depth`` levels deep; only the innermost has a model."""
+    model = Model(
+        id=uuid4(),
+        tenant_id=tenant.id,
+        sku="GRAPH-MODEL-001",
+        name="Graph Egg",
+        labor_hours=Decimal("0"),
+        is_active=True,
+    )
+    products = [
+        Product(id=uuid4(), tenant_id=tenant.id, sku=f"GRAPH-{level}", name=f"Level {level}")
+        for level in range(depth + 1)
+    ]
+    db.add_all([model, *products])
+    await db.flush()
+    db.add(ModelComponent(model_id=model.id, component_name="Shell", quantity=1, unit_cost=2.00))
+    db.add(ProductModel(product_id=products[-1].id, model_id=model.id, quantity=1))
+    for parent, child in zip(products, products[1:]):
+        db.add(ProductComponent(parent_product_id=parent.id, child_product_id=child.id, quantity=2))
+    await db.commit()
+    return products
+
+
+@pytest.mark.asyncio
+async def test_loads_bundles_nested_deeper_than_two_levels(db_session, test_tenant):
+    products = await _chain(db_session, test_tenant, depth=4)
+
+    graph = await load_product_graph(db_session, [products[0].id])
+
+    assert set(graph) == {p.id for p in products}
+    # Costing the whole chain must not need any further (lazy) loads
+    cost = CostingService.calculate_product_cost(graph[products[0].id])
+    assert cost.total_make_cost == Decimal("32.00")  # 2^4 eggs at £2
+
+
+@pytest.mark.asyncio
+async def test_criteria_filter_requested_products(db_session, test_tenant):
+    products = await _chain(db_session, test_tenant, depth=1)
+
+    graph = await load_product_graph(db_session, [products[0].id], Product.tenant_id == uuid4())
+
+    assert graph == {}
+
+
+@pytest.mark.asyncio
+async def test_circular_bundle_loads_and_is_reported(db_session, test_tenant):
+    products = await _chain(db_session, test_tenant, depth=1)
+    db_session.add(
+        ProductComponent(
+            parent_product_id=products[1].id, child_product_id=products[0].id, quantity=1
+        )
+    )
+    await db_session.commit()
+
+    graph = await load_product_graph(db_session, [products[0].id])
+
+    assert set(graph) == {p.id for p in products}
+    with pytest.raises(CircularReferenceError):
+        CostingService.calculate_product_cost(graph[products[0].id])
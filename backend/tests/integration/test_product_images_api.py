@@ -5,8 +5,11 @@ from httpx import AsyncClient
 from uuid import uuid4
 from io import BytesIO
 from PIL import Image
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.product import Product
+from app.models.storage_blob import StorageBlob
 
 
 def create_test_image(width: int = 200, height: int = 100, format: str = "JPEG") -> bytes:
@@ -157,6 +160,134 @@ class TestProductImageRotation:
         assert response.status_code == 404
 
 
+class TestProductImageDeduplication:
+    """Test that identical image uploads share one stored copy."""
+
+    async def _upload(self, client, auth_headers, product_id, image_data: bytes) -> dict:
+        response = await client.post(
+            f"/api/v1/products/{product_id}/images",
+            headers=auth_headers,
+            files={"file": ("test.jpg", image_data, "image/jpeg")},
+        )
+        assert response.status_code == 201
+        return response.json()
+
+    @pytest.mark.asyncio
+    async def test_identical_upload_reuses_stored_image(
+        self, client: AsyncClient, auth_headers: dict, test_product: Product
+    ):
+        """Test that re-uploading the same image reuses its URLs."""
+        image_data = create_test_image()
+
+        first = await self._upload(client, auth_headers, test_product.id, image_data)
+        second = await self._upload(client, auth_headers, test_product.id, image_data)
+
+        assert second["id"] != first["id"]
+        assert second["image_url"] == first["image_url"]
+        assert second["thumbnail_url"] == first["thumbnail_url"]
+
+    @pytest.mark.asyncio
+    async def test_delete_keeps_shared_image_until_last_reference(
+        self, client: AsyncClient, auth_headers: dict, test_product: Product
+    ):
+        """Test that a shared image is only removed with its last reference."""
+        image_data = create_test_image(width=120, height=80)
+        first = await self._upload(client, auth_headers, test_product.id, image_data)
+        second = await self._upload(client, auth_headers, test_product.id, image_data)
+        base = f"/api/v1/products/{test_product.id}/images"
+
+        await client.delete(f"{base}/{first['id']}", headers=auth_headers)
+        assert (await client.get(second["image_url"])).status_code == 200
+
+        await client.delete(f"{base}/{second['id']}", headers=auth_headers)
+        assert (await client.get(second["image_url"])).status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_rotating_shared_image_copies_it(
+        self, client: AsyncClient, auth_headers: dict, test_product: Product
+    ):
+        """Test that rotating one of two identical images leaves the other untouched."""
+        image_data = create_test_image(width=160, height=90)
+        first = await self._upload(client, auth_headers, test_product.id, image_data)
+        second = await self._upload(client, auth_headers, test_product.id, image_data)
+
+        response = await client.post(
+            f"/api/v1/products/{test_product.id}/images/{second['id']}/rotate?degrees=90",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["image_url"] != first["image_url"]
+        original = Image.open(BytesIO((await client.get(first["image_url"])).content))
+        assert original.width > original.height
+
+    @pytest.mark.asyncio
+    async def test_same_photo_on_two_products_shares_stored_image(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        db_session: AsyncSession,
+        test_product: Product,
+    ):
+        """Test that one photo uploaded to two products is stored once."""
+        other = Product(
+            id=uuid4(),
+            tenant_id=test_product.tenant_id,
+            sku="TEST-PROD-002",
+            name="Second Product",
+            is_active=True,
+        )
+        db_session.add(other)
+        await db_session.commit()
+        image_data = create_test_image(width=140, height=70)
+
+        first = await self._upload(client, auth_headers, test_product.id, image_data)
+        second = await self._upload(client, auth_headers, other.id, image_data)
+
+        assert second["image_url"] == first["image_url"]
+        assert second["thumbnail_url"] == first["thumbnail_url"]
+        blob = (await db_session.execute(select(StorageBlob))).scalar_one()
+        assert blob.ref_count == 2
+
+        await client.delete(
+            f"/api/v1/products/{test_product.id}/images/{first['id']}", headers=auth_headers
+        )
+        assert (await client.get(second["image_url"])).status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_purging_product_releases_its_images(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        db_session: AsyncSession,
+        test_product: Product,
+    ):
+        """Test that hard-deleting a product drops its references to shared images."""
+        other = Product(
+            id=uuid4(),
+            tenant_id=test_product.tenant_id,
+            sku="TEST-PROD-002",
+            name="Second Product",
+            is_active=False,
+        )
+        db_session.add(other)
+        await db_session.commit()
+        image_data = create_test_image(width=150, height=75)
+        kept = await self._upload(client, auth_headers, test_product.id, image_data)
+        await self._upload(client, auth_headers, other.id, image_data)
+        await self._upload(client, auth_headers, other.id, create_test_image(width=90, height=90))
+
+        response = await client.delete(
+            f"/api/v1/products/{other.id}?purge=true", headers=auth_headers
+        )
+        assert response.status_code == 204
+
+        db_session.expire_all()
+        blobs = (await db_session.execute(select(StorageBlob))).scalars().all()
+        assert [(b.url, b.ref_count) for b in blobs] == [(kept["image_url"], 1)]
+        assert (await client.get(kept["image_url"])).status_code == 200
+
+
 class TestUploadsProxyEndpoint:
     """Test the /uploads/ proxy endpoint for serving images."""
 
@@ -0,0 +1,197 @@
+"""Integration tests for the incrementally maintained daily sales rollup."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.daily_product_sales import DailyProductSales
+from app.models.order import Order, OrderItem, OrderStatus
+from app.models.product import Product
+from app.models.tenant import Tenant
+from app.services.forecasting_service import ForecastingService
+from app.services.sales_rollup import rebuild_sales_rollup, utc_day
+
+NOW = datetime.now(timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def product(db_session: AsyncSession, test_tenant: Tenant) -> Product:
+    product = Product(
+        id=uuid4(),
+        tenant_id=test_tenant.id,
+        sku="ROLLUP-001",
+        name="Rollup Dragon",
+        is_active=True,
+        units_in_stock=10,
+    )
+    db_session.add(product)
+    await db_session.commit()
+    return product
+
+
+async def _place_order(
+    db: AsyncSession,
+    tenant: Tenant,
+    product: Product,
+    quantity: int,
+    created_at: datetime = NOW,
+    status: str = OrderStatus.PENDING,
+) -> Order:
+    order = Order(
+        id=uuid4(),
+        tenant_id=tenant.id,
+        order_number=f"ROLL-{uuid4().hex[:8]}",
+        status=status,
+        customer_email="rollup@example.com",
+        customer_name="Rollup Customer",
+        shipping_address_line1="1 Rollup Road",
+        shipping_city="London",
+        shipping_postcode="SW1A 1AA",
+        shipping_country="GB",
+        shipping_method="Royal Mail",
+        shipping_cost=Decimal("0"),
+        subtotal=Decimal("10.00") * quantity,
+        total=Decimal("10.00") * quantity,
+        created_at=created_at,
+    )
+    db.add(order)
+    db.add(
+        OrderItem(
+            tenant_id=tenant.id,
+            order_id=order.id,
+            product_id=product.id,
+            product_sku=product.sku,
+            product_name=product.name,
+            quantity=quantity,
+            unit_price=Decimal("10.00"),
+            total_price=Decimal("10.00") * quantity,
+        )
+    )
+    await db.commit()
+    return order
+
+
+async def _rollup(db: AsyncSession, product: Product) -> dict:
+    result = await db.execute(
+        select(DailyProductSales).where(DailyProductSales.product_id == product.id)
+    )
+    return {row.day: row for row in result.scalars().all()}
+
+
+@pytest.mark.asyncio
+async def test_new_orders_are_summed_per_day(db_session, test_tenant, product):
+    yesterday = NOW - timedelta(days=1)
+    await _place_order(db_session, test_tenant, product, 2)
+    await _place_order(db_session, test_tenant, product, 3)
+    await _place_order(db_session, test_tenant, product, 1, created_at=yesterday)
+
+    rollup = await _rollup(db_session, product)
+
+    today = rollup[utc_day(NOW)]
+    assert (today.units_sold, today.revenue, today.order_count) == (5, Decimal("50.00"), 2)
+    assert rollup[utc_day(yesterday)].units_sold == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [OrderStatus.CANCELLED, OrderStatus.REFUNDED])
+async def test_cancelled_and_refunded_orders_drop_out(db_session, test_tenant, product, status):
+    await _place_order(db_session, test_tenant, product, 2)
+    order = await _place_order(db_session, test_tenant, product, 3)
+
+    order.status = status
+    await db_session.commit()
+
+    rollup = await _rollup(db_session, product)
+    assert rollup[utc_day(NOW)].units_sold == 2
+    assert rollup[utc_day(NOW)].order_count == 1
+
+
+@pytest.mark.asyncio
+async def test_item_quantity_change_updates_day(db_session, test_tenant, product):
+    order = await _place_order(db_session, test_tenant, product, 2)
+    item = (
+        await db_session.execute(select(OrderItem).where(OrderItem.order_id == order.id))
+    ).scalar_one()
+
+    # Only the item is dirty; its order's day is resolved before commit
+    item.quantity = 4
+    item.total_price = Decimal("40.00")
+    await db_session.commit()
+
+    assert (await _rollup(db_session, product))[utc_day(NOW)].units_sold == 4
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_orders_leave_no_rows(db_session, test_tenant, product):
+    # rollback() expires every loaded object, so reload by id afterwards
+    tenant_id, product_id = test_tenant.id, product.id
+    order = Order(
+        id=uuid4(),
+        tenant_id=tenant_id,
+        order_number="ROLL-ROLLBACK",
+        status=OrderStatus.PENDING,
+        customer_email="rollup@example.com",
+        customer_name="Rollup Customer",
+        shipping_address_line1="1 Rollup Road",
+        shipping_city="London",
+        shipping_postcode="SW1A 1AA",
+        shipping_country="GB",
+        shipping_method="Royal Mail",
+        subtotal=Decimal("50.00"),
+        total=Decimal("50.00"),
+    )
+    db_session.add(order)
+    db_session.add(
+        OrderItem(
+            tenant_id=tenant_id,
+            order_id=order.id,
+            product_id=product_id,
+            product_sku=product.sku,
+            product_name=product.name,
+            quantity=5,
+            unit_price=Decimal("10.00"),
+            total_price=Decimal("50.00"),
+        )
+    )
+    await db_session.flush()
+    await db_session.rollback()
+
+    tenant = await db_session.get(Tenant, tenant_id)
+    product = await db_session.get(Product, product_id)
+    await _place_order(db_session, tenant, product, 1)
+
+    assert (await _rollup(db_session, product))[utc_day(NOW)].units_sold == 1
+
+
+@pytest.mark.asyncio
+async def test_rebuild_restores_rollup(db_session, test_tenant, product):
+    await _place_order(db_session, test_tenant, product, 2)
+    await _place_order(db_session, test_tenant, product, 1, created_at=NOW - timedelta(days=5))
+    await db_session.execute(delete(DailyProductSales))
+    await db_session.commit()
+
+    rows = await rebuild_sales_rollup(db_session, test_tenant.id)
+    await db_session.commit()
+
+    assert rows == 2
+    assert sum(r.units_sold for r in (await _rollup(db_session, product)).values()) == 3
+
+
+@pytest.mark.asyncio
+async def test_forecast_reads_rollup(db_session, test_tenant, product):
+    for days_ago in range(3):
+        await _place_order(
+            db_session, test_tenant, product, 2, created_at=NOW - timedelta(days=days_ago)
+        )
+
+    service = ForecastingService(db_session)
+    history = await service.get_sales_history(product.id, test_tenant.id, days=30)
+    batch = await service.get_tenant_sales_history(test_tenant.id, days=30)
+
+    assert [d.quantity for d in history] == [2, 2, 2]
+    assert [d.quantity for d in batch[product.id]] == [2, 2, 2]
@@ -3,14 +3,16 @@
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import uuid4
 
-from app.models.category import Category
+from app.models.category import Category, CategoryProductCount
 from app.models.product import Product
 from app.models.sales_channel import SalesChannel
 from app.models.tenant import Tenant
 from app.main import app
+from app.services.shop_projection import mark_products_changed
 
 
 @pytest_asyncio.fixture
@@ -77,6 +79,7 @@ async def shop_product_dragon(
             category_id=shop_category_dragons.id,
         )
     )
+    mark_products_changed(db_session, product.id)
     await db_session.commit()
     await db_session.refresh(product)
     return product
@@ -110,6 +113,7 @@ async def shop_product_dice(
             category_id=shop_category_dice.id,
         )
     )
+    mark_products_changed(db_session, product.id)
     await db_session.commit()
     await db_session.refresh(product)
     return product
@@ -240,6 +244,114 @@ class TestShopCategoryEndpoint:
         slugs = [c["slug"] for c in data["data"]]
         assert "inactive-shop-category" not in slugs
 
+    @pytest.mark.asyncio
+    async def test_shop_categories_scoped_to_shop_tenant(
+        self,
+        shop_client: AsyncClient,
+        db_session,
+        shop_category_dragons: Category,
+    ):
+        """Test shop categories only include the resolved tenant's categories."""
+        other_tenant = Tenant(id=uuid4(), name="Other Shop", slug=f"other-{uuid4().hex[:8]}")
+        db_session.add(other_tenant)
+        db_session.add(
+            Category(
+                id=uuid4(),
+                tenant_id=other_tenant.id,
+                name="Other Tenant Category",
+                slug="other-tenant-category",
+                is_active=True,
+            )
+        )
+        await db_session.commit()
+
+        response = await shop_client.get("/api/v1/shop/categories")
+        assert response.status_code == 200
+        slugs = [c["slug"] for c in response.json()["data"]]
+        assert "dragons" in slugs
+        assert "other-tenant-category" not in slugs
+
+    @pytest.mark.asyncio
+    async def test_shop_categories_counted_in_single_query(
+        self,
+        shop_client: AsyncClient,
+        db_engine,
+        shop_product_dragon: Product,
+        shop_product_dice: Product,
+    ):
+        """Test product counts for all categories come from one grouped query."""
+        statements: list[str] = []
+
+        def _before_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db_engine.sync_engine, "before_cursor_execute", _before_execute)
+        try:
+            response = await shop_client.get("/api/v1/shop/categories")
+        finally:
+            event.remove(db_engine.sync_engine, "before_cursor_execute", _before_execute)
+
+        assert response.status_code == 200
+        counts = {c["slug"]: c["product_count"] for c in response.json()["data"]}
+        assert counts == {"dragons": 1, "dice": 1}
+        assert len(statements) == 1
+
+
+class TestMaterializedCategoryCounts:
+    """Test the optional materialized category count table."""
+
+    @pytest.fixture(autouse=True)
+    def materialized(self, monkeypatch):
+        from app.services import category_counts
+
+        monkeypatch.setattr(category_counts.settings, "shop_category_counts_materialized", True)
+
+    @pytest.mark.asyncio
+    async def test_counts_read_from_table(
+        self,
+        shop_client: AsyncClient,
+        db_session,
+        test_tenant: Tenant,
+        shop_product_dragon: Product,
+        shop_category_dice: Category,
+    ):
+        """Test shop navigation reads counts from the refreshed table."""
+        from app.services.category_counts import refresh_category_counts
+
+        await refresh_category_counts(db_session, test_tenant.id)
+        await db_session.commit()
+
+        stored = await db_session.get(CategoryProductCount, shop_product_dragon.categories[0].id)
+        assert stored.product_count == 1
+
+        response = await shop_client.get("/api/v1/shop/categories")
+        counts = {c["slug"]: c["product_count"] for c in response.json()["data"]}
+        assert counts == {"dragons": 1, "dice": 0}
+
+    @pytest.mark.asyncio
+    async def test_hiding_product_refreshes_counts(
+        self,
+        client: AsyncClient,
+        db_session,
+        test_tenant: Tenant,
+        shop_product_dragon: Product,
+    ):
+        """Test that changing product visibility via the API rebuilds the counts."""
+        from app.services.category_counts import refresh_category_counts
+
+        await refresh_category_counts(db_session, test_tenant.id)
+        await db_session.commit()
+        category_id = shop_product_dragon.categories[0].id
+
+        response = await client.put(
+            f"/api/v1/products/{shop_product_dragon.id}", json={"shop_visible": False}
+        )
+        assert response.status_code == 200
+
+        db_session.expire_all()
+        stored = await db_session.get(CategoryProductCount, category_id)
+        assert stored.product_count == 0
+
 
 class TestShopProductCategoryFilter:
     """Test shop products category filtering."""
@@ -0,0 +1,406 @@
+"""Integration tests for the denormalized shop product projection."""
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.shop import ShopProduct
+from app.main import app
+from app.models.category import Category, product_categories
+from app.models.designer import Designer
+from app.models.product import Product
+from app.models.product_image import ProductImage
+from app.models.product_pricing import ProductPricing
+from app.models.sales_channel import SalesChannel
+from app.models.shop_product_projection import ShopProductProjection
+from app.models.tenant import Tenant
+from app.services.shop_projection import mark_products_changed, rebuild_shop_projections
+
+
+@pytest_asyncio.fixture
+async def shop_channel(db_session: AsyncSession, test_tenant: Tenant) -> SalesChannel:
+    channel = SalesChannel(
+        id=uuid4(),
+        tenant_id=test_tenant.id,
+        name="Online Shop",
+        platform_type="online_shop",
+        is_active=True,
+    )
+    fair = SalesChannel(
+        id=uuid4(),
+        tenant_id=test_tenant.id,
+        name="Craft Fair",
+        platform_type="fair",
+        is_active=True,
+    )
+    db_session.add_all([channel, fair])
+    await db_session.commit()
+    return channel
+
+
+@pytest_asyncio.fixture
+async def designer(db_session: AsyncSession, test_tenant: Tenant) -> Designer:
+    designer = Designer(
+        id=uuid4(), tenant_id=test_tenant.id, name="Loot Studios", slug="loot-studios"
+    )
+    db_session.add(designer)
+    await db_session.commit()
+    return designer
+
+
+@pytest_asyncio.fixture
+async def product(
+    db_session: AsyncSession, test_tenant: Tenant, shop_channel: SalesChannel, designer: Designer
+) -> Product:
+    product = Product(
+        id=uuid4(),
+        tenant_id=test_tenant.id,
+        designer_id=designer.id,
+        sku="PROJ-001",
+        name="Projected Dragon",
+        description="A dragon",
+        shop_description="A very fine dragon",
+        is_active=True,
+        shop_visible=True,
+        is_dragon=True,
+        units_in_stock=3,
+        seo_slug="projected-dragon",
+    )
+    db_session.add(product)
+    db_session.add(
+        ProductImage(
+            id=uuid4(),
+            tenant_id=test_tenant.id,
+            product_id=product.id,
+            image_url=f"/uploads/products/{product.id}/dragon.webp",
+            alt_text="Dragon",
+            is_primary=True,
+        )
+    )
+    db_session.add(
+        ProductPricing(
+            id=uuid4(),
+            product_id=product.id,
+            sales_channel_id=shop_channel.id,
+            list_price=Decimal("24.99"),
+        )
+    )
+    await db_session.commit()
+    return product
+
+
+@pytest_asyncio.fixture
+async def shop_client(db_session: AsyncSession, test_tenant: Tenant, shop_channel: SalesChannel):
+    from app.auth.dependencies import get_shop_sales_channel
+    from app.database import get_db
+
+    async def override_get_db():
+        yield db_session
+
+    async def override_shop_context():
+        return (test_tenant, shop_channel)
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_shop_sales_channel] = override_shop_context
+    app.state.limiter.enabled = False
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+    app.state.limiter.enabled = True
+    app.dependency_overrides.clear()
+
+
+async def _rows(db_session: AsyncSession, product_id) -> dict:
+    result = await db_session.execute(
+        select(ShopProductProjection).where(ShopProductProjection.product_id == product_id)
+    )
+    return {row.sales_channel_id: row for row in result.scalars().all()}
+
+
+async def _add_to_category(db_session: AsyncSession, product: Product, category: Category):
+    await db_session.flush()
+    await db_session.execute(
+        product_categories.insert().values(
+            tenant_id=product.tenant_id, product_id=product.id, category_id=category.id
+        )
+    )
+    mark_products_changed(db_session, product.id)
+    await db_session.commit()
+    # Load the new membership into the identity map, as a request would
+    await db_session.refresh(category, ["products"])
+
+
+class TestProjectionMaintenance:
+    """Projection rows are rebuilt when shop-facing data is committed."""
+
+    async def test_rows_per_channel_with_resolved_price(
+        self, db_session, product, shop_channel, designer
+    ):
+        rows = await _rows(db_session, product.id)
+
+        # Default row plus one per sales channel of the tenant
+        assert len(rows) == 3
+        assert rows[shop_channel.id].price_pence == 2499
+        # Channels without their own price fall back to the first active price
+        assert {row.price_pence for row in rows.values()} == {2499}
+
+        row = rows[None]
+        assert row.designer_slug == "loot-studios"
+        assert row.seo_slug == "projected-dragon"
+        assert row.payload["images"] == [
+            {
+                "url": f"/api/v1/shop/images/{product.id}/dragon.webp",
+                "alt": "Dragon",
+                "is_primary": True,
+            }
+        ]
+        assert row.payload["description"] == "A dragon"
+        assert row.detail["description"] == "A very fine dragon"
+
+    async def test_documents_match_shop_schema(self, db_session, product):
+        row = (await _rows(db_session, product.id))[None]
+
+        for document in (row.payload, row.detail):
+            assert ShopProduct.model_validate(document).model_dump(mode="json") == document
+
+    async def test_price_change_rebuilds_rows(self, db_session, product, shop_channel):
+        pricing = (
+            await db_session.execute(
+                select(ProductPricing).where(ProductPricing.product_id == product.id)
+            )
+        ).scalar_one()
+        pricing.list_price = Decimal("30.00")
+        await db_session.commit()
+
+        rows = await _rows(db_session, product.id)
+        assert rows[shop_channel.id].price_pence == 3000
+        assert rows[shop_channel.id].payload["price"] == "3000.00"
+
+    async def test_core_category_insert_rebuilds_rows(self, db_session, test_tenant, product):
+        category = Category(id=uuid4(), tenant_id=test_tenant.id, name="Dragons", slug="dragons")
+        db_session.add(category)
+        await db_session.commit()
+
+        await db_session.execute(
+            product_categories.insert().values(
+                tenant_id=test_tenant.id, product_id=product.id, category_id=category.id
+            )
+        )
+        mark_products_changed(db_session, product.id)
+        await db_session.commit()
+
+        row = (await _rows(db_session, product.id))[None]
+        assert row.payload["categories"] == [{"slug": "dragons", "name": "Dragons"}]
+
+    async def test_category_rename_rebuilds_members_only(self, db_session, test_tenant, product):
+        other = Product(
+            id=uuid4(),
+            tenant_id=test_tenant.id,
+            sku="PROJ-OTHER",
+            name="Unrelated",
+            is_active=True,
+            shop_visible=True,
+        )
+        category = Category(id=uuid4(), tenant_id=test_tenant.id, name="Dragons", slug="dragons")
+        db_session.add_all([other, category])
+        await _add_to_category(db_session, product, category)
+        other_row_ids = {row.id for row in (await _rows(db_session, other.id)).values()}
+
+        category.name = "Wyrms"
+        await db_session.commit()
+
+        row = (await _rows(db_session, product.id))[None]
+        assert row.payload["categories"] == [{"slug": "dragons", "name": "Wyrms"}]
+        assert {row.id for row in (await _rows(db_session, other.id)).values()} == other_row_ids
+
+    async def test_category_delete_rebuilds_members(self, db_session, test_tenant, product):
+        category = Category(id=uuid4(), tenant_id=test_tenant.id, name="Dragons", slug="dragons")
+        db_session.add(category)
+        await _add_to_category(db_session, product, category)
+
+        await db_session.delete(category)
+        await db_session.commit()
+
+        row = (await _rows(db_session, product.id))[None]
+        assert row.payload["categories"] == []
+
+    async def test_designer_deactivation_rebuilds_tenant(self, db_session, product, designer):
+        designer.is_active = False
+        await db_session.commit()
+
+        row = (await _rows(db_session, product.id))[None]
+        assert row.designer_slug is None
+        assert row.payload["designer"] is None
+
+    async def test_designer_delete_rebuilds_linked_products(self, db_session, product, designer):
+        await db_session.delete(designer)
+        await db_session.commit()
+
+        row = (await _rows(db_session, product.id))[None]
+        assert row.payload["designer"] is None
+
+    async def test_channel_delete_drops_its_rows(self, db_session, test_tenant, product):
+        fair = (
+            await db_session.execute(
+                select(SalesChannel).where(
+                    SalesChannel.tenant_id == test_tenant.id, SalesChannel.platform_type == "fair"
+                )
+            )
+        ).scalar_one()
+
+        await db_session.delete(fair)
+        await db_session.commit()
+
+        rows = await _rows(db_session, product.id)
+        assert len(rows) == 2
+        assert fair.id not in rows
+
+    async def test_hidden_product_is_not_projected(self, db_session, product):
+        product.shop_visible = False
+        await db_session.commit()
+
+        assert await _rows(db_session, product.id) == {}
+
+    async def test_rebuild_backfills_tenant(self, db_session, test_tenant, product):
+        await db_session.execute(delete(ShopProductProjection))
+        await db_session.commit()
+
+        written = await rebuild_shop_projections(db_session, test_tenant.id)
+        await db_session.commit()
+
+        assert written == 3
+        assert len(await _rows(db_session, product.id)) == 3
+
+
+class TestProjectionReads:
+    """Catalogue endpoints read the projection instead of loading relationships."""
+
+    @pytest.fixture
+    def statements(self, db_engine):
+        captured: list[str] = []
+
+        def _before_execute(conn, cursor, statement, parameters, context, executemany):
+            captured.append(statement)
+
+        event.listen(db_engine.sync_engine, "before_cursor_execute", _before_execute)
+        yield captured
+        event.remove(db_engine.sync_engine, "before_cursor_execute", _before_execute)
+
+    async def test_list_reads_projection_only(self, shop_client, product, statements):
+        response = await shop_client.get("/api/v1/shop/products")
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [p["sku"] for p in data] == ["PROJ-001"]
+        assert data[0]["designer"]["slug"] == "loot-studios"
+        reads = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        assert len(reads) == 2  # count + page
+        assert not any("product_images" in s or "product_pricing" in s for s in reads)
+
+    async def test_detail_and_dragons_read_projection(self, shop_client, product, statements):
+        detail = await shop_client.get("/api/v1/shop/products/projected-dragon")
+        dragons = await shop_client.get("/api/v1/shop/dragons")
+
+        assert detail.status_code == 200
+        assert detail.json()["data"]["description"] == "A very fine dragon"
+        assert [p["sku"] for p in dragons.json()["data"]] == ["PROJ-001"]
+        assert not any("product_images" in s or "product_pricing" in s for s in statements)
+
+    async def test_list_cursor_pagination(self, shop_client, db_session, test_tenant, product):
+        for i in range(2):
+            db_session.add(
+                Product(
+                    id=uuid4(),
+                    tenant_id=test_tenant.id,
+                    sku=f"PROJ-10{i}",
+                    name=f"Cursor {i}",
+                    is_active=True,
+                    shop_visible=True,
+                )
+            )
+        await db_session.commit()
+
+        first = (await shop_client.get("/api/v1/shop/products?limit=2")).json()
+        assert first["total"] == 3
+        second = (
+            await shop_client.get(f"/api/v1/shop/products?limit=2&after={first['next_cursor']}")
+        ).json()
+
+        assert second["total"] is None
+        assert second["next_cursor"] is None
+        skus = [p["sku"] for p in first["data"] + second["data"]]
+        assert sorted(skus) == ["PROJ-001", "PROJ-100", "PROJ-101"]
+
+    async def test_list_sorts_and_filters_by_channel_price(
+        self, shop_client, db_session, test_tenant, shop_channel, product
+    ):
+        for sku, price in (("PROJ-CHEAP", "5.00"), ("PROJ-DEAR", "99.50")):
+            other = Product(
+                id=uuid4(),
+                tenant_id=test_tenant.id,
+                sku=sku,
+                name=sku,
+                is_active=True,
+                shop_visible=True,
+            )
+            db_session.add(other)
+            db_session.add(
+                ProductPricing(
+                    id=uuid4(),
+                    product_id=other.id,
+                    sales_channel_id=shop_channel.id,
+                    list_price=Decimal(price),
+                )
+            )
+        await db_session.commit()
+
+        ascending = (await shop_client.get("/api/v1/shop/products?sort=price-asc")).json()
+        descending = (await shop_client.get("/api/v1/shop/products?sort=price-desc")).json()
+        ranged = (
+            await shop_client.get("/api/v1/shop/products?min_price=1000&max_price=5000")
+        ).json()
+
+        assert [p["sku"] for p in ascending["data"]] == ["PROJ-CHEAP", "PROJ-001", "PROJ-DEAR"]
+        assert [p["sku"] for p in descending["data"]] == ["PROJ-DEAR", "PROJ-001", "PROJ-CHEAP"]
+        assert [p["sku"] for p in ranged["data"]] == ["PROJ-001"]
+        assert ranged["total"] == 1
+
+    async def test_price_sort_cursor_pagination(
+        self, shop_client, db_session, test_tenant, shop_channel, product
+    ):
+        for i, price in enumerate(("5.00", "24.99", "50.00")):
+            other = Product(
+                id=uuid4(),
+                tenant_id=test_tenant.id,
+                sku=f"PROJ-P{i}",
+                name=f"Priced {i}",
+                is_active=True,
+                shop_visible=True,
+            )
+            db_session.add(other)
+            db_session.add(
+                ProductPricing(
+                    id=uuid4(),
+                    product_id=other.id,
+                    sales_channel_id=shop_channel.id,
+                    list_price=Decimal(price),
+                )
+            )
+        await db_session.commit()
+
+        prices = []
+        page = (await shop_client.get("/api/v1/shop/products?sort=price-asc&limit=3")).json()
+        prices.extend(p["price"] for p in page["data"])
+        while page["next_cursor"]:
+            page = (
+                await shop_client.get(
+                    f"/api/v1/shop/products?sort=price-asc&limit=3&after={page['next_cursor']}"
+                )
+            ).json()
+            prices.extend(p["price"] for p in page["data"])
+
+        assert [Decimal(p) for p in prices] == [500, 2499, 2499, 5000]
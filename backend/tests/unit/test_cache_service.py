@@ -1,16 +1,26 @@
 """Unit tests for the cache service."""
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import patch
 
+import fakeredis
 import fakeredis.aioredis
 
 from app.services.cache_service import (
+    INVALIDATION_CHANNEL,
+    PRODUCT_PREFIX,
+    CacheEntry,
     CacheService,
+    LocalCache,
     build_cache_key,
+    invalidate_category_change,
     invalidate_on_product_change,
     invalidate_on_order_complete,
     invalidate_on_inventory_change,
+    invalidate_on_production_change,
 )
 
 
@@ -129,6 +139,25 @@ class TestProductCaching:
         assert await cache_service.get_product("2", "tenant1") is None
         assert await cache_service.get_product("3", "tenant2") is not None
 
+    async def test_product_lists_are_tenant_scoped(self, cache_service):
+        """Test product and shop listing caches are keyed per tenant."""
+        await cache_service.set_product_list("tenant1", "page1", {"total": 1})
+        await cache_service.set_shop_products("tenant1", "page1", {"total": 2})
+
+        assert await cache_service.get_product_list("tenant1", "page1") == {"total": 1}
+        assert await cache_service.get_shop_products("tenant1", "page1") == {"total": 2}
+        assert await cache_service.get_product_list("tenant2", "page1") is None
+
+    async def test_invalidate_tenant_products_drops_lists(self, cache_service):
+        """Test tenant invalidation also drops cached listings."""
+        await cache_service.set_product_list("tenant1", "page1", {"total": 1})
+        await cache_service.set_shop_products("tenant1", "page1", {"total": 1})
+
+        await cache_service.invalidate_tenant_products("tenant1")
+
+        assert await cache_service.get_product_list("tenant1", "page1") is None
+        assert await cache_service.get_shop_products("tenant1", "page1") is None
+
 
 class TestCategoryCaching:
     """Tests for category-specific caching methods."""
@@ -263,6 +292,36 @@ class TestInvalidationHelpers:
         assert await cache.get_cost_breakdown("prod1", "tenant1") is None
         assert await cache.get_dashboard("tenant1", "metric") is None
 
+    async def test_invalidate_on_product_change_drops_listings(self, fake_redis):
+        """Test product change invalidation drops listings and categories."""
+        cache = CacheService(redis_client=fake_redis)
+
+        await cache.set_product_list("tenant1", "page1", {"total": 1})
+        await cache.set_shop_products("tenant1", "page1", {"total": 1})
+        await cache.set_categories("tenant1", [{"slug": "dragons", "product_count": 1}])
+        await cache.set_product_list("tenant2", "page1", {"total": 5})
+
+        with patch("app.services.cache_service._cache_service", cache):
+            await invalidate_on_product_change("tenant1", "prod1")
+
+        assert await cache.get_product_list("tenant1", "page1") is None
+        assert await cache.get_shop_products("tenant1", "page1") is None
+        assert await cache.get_categories("tenant1") is None
+        assert await cache.get_product_list("tenant2", "page1") == {"total": 5}
+
+    async def test_invalidate_category_change(self, fake_redis):
+        """Test category change invalidation."""
+        cache = CacheService(redis_client=fake_redis)
+
+        await cache.set_categories("tenant1", [{"slug": "dragons"}])
+        await cache.set_shop_products("tenant1", "dragons", {"total": 1})
+
+        with patch("app.services.cache_service._cache_service", cache):
+            await invalidate_category_change("tenant1")
+
+        assert await cache.get_categories("tenant1") is None
+        assert await cache.get_shop_products("tenant1", "dragons") is None
+
     async def test_invalidate_on_order_complete(self, fake_redis):
         """Test order completion invalidation."""
         cache = CacheService(redis_client=fake_redis)
@@ -274,6 +333,19 @@ class TestInvalidationHelpers:
 
         assert await cache.get_dashboard("tenant1", "order_count") is None
 
+    async def test_invalidate_on_production_change(self, fake_redis):
+        """Test production run change invalidation."""
+        cache = CacheService(redis_client=fake_redis)
+
+        await cache.set_product("prod1", "tenant1", {"stock": 10})
+        await cache.set_dashboard("tenant1", "summary", {"active_prints": 0})
+
+        with patch("app.services.cache_service._cache_service", cache):
+            await invalidate_on_production_change("tenant1")
+
+        assert await cache.get_dashboard("tenant1", "summary") is None
+        assert await cache.get_product("prod1", "tenant1") == {"stock": 10}
+
     async def test_invalidate_on_inventory_change(self, fake_redis):
         """Test inventory change invalidation."""
         cache = CacheService(redis_client=fake_redis)
@@ -286,3 +358,262 @@ class TestInvalidationHelpers:
 
         assert await cache.get_product("prod1", "tenant1") is None
         assert await cache.get_dashboard("tenant1", "low_stock") is None
+
+
+class TestCacheMetrics:
+    """Tests for cache lookup metrics."""
+
+    async def test_lookup_records_hit_and_miss(self, cache_service):
+        """Test lookups record their namespace and result."""
+        await cache_service.set_product("123", "tenant1", {"name": "Product"})
+
+        with patch("app.observability.metrics.record_cache_lookup") as mock_record:
+            await cache_service.get_product("123", "tenant1")
+            await cache_service.get_categories("tenant1")
+
+        assert [call.args[:2] for call in mock_record.call_args_list] == [
+            ("product", True),
+            ("category", False),
+        ]
+        assert all(call.args[2] >= 0 for call in mock_record.call_args_list)
+
+
+class TestLocalCache:
+    """Tests for the in-process L1 tier."""
+
+    def test_evicts_least_recently_used(self):
+        local = LocalCache(max_entries=2, ttl=60)
+        local.set_value("a", 1)
+        local.set_value("b", 2)
+        local.get("a")
+        local.set_value("c", 3)
+
+        assert local.get("a").value == 1
+        assert local.get("b") is None
+        assert local.get("c").value == 3
+
+    def test_expired_entries_are_dropped(self):
+        local = LocalCache(max_entries=10, ttl=60)
+        local.set("key", CacheEntry("value", fresh_until=0, expires_at=0))
+
+        assert local.get("key") is None
+        assert len(local) == 0
+
+    def test_lifetime_capped_at_local_ttl(self):
+        local = LocalCache(max_entries=10, ttl=5)
+        local.set_value("key", "value", ttl=3600)
+
+        entry = local.get("key")
+        assert entry.expires_at - entry.fresh_until == 0
+        assert entry.expires_at <= time.time() + 5
+
+    def test_delete_pattern(self):
+        local = LocalCache(max_entries=10, ttl=60)
+        local.set_value("batchivo:cache:product:t1:a", 1)
+        local.set_value("batchivo:cache:product:t2:a", 2)
+
+        assert local.delete_pattern("batchivo:cache:product:t1:*") == 1
+        assert local.get("batchivo:cache:product:t1:a") is None
+        assert local.get("batchivo:cache:product:t2:a").value == 2
+
+
+class TestTwoTierCache:
+    """Tests for the L1 + Redis read path."""
+
+    async def test_local_hit_skips_redis(self, cache_service, fake_redis):
+        """Test that a value set in-process is served from L1."""
+        await cache_service.set("test:l1", {"foo": "bar"})
+        await fake_redis.delete("test:l1")
+
+        assert await cache_service.get("test:l1") == {"foo": "bar"}
+
+    async def test_redis_hit_populates_local(self, cache_service, fake_redis):
+        """Test that values written by another worker are promoted to L1."""
+        await fake_redis.set("test:remote", '{"foo": "bar"}')
+
+        assert await cache_service.get("test:remote") == {"foo": "bar"}
+        await fake_redis.delete("test:remote")
+        assert await cache_service.get("test:remote") == {"foo": "bar"}
+
+    async def test_delete_pattern_evicts_local(self, cache_service):
+        """Test that pattern invalidation clears L1 as well as Redis."""
+        await cache_service.set("test:pattern:1", "value")
+        await cache_service.delete_pattern("test:pattern:*")
+
+        assert await cache_service.get("test:pattern:1") is None
+
+
+class TestGetOrSet:
+    """Tests for single-flight get-or-compute."""
+
+    async def test_concurrent_misses_compute_once(self, cache_service):
+        """Test that concurrent callers share one loader call."""
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"total": 42}
+
+        results = await asyncio.gather(
+            *(cache_service.get_or_set("test:flight", loader, ttl=60) for _ in range(10))
+        )
+
+        assert calls == 1
+        assert results == [{"total": 42}] * 10
+
+    async def test_stale_value_served_while_refreshing(self, cache_service):
+        """Test stale-while-revalidate: only the refresher waits for the loader."""
+        await cache_service.get_or_set(
+            "test:swr", lambda: asyncio.sleep(0, "v1"), ttl=0, stale_ttl=60
+        )
+
+        refresh_started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_loader():
+            refresh_started.set()
+            await release.wait()
+            return "v2"
+
+        refresher = asyncio.create_task(
+            cache_service.get_or_set("test:swr", slow_loader, ttl=60, stale_ttl=60)
+        )
+        await refresh_started.wait()
+
+        # Concurrent reader gets the stale value without waiting
+        assert await cache_service.get_or_set("test:swr", slow_loader, ttl=60) == "v1"
+
+        release.set()
+        assert await refresher == "v2"
+        assert await cache_service.get_or_set("test:swr", slow_loader, ttl=60) == "v2"
+
+    async def test_failed_refresh_serves_stale(self, cache_service):
+        """Test that a failing loader falls back to the stale value."""
+        await cache_service.get_or_set(
+            "test:fail", lambda: asyncio.sleep(0, "v1"), ttl=0, stale_ttl=60
+        )
+
+        async def failing_loader():
+            raise RuntimeError("database unavailable")
+
+        assert await cache_service.get_or_set("test:fail", failing_loader, ttl=60) == "v1"
+
+    async def test_failed_load_without_stale_raises(self, cache_service):
+        """Test that loader errors propagate when there is nothing to serve."""
+
+        async def failing_loader():
+            raise RuntimeError("database unavailable")
+
+        with pytest.raises(RuntimeError):
+            await cache_service.get_or_set("test:fail", failing_loader, ttl=60)
+
+    async def test_entries_shared_through_redis(self, fake_redis):
+        """Test that another worker reads the value without recomputing it."""
+        worker_a = CacheService(redis_client=fake_redis)
+        worker_b = CacheService(redis_client=fake_redis)
+        await worker_a.get_or_set("test:shared", lambda: asyncio.sleep(0, "v1"), ttl=60)
+
+        async def loader():
+            raise AssertionError("should be served from Redis")
+
+        assert await worker_b.get_or_set("test:shared", loader, ttl=60) == "v1"
+
+
+class TestInvalidationBroadcast:
+    """Tests for cross-worker L1 eviction via pub/sub."""
+
+    @pytest.fixture
+    async def workers(self):
+        """Two cache services (worker processes) sharing one Redis server."""
+        server = fakeredis.FakeServer()
+        worker_a = CacheService(
+            redis_client=fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+        )
+        redis_b = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+        worker_b = CacheService(redis_client=redis_b)
+
+        await worker_b.start_invalidation_listener()
+        for _ in range(100):
+            if (await redis_b.pubsub_numsub(INVALIDATION_CHANNEL))[0][1]:
+                break
+            await asyncio.sleep(0.01)
+        yield worker_a, worker_b
+        await worker_b.stop_invalidation_listener()
+
+    @staticmethod
+    async def _wait_for(condition):
+        for _ in range(100):
+            if condition():
+                return
+            await asyncio.sleep(0.01)
+
+    async def test_delete_pattern_evicts_other_workers(self, workers):
+        """Test that invalidation on one worker clears another worker's L1."""
+        worker_a, worker_b = workers
+        await worker_b.set("test:pattern:1", "value")
+        assert len(worker_b._local) == 1
+
+        await worker_a.delete_pattern("test:pattern:*")
+        await self._wait_for(lambda: len(worker_b._local) == 0)
+
+        assert len(worker_b._local) == 0
+
+    async def test_generation_bump_reaches_other_workers(self, workers):
+        """Test that a generation bump on one worker invalidates another's entries."""
+        worker_a, worker_b = workers
+        await worker_b.set_product("p1", "tenant1", {"name": "Product"})
+        assert await worker_b.get_product("p1", "tenant1") == {"name": "Product"}
+
+        generation_key = worker_b._generation_key(PRODUCT_PREFIX, "tenant1")
+        await worker_a.invalidate_tenant_products("tenant1")
+        await self._wait_for(lambda: worker_b._local.get(generation_key) is None)
+
+        assert await worker_b.get_product("p1", "tenant1") is None
+
+    async def test_own_messages_are_ignored(self, cache_service):
+        """Test that a worker does not re-process its own broadcasts."""
+        await cache_service.set("test:own", "value")
+        cache_service._handle_invalidation(
+            '{"origin": "%s", "pattern": "test:*"}' % cache_service._instance_id
+        )
+
+        assert await cache_service.get("test:own") == "value"
+
+
+class TestGenerationInvalidation:
+    """Tests for generation-versioned tenant keys."""
+
+    async def test_invalidation_does_not_scan_keyspace(self, cache_service, fake_redis):
+        """Test that tenant invalidation is O(1) rather than a SCAN over all keys."""
+        for i in range(50):
+            await cache_service.set_product(str(i), "tenant1", {"id": i})
+            await cache_service.set_product(str(i), "tenant2", {"id": i})
+
+        with patch.object(fake_redis, "scan_iter", side_effect=AssertionError("SCAN used")):
+            await cache_service.invalidate_tenant_products("tenant1")
+            await cache_service.invalidate_dashboard("tenant1")
+
+        assert await cache_service.get_product("0", "tenant1") is None
+        assert await cache_service.get_product("0", "tenant2") == {"id": 0}
+
+    async def test_bump_advances_generation(self, cache_service):
+        """Test that each bump moves to a new, larger generation."""
+        first = await cache_service.get_generation(PRODUCT_PREFIX, "tenant1")
+        await cache_service.invalidate_tenant_products("tenant1")
+        second = await cache_service.get_generation(PRODUCT_PREFIX, "tenant1")
+
+        assert second == first + 1
+
+    async def test_missing_counter_seeded_from_clock(self, cache_service, fake_redis):
+        """Test that a lost counter never restarts at a previously used generation."""
+        await cache_service.get_generation(PRODUCT_PREFIX, "tenant1")
+        await cache_service.invalidate_tenant_products("tenant1")
+        old = await cache_service.get_generation(PRODUCT_PREFIX, "tenant1")
+
+        await fake_redis.delete(cache_service._generation_key(PRODUCT_PREFIX, "tenant1"))
+        cache_service._local.clear()
+        await asyncio.sleep(0.002)
+
+        assert await cache_service.get_generation(PRODUCT_PREFIX, "tenant1") > old
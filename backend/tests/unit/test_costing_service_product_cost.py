@@ -7,6 +7,7 @@ variance — with circular reference and max-depth protection.
 
 from decimal import Decimal
 from types import SimpleNamespace
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
@@ -16,6 +17,7 @@ from app.services.costing import (
     CostingService,
     MAX_RECURSION_DEPTH,
     MaxDepthExceededError,
+    ProductCostCalculator,
 )
 
 
@@ -416,3 +418,61 @@ class TestDefaultLaborRate:
         # Should not raise even though both children are processed
         result = CostingService.calculate_product_cost(parent)
         assert result.child_products_cost == Decimal("3.00")
+
+
+# ---------------------------------------------------------------------------
+# Memoized batch costing
+# ---------------------------------------------------------------------------
+
+
+class TestProductCostCalculator:
+    def test_shared_models_and_children_costed_once(self):
+        material = SimpleNamespace(weight_grams=Decimal("10"), cost_per_gram=Decimal("0.10"))
+        model = make_model_ns(materials=[material])
+        # Diamond: both halves of the bundle contain the same base product
+        base = make_product(product_models=[make_product_model_ns(model, quantity=2)])
+        left = make_product(child_products=[make_product_child_ns(base)])
+        right = make_product(child_products=[make_product_child_ns(base, quantity=3)])
+        bundle = make_product(
+            child_products=[make_product_child_ns(left), make_product_child_ns(right)]
+        )
+
+        calculator = ProductCostCalculator()
+        with patch.object(
+            CostingService, "calculate_model_cost", wraps=CostingService.calculate_model_cost
+        ) as model_cost:
+            costs = calculator.product_costs([bundle, left, right, base])
+
+        assert model_cost.call_count == 1
+        assert costs[base.id].total_make_cost == Decimal("2.00")
+        assert costs[bundle.id].child_products_cost == Decimal("8.00")
+        assert costs[left.id].total_make_cost == Decimal("2.00")
+
+    def test_batch_matches_single_product_costs(self):
+        material = SimpleNamespace(weight_grams=Decimal("25"), cost_per_gram=Decimal("0.03"))
+        model = make_model_ns(materials=[material], labor_hours=Decimal("0.5"))
+        child = make_product(
+            product_models=[make_product_model_ns(model)], packaging_cost=Decimal("0.40")
+        )
+        parent = make_product(
+            child_products=[make_product_child_ns(child, quantity=2)], assembly_minutes=15
+        )
+
+        batch = CostingService.calculate_product_costs([parent, child])
+
+        assert batch[parent.id] == CostingService.calculate_product_cost(parent)
+        assert batch[child.id] == CostingService.calculate_product_cost(child)
+
+    def test_reused_product_still_checked_for_depth(self):
+        # Chain of MAX_RECURSION_DEPTH products is fine on its own...
+        leaf = make_product()
+        chain = leaf
+        for _ in range(MAX_RECURSION_DEPTH):
+            chain = make_product(child_products=[make_product_child_ns(chain)])
+        calculator = ProductCostCalculator()
+        calculator.product_cost(chain)
+
+        # ...but not one level deeper, even though the chain is memoized
+        deeper = make_product(child_products=[make_product_child_ns(chain)])
+        with pytest.raises(MaxDepthExceededError):
+            calculator.product_cost(deeper)
@@ -119,13 +119,9 @@ class TestSendOrderConfirmation:
         """Test successful order confirmation email."""
         with patch("app.services.email_service.get_settings") as mock_settings:
             mock_settings.return_value = get_mock_settings()
-            with patch("app.services.email_service.httpx.AsyncClient") as mock_client:
+            with patch("app.services.email_service.get_http_client") as mock_client:
                 mock_response = Mock()
                 mock_response.raise_for_status = Mock()
-                mock_client.return_value.__aenter__ = AsyncMock(
-                    return_value=mock_client.return_value
-                )
-                mock_client.return_value.__aexit__ = AsyncMock(return_value=False)
                 mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
                 service = EmailService()
@@ -159,11 +155,7 @@ class TestSendOrderConfirmation:
         """Test that exceptions are handled gracefully."""
         with patch("app.services.email_service.get_settings") as mock_settings:
             mock_settings.return_value = get_mock_settings()
-            with patch("app.services.email_service.httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__ = AsyncMock(
-                    return_value=mock_client.return_value
-                )
-                mock_client.return_value.__aexit__ = AsyncMock(return_value=False)
+            with patch("app.services.email_service.get_http_client") as mock_client:
                 mock_client.return_value.post = AsyncMock(side_effect=Exception("Brevo API error"))
 
                 service = EmailService()
@@ -248,13 +240,9 @@ class TestSendRefundConfirmation:
         """Test successful refund confirmation email."""
         with patch("app.services.email_service.get_settings") as mock_settings:
             mock_settings.return_value = get_mock_settings()
-            with patch("app.services.email_service.httpx.AsyncClient") as mock_client:
+            with patch("app.services.email_service.get_http_client") as mock_client:
                 mock_response = Mock()
                 mock_response.raise_for_status = Mock()
-                mock_client.return_value.__aenter__ = AsyncMock(
-                    return_value=mock_client.return_value
-                )
-                mock_client.return_value.__aexit__ = AsyncMock(return_value=False)
                 mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
                 service = EmailService()
@@ -296,13 +284,9 @@ class TestSendContactNotification:
         """Test successful contact notification email to owner and customer."""
         with patch("app.services.email_service.get_settings") as mock_settings:
             mock_settings.return_value = get_mock_settings()
-            with patch("app.services.email_service.httpx.AsyncClient") as mock_client:
+            with patch("app.services.email_service.get_http_client") as mock_client:
                 mock_response = Mock()
                 mock_response.raise_for_status = Mock()
-                mock_client.return_value.__aenter__ = AsyncMock(
-                    return_value=mock_client.return_value
-                )
-                mock_client.return_value.__aexit__ = AsyncMock(return_value=False)
                 mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
                 service = EmailService()
@@ -1,11 +1,13 @@
 """Unit tests for ExportService pure helper methods."""
 
+import gzip
+import io
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from app.models.order import OrderStatus
-from app.services.export_service import ExportService
+from app.services.export_service import ExportService, gzip_chunks
 
 
 @pytest.fixture
@@ -98,3 +100,33 @@ class TestMapFulfillmentStatus:
 
     def test_unknown_status_returns_empty(self, service: ExportService):
         assert service._map_fulfillment_status("nonexistent") == ""
+
+
+class TestStreamingHelpers:
+    """Tests for the CSV streaming helpers."""
+
+    def test_drain_returns_and_empties_buffer(self, service: ExportService):
+        output = io.StringIO()
+        output.write("a,b\r\n")
+
+        assert service._drain(output) == "a,b\r\n"
+        assert output.getvalue() == ""
+        output.write("c")
+        assert output.getvalue() == "c"
+
+    async def test_join_collects_chunks(self, service: ExportService):
+        async def chunks():
+            yield "a,"
+            yield "b"
+
+        assert await service._join(chunks()) == "a,b"
+
+    async def test_gzip_chunks_produces_one_gzip_file(self):
+        async def chunks():
+            for i in range(1000):
+                yield f"row-{i},£{i}\r\n"
+
+        compressed = b"".join([piece async for piece in gzip_chunks(chunks())])
+
+        expected = "".join(f"row-{i},£{i}\r\n" for i in range(1000))
+        assert gzip.decompress(compressed).decode("utf-8") == expected
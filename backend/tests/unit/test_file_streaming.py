@@ -0,0 +1,104 @@
+"""Unit tests for streaming file responses and Range parsing."""
+
+import pytest
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.requests import Request
+
+from app.utils.file_streaming import (
+    RangeNotSatisfiableError,
+    StoredFile,
+    parse_range,
+    stream_file_response,
+)
+
+
+def make_request(headers: dict[str, str] | None = None) -> Request:
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def make_remote(data: bytes, etag: str | None = None) -> StoredFile:
+    async def read_range(start: int, end: int):
+        yield data[start : end + 1]
+
+    return StoredFile(size=len(data), content_type="model/stl", read_range=read_range, etag=etag)
+
+
+async def collect(response: StreamingResponse) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+class TestParseRange:
+    """Tests for parse_range."""
+
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            ("bytes=0-99", (0, 99)),
+            ("bytes=100-", (100, 999)),
+            ("bytes=-100", (900, 999)),
+            ("bytes=500-5000", (500, 999)),
+            ("bytes=-5000", (0, 999)),
+        ],
+    )
+    def test_single_ranges(self, header, expected):
+        assert parse_range(header, 1000) == expected
+
+    @pytest.mark.parametrize(
+        "header", [None, "", "items=0-1", "bytes=0-1,5-6", "bytes=abc-", "bytes=5-1", "bytes=5"]
+    )
+    def test_ignored_headers_serve_whole_object(self, header):
+        assert parse_range(header, 1000) is None
+
+    @pytest.mark.parametrize("header", ["bytes=1000-", "bytes=-0"])
+    def test_unsatisfiable(self, header):
+        with pytest.raises(RangeNotSatisfiableError):
+            parse_range(header, 1000)
+
+
+class TestStreamFileResponse:
+    """Tests for stream_file_response."""
+
+    def test_local_file_uses_file_response(self, tmp_path):
+        path = tmp_path / "model.stl"
+        path.write_bytes(b"solid")
+        stored = StoredFile(size=5, content_type="model/stl", path=path)
+
+        response = stream_file_response(make_request(), stored, {"X-Test": "1"})
+
+        assert isinstance(response, FileResponse)
+        assert response.headers["x-test"] == "1"
+
+    async def test_remote_full_body(self):
+        response = stream_file_response(make_request(), make_remote(b"0123456789"))
+
+        assert response.status_code == 200
+        assert response.headers["content-length"] == "10"
+        assert response.headers["accept-ranges"] == "bytes"
+        assert await collect(response) == b"0123456789"
+
+    async def test_remote_partial_content(self):
+        request = make_request({"Range": "bytes=2-5"})
+
+        response = stream_file_response(request, make_remote(b"0123456789"))
+
+        assert response.status_code == 206
+        assert response.headers["content-range"] == "bytes 2-5/10"
+        assert response.headers["content-length"] == "4"
+        assert await collect(response) == b"2345"
+
+    def test_remote_unsatisfiable_range(self):
+        request = make_request({"Range": "bytes=50-"})
+
+        response = stream_file_response(request, make_remote(b"0123456789"))
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */10"
+
+    async def test_stale_if_range_serves_whole_object(self):
+        request = make_request({"Range": "bytes=2-5", "If-Range": '"old"'})
+
+        response = stream_file_response(request, make_remote(b"0123456789", etag='"new"'))
+
+        assert response.status_code == 200
+        assert await collect(response) == b"0123456789"
@@ -63,13 +63,30 @@ class TestCalculateStatistics:
         """When every day has identical sales the population std dev is 0."""
         svc = _make_service()
         analysis_days = 5
-        # Create one entry per day for all 5 days
-        history = [_daily_demand(i, 4) for i in range(1, analysis_days + 1)]
+        # Create one entry per day for all 5 days, today included
+        history = [_daily_demand(i, 4) for i in range(analysis_days)]
         avg, std, total = svc._calculate_statistics(history, analysis_days=analysis_days)
         assert total == 20
         assert avg == pytest.approx(4.0)
         assert std == pytest.approx(0.0, abs=1e-9)
 
+    def test_std_dev_covers_same_days_as_history(self):
+        """Today's sales count towards the std dev; the day before the window does not."""
+        svc = _make_service()
+        analysis_days = 7
+        history = [
+            _daily_demand(0, 9),
+            _daily_demand(2, 3),
+            _daily_demand(6, 1),
+        ]
+        avg, std, total = svc._calculate_statistics(history, analysis_days=analysis_days)
+
+        daily = [9, 0, 3, 0, 0, 0, 1]
+        mean = sum(daily) / analysis_days
+        expected = (sum((x - mean) ** 2 for x in daily) / analysis_days) ** 0.5
+        assert avg == pytest.approx(mean)
+        assert std == pytest.approx(expected)
+
     def test_total_sold_sums_all_quantities(self):
         svc = _make_service()
         history = [
@@ -0,0 +1,75 @@
+"""Unit tests for the shared outbound HTTP clients."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.utils import http_client
+from app.utils.http_client import HttpClientRegistry, _InstrumentedTransport
+
+
+class TestHttpClientRegistry:
+    @pytest.mark.asyncio
+    async def test_reuses_client_per_name(self):
+        registry = HttpClientRegistry()
+
+        first = registry.get("webhooks")
+        assert registry.get("webhooks") is first
+        assert registry.get("email") is not first
+
+        await registry.aclose()
+        assert first.is_closed
+
+    @pytest.mark.asyncio
+    async def test_replaces_closed_client(self):
+        registry = HttpClientRegistry()
+        first = registry.get("email")
+        await first.aclose()
+
+        second = registry.get("email")
+
+        assert second is not first
+        assert not second.is_closed
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_configured_from_settings(self):
+        settings = http_client.get_settings()
+        client = http_client.create_http_client("shopify")
+        try:
+            assert client.timeout.connect == settings.http_client_connect_timeout_seconds
+            assert client.timeout.read == settings.http_client_timeout_seconds
+            assert isinstance(client._transport, _InstrumentedTransport)
+        finally:
+            await client.aclose()
+
+
+class TestInstrumentedTransport:
+    @pytest.mark.asyncio
+    async def test_records_status_class_per_host(self):
+        transport = _InstrumentedTransport(
+            "webhooks", httpx.MockTransport(lambda request: httpx.Response(503))
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch.object(http_client, "_record_request") as record:
+                response = await client.post("https://hooks.example.com/in")
+
+        assert response.status_code == 503
+        client_name, host, outcome, duration = record.call_args.args
+        assert (client_name, host, outcome) == ("webhooks", "hooks.example.com", "5xx")
+        assert duration >= 0
+
+    @pytest.mark.asyncio
+    async def test_records_errors(self):
+        def refuse(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        transport = _InstrumentedTransport("email", httpx.MockTransport(refuse))
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch.object(http_client, "_record_request") as record:
+                with pytest.raises(httpx.ConnectError):
+                    await client.get("https://api.brevo.com/v3/smtp/email")
+
+        assert record.call_args.args[2] == "error"
+        assert record.call_args.kwargs["error_type"] == "ConnectError"
@@ -0,0 +1,110 @@
+"""Tests for on-demand responsive image derivatives."""
+
+import asyncio
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from app.services import image_derivatives
+from app.services.image_derivatives import (
+    ImageDerivativeService,
+    content_etag,
+    negotiate_extension,
+    width_bucket,
+)
+from app.services.image_storage import ImageStorage, ImageStorageError, derivative_url
+
+
+IMAGE_URL = "/uploads/products/p1/source.jpg"
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = ImageStorage()
+    storage.base_path = tmp_path
+    storage.storage_type = "local"
+    source = tmp_path / "products" / "p1" / "source.jpg"
+    source.parent.mkdir(parents=True)
+    Image.new("RGB", (800, 400), color="green").save(source, format="JPEG")
+    return storage
+
+
+@pytest.fixture
+def service(storage):
+    return ImageDerivativeService(storage)
+
+
+class TestNegotiation:
+    """Tests for format negotiation and width bucketing."""
+
+    def test_prefers_avif_then_webp(self):
+        assert negotiate_extension("image/avif,image/webp,*/*", "jpg") == "avif"
+        assert negotiate_extension("image/webp,*/*;q=0.8", "jpg") == "webp"
+
+    def test_falls_back_to_source_format(self):
+        assert negotiate_extension("*/*", "png") == "png"
+        assert negotiate_extension(None, "jpeg") == "jpg"
+
+    def test_ignores_refused_types(self):
+        assert negotiate_extension("image/avif;q=0, image/webp", "jpg") == "webp"
+
+    def test_width_buckets(self):
+        assert width_bucket(1) == 160
+        assert width_bucket(321) == 480
+        assert width_bucket(5000) == 800
+        assert width_bucket(None) == 800
+
+
+class TestImageDerivativeService:
+    """Tests for rendering and storing variants."""
+
+    async def test_renders_and_stores_variant(self, service, storage, tmp_path):
+        content, content_type = await service.get_variant(IMAGE_URL, 300, "image/webp")
+
+        assert content_type == "image/webp"
+        with Image.open(BytesIO(content)) as img:
+            assert img.format == "WEBP"
+            assert img.size == (320, 160)
+
+        stored = tmp_path / derivative_url(IMAGE_URL, 320, "webp")[len("/uploads/") :]
+        assert stored.read_bytes() == content
+
+    async def test_stored_variant_is_reused(self, service):
+        first, _ = await service.get_variant(IMAGE_URL, 160, None)
+
+        with patch.object(image_derivatives, "_render_derivative") as render:
+            second, content_type = await service.get_variant(IMAGE_URL, 100, None)
+
+        render.assert_not_called()
+        assert second == first
+        assert content_type == "image/jpeg"
+
+    async def test_concurrent_misses_render_once(self, service):
+        real_render = image_derivatives._render_derivative
+        with patch.object(
+            image_derivatives, "_render_derivative", side_effect=real_render
+        ) as render:
+            results = await asyncio.gather(
+                *(service.get_variant(IMAGE_URL, 480, "image/webp") for _ in range(4))
+            )
+
+        assert render.call_count == 1
+        assert len({content_etag(content) for content, _ in results}) == 1
+
+    async def test_missing_source_raises(self, service):
+        with pytest.raises(ImageStorageError):
+            await service.get_variant("/uploads/products/p1/missing.jpg", 320, None)
+
+    async def test_delete_and_rotate_drop_variants(self, service, storage, tmp_path):
+        await service.get_variant(IMAGE_URL, 320, "image/webp")
+        variant = tmp_path / derivative_url(IMAGE_URL, 320, "webp")[len("/uploads/") :]
+        assert variant.exists()
+
+        await storage.rotate_image(IMAGE_URL, None, 90)
+        assert not variant.exists()
+
+        await service.get_variant(IMAGE_URL, 320, "image/webp")
+        await storage.delete_image(IMAGE_URL)
+        assert not variant.exists()
@@ -8,6 +8,7 @@ Includes tests for:
 - Storage backends (local, S3)
 """
 
+import hashlib
 import io
 import zipfile
 from pathlib import Path
@@ -215,6 +216,23 @@ class TestExtract3mfThumbnail:
 
         assert result is None
 
+    def test_extract_from_file_object(self, tmp_path):
+        """Test extracting a thumbnail from a file on disk without reading it first."""
+        png_data = create_png_image_bytes()
+        path = tmp_path / "model.3mf"
+        path.write_bytes(
+            create_3mf_with_thumbnail(
+                thumbnail_path="Metadata/thumbnail.png",
+                thumbnail_content=png_data,
+            )
+        )
+
+        with path.open("rb") as f:
+            f.read(10)  # Position should not matter
+            result = extract_3mf_thumbnail(f)
+
+        assert result == (png_data, "image/png")
+
     def test_priority_of_standard_path(self):
         """Test that standard path is preferred over alternative paths."""
         png_data_standard = create_png_image_bytes()
@@ -354,6 +372,22 @@ class TestLocalStorage:
         saved_content = (tmp_path / model_dir / filename).read_bytes()
         assert saved_content == content
 
+    @pytest.mark.asyncio
+    async def test_save_local_stream_copies_and_hashes(self, tmp_path):
+        """Test that _save_local_stream copies a file object and returns its SHA-256."""
+        service = _create_mock_service(storage_path=str(tmp_path))
+        content = create_minimal_stl() * 1000
+        model_dir = f"models/{uuid4()}"
+
+        file_url, sha256 = await service._save_local_stream(
+            io.BytesIO(content), model_dir, "test.stl"
+        )
+
+        assert file_url == f"/uploads/{model_dir}/test.stl"
+        assert (tmp_path / model_dir / "test.stl").read_bytes() == content
+        assert sha256 == hashlib.sha256(content).hexdigest()
+        assert not (tmp_path / model_dir / "test.stl.partial").exists()
+
     @pytest.mark.asyncio
     async def test_get_local_reads_content(self, tmp_path):
         """Test that _get_local reads file content correctly."""
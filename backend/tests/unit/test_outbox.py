@@ -0,0 +1,193 @@
+"""Unit tests for the transactional outbox and its dispatcher."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.order import Order, OrderItem, OrderStatus
+from app.models.outbox import OutboxEvent, OutboxEventStatus
+from app.services import outbox
+from app.services.outbox import OUTBOX_RETRY_INTERVALS, OutboxDispatcher
+
+pytestmark = pytest.mark.anyio
+
+TEST_EVENT = "test.event"
+
+
+@pytest.fixture
+def session_factory(db_engine):
+    return async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+def test_handler(monkeypatch):
+    handler = AsyncMock()
+    monkeypatch.setitem(outbox._handlers, TEST_EVENT, handler)
+    return handler
+
+
+async def _enqueue(db_session, tenant_id, event_type=TEST_EVENT, payload=None):
+    event = outbox.enqueue(db_session, tenant_id, event_type, payload or {"key": "value"})
+    await db_session.commit()
+    return event
+
+
+class TestEnqueue:
+    async def test_enqueue_is_part_of_callers_transaction(
+        self, db_session, test_tenant, test_handler
+    ):
+        outbox.enqueue(db_session, test_tenant.id, TEST_EVENT, {"key": "value"})
+        await db_session.rollback()
+
+        dispatcher = OutboxDispatcher(async_sessionmaker(db_session.bind))
+        assert await dispatcher.claim_due(10) == []
+
+    async def test_enqueue_unknown_event_type(self, db_session, test_tenant):
+        with pytest.raises(ValueError, match="No outbox handler"):
+            outbox.enqueue(db_session, test_tenant.id, "unknown.event")
+
+
+class TestDispatcher:
+    async def test_claim_leases_events(
+        self, db_session, session_factory, test_tenant, test_handler
+    ):
+        event = await _enqueue(db_session, test_tenant.id)
+        dispatcher = OutboxDispatcher(session_factory)
+
+        assert await dispatcher.claim_due(10) == [event.id]
+        # Leased events are hidden until the lease expires
+        assert await dispatcher.claim_due(10) == []
+
+    async def test_dispatch_runs_handler_and_completes(
+        self, db_session, session_factory, test_tenant, test_handler
+    ):
+        event = await _enqueue(db_session, test_tenant.id)
+        dispatcher = OutboxDispatcher(session_factory)
+
+        await dispatcher.dispatch(event.id)
+
+        test_handler.assert_awaited_once()
+        _, tenant_id, payload = test_handler.await_args.args
+        assert tenant_id == test_tenant.id
+        assert payload == {"key": "value"}
+
+        await db_session.refresh(event)
+        assert event.status == OutboxEventStatus.COMPLETED.value
+        assert event.attempts == 1
+        assert event.completed_at is not None
+
+    async def test_failed_dispatch_schedules_retry(
+        self, db_session, session_factory, test_tenant, test_handler
+    ):
+        test_handler.side_effect = RuntimeError("provider down")
+        event = await _enqueue(db_session, test_tenant.id)
+        dispatcher = OutboxDispatcher(session_factory)
+
+        before = datetime.now(timezone.utc)
+        await dispatcher.dispatch(event.id)
+
+        await db_session.refresh(event)
+        assert event.status == OutboxEventStatus.PENDING.value
+        assert event.attempts == 1
+        assert "provider down" in event.last_error
+        next_attempt = event.next_attempt_at.replace(tzinfo=timezone.utc)
+        assert next_attempt >= before + timedelta(seconds=OUTBOX_RETRY_INTERVALS[0] - 1)
+
+    async def test_exhausted_retries_mark_failed(
+        self, db_session, session_factory, test_tenant, test_handler
+    ):
+        test_handler.side_effect = RuntimeError("provider down")
+        event = await _enqueue(db_session, test_tenant.id)
+        event.attempts = len(OUTBOX_RETRY_INTERVALS)
+        await db_session.commit()
+
+        await OutboxDispatcher(session_factory).dispatch(event.id)
+
+        await db_session.refresh(event)
+        assert event.status == OutboxEventStatus.FAILED.value
+        assert event.completed_at is not None
+
+
+class TestOrderConfirmationHandler:
+    @pytest.fixture
+    async def order(self, db_session, test_tenant):
+        order = Order(
+            tenant_id=test_tenant.id,
+            order_number="TEST-20261016-001",
+            status=OrderStatus.PENDING,
+            customer_email="customer@example.com",
+            customer_name="Jane Doe",
+            shipping_address_line1="1 Test Street",
+            shipping_city="London",
+            shipping_postcode="SW1A 1AA",
+            shipping_country="United Kingdom",
+            shipping_method="Royal Mail",
+            shipping_cost=Decimal("3.99"),
+            subtotal=Decimal("20.00"),
+            total=Decimal("23.99"),
+        )
+        db_session.add(order)
+        await db_session.flush()
+        db_session.add(
+            OrderItem(
+                tenant_id=test_tenant.id,
+                order_id=order.id,
+                product_sku="SKU-1",
+                product_name="Dragon",
+                quantity=2,
+                unit_price=Decimal("10.00"),
+                total_price=Decimal("20.00"),
+            )
+        )
+        await db_session.commit()
+        return order
+
+    async def test_sends_confirmation_once(self, db_session, session_factory, test_tenant, order):
+        event = await _enqueue(
+            db_session,
+            test_tenant.id,
+            outbox.EVENT_ORDER_CONFIRMATION_EMAIL,
+            {"order_id": str(order.id), "receipt_url": "https://example.com/receipt"},
+        )
+        email_service = MagicMock(is_configured=True)
+        email_service.send_order_confirmation = AsyncMock(return_value=True)
+
+        with patch("app.services.email_service.get_email_service", return_value=email_service):
+            await OutboxDispatcher(session_factory).dispatch(event.id)
+
+        kwargs = email_service.send_order_confirmation.await_args.kwargs
+        assert kwargs["order_number"] == order.order_number
+        assert kwargs["order_items"] == [{"name": "Dragon", "quantity": 2, "price": 10.0}]
+        assert kwargs["receipt_url"] == "https://example.com/receipt"
+
+        await db_session.refresh(order)
+        assert order.confirmation_email_sent is True
+        await db_session.refresh(event)
+        assert event.status == OutboxEventStatus.COMPLETED.value
+
+    async def test_unsent_email_is_retried(self, db_session, session_factory, test_tenant, order):
+        event = await _enqueue(
+            db_session,
+            test_tenant.id,
+            outbox.EVENT_ORDER_CONFIRMATION_EMAIL,
+            {"order_id": str(order.id)},
+        )
+        email_service = MagicMock(is_configured=True)
+        email_service.send_order_confirmation = AsyncMock(return_value=False)
+
+        with patch("app.services.email_service.get_email_service", return_value=email_service):
+            await OutboxDispatcher(session_factory).dispatch(event.id)
+
+        await db_session.refresh(event)
+        assert event.status == OutboxEventStatus.PENDING.value
+        assert event.attempts == 1
+        await db_session.refresh(order)
+        assert not order.confirmation_email_sent
+
+
+def test_outbox_event_repr():
+    event = OutboxEvent(event_type=TEST_EVENT, status=OutboxEventStatus.PENDING.value)
+    assert "test.event" in repr(event)
@@ -0,0 +1,39 @@
+"""Unit tests for keyset pagination cursors."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.utils.pagination import Cursor, InvalidCursorError, decode_cursor, encode_cursor
+
+
+class TestCursorEncoding:
+    """Tests for encode_cursor/decode_cursor."""
+
+    def test_roundtrip(self):
+        """Decoding an encoded cursor should return the boundary row."""
+        sort_value = datetime(2026, 10, 16, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        row_id = uuid4()
+
+        assert decode_cursor(encode_cursor(sort_value, row_id)) == Cursor(sort_value, row_id)
+
+    def test_integer_sort_value_roundtrip(self):
+        """Integer sort values (e.g. prices in pence) should survive encoding."""
+        row_id = uuid4()
+
+        assert decode_cursor(encode_cursor(2499, row_id)) == Cursor(2499, row_id)
+
+    def test_token_is_url_safe(self):
+        """Tokens should be usable as query parameters without escaping."""
+        token = encode_cursor(datetime(2026, 1, 1), uuid4())
+
+        assert "=" not in token
+        assert "+" not in token
+        assert "/" not in token
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "e30", "eyJ2IjoieCIsImlkIjoieSJ9"])
+    def test_malformed_token_raises(self, token):
+        """Malformed tokens should raise InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token)
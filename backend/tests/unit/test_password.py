@@ -1,6 +1,20 @@
 """Unit tests for password hashing utilities."""
 
-from app.auth.password import get_password_hash, verify_password
+import asyncio
+
+import pytest
+
+from app.auth.password import (
+    PasswordHasher,
+    PasswordHasherBusyError,
+    get_password_hash,
+    hash_password_async,
+    needs_rehash,
+    settings,
+    verify_and_update_async,
+    verify_password,
+    verify_password_async,
+)
 
 
 class TestGetPasswordHash:
@@ -72,3 +86,63 @@ class TestVerifyPassword:
         hash2 = get_password_hash(pw)
         assert verify_password(pw, hash1) is True
         assert verify_password(pw, hash2) is True
+
+
+class TestNeedsRehash:
+    """Tests for needs_rehash."""
+
+    def test_current_cost_does_not_need_rehash(self):
+        hashed = get_password_hash("pw", rounds=settings.password_hash_rounds)
+        assert needs_rehash(hashed) is False
+
+    def test_other_cost_needs_rehash(self):
+        hashed = get_password_hash("pw", rounds=4)
+        assert needs_rehash(hashed) is (settings.password_hash_rounds != 4)
+
+    def test_malformed_hash_needs_rehash(self):
+        assert needs_rehash("not-a-bcrypt-hash") is True
+
+
+class TestAsyncPasswordHashing:
+    """Tests for the thread-pool backed async API."""
+
+    async def test_hash_and_verify_roundtrip(self):
+        hashed = await hash_password_async("asyncpassword")
+        assert await verify_password_async("asyncpassword", hashed) is True
+        assert await verify_password_async("wrong", hashed) is False
+
+    async def test_verify_empty_hash_returns_false(self):
+        assert await verify_password_async("anything", "") is False
+
+    async def test_verify_and_update_rehashes_outdated_cost(self, monkeypatch):
+        old_hash = get_password_hash("upgrade-me", rounds=4)
+        monkeypatch.setattr(settings, "password_hash_rounds", 5)
+
+        valid, new_hash = await verify_and_update_async("upgrade-me", old_hash)
+
+        assert valid is True
+        assert new_hash is not None and new_hash.startswith("$2b$05$")
+        assert verify_password("upgrade-me", new_hash) is True
+
+    async def test_verify_and_update_keeps_current_hash(self, monkeypatch):
+        monkeypatch.setattr(settings, "password_hash_rounds", 4)
+        hashed = get_password_hash("current")
+
+        assert await verify_and_update_async("current", hashed) == (True, None)
+        assert await verify_and_update_async("wrong", hashed) == (False, None)
+
+    async def test_full_queue_rejects_calls(self):
+        hasher = PasswordHasher(workers=1, max_pending=1)
+        hashed = get_password_hash("pw", rounds=4)
+        try:
+            calls = [asyncio.create_task(hasher.verify("pw", hashed)) for _ in range(2)]
+            await asyncio.sleep(0)
+            assert hasher.in_flight == 2
+
+            with pytest.raises(PasswordHasherBusyError):
+                await hasher.verify("pw", hashed)
+
+            assert await asyncio.gather(*calls) == [True, True]
+            assert hasher.in_flight == 0
+        finally:
+            hasher.shutdown()
@@ -0,0 +1,102 @@
+"""Unit tests for the shared per-tenant printer poller behind /ws/printers."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.api.v1 import printer_ws
+from app.api.v1.printer_ws import PrinterWSManager, _state_message
+
+
+def _state(printer_id: str, status: str = "idle", progress=None) -> dict:
+    return {"id": printer_id, "status": status, "progress_percent": progress, "job_name": None}
+
+
+def _websocket(fail: bool = False) -> AsyncMock:
+    ws = AsyncMock()
+    if fail:
+        ws.send_json.side_effect = RuntimeError("closed")
+    return ws
+
+
+class TestStateMessage:
+    def test_no_change(self):
+        states = [_state("a"), _state("b")]
+        assert _state_message(states, [dict(s) for s in states]) is None
+
+    def test_delta_contains_only_changed_printers(self):
+        old = [_state("a"), _state("b")]
+        new = [_state("a"), _state("b", "printing", 12.5)]
+
+        message = _state_message(old, new)
+
+        assert message == {"type": "printer_state_delta", "data": [new[1]]}
+
+    def test_snapshot_when_printers_added(self):
+        new = [_state("a"), _state("b")]
+
+        message = _state_message([_state("a")], new)
+
+        assert message == {"type": "printer_state", "data": new}
+
+
+class TestTenantPoller:
+    @pytest.mark.asyncio
+    async def test_one_poll_serves_every_connection(self):
+        ws_manager = PrinterWSManager()
+        tenant_id = uuid4()
+        polls = [[_state("a")], [_state("a", "printing", 5.0)]]
+        build = AsyncMock(side_effect=polls)
+        first, second = _websocket(), _websocket()
+
+        with patch.object(printer_ws, "_build_printer_live_states", build):
+            await ws_manager.connect(first, tenant_id)
+            await ws_manager.connect(second, tenant_id)
+
+            assert await ws_manager.snapshot(tenant_id) == polls[0]
+            await ws_manager._pollers[tenant_id].poll_once()
+
+        assert build.await_count == 2
+        delta = {"type": "printer_state_delta", "data": polls[1]}
+        first.send_json.assert_awaited_once_with(delta)
+        second.send_json.assert_awaited_once_with(delta)
+
+        ws_manager.disconnect(first, tenant_id)
+        ws_manager.disconnect(second, tenant_id)
+
+    @pytest.mark.asyncio
+    async def test_poller_stops_with_last_connection(self):
+        ws_manager = PrinterWSManager()
+        tenant_id = uuid4()
+        first, second = _websocket(), _websocket()
+
+        with patch.object(printer_ws, "_build_printer_live_states", AsyncMock(return_value=[])):
+            await ws_manager.connect(first, tenant_id)
+            await ws_manager.connect(second, tenant_id)
+            task = ws_manager._pollers[tenant_id]._task
+
+            ws_manager.disconnect(first, tenant_id)
+            assert not task.cancelled()
+
+            ws_manager.disconnect(second, tenant_id)
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert tenant_id not in ws_manager._pollers
+
+    @pytest.mark.asyncio
+    async def test_failed_send_drops_connection(self):
+        ws_manager = PrinterWSManager()
+        tenant_id = uuid4()
+        healthy, dead = _websocket(), _websocket(fail=True)
+
+        with patch.object(printer_ws, "_build_printer_live_states", AsyncMock(return_value=[])):
+            await ws_manager.connect(healthy, tenant_id)
+            await ws_manager.connect(dead, tenant_id)
+
+            await ws_manager.broadcast_to_tenant(tenant_id, {"type": "printer_state"})
+
+            assert ws_manager._connections[tenant_id] == [healthy]
+            ws_manager.disconnect(healthy, tenant_id)
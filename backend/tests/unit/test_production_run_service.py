@@ -168,6 +168,38 @@ class TestProductionRunService:
         assert total == 2
         assert all(run.status == "completed" for run in runs)
 
+    @pytest.mark.asyncio
+    async def test_list_production_runs_keyset(self, db_session, test_tenant):
+        """Test walking production runs with keyset cursors in both directions."""
+        service = ProductionRunService(db_session, test_tenant)
+
+        started_at = datetime.now()
+        for i in range(5):
+            data = ProductionRunCreate(
+                run_number=unique_run_number(f"TEST-KEYSET-{i}"),
+                # Two runs share a start time to exercise the id tie-breaker
+                started_at=started_at - timedelta(hours=min(i, 3)),
+                status="completed",
+            )
+            await service.create_production_run(data)
+
+        seen = []
+        page, total = await service.list_production_runs_keyset(limit=2, include_total=True)
+        assert total == 5
+        assert page.prev_cursor is None
+        seen.extend(run.id for run in page.items)
+        while page.next_cursor:
+            page, total = await service.list_production_runs_keyset(limit=2, after=page.next_cursor)
+            assert total is None
+            seen.extend(run.id for run in page.items)
+
+        offset_runs, _ = await service.list_production_runs(page=1, page_size=5)
+        assert seen == [run.id for run in offset_runs]
+
+        # The last page's prev_cursor leads back to the page before it
+        page, _ = await service.list_production_runs_keyset(limit=2, before=page.prev_cursor)
+        assert [run.id for run in page.items] == seen[2:4]
+
     @pytest.mark.asyncio
     async def test_update_production_run(self, db_session, test_tenant):
         """Test updating a production run."""
@@ -0,0 +1,31 @@
+"""Unit tests for read-model session hook registration."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def test_models_alone_register_read_model_hooks():
+    """A process that only imports models (e.g. a script) still maintains read models."""
+    code = (
+        "import sys\n"
+        "import app.models.product\n"
+        "from sqlalchemy.orm import Session, configure_mappers\n"
+        "session = Session()\n"
+        "configure_mappers()\n"
+        "for name in ('cost_snapshots', 'sales_rollup', 'shop_projection'):\n"
+        "    assert 'app.services.' + name in sys.modules, name\n"
+        "assert len(session.dispatch.before_commit) >= 3\n"
+    )
+    env = {**os.environ, "SECRET_KEY": os.environ.get("SECRET_KEY", "x" * 40)}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,131 @@
+"""Unit tests for the in-process shop tenant routing index."""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from app.auth.dependencies import get_shop_sales_channel, get_shop_tenant
+from app.models.sales_channel import SalesChannel
+from app.models.tenant import Tenant
+from app.services.tenant_routing import TenantRoutingIndex, tenant_routing_index
+from app.services.tenant_settings import TenantSettingsService
+
+
+@pytest.fixture
+async def shop_tenant(db_session) -> Tenant:
+    tenant = Tenant(
+        id=uuid4(),
+        name="Routing Shop",
+        slug=f"routing-{uuid4().hex[:8]}",
+        settings={"shop": {"enabled": True}},
+    )
+    db_session.add(tenant)
+    db_session.add(
+        SalesChannel(
+            id=uuid4(),
+            tenant_id=tenant.id,
+            name="Online Shop",
+            platform_type="online_shop",
+            is_active=True,
+        )
+    )
+    await db_session.commit()
+    return tenant
+
+
+@pytest.fixture
+def statements(db_engine):
+    """Record SQL statements executed against the test engine."""
+    captured: list[str] = []
+
+    def _before_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", _before_execute)
+    yield captured
+    event.remove(db_engine.sync_engine, "before_cursor_execute", _before_execute)
+
+
+class TestTenantRoutingIndex:
+    """Tests for TenantRoutingIndex bookkeeping."""
+
+    def test_lookup_miss(self):
+        index = TenantRoutingIndex()
+        assert index.lookup("unknown.batchivo.shop") is None
+
+    async def test_store_and_lookup_normalizes_hostname(self, shop_tenant):
+        index = TenantRoutingIndex()
+        index.store_tenant("Shop.Example.com:443", shop_tenant)
+
+        route = index.lookup("shop.example.com")
+        assert route is not None
+        assert route.tenant.id == shop_tenant.id
+        assert route.tenant is not shop_tenant
+
+    async def test_expired_entries_are_dropped(self, shop_tenant):
+        index = TenantRoutingIndex(ttl=0)
+        index.store_tenant("shop.example.com", shop_tenant)
+
+        assert index.lookup("shop.example.com") is None
+        assert len(index) == 0
+
+    async def test_invalidate_tenant_drops_all_hostnames(self, shop_tenant):
+        index = TenantRoutingIndex()
+        index.store_tenant("shop.example.com", shop_tenant)
+        index.store_tenant("www.shop.example.com", shop_tenant)
+
+        index.invalidate_tenant(shop_tenant.id)
+
+        assert index.lookup("shop.example.com") is None
+        assert index.lookup("www.shop.example.com") is None
+
+    async def test_evicts_least_recently_used_hostname(self, shop_tenant):
+        index = TenantRoutingIndex(max_hostnames=2)
+        index.store_tenant("a.example.com", shop_tenant)
+        index.store_tenant("b.example.com", shop_tenant)
+        index.lookup("a.example.com")
+        index.store_tenant("c.example.com", shop_tenant)
+
+        assert index.lookup("a.example.com") is not None
+        assert index.lookup("b.example.com") is None
+        assert index.lookup("c.example.com") is not None
+
+    async def test_snapshot_does_not_alias_settings(self, shop_tenant):
+        index = TenantRoutingIndex()
+        index.store_tenant("shop.example.com", shop_tenant)
+
+        shop_tenant.settings["shop"]["enabled"] = False
+
+        route = index.lookup("shop.example.com")
+        assert route.tenant.settings["shop"]["enabled"] is True
+
+
+class TestShopDependencies:
+    """Tests for get_shop_tenant / get_shop_sales_channel using the index."""
+
+    async def test_second_resolution_is_query_free(self, db_session, shop_tenant, statements):
+        hostname = f"{shop_tenant.slug}.batchivo.shop"
+
+        tenant = await get_shop_tenant(db_session, hostname)
+        _, channel = await get_shop_sales_channel(db_session, tenant)
+        assert statements, "first resolution should hit the database"
+
+        statements.clear()
+        tenant = await get_shop_tenant(db_session, hostname)
+        _, cached_channel = await get_shop_sales_channel(db_session, tenant)
+
+        assert statements == []
+        assert tenant.id == shop_tenant.id
+        assert cached_channel.id == channel.id
+        assert cached_channel.platform_type == "online_shop"
+
+    async def test_settings_update_invalidates_route(self, db_session, shop_tenant):
+        hostname = f"{shop_tenant.slug}.batchivo.shop"
+        await get_shop_tenant(db_session, hostname)
+        assert tenant_routing_index.lookup(hostname) is not None
+
+        service = TenantSettingsService(db_session)
+        await service._update_tenant_settings(shop_tenant.id, {"shop": {"enabled": False}})
+
+        assert tenant_routing_index.lookup(hostname) is None
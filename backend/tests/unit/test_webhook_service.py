@@ -291,14 +291,14 @@ class TestWebhookDelivery:
         )
 
         # Mock successful response
-        with patch("app.services.webhook_service.httpx.AsyncClient") as mock_client:
+        with patch("app.services.webhook_service.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.text = '{"received": true}'
 
             mock_instance = AsyncMock()
             mock_instance.post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             await service._send_webhook(delivery, subscription)
 
@@ -327,14 +327,14 @@ class TestWebhookDelivery:
         )
 
         # Mock failed response
-        with patch("app.services.webhook_service.httpx.AsyncClient") as mock_client:
+        with patch("app.services.webhook_service.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 500
             mock_response.text = "Internal Server Error"
 
             mock_instance = AsyncMock()
             mock_instance.post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             await service._send_webhook(delivery, subscription)
 
@@ -364,10 +364,10 @@ class TestWebhookDelivery:
         )
 
         # Mock timeout
-        with patch("app.services.webhook_service.httpx.AsyncClient") as mock_client:
+        with patch("app.services.webhook_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.post = AsyncMock(side_effect=httpx.TimeoutException("Timed out"))
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             await service._send_webhook(delivery, subscription)
 
@@ -389,14 +389,14 @@ class TestWebhookTesting:
             events=[WebhookEventType.ORDER_CREATED],
         )
 
-        with patch("app.services.webhook_service.httpx.AsyncClient") as mock_client:
+        with patch("app.services.webhook_service.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.text = '{"ok": true}'
 
             mock_instance = AsyncMock()
             mock_instance.post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
 
             result = await service.test_webhook(subscription.id, test_tenant.id)
 
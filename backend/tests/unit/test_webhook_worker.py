@@ -0,0 +1,170 @@
+"""Unit tests for the webhook delivery worker."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.webhook import DeliveryStatus, WebhookEventType
+from app.services.webhook_service import RETRY_INTERVALS, DeliveryAttempt, WebhookService
+from app.services.webhook_worker import WebhookDeliveryWorker
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def session_factory(db_engine):
+    return async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def _queue(db_session, tenant_id, count=1, url="https://example.com/webhook"):
+    service = WebhookService(db_session)
+    subscription, _ = await service.create_subscription(
+        tenant_id=tenant_id,
+        name="Test",
+        url=url,
+        events=[WebhookEventType.ORDER_CREATED],
+    )
+    deliveries = [
+        await service._create_delivery(
+            subscription=subscription,
+            event_type=WebhookEventType.ORDER_CREATED,
+            event_id=f"event-{i}",
+            data={"order_id": str(i)},
+            tenant_id=tenant_id,
+        )
+        for i in range(count)
+    ]
+    return subscription, deliveries
+
+
+class TestClaiming:
+    """Tests for claiming due deliveries."""
+
+    async def test_claims_pending_and_sets_lease(self, db_session, session_factory, test_tenant):
+        _, deliveries = await _queue(db_session, test_tenant.id)
+        worker = WebhookDeliveryWorker(session_factory, lease_seconds=120)
+
+        claimed = await worker.claim_due(10)
+
+        assert [delivery_id for delivery_id, _ in claimed] == [deliveries[0].id]
+        await db_session.refresh(deliveries[0])
+        assert deliveries[0].next_retry_at is not None
+
+        # Leased rows are not claimed again until the lease expires
+        assert await worker.claim_due(10) == []
+
+    async def test_skips_retries_not_yet_due(self, db_session, session_factory, test_tenant):
+        _, deliveries = await _queue(db_session, test_tenant.id)
+        deliveries[0].next_retry_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+        await db_session.commit()
+
+        worker = WebhookDeliveryWorker(session_factory)
+
+        assert await worker.claim_due(10) == []
+
+    async def test_respects_per_subscription_limit(self, db_session, session_factory, test_tenant):
+        subscription, _ = await _queue(db_session, test_tenant.id, count=5)
+        other, _ = await _queue(db_session, test_tenant.id, url="https://example.org/hook")
+        worker = WebhookDeliveryWorker(session_factory, per_subscription=2)
+
+        claimed = await worker.claim_due(10)
+
+        subscriptions = [subscription_id for _, subscription_id in claimed]
+        assert subscriptions.count(subscription.id) == 2
+        assert subscriptions.count(other.id) == 1
+
+    async def test_ignores_completed_deliveries(self, db_session, session_factory, test_tenant):
+        _, deliveries = await _queue(db_session, test_tenant.id)
+        deliveries[0].status = DeliveryStatus.SUCCESS.value
+        await db_session.commit()
+
+        worker = WebhookDeliveryWorker(session_factory)
+
+        assert await worker.claim_due(10) == []
+
+
+class TestDelivery:
+    """Tests for sending claimed deliveries."""
+
+    async def test_run_once_delivers_queued(self, db_session, session_factory, test_tenant):
+        _, deliveries = await _queue(db_session, test_tenant.id)
+        worker = WebhookDeliveryWorker(session_factory)
+
+        with patch.object(
+            WebhookService,
+            "_attempt_delivery",
+            new_callable=AsyncMock,
+            return_value=DeliveryAttempt(response_code=200, response_body="ok", response_time_ms=5),
+        ):
+            assert await worker.run_once() == 1
+            await asyncio.gather(*worker._tasks)
+
+        await db_session.refresh(deliveries[0])
+        assert deliveries[0].status == DeliveryStatus.SUCCESS.value
+        assert deliveries[0].response_code == 200
+        assert not worker._in_flight
+
+    async def test_failed_attempt_uses_retry_backoff(
+        self, db_session, session_factory, test_tenant
+    ):
+        _, deliveries = await _queue(db_session, test_tenant.id)
+        worker = WebhookDeliveryWorker(session_factory)
+        await worker.claim_due(10)
+
+        before = datetime.now(timezone.utc)
+        with patch.object(
+            WebhookService,
+            "_attempt_delivery",
+            new_callable=AsyncMock,
+            return_value=DeliveryAttempt(error_message="Request timed out"),
+        ):
+            await worker.deliver(deliveries[0].id)
+
+        await db_session.refresh(deliveries[0])
+        assert deliveries[0].status == DeliveryStatus.PENDING.value
+        assert deliveries[0].attempts == 2
+        next_retry = deliveries[0].next_retry_at.replace(tzinfo=timezone.utc)
+        assert next_retry >= before + timedelta(seconds=RETRY_INTERVALS[0] - 1)
+
+    async def test_inactive_subscription_fails_delivery(
+        self, db_session, session_factory, test_tenant
+    ):
+        subscription, deliveries = await _queue(db_session, test_tenant.id)
+        subscription.is_active = False
+        await db_session.commit()
+
+        worker = WebhookDeliveryWorker(session_factory)
+        with patch.object(WebhookService, "_attempt_delivery", new_callable=AsyncMock) as attempt:
+            await worker.deliver(deliveries[0].id)
+
+        attempt.assert_not_called()
+        await db_session.refresh(deliveries[0])
+        assert deliveries[0].status == DeliveryStatus.FAILED.value
+        assert deliveries[0].error_message == "Subscription is inactive"
+
+    async def test_stop_waits_for_in_flight(self, db_session, session_factory, test_tenant):
+        await _queue(db_session, test_tenant.id)
+        worker = WebhookDeliveryWorker(session_factory)
+        release = asyncio.Event()
+        finished = []
+
+        async def slow_deliver(delivery_id):
+            await release.wait()
+            finished.append(delivery_id)
+
+        with patch.object(worker, "deliver", side_effect=slow_deliver):
+            # Claim directly so no poll is cancelled mid-query by stop()
+            assert await worker.run_once() == 1
+            stopping = asyncio.create_task(worker.stop())
+            await asyncio.sleep(0)
+            assert not stopping.done()
+
+            release.set()
+            await stopping
+
+        assert len(finished) == 1
+        assert not worker._tasks
+        assert worker._runner is None
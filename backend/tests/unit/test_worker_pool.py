@@ -0,0 +1,57 @@
+"""Unit tests for the bounded worker pool."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.utils.worker_pool import BoundedExecutor, WorkerPoolBusyError
+
+
+class CustomBusyError(WorkerPoolBusyError):
+    pass
+
+
+@pytest.fixture
+def pool():
+    pool = BoundedExecutor("test-pool", workers=1, max_pending=1)
+    yield pool
+    pool.shutdown()
+
+
+class TestBoundedExecutor:
+    """Tests for BoundedExecutor."""
+
+    async def test_runs_off_the_event_loop_thread(self, pool):
+        loop_thread = threading.get_ident()
+
+        worker_thread = await pool.run("probe", threading.get_ident)
+
+        assert worker_thread != loop_thread
+
+    async def test_propagates_exceptions(self, pool):
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await pool.run("fail", fail)
+        assert pool.in_flight == 0
+
+    async def test_rejects_when_queue_full(self, pool):
+        release = threading.Event()
+        calls = [asyncio.create_task(pool.run("block", release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert pool.in_flight == 2
+
+        with pytest.raises(CustomBusyError):
+            await pool.run("block", release.wait, busy_error=CustomBusyError)
+
+        release.set()
+        assert await asyncio.gather(*calls) == [True, True]
+        assert pool.in_flight == 0
+
+    async def test_shutdown_allows_restart(self, pool):
+        assert await pool.run("add", sum, [1, 2]) == 3
+        pool.shutdown()
+
+        assert await pool.run("add", sum, [3, 4]) == 7
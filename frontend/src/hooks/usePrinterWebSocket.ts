@@ -2,6 +2,7 @@
  * WebSocket hook for live printer state from /ws/printers
  *
  * Connects on mount, reconnects automatically after 3s on disconnect.
+ * The server sends a full snapshot on connect and deltas afterwards.
  * Falls back to REST polling via TanStack Query when the WS is unavailable.
  */
 
@@ -51,6 +52,12 @@ export function usePrinterWebSocket(): UsePrinterWebSocketResult {
         const msg = JSON.parse(event.data)
         if (msg.type === 'printer_state' && Array.isArray(msg.data)) {
           setPrinters(msg.data)
+        } else if (msg.type === 'printer_state_delta' && Array.isArray(msg.data)) {
+          // Only changed printers are sent; merge them into the current list
+          const changed = new Map<string, PrinterLiveState>(
+            msg.data.map((p: PrinterLiveState) => [p.id, p])
+          )
+          setPrinters((prev) => prev.map((p) => changed.get(p.id) ?? p))
         }
       } catch {
         // ignore malformed messages